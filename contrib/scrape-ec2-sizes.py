@@ -441,6 +441,23 @@ def dump():
     print("Data written to %s" % (file_path))
     print("")
 
+    # 4. Write compact JSON catalog which is used by the EC2 driver list_sizes() method
+    catalog = {
+        "instance_types": sizes,
+        "regions": {
+            region_name: region_details["instance_types"]
+            for region_name, region_details in regions.items()
+        },
+    }
+
+    file_path = "libcloud/data/ec2_sizes.json"
+
+    with open(file_path, "w") as fp:
+        json.dump(catalog, fp, sort_keys=True, separators=(",", ":"))
+
+    print("Data written to %s" % (file_path))
+    print("")
+
 
 if __name__ == "__main__":
     dump()
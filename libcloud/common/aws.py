@@ -108,8 +108,12 @@ class AWSGenericResponse(AWSBaseResponse):
             else:
                 raise InvalidCredsError(self.body)
 
+        # Reading the body of a raw response already raises the parsed error
+        # so it's read outside of the try block
+        body = self.body
+
         try:
-            body = ET.XML(self.body)
+            body = ET.XML(body)
         except Exception:
             raise MalformedResponseError(
                 "Failed to parse XML", body=self.body, driver=self.connection.driver
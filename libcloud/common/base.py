@@ -18,23 +18,35 @@ import ssl
 import copy
 import json
 import time
+import random
 import socket
+import asyncio
 import binascii
+import threading
 from typing import Any, Dict, Type, Union, Optional
 
 import libcloud
-from libcloud.http import LibcloudConnection, HttpLibResponseProxy
+from libcloud.http import (
+    LibcloudConnection,
+    HttpLibResponseProxy,
+    ThreadLocalAttribute,
+    AsyncLibcloudConnection,
+)
 from libcloud.utils.py3 import ET, httplib, urlparse, urlencode
+from libcloud.utils.xml import IterParser
 from libcloud.utils.misc import lowercase_keys
-from libcloud.utils.retry import Retry
+from libcloud.utils.retry import Retry, AsyncRetry
 from libcloud.common.types import LibcloudError, MalformedResponseError
-from libcloud.common.exceptions import exception_from_message
+from libcloud.utils.ratelimit import RateLimiter, TokenBucket, parse_retry_after
+from libcloud.common.exceptions import RateLimitReachedError, exception_from_message
 
 __all__ = [
     "RETRY_FAILED_HTTP_REQUESTS",
     "BaseDriver",
     "Connection",
     "PollingConnection",
+    "PollingStrategy",
+    "ExponentialBackoffPollingStrategy",
     "ConnectionKey",
     "ConnectionUserAndKey",
     "CertificateConnection",
@@ -55,6 +67,10 @@ RETRY_FAILED_HTTP_REQUESTS = False
 # We default it to False for backward compatibility reasons.
 ALLOW_PATH_DOUBLE_SLASHES = False
 
+# Size of the chunks which are read from the connection when a raw XML
+# response is parsed incrementally
+XML_ITERPARSE_CHUNK_SIZE = 64 * 1024
+
 
 class LazyObject:
     """An object that doesn't get initialized until accessed."""
@@ -118,9 +134,6 @@ class Response:
     # Response headers
     headers = {}  # type: dict
 
-    # Raw response body
-    body = None
-
     # Parsed response body
     object = None
 
@@ -128,6 +141,16 @@ class Response:
     connection = None  # Parent connection class
     parse_zero_length_body = False
 
+    # Encoding which is used to decode the response body when the server
+    # doesn't specify a charset
+    default_encoding = "utf-8"
+
+    # Undecoded response body
+    _content = None
+    # Decoded response body, see the body property
+    _body = None
+    _encoding = None
+
     def __init__(self, response, connection):
         """
         :param response: HTTP response object. (optional)
@@ -146,11 +169,12 @@ class Response:
         self.request = response.request
         self.iter_content = response.iter_content
 
-        self.body = (
-            response.text.strip()
-            if response.text is not None and hasattr(response.text, "strip")
-            else ""
-        )
+        # Note: The body is decoded lazily. Accessing response.text would
+        # make requests run charset detection on the whole body when the
+        # server doesn't specify a charset which is very slow for large
+        # responses.
+        self._content = response.content if response.content is not None else b""
+        self._encoding = response.encoding or self.default_encoding
 
         if not self.success():
             raise exception_from_message(
@@ -159,6 +183,36 @@ class Response:
 
         self.object = self.parse_body()
 
+    @property
+    def body(self):
+        """
+        Response body decoded to text.
+
+        :rtype: ``str``
+        """
+        if self._body is None and self._content is not None:
+            self._body = self._content.decode(self._encoding, errors="replace").strip()
+
+        return self._body
+
+    @body.setter
+    def body(self, value):
+        self._body = value
+
+    def _get_body_bytes(self):
+        """
+        Return the response body as bytes if it hasn't been decoded or
+        modified yet, otherwise return the decoded body.
+
+        This allows parsers which accept bytes to skip decoding the body.
+
+        :rtype: ``bytes`` or ``str``
+        """
+        if self._body is None and self._content is not None:
+            return self._content.strip()
+
+        return self.body
+
     def parse_body(self):
         """
         Parse response body.
@@ -209,11 +263,13 @@ class JsonResponse(Response):
     """
 
     def parse_body(self):
-        if len(self.body) == 0 and not self.parse_zero_length_body:
+        body = self._get_body_bytes()
+
+        if len(body) == 0 and not self.parse_zero_length_body:
             return self.body
 
         try:
-            body = json.loads(self.body)
+            body = json.loads(body)
         except Exception:
             raise MalformedResponseError(
                 "Failed to parse JSON", body=self.body, driver=self.connection.driver
@@ -229,15 +285,17 @@ class XmlResponse(Response):
     """
 
     def parse_body(self):
-        if len(self.body) == 0 and not self.parse_zero_length_body:
+        body = self._get_body_bytes()
+
+        if len(body) == 0 and not self.parse_zero_length_body:
             return self.body
 
         try:
             try:
-                body = ET.XML(self.body)
+                body = ET.XML(body)
             except ValueError:
                 # lxml wants a bytes and tests are basically hard-coded to str
-                body = ET.XML(self.body.encode("utf-8"))
+                body = ET.XML(body.encode("utf-8"))
         except Exception:
             raise MalformedResponseError(
                 "Failed to parse XML", body=self.body, driver=self.connection.driver
@@ -246,6 +304,37 @@ class XmlResponse(Response):
 
     parse_error = parse_body
 
+    def iterparse_body(self, xpath, namespace=None):
+        """
+        Incrementally parse the response body and iterate over the elements
+        at the provided path, see :class:`libcloud.utils.xml.IterParser`.
+
+        Raw responses of streamed requests are parsed as they are read from
+        the connection so neither the body nor the whole element tree is
+        held in memory.
+
+        :param xpath: Path of the elements relative to the root element.
+        :type xpath: ``str``
+
+        :param namespace: Namespace of the element tags.
+        :type namespace: ``str``
+
+        :rtype: :class:`libcloud.utils.xml.IterParser`
+        """
+        if isinstance(self, RawResponse):
+            if not self.success():
+                # Unlike regular responses, raw responses don't raise an
+                # exception for an unsuccessful status code on their own
+                raise exception_from_message(
+                    code=self.status, message=self.parse_error(), headers=self.headers
+                )
+
+            chunks = self.iter_content(XML_ITERPARSE_CHUNK_SIZE)
+        else:
+            chunks = [self._get_body_bytes()]
+
+        return IterParser(chunks, xpath=xpath, namespace=namespace)
+
 
 class RawResponse(Response):
     def __init__(self, connection, response=None):
@@ -258,6 +347,7 @@ class RawResponse(Response):
         self._headers = {}
         self._error = None
         self._reason = None
+        self._http_response = response
         self.connection = connection
         if response is not None:
             self.headers = lowercase_keys(dict(response.headers))
@@ -311,6 +401,16 @@ class RawResponse(Response):
             self._reason = self.response.reason
         return self._reason
 
+    def close(self):
+        """
+        Close the response and release its connection back to the pool.
+
+        The body of a streamed response which is not read until the end is
+        only released once the response is closed.
+        """
+        if self._http_response is not None:
+            self._http_response.close()
+
 
 class Connection:
     """
@@ -328,11 +428,27 @@ class Connection:
     timeout = None  # type: Optional[Union[int, float]]
     secure = 1
     driver = None  # type:  Type[BaseDriver]
-    action = None
     cache_busting = False
     backoff = None
     retry_delay = None
 
+    # When True, the state of the current request is local to each thread
+    # and a single connection can be used by multiple threads concurrently
+    thread_safe = False
+    # Size of the connection pool of the HTTP session, see
+    # :meth:`libcloud.http.LibcloudConnection._setup_pool`
+    pool_connections = None
+    pool_maxsize = None
+    # Client side rate limiter (RateLimiter with a bucket per endpoint or a
+    # single TokenBucket) which is shared by all the connections which use it
+    rate_limiter = None  # type: Optional[Union[RateLimiter, TokenBucket]]
+
+    # State of the current request
+    action = ThreadLocalAttribute()
+    method = ThreadLocalAttribute()
+    data = ThreadLocalAttribute()
+    context = ThreadLocalAttribute(default_factory=dict)
+
     allow_insecure = True
 
     def __init__(
@@ -481,6 +597,15 @@ class Connection:
         if self.proxy_url:
             kwargs.update({"proxy_url": self.proxy_url})
 
+        if self.thread_safe:
+            kwargs.update({"thread_safe": self.thread_safe})
+
+        if self.pool_connections:
+            kwargs.update({"pool_connections": self.pool_connections})
+
+        if self.pool_maxsize:
+            kwargs.update({"pool_maxsize": self.pool_maxsize})
+
         connection = self.conn_class(**kwargs)
         # You can uncomment this line, if you setup a reverse proxy server
         # which proxies to your endpoint, and lets you easily capture
@@ -570,16 +695,37 @@ class Connection:
         :rtype: :class:`Response` instance
 
         """
-        if params is None:
-            params = {}
-        else:
-            params = copy.copy(params)
+        retry_enabled = self._is_retry_enabled(retry_failed=retry_failed)
+        url, headers, data = self._prepare_request(
+            action=action, params=params, data=data, headers=headers, method=method
+        )
 
-        if headers is None:
-            headers = {}
-        else:
-            headers = copy.copy(headers)
+        # IF connection has not yet been established
+        if self.connection is None:
+            self.connect()
+
+        request_to_be_executed = self._retryable_request
+
+        if retry_enabled:
+            retry_request = self.retryCls(
+                retry_delay=self.retry_delay, timeout=self.timeout, backoff=self.backoff
+            )
+            request_to_be_executed = retry_request(self._retryable_request)
+
+        return request_to_be_executed(
+            url=url, method=method, raw=raw, stream=stream, headers=headers, data=data
+        )
+
+    def _is_retry_enabled(self, retry_failed=None):
+        """
+        Return True if failed requests should be retried.
 
+        :param retry_failed: Value of the ``retry_failed`` argument of the
+                             request method.
+        :type retry_failed: ``bool``
+
+        :rtype: ``bool``
+        """
         retry_enabled = (
             os.environ.get("LIBCLOUD_RETRY_FAILED_HTTP_REQUESTS", False)
             or RETRY_FAILED_HTTP_REQUESTS
@@ -590,6 +736,30 @@ class Connection:
         if retry_failed is not None:
             retry_enabled = retry_failed
 
+        return retry_enabled
+
+    def _prepare_request(self, action, params=None, data=None, headers=None, method="GET"):
+        """
+        Run the request hooks and build the url, headers and body of a
+        request.
+
+        This is used by :meth:`request` and by
+        :class:`libcloud.common.base.AsyncConnection` so both send exactly the
+        same (signed) requests.
+
+        :return: A tuple of (url, headers, data).
+        :rtype: ``tuple``
+        """
+        if params is None:
+            params = {}
+        else:
+            params = copy.copy(params)
+
+        if headers is None:
+            headers = {}
+        else:
+            headers = copy.copy(headers)
+
         action = self.morph_action_hook(action)
         self.action = action
         self.method = method
@@ -631,21 +801,7 @@ class Connection:
         else:
             url = action
 
-        # IF connection has not yet been established
-        if self.connection is None:
-            self.connect()
-
-        request_to_be_executed = self._retryable_request
-
-        if retry_enabled:
-            retry_request = self.retryCls(
-                retry_delay=self.retry_delay, timeout=self.timeout, backoff=self.backoff
-            )
-            request_to_be_executed = retry_request(self._retryable_request)
-
-        return request_to_be_executed(
-            url=url, method=method, raw=raw, stream=stream, headers=headers, data=data
-        )
+        return url, headers, data
 
     def _retryable_request(
         self,
@@ -656,6 +812,9 @@ class Connection:
         raw: bool,
         stream: bool,
     ) -> Union[RawResponse, Response]:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method=method, path=url)
+
         try:
             # @TODO: Should we just pass File object as body to request method
             # instead of dealing with splitting and sending the file ourselves?
@@ -706,10 +865,18 @@ class Connection:
 
         try:
             response = responseCls(**kwargs)
+        except RateLimitReachedError as e:
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(method=method, path=url, retry_after=e.retry_after)
+            raise
         finally:
             # Always reset the context after the request has completed
             self.reset_context()
 
+        if self.rate_limiter is not None:
+            headers = getattr(response, "headers", None)
+            self.rate_limiter.update(method=method, path=url, headers=headers)
+
         return response
 
     def morph_action_hook(self, action):
@@ -794,6 +961,97 @@ class Connection:
         return params
 
 
+class PollingStrategy:
+    """
+    Strategy which decides how long :class:`PollingConnection` waits between
+    two job status polls.
+
+    This strategy polls at a fixed interval. If a poll response carries a
+    ``Retry-After`` header, the next poll is never issued before the delay
+    requested by the server.
+    """
+
+    def __init__(self, interval=0.5):
+        """
+        :param interval: Number of seconds to wait between polls.
+        :type interval: ``float``
+        """
+        self.interval = interval
+
+    def get_delay(self, attempt, response=None):
+        """
+        Return the number of seconds to wait before the next poll.
+
+        :param attempt: Number of polls which have been performed so far.
+        :type attempt: ``int``
+
+        :param response: Response returned by the last poll request.
+        :type response: :class:`Response`
+
+        :rtype: ``float``
+        """
+        delay = self._get_delay(attempt)
+        retry_after = self.get_retry_after(response)
+
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        return delay
+
+    def get_retry_after(self, response):
+        """
+        Return the delay in seconds requested by the server via the
+        ``Retry-After`` header or None if the header is not present.
+
+        Both the delta-seconds and the HTTP-date format are supported.
+
+        :rtype: ``float`` or ``None``
+        """
+        headers = getattr(response, "headers", None) or {}
+
+        return parse_retry_after(headers.get("retry-after", None))
+
+    def _get_delay(self, attempt):
+        return self.interval
+
+
+class ExponentialBackoffPollingStrategy(PollingStrategy):
+    """
+    Polling strategy which multiplies the delay between polls by ``backoff``
+    after each poll, up to ``max_interval`` seconds.
+
+    Random jitter is subtracted from each delay so that many callers which
+    start waiting at the same time don't poll the API in lockstep.
+    """
+
+    def __init__(self, interval=0.5, max_interval=30, backoff=2, jitter=0.5):
+        """
+        :param interval: Delay in seconds after the first poll.
+        :type interval: ``float``
+
+        :param max_interval: Upper bound for the delay in seconds.
+        :type max_interval: ``float``
+
+        :param backoff: Multiplier applied to the delay after each poll.
+        :type backoff: ``float``
+
+        :param jitter: Fraction (0 - 1) of the delay which is randomized.
+        :type jitter: ``float``
+        """
+        super().__init__(interval=interval)
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+
+    def _get_delay(self, attempt):
+        delay = min(self.max_interval, self.interval * self.backoff ** max(attempt - 1, 0))
+
+        if self.jitter:
+            delay -= random.uniform(0, delay * self.jitter)
+
+        return delay
+
+
 class PollingConnection(Connection):
     """
     Connection class which can also work with the async APIs.
@@ -801,9 +1059,13 @@ class PollingConnection(Connection):
     After initial requests, this class periodically polls for jobs status and
     waits until the job has finished.
     If job doesn't finish in timeout seconds, an Exception thrown.
+
+    The delay between polls is determined by ``poll_strategy``. If it's not
+    set, jobs are polled every ``poll_interval`` seconds.
     """
 
     poll_interval = 0.5
+    poll_strategy = None  # type: Optional[PollingStrategy]
     timeout = 200
     request_method = "request"
 
@@ -865,19 +1127,117 @@ class PollingConnection(Connection):
             response=response, context=context, request_kwargs=kwargs
         )
 
+        strategy = self.get_poll_strategy()
         end = time.time() + self.timeout
+        attempt = 0
         completed = False
         while time.time() < end and not completed:
             response = request(**kwargs)
+            attempt += 1
             completed = self.has_completed(response=response)
             if not completed:
-                time.sleep(self.poll_interval)
+                self._wait_for_next_poll(strategy.get_delay(attempt, response), end)
 
         if not completed:
             raise LibcloudError("Job did not complete in %s seconds" % (self.timeout))
 
         return response
 
+    def async_request_many(self, requests):
+        """
+        Perform multiple 'async' requests and wait until all the resulting
+        jobs have completed.
+
+        Unlike calling :meth:`async_request` for each request, all the pending
+        jobs are polled together in rounds (see :meth:`poll_many`) and a
+        single polling strategy paces those rounds.
+
+        :param requests: List of dictionaries with the keyword arguments
+                         (``action``, ``params``, ``data``, ``headers``,
+                         ``method`` and ``context``) for each request.
+        :type requests: ``list`` of ``dict``
+
+        :return: List with the final poll response of each job, in the same
+                 order as ``requests``.
+        :rtype: ``list`` of :class:`Response`
+        """
+        request = getattr(self, self.request_method)
+        poll_kwargs = []
+
+        for item in requests:
+            kwargs = self.get_request_kwargs(**item)
+            response = request(**kwargs)
+            poll_kwargs.append(
+                self.get_poll_request_kwargs(
+                    response=response, context=item.get("context", None), request_kwargs=kwargs
+                )
+            )
+
+        strategy = self.get_poll_strategy()
+        end = time.time() + self.timeout
+        attempt = 0
+        responses = [None] * len(poll_kwargs)
+        pending = list(range(len(poll_kwargs)))
+        while time.time() < end and pending:
+            polled = self.poll_many([poll_kwargs[index] for index in pending])
+            attempt += 1
+            not_completed = []
+            last_response = None
+
+            for index, response in zip(pending, polled):
+                if self.has_completed(response=response):
+                    responses[index] = response
+                else:
+                    not_completed.append(index)
+                    last_response = response
+
+            pending = not_completed
+            if pending:
+                self._wait_for_next_poll(strategy.get_delay(attempt, last_response), end)
+
+        if pending:
+            raise LibcloudError(
+                "%s of %s jobs did not complete in %s seconds"
+                % (len(pending), len(poll_kwargs), self.timeout)
+            )
+
+        return responses
+
+    def poll_many(self, poll_request_kwargs):
+        """
+        Poll the status of multiple jobs.
+
+        By default one poll request is performed per job. Drivers for APIs
+        which can report the status of many jobs with a single request should
+        override this method.
+
+        :param poll_request_kwargs: Poll request kwargs of each pending job
+                                    (see :meth:`get_poll_request_kwargs`).
+        :type poll_request_kwargs: ``list`` of ``dict``
+
+        :return: List with a response for each job, in the same order as
+                 ``poll_request_kwargs``. Each response is passed to
+                 :meth:`has_completed`.
+        :rtype: ``list`` of :class:`Response`
+        """
+        request = getattr(self, self.request_method)
+        return [request(**kwargs) for kwargs in poll_request_kwargs]
+
+    def get_poll_strategy(self):
+        """
+        Return the strategy which decides how long to wait between polls.
+
+        :rtype: :class:`PollingStrategy`
+        """
+        if self.poll_strategy is not None:
+            return self.poll_strategy
+
+        return PollingStrategy(interval=self.poll_interval)
+
+    def _wait_for_next_poll(self, delay, end):
+        # Don't sleep past the overall timeout
+        time.sleep(max(0, min(delay, end - time.time())))
+
     def get_request_kwargs(
         self, action, params=None, data=None, headers=None, method="GET", context=None
     ):
@@ -1066,12 +1426,163 @@ class ConnectionUserAndKey(ConnectionKey):
         self.user_id = user_id
 
 
+class AsyncConnection:
+    """
+    Asyncio counterpart of :class:`Connection`.
+
+    It wraps the driver connection and uses its hooks to build and sign the
+    requests and its Response class to parse the responses, only the HTTP
+    transport is replaced. This way thousands of requests can run
+    concurrently on a single event loop.
+
+    Only non-raw requests are supported, the whole response body is read
+    before it's parsed.
+    """
+
+    conn_class = AsyncLibcloudConnection
+    retryCls = AsyncRetry
+    connection = None
+
+    def __init__(self, driver_connection):
+        """
+        :param driver_connection: Connection which is used to build the
+                                  requests and parse the responses.
+        :type driver_connection: :class:`.Connection`
+        """
+        self.driver_connection = driver_connection
+
+        # The hooks store the state of the current request on the driver
+        # connection so only a single request is prepared at a time
+        self._prepare_lock = threading.Lock()
+
+    def connect(self):
+        """
+        Set up the asyncio HTTP transport.
+        """
+        self.connection = self.conn_class(
+            timeout=self.driver_connection.timeout,
+            proxy_url=self.driver_connection.proxy_url,
+        )
+
+    async def close(self):
+        """
+        Close the HTTP transport and release its connections.
+        """
+        if self.connection is not None:
+            await self.connection.close()
+
+    async def request(
+        self,
+        action,
+        params=None,
+        data=None,
+        headers=None,
+        method="GET",
+        retry_failed=None,
+    ):
+        """
+        Request a given `action`, see :meth:`Connection.request`.
+
+        :return: An :class:`Response` instance.
+        :rtype: :class:`Response` instance
+        """
+        driver_connection = self.driver_connection
+        retry_enabled = driver_connection._is_retry_enabled(retry_failed=retry_failed)
+
+        # The hooks can block (e.g. to retrieve an authentication token) so
+        # the request is prepared in a thread to not block the event loop.
+        # The context is thread local so it's passed to that thread.
+        loop = asyncio.get_running_loop()
+        url, headers, data = await loop.run_in_executor(
+            None,
+            self._prepare_request,
+            action,
+            params,
+            data,
+            headers,
+            method,
+            driver_connection.context,
+        )
+
+        if self.connection is None:
+            self.connect()
+
+        request_to_be_executed = self._retryable_request
+
+        if retry_enabled:
+            retry_request = self.retryCls(
+                retry_delay=driver_connection.retry_delay,
+                timeout=driver_connection.timeout,
+                backoff=driver_connection.backoff,
+            )
+            request_to_be_executed = retry_request(self._retryable_request)
+
+        return await request_to_be_executed(url=url, method=method, headers=headers, data=data)
+
+    def _prepare_request(self, action, params, data, headers, method, context):
+        driver_connection = self.driver_connection
+
+        with self._prepare_lock:
+            driver_connection.set_context(context)
+
+            try:
+                url, headers, data = driver_connection._prepare_request(
+                    action=action, params=params, data=data, headers=headers, method=method
+                )
+
+                # Hosts can be changed by the hooks (e.g. after authentication)
+                # so the base url is always taken from the driver connection
+                if driver_connection.connection is None:
+                    driver_connection.connect()
+
+                url = urlparse.urljoin(driver_connection.connection.host, url)
+            finally:
+                driver_connection.reset_context()
+
+        return url, headers, data
+
+    async def _retryable_request(
+        self, url: str, data: bytes, headers: Dict[str, Any], method: str
+    ) -> Response:
+        # Rate limiter is shared with the driver connection. Acquiring a token
+        # can block so it's done in a thread to not block the event loop.
+        rate_limiter = self.driver_connection.rate_limiter
+        path = urlparse.urlparse(url).path
+
+        if rate_limiter is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: rate_limiter.acquire(method=method, path=path))
+
+        try:
+            response = await self.connection.request(
+                method=method, url=url, body=data, headers=headers
+            )
+        except ssl.SSLError as e:
+            raise ssl.SSLError(str(e))
+
+        try:
+            response = self.driver_connection.responseCls(
+                connection=self.driver_connection, response=response
+            )
+        except RateLimitReachedError as e:
+            if rate_limiter is not None:
+                rate_limiter.update(method=method, path=path, retry_after=e.retry_after)
+            raise
+
+        if rate_limiter is not None:
+            headers = getattr(response, "headers", None)
+            rate_limiter.update(method=method, path=path, headers=headers)
+
+        return response
+
+
 class BaseDriver:
     """
     Base driver class from which other classes can inherit from.
     """
 
     connectionCls = ConnectionKey  # type: Type[Connection]
+    asyncConnectionCls = AsyncConnection  # type: Type[AsyncConnection]
 
     def __init__(
         self,
@@ -1109,6 +1620,27 @@ class BaseDriver:
                        support multiple regions.
         :type region: ``str``
 
+        :param thread_safe: Keep the state of each request local to the
+                            calling thread so the driver can be used from
+                            multiple threads concurrently.
+        :type thread_safe: ``bool``
+
+        :param pool_connections: Number of hosts for which HTTP connections
+                                 are kept in the connection pool.
+        :type pool_connections: ``int``
+
+        :param pool_maxsize: Maximum number of HTTP connections which are
+                             kept in the pool for a single host. When the
+                             driver is shared between threads it should be
+                             at least the number of threads.
+        :type pool_maxsize: ``int``
+
+        :param rate_limiter: Client side rate limiter for the requests sent
+                             by the driver. The same limiter can be passed to
+                             multiple drivers to share the rate limit.
+        :type rate_limiter: :class:`libcloud.utils.ratelimit.RateLimiter` or
+                            :class:`libcloud.utils.ratelimit.TokenBucket`
+
         :rtype: ``None``
         """
 
@@ -1128,6 +1660,11 @@ class BaseDriver:
             }
         )
 
+        thread_safe = kwargs.pop("thread_safe", False)
+        pool_connections = kwargs.pop("pool_connections", None)
+        pool_maxsize = kwargs.pop("pool_maxsize", None)
+        rate_limiter = kwargs.pop("rate_limiter", None)
+
         args = [self.key]
 
         if self.secret is not None:
@@ -1145,6 +1682,19 @@ class BaseDriver:
 
         self.connection = self.connectionCls(*args, **conn_kwargs)
         self.connection.driver = self
+
+        if thread_safe:
+            self.connection.thread_safe = True
+
+        if pool_connections:
+            self.connection.pool_connections = pool_connections
+
+        if pool_maxsize:
+            self.connection.pool_maxsize = pool_maxsize
+
+        if rate_limiter is not None:
+            self.connection.rate_limiter = rate_limiter
+
         self.connection.connect()
 
     def _ex_connection_class_kwargs(self):
@@ -1153,3 +1703,82 @@ class BaseDriver:
         Connection class constructor.
         """
         return {}
+
+    def _get_thread_connection(self):
+        """
+        Return a connection instance which is private to the calling thread.
+
+        Connection instances store per-request state and are not safe to
+        share between threads. Driver methods which issue requests from worker
+        threads should use this method instead of ``self.connection``. The
+        returned connection is a copy of ``self.connection`` with its own HTTP
+        connection pool and is reused for all the requests issued by the same
+        thread.
+
+        Thread-safe connections (see the ``thread_safe`` driver argument) are
+        returned as is so all the threads share the same connection pool.
+
+        :rtype: :class:`.Connection`
+        """
+        if self.connection.thread_safe:
+            return self.connection
+
+        thread_connections = self.__dict__.setdefault("_thread_connections", threading.local())
+        connection = getattr(thread_connections, "connection", None)
+
+        if connection is None:
+            connection = copy.copy(self.connection)
+            connection.context = {}
+            connection.connect()
+            thread_connections.connection = connection
+
+        return connection
+
+    @property
+    def async_connection(self):
+        """
+        Asyncio connection which is used by the ``async_*`` driver methods.
+
+        :rtype: :class:`.AsyncConnection`
+        """
+        connection = self.__dict__.get("_async_connection")
+
+        if connection is None:
+            connection = self.asyncConnectionCls(self.connection)
+            self._async_connection = connection
+
+        return connection
+
+    async def _run_in_executor(self, method_name, *args, **kwargs):
+        """
+        Run a blocking driver method in the default executor of the running
+        event loop.
+
+        This is used by the ``async_*`` methods of drivers which don't
+        provide a native asyncio implementation. The method is called on the
+        driver returned by :meth:`_get_thread_driver` so concurrent calls
+        don't share a connection.
+        """
+
+        def run():
+            method = getattr(self._get_thread_driver(), method_name)
+            return method(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, run)
+
+    def _get_thread_driver(self):
+        """
+        Return a shallow copy of this driver which issues requests using the
+        connection returned by :meth:`_get_thread_connection`.
+
+        This allows existing driver methods to be called from worker threads.
+
+        :rtype: :class:`.BaseDriver`
+        """
+        # copy.copy() would call __new__ which some drivers override to pick
+        # the driver class based on the constructor arguments
+        driver = object.__new__(self.__class__)
+        driver.__dict__.update(self.__dict__)
+        driver.connection = self._get_thread_connection()
+        return driver
@@ -78,7 +78,13 @@ from typing import Optional
 from http.server import HTTPServer, BaseHTTPRequestHandler
 
 from libcloud.utils.py3 import b, httplib, urlparse, urlencode
-from libcloud.common.base import BaseDriver, JsonResponse, PollingConnection, ConnectionUserAndKey
+from libcloud.common.base import (
+    BaseDriver,
+    JsonResponse,
+    PollingConnection,
+    ConnectionUserAndKey,
+    ExponentialBackoffPollingStrategy,
+)
 from libcloud.common.types import LibcloudError, ProviderError
 from libcloud.utils.connection import get_response_object
 
@@ -845,6 +851,9 @@ class GoogleBaseConnection(ConnectionUserAndKey, PollingConnection):
     responseCls = GoogleResponse
     host = "www.googleapis.com"
     poll_interval = 2.0
+    # Back off while waiting for long running operations so that waiting on
+    # many of them doesn't exhaust the API request quota.
+    poll_strategy = ExponentialBackoffPollingStrategy(interval=poll_interval, max_interval=30)
     timeout = 180
 
     def __init__(
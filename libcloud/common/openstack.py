@@ -252,8 +252,10 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
         params = params or {}
 
         # Include default content-type for POST and PUT request (if available)
+        # unless the caller has explicitly provided one
         default_content_type = getattr(self, "default_content_type", None)
-        if method.upper() in ["POST", "PUT"] and default_content_type:
+        has_content_type = any(key.lower() == "content-type" for key in headers)
+        if method.upper() in ["POST", "PUT"] and default_content_type and not has_content_type:
             headers["Content-Type"] = default_content_type
 
         try:
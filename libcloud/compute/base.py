@@ -29,11 +29,17 @@ import binascii
 import datetime
 import traceback
 from typing import TYPE_CHECKING, Any, Dict, List, Type, Tuple, Union, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import libcloud.compute.ssh
 from libcloud.pricing import get_size_price
 from libcloud.utils.py3 import b
-from libcloud.common.base import BaseDriver, Connection, ConnectionKey
+from libcloud.common.base import (
+    BaseDriver,
+    Connection,
+    ConnectionKey,
+    ExponentialBackoffPollingStrategy,
+)
 from libcloud.compute.ssh import SSHClient, BaseSSHClient, SSHCommandTimeoutError, have_paramiko
 from libcloud.common.types import LibcloudError
 from libcloud.compute.types import (
@@ -77,6 +83,16 @@ NODE_ONLINE_WAIT_TIMEOUT = 10 * 60
 # script.
 SSH_CONNECT_TIMEOUT = 5 * 60
 
+# Default number of nodes which are created concurrently by create_nodes()
+CREATE_NODES_CONCURRENCY = 8
+
+# Default number of nodes which are deployed concurrently by deploy_nodes()
+DEPLOY_NODES_CONCURRENCY = 16
+
+# Maximum number of nodes which drivers retrieve one by one in
+# _refresh_nodes() before falling back to listing all the nodes
+REFRESH_NODES_MAX_REQUESTS = 25
+
 # Error message which should be considered fatal for deploy_node() method and
 # on which we should abort retrying and immediately propagate the error
 SSH_FATAL_ERROR_MSGS = [
@@ -104,6 +120,8 @@ __all__ = [
     "NodeAuthSSHKey",
     "NodeAuthPassword",
     "NodeDriver",
+    "NodeCreationResult",
+    "NodeDeploymentResult",
     "StorageVolume",
     "StorageVolumeState",
     "VolumeSnapshot",
@@ -865,6 +883,87 @@ class KeyPair:
         )
 
 
+class NodeCreationResult:
+    """
+    Outcome of creating a single node with
+    :meth:`NodeDriver.create_nodes`.
+    """
+
+    def __init__(
+        self,
+        spec,  # type: Dict[str, Any]
+        node=None,  # type: Optional[Node]
+        error=None,  # type: Optional[Exception]
+    ):
+        """
+        :param spec: Keyword arguments which were passed to ``create_node``.
+        :type spec: ``dict``
+
+        :param node: Created node or None if the creation failed.
+        :type node: :class:`.Node`
+
+        :param error: Exception raised while creating the node.
+        :type error: ``Exception``
+        """
+        self.spec = spec
+        self.node = node
+        self.error = error
+
+    @property
+    def success(self):
+        # type: () -> bool
+        return self.error is None
+
+    def __repr__(self):
+        return "<NodeCreationResult: name=%s, success=%s, node=%s, error=%r>" % (
+            self.spec.get("name", None),
+            self.success,
+            self.node,
+            self.error,
+        )
+
+
+class NodeDeploymentResult:
+    """
+    Outcome of running a deployment on a single node with
+    :meth:`NodeDriver.deploy_nodes`.
+    """
+
+    def __init__(
+        self,
+        node,  # type: Node
+        error=None,  # type: Optional[Exception]
+        step_timings=None,  # type: Optional[List[Tuple[Deployment, float]]]
+    ):
+        """
+        :param node: Node the deployment was run on.
+        :type node: :class:`.Node`
+
+        :param error: :class:`.DeploymentError` if the deployment failed.
+        :type error: ``Exception``
+
+        :param step_timings: ``(step, seconds)`` tuple for each completed
+                             deployment step.
+        :type step_timings: ``list`` of ``tuple``
+        """
+        self.node = node
+        self.error = error
+        self.step_timings = step_timings or []
+
+    @property
+    def success(self):
+        # type: () -> bool
+        return self.error is None
+
+    def __repr__(self):
+        return "<NodeDeploymentResult: node=%s, success=%s, steps=%s, error=%r>" % (
+            self.node.id,
+            self.success,
+            len(self.step_timings),
+            self.error,
+        )
+
+
 class NodeDriver(BaseDriver):
     """
     A base NodeDriver class to derive from
@@ -896,6 +995,10 @@ class NodeDriver(BaseDriver):
 
     NODE_STATE_MAP = {}  # type: Dict[str, NodeState]
 
+    # True if the driver implements _refresh_nodes() which retrieves only the
+    # provided nodes
+    supports_refresh_nodes = False  # type: bool
+
     def list_nodes(self, *args, **kwargs):
         # type: (Any, Any) -> List[Node]
         """
@@ -1019,6 +1122,106 @@ class NodeDriver(BaseDriver):
         """
         raise NotImplementedError("create_node not implemented for this driver")
 
+    def create_nodes(
+        self,
+        specs,  # type: List[Dict[str, Any]]
+        concurrency=CREATE_NODES_CONCURRENCY,  # type: int
+        wait_until_running=False,  # type: bool
+        wait_kwargs=None,  # type: Optional[Dict[str, Any]]
+    ):
+        # type: (...) -> List[NodeCreationResult]
+        """
+        Create multiple nodes.
+
+        Each spec is a dictionary with the keyword arguments for
+        :meth:`create_node`. Drivers for APIs which can create multiple nodes
+        with a single request group compatible specs together, remaining
+        nodes are created concurrently using a bounded pool of worker
+        threads.
+
+        A failure to create one node doesn't affect the other nodes, the
+        outcome of each spec is reported in the returned list.
+
+        :param specs: ``create_node`` keyword arguments for each node.
+        :type specs: ``list`` of ``dict``
+
+        :param concurrency: Maximum number of concurrent create requests.
+        :type concurrency: ``int``
+
+        :param wait_until_running: Wait until all the created nodes are
+                                   running. All the nodes are polled together
+                                   using :meth:`wait_until_running`.
+        :type wait_until_running: ``bool``
+
+        :param wait_kwargs: Keyword arguments which are passed to
+                            :meth:`wait_until_running`.
+        :type wait_kwargs: ``dict``
+
+        :return: Result for each spec, in the same order as ``specs``.
+        :rtype: ``list`` of :class:`.NodeCreationResult`
+        """
+        specs = list(specs)
+        results = [None] * len(specs)  # type: List[Any]
+
+        def create(batch):
+            driver = self._get_thread_driver()
+            return driver._create_nodes_batch([specs[index] for index in batch])
+
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            futures = {
+                executor.submit(create, batch): batch
+                for batch in self._get_create_nodes_batches(specs)
+            }
+
+            for future in as_completed(futures):
+                batch = futures[future]
+
+                try:
+                    nodes = future.result()
+                except Exception as e:
+                    for index in batch:
+                        results[index] = NodeCreationResult(specs[index], error=e)
+                else:
+                    for index, node in zip(batch, nodes):
+                        results[index] = NodeCreationResult(specs[index], node=node)
+
+        created = [result for result in results if result.success]
+
+        if wait_until_running and created:
+            running = self.wait_until_running(
+                nodes=[result.node for result in created], **(wait_kwargs or {})
+            )
+            running_nodes = {node.uuid: node for node, _ in running}
+
+            for result in created:
+                result.node = running_nodes.get(result.node.uuid, result.node)
+
+        return results
+
+    def _get_create_nodes_batches(self, specs):
+        # type: (List[Dict[str, Any]]) -> List[List[int]]
+        """
+        Split specs passed to :meth:`create_nodes` into batches which are
+        created with a single :meth:`_create_nodes_batch` call.
+
+        By default each node is created on its own.
+
+        :return: Lists of spec indexes.
+        :rtype: ``list`` of ``list`` of ``int``
+        """
+        return [[index] for index in range(len(specs))]
+
+    def _create_nodes_batch(self, specs):
+        # type: (List[Dict[str, Any]]) -> List[Node]
+        """
+        Create nodes for a batch of specs returned by
+        :meth:`_get_create_nodes_batches`.
+
+        :return: Created node for each spec, in the same order as ``specs``.
+        :rtype: ``list`` of :class:`.Node`
+        """
+        return [self.create_node(**spec) for spec in specs]
+
     def deploy_node(
         self,
         deploy,  # type: Deployment
@@ -1210,12 +1413,7 @@ class NodeDriver(BaseDriver):
         if at_exit_func:
             atexit.register(at_exit_func, driver=self, node=node)
 
-        password = None
-        if auth:
-            if isinstance(auth, NodeAuthPassword):
-                password = auth.password
-        elif "password" in node.extra:
-            password = node.extra["password"]
+        password = self._get_deployment_password(node=node, auth=auth)
 
         wait_timeout = timeout or NODE_ONLINE_WAIT_TIMEOUT
 
@@ -1274,6 +1472,162 @@ class NodeDriver(BaseDriver):
 
         return node
 
+    def deploy_nodes(
+        self,
+        nodes,  # type: List[Node]
+        deploy,  # type: Deployment
+        ssh_username="root",  # type: str
+        ssh_port=22,  # type: int
+        ssh_timeout=10,  # type: int
+        ssh_key=None,  # type: Optional[T_Ssh_key]
+        ssh_key_password=None,  # type: Optional[str]
+        auth=None,  # type: Optional[T_Auth]
+        timeout=SSH_CONNECT_TIMEOUT,  # type: int
+        max_tries=3,  # type: int
+        ssh_interface="public_ips",  # type: str
+        wait_period=5,  # type: int
+        concurrency=DEPLOY_NODES_CONCURRENCY,  # type: int
+        progress_callback=None,  # type: Optional[Callable]
+    ):
+        # type: (...) -> List[NodeDeploymentResult]
+        """
+        Run a deployment on multiple existing nodes concurrently.
+
+        All the nodes are first waited for together using
+        :meth:`wait_until_running`. If some of them don't become ready in
+        time, each remaining node is checked on its own and the nodes which
+        never become ready are reported as failed. Up to ``concurrency``
+        nodes are connected to and deployed at the same time. Steps of a
+        :class:`MultiStepDeployment` are run one by one over the same SSH
+        connection and each step is retried up to ``max_tries`` times.
+
+        A failed deployment doesn't affect the other nodes, the outcome for
+        each node is reported in the returned list.
+
+        :param nodes: Nodes to deploy.
+        :type nodes: ``list`` of :class:`.Node`
+
+        :param deploy: Deployment to run on each node.
+        :type deploy: :class:`Deployment`
+
+        :param concurrency: Maximum number of nodes which are deployed at
+                            the same time.
+        :type concurrency: ``int``
+
+        :param progress_callback: Optional function which is called with the
+                                  node, the step and the step duration in
+                                  seconds after each step has completed. It's
+                                  called from worker threads.
+        :type progress_callback: ``callable``
+
+        See :meth:`deploy_node` for the description of the other arguments.
+
+        :return: Result for each node, in the same order as ``nodes``.
+        :rtype: ``list`` of :class:`.NodeDeploymentResult`
+        """
+        wait_timeout = timeout or NODE_ONLINE_WAIT_TIMEOUT
+        deploy_timeout = timeout or SSH_CONNECT_TIMEOUT
+        wait_end = time.time() + wait_timeout
+
+        try:
+            running = self.wait_until_running(
+                nodes=nodes,
+                wait_period=wait_period,
+                timeout=wait_timeout,
+                ssh_interface=ssh_interface,
+            )
+        except Exception:
+            # Some of the nodes didn't become ready, they are checked one by
+            # one below
+            running = []
+
+        running_nodes = {node.uuid: (node, ip_addresses) for node, ip_addresses in running}
+        steps = self._get_deployment_steps(deploy)
+
+        def run(node):
+            result = NodeDeploymentResult(node)
+
+            if node.uuid in running_nodes:
+                node, ip_addresses = running_nodes[node.uuid]
+            else:
+                try:
+                    node, ip_addresses = self._get_thread_driver().wait_until_running(
+                        nodes=[node],
+                        wait_period=wait_period,
+                        timeout=max(wait_end - time.time(), wait_period),
+                        ssh_interface=ssh_interface,
+                    )[0]
+                except Exception as e:
+                    result.error = DeploymentError(node=node, original_exception=e, driver=self)
+                    return result
+
+            ssh_client = SSHClient(
+                hostname=ip_addresses[0],
+                port=ssh_port,
+                username=ssh_username,
+                password=ssh_key_password or self._get_deployment_password(node=node, auth=auth),
+                key_files=ssh_key,
+                timeout=ssh_timeout,
+            )
+
+            try:
+                ssh_client = self._ssh_client_connect(ssh_client=ssh_client, timeout=deploy_timeout)
+
+                for step in steps:
+                    start = time.time()
+                    node, ssh_client = self._run_deployment_step(
+                        task=step, node=node, ssh_client=ssh_client, max_tries=max_tries
+                    )
+                    duration = time.time() - start
+                    result.step_timings.append((step, duration))
+
+                    if progress_callback:
+                        progress_callback(node, step, duration)
+            except Exception as e:
+                result.error = DeploymentError(node=node, original_exception=e, driver=self)
+            finally:
+                try:
+                    ssh_client.close()
+                except Exception:
+                    pass
+
+            result.node = node
+            return result
+
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            futures = [executor.submit(run, node) for node in nodes]
+            return [future.result() for future in futures]
+
+    def _get_deployment_password(self, node, auth=None):
+        # type: (Node, Optional[T_Auth]) -> Optional[str]
+        """
+        Return the SSH password used to deploy the provided node.
+
+        The password from ``auth`` is used if it's a :class:`NodeAuthPassword`
+        and the password the driver generated for the node (``password`` in
+        ``node.extra``) is only used when no ``auth`` is provided.
+        """
+        if auth:
+            if isinstance(auth, NodeAuthPassword):
+                return auth.password
+
+            return None
+
+        return node.extra.get("password", None)
+
+    def _get_deployment_steps(self, task):
+        # type: (Deployment) -> List[Deployment]
+        """
+        Flatten (nested) :class:`MultiStepDeployment` tasks into a list of
+        steps.
+        """
+        from libcloud.compute.deployment import MultiStepDeployment
+
+        if not isinstance(task, MultiStepDeployment):
+            return [task]
+
+        return [step for child in task.steps for step in self._get_deployment_steps(child)]
+
     def reboot_node(self, node):
         # type: (Node) -> bool
         """
@@ -1329,6 +1683,82 @@ class NodeDriver(BaseDriver):
         """
         raise NotImplementedError("destroy_node not implemented for this driver")
 
+    ##
+    # Asyncio methods
+    ##
+
+    async def async_list_nodes(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`list_nodes`.
+
+        :rtype: ``list`` of :class:`.Node`
+        """
+        return await self._run_in_executor("list_nodes", *args, **kwargs)
+
+    async def async_list_sizes(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`list_sizes`.
+
+        :rtype: ``list`` of :class:`.NodeSize`
+        """
+        return await self._run_in_executor("list_sizes", *args, **kwargs)
+
+    async def async_list_locations(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`list_locations`.
+
+        :rtype: ``list`` of :class:`.NodeLocation`
+        """
+        return await self._run_in_executor("list_locations", *args, **kwargs)
+
+    async def async_list_images(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`list_images`.
+
+        :rtype: ``list`` of :class:`.NodeImage`
+        """
+        return await self._run_in_executor("list_images", *args, **kwargs)
+
+    async def async_create_node(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`create_node`.
+
+        :rtype: :class:`.Node`
+        """
+        return await self._run_in_executor("create_node", *args, **kwargs)
+
+    async def async_reboot_node(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`reboot_node`.
+
+        :rtype: ``bool``
+        """
+        return await self._run_in_executor("reboot_node", *args, **kwargs)
+
+    async def async_start_node(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`start_node`.
+
+        :rtype: ``bool``
+        """
+        return await self._run_in_executor("start_node", *args, **kwargs)
+
+    async def async_stop_node(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`stop_node`.
+
+        :rtype: ``bool``
+        """
+        return await self._run_in_executor("stop_node", *args, **kwargs)
+
+    async def async_destroy_node(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`destroy_node`.
+
+        :rtype: ``bool``
+        """
+        return await self._run_in_executor("destroy_node", *args, **kwargs)
+
     ##
     # Volume and snapshot management methods
     ##
@@ -1631,6 +2061,7 @@ class NodeDriver(BaseDriver):
         ssh_interface="public_ips",  # type: str
         force_ipv4=True,  # type: bool
         ex_list_nodes_kwargs=None,  # type: Optional[Dict]
+        max_wait_period=None,  # type: Optional[float]
     ):
         # type: (...) -> List[Tuple[Node, List[str]]]
         """
@@ -1639,11 +2070,19 @@ class NodeDriver(BaseDriver):
         Node is considered running when it's state is "running" and when it has
         at least one IP address assigned.
 
+        If the driver can retrieve specific nodes (see
+        ``supports_refresh_nodes`` and :meth:`_refresh_nodes`) and no
+        ``ex_list_nodes_kwargs`` are provided, only the provided nodes are
+        retrieved on each iteration. Otherwise all the nodes are listed.
+
+        If ``max_wait_period`` is provided, the wait period grows while none
+        of the nodes make progress, up to ``max_wait_period`` seconds.
+
         :param nodes: List of nodes to wait for.
         :type nodes: ``list`` of :class:`.Node`
 
         :param wait_period: How many seconds to wait between each loop
-                            iteration. (default is 3)
+                            iteration. (default is 5)
         :type wait_period: ``int``
 
         :param timeout: How many seconds to wait before giving up.
@@ -1663,11 +2102,23 @@ class NodeDriver(BaseDriver):
                                      method.
         :type ex_list_nodes_kwargs: ``dict``
 
+        :param max_wait_period: Upper bound for the wait period in seconds.
+                                By default the wait period doesn't grow.
+        :type max_wait_period: ``float``
+
         :return: ``[(Node, ip_addresses)]`` list of tuple of Node instance and
                  list of ip_address on success.
         :rtype: ``list`` of ``tuple``
         """
-        ex_list_nodes_kwargs = ex_list_nodes_kwargs or {}
+        if max_wait_period is None:
+            max_wait_period = wait_period
+
+        strategy = ExponentialBackoffPollingStrategy(
+            interval=wait_period,
+            max_interval=max(wait_period, max_wait_period),
+            backoff=1.5,
+            jitter=0,
+        )
 
         def is_supported(address):
             # type: (str) -> bool
@@ -1693,8 +2144,19 @@ class NodeDriver(BaseDriver):
 
         uuids = {node.uuid for node in nodes}
 
+        # Number of polls since the last time more nodes became ready
+        attempt = 0
+        ready_count = 0
+
         while time.time() < end:
-            all_nodes = self.list_nodes(**ex_list_nodes_kwargs)
+            all_nodes = None
+
+            if self.supports_refresh_nodes and not ex_list_nodes_kwargs:
+                all_nodes = self._refresh_nodes(nodes)
+
+            if all_nodes is None:
+                all_nodes = self.list_nodes(**(ex_list_nodes_kwargs or {}))
+
             matching_nodes = list(node for node in all_nodes if node.uuid in uuids)
 
             if len(matching_nodes) > len(uuids):
@@ -1715,12 +2177,35 @@ class NodeDriver(BaseDriver):
 
             if len(running_nodes) == len(uuids) == len(addresses):
                 return list(zip(running_nodes, addresses))
-            else:
-                time.sleep(wait_period)
-                continue
+
+            if len(addresses) > ready_count:
+                attempt = 0
+                ready_count = len(addresses)
+
+            attempt += 1
+            time.sleep(max(0, min(strategy.get_delay(attempt), end - time.time())))
 
         raise LibcloudError(value="Timed out after %s seconds" % (timeout), driver=self)
 
+    def _refresh_nodes(self, nodes):
+        # type: (List[Node]) -> Optional[List[Node]]
+        """
+        Retrieve the current state of the provided nodes.
+
+        Drivers for APIs which support ID-scoped queries override this method
+        and set ``supports_refresh_nodes`` so :meth:`wait_until_running`
+        doesn't need to list all the nodes on each iteration. Nodes which
+        can't be found (yet) are left out.
+
+        :param nodes: Nodes to retrieve.
+        :type nodes: ``list`` of :class:`.Node`
+
+        :return: List of nodes or None if the driver can't retrieve these
+                 specific nodes (e.g. because there are too many of them).
+        :rtype: ``list`` of :class:`.Node`
+        """
+        raise NotImplementedError("_refresh_nodes not implemented for this driver")
+
     def _get_and_check_auth(self, auth):
         # type: (T_Auth) -> T_Auth
         """
@@ -1905,6 +2390,22 @@ class NodeDriver(BaseDriver):
         :rtype: :class:`.Node`
         :return: ``Node`` Node instance on success.
         """
+        node, ssh_client = self._run_deployment_step(
+            task=task, node=node, ssh_client=ssh_client, max_tries=max_tries
+        )
+        ssh_client.close()
+        return node
+
+    def _run_deployment_step(self, task, node, ssh_client, max_tries=3):
+        # type: (Deployment, Node, BaseSSHClient, int) -> Tuple[Node, BaseSSHClient]
+        """
+        Run the deployment task and retry it up to ``max_tries`` times. The
+        SSH connection is re-established if it has been closed in the middle
+        of the task.
+
+        :return: Node instance and the (possibly re-connected) SSH client.
+        :rtype: ``tuple``
+        """
         tries = 0
 
         while tries < max_tries:
@@ -1939,10 +2440,9 @@ class NodeDriver(BaseDriver):
                     )
             else:
                 # Deployment succeeded
-                ssh_client.close()
-                return node
+                return node, ssh_client
 
-        return node
+        return node, ssh_client
 
     def _get_size_price(self, size_id):
         # type: (str) -> Optional[float]
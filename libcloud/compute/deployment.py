@@ -21,7 +21,7 @@ Provides generic deployment steps for machines post boot.
 import os
 import re
 import binascii
-from typing import IO, List, Union, Optional, cast
+from typing import IO, List, Union, Callable, Optional, cast
 
 from libcloud.utils.py3 import basestring
 from libcloud.compute.ssh import BaseSSHClient
@@ -148,6 +148,9 @@ class ScriptDeployment(Deployment):
         name=None,  # type: Optional[str]
         delete=False,  # type bool
         timeout=None,  # type: Optional[float]
+        stdout_callback=None,  # type: Optional[Callable[[str], None]]
+        stderr_callback=None,  # type: Optional[Callable[[str], None]]
+        max_output_size=None,  # type: Optional[int]
     ):
         # type: (...) -> None
         """
@@ -167,6 +170,21 @@ class ScriptDeployment(Deployment):
 
         :param timeout: Optional run timeout for this command.
         :type timeout: ``float``
+
+        :param stdout_callback: Optional function which is called with the
+                                script stdout as it's being received.
+        :type stdout_callback: ``callable``
+
+        :param stderr_callback: Optional function which is called with the
+                                script stderr as it's being received.
+        :type stderr_callback: ``callable``
+
+        :param max_output_size: Optional maximum number of characters of
+                                stdout and stderr which are kept in memory
+                                (and stored on this object). If the script
+                                produces more output, only the end of it is
+                                kept.
+        :type max_output_size: ``int``
         """
         script = self._get_string_value(argument_name="script", argument_value=script)
 
@@ -177,6 +195,9 @@ class ScriptDeployment(Deployment):
         self.exit_status = None  # type: Optional[int]
         self.delete = delete
         self.timeout = timeout
+        self.stdout_callback = stdout_callback
+        self.stderr_callback = stderr_callback
+        self.max_output_size = max_output_size
         self.name = name  # type: Optional[str]
 
         if self.name is None:
@@ -216,7 +237,20 @@ class ScriptDeployment(Deployment):
         else:
             cmd = name
 
-        self.stdout, self.stderr, self.exit_status = client.run(cmd, timeout=self.timeout)
+        run_kwargs = {}
+
+        # Output streaming is only supported by some of the clients so those
+        # arguments are only passed when they are used
+        if self.stdout_callback or self.stderr_callback or self.max_output_size:
+            run_kwargs = {
+                "stdout_callback": self.stdout_callback,
+                "stderr_callback": self.stderr_callback,
+                "max_buffer_size": self.max_output_size,
+            }
+
+        self.stdout, self.stderr, self.exit_status = client.run(
+            cmd, timeout=self.timeout, **run_kwargs
+        )
 
         if self.delete:
             client.delete(self.name)
@@ -259,6 +293,9 @@ class ScriptFileDeployment(ScriptDeployment):
         name=None,  # type: Optional[str]
         delete=False,  # type bool
         timeout=None,  # type: Optional[float]
+        stdout_callback=None,  # type: Optional[Callable[[str], None]]
+        stderr_callback=None,  # type: Optional[Callable[[str], None]]
+        max_output_size=None,  # type: Optional[int]
     ):
         # type: (...) -> None
         """
@@ -279,6 +316,9 @@ class ScriptFileDeployment(ScriptDeployment):
 
         :param timeout: Optional run timeout for this command.
         :type timeout: ``float``
+
+        See :class:`ScriptDeployment` for the description of the output
+        arguments.
         """
         with open(script_file, "rb") as fp:
             content = fp.read()  # type: Union[bytes, str]
@@ -286,7 +326,16 @@ class ScriptFileDeployment(ScriptDeployment):
         content = cast(bytes, content)
         content = content.decode("utf-8")
 
-        super().__init__(script=content, args=args, name=name, delete=delete, timeout=timeout)
+        super().__init__(
+            script=content,
+            args=args,
+            name=name,
+            delete=delete,
+            timeout=timeout,
+            stdout_callback=stdout_callback,
+            stderr_callback=stderr_callback,
+            max_output_size=max_output_size,
+        )
 
 
 class MultiStepDeployment(Deployment):
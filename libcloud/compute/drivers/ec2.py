@@ -17,17 +17,21 @@
 Amazon EC2, Eucalyptus, Nimbus and Outscale drivers.
 """
 
+import os
 import re
 import copy
+import json
 import time
 import base64
 import warnings
 from typing import List
+from concurrent.futures import ThreadPoolExecutor
 
 from libcloud.pricing import get_size_price
 from libcloud.utils.py3 import ET, b, basestring, ensure_string
 from libcloud.utils.xml import findall, findattr, findtext, fixxpath
 from libcloud.common.aws import DEFAULT_SIGNATURE_VERSION, AWSBaseResponse, SignedAWSConnection
+from libcloud.common.base import RawResponse
 from libcloud.common.types import LibcloudError, InvalidCredsError, MalformedResponseError
 from libcloud.compute.base import (
     Node,
@@ -92,6 +96,21 @@ EUCA_NAMESPACE = "http://msgs.eucalyptus.com/%s" % (DEFAULT_EUCA_API_VERSION)
 DEFAULT_OUTSCALE_API_VERSION = "2016-04-01"
 OUTSCALE_NAMESPACE = "http://api.outscale.com/wsdl/fcuext/2014-04-15/"
 
+# Compact catalog of the instance types and the instance types available in each
+# region. It's generated by contrib/scrape-ec2-sizes.py from the same data as
+# the libcloud.compute.constants.ec2_* modules, but it's much faster to load.
+SIZES_CATALOG_FILE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data/ec2_sizes.json",
+)
+
+# Catalog loaded from SIZES_CATALOG_FILE_PATH which is shared by all the driver
+# instances. It should be treated as read-only.
+_SIZES_CATALOG = None
+
+# Maximum number of values which can be passed to a single filter
+MAX_FILTER_VALUES = 200
+
 # Add Nimbus region
 REGION_DETAILS_NIMBUS = {
     # Nimbus clouds have 3 EC2-style instance types but their particular
@@ -827,6 +846,26 @@ VALID_EC2_REGIONS = REGION_DETAILS_PARTIAL.keys()
 VALID_VOLUME_TYPES = ["standard", "io1", "io2", "gp2", "gp3", "st1", "sc1"]
 
 
+def get_sizes_catalog():
+    """
+    Return the EC2 instance types catalog.
+
+    The catalog is loaded from :data:`SIZES_CATALOG_FILE_PATH` on first use and
+    cached in memory. It contains two keys - ``instance_types`` which maps an
+    instance type to the size attributes and ``regions`` which maps a region
+    name to the list of instance types available in that region.
+
+    :rtype: ``dict``
+    """
+    global _SIZES_CATALOG
+
+    if _SIZES_CATALOG is None:
+        with open(SIZES_CATALOG_FILE_PATH) as fp:
+            _SIZES_CATALOG = json.load(fp)
+
+    return _SIZES_CATALOG
+
+
 class EC2NodeLocation(NodeLocation):
     def __init__(self, id, name, country, driver, availability_zone):
         super().__init__(id, name, country, driver)
@@ -851,8 +890,12 @@ class EC2Response(AWSBaseResponse):
         if self.status == 403 and self.body[: len(msg)] == msg:
             raise InvalidCredsError(msg)
 
+        # Reading the body of a raw response already raises the parsed error
+        # so it's read outside of the try block
+        body = self.body
+
         try:
-            body = ET.XML(self.body)
+            body = ET.XML(body)
         except Exception:
             raise MalformedResponseError(
                 "Failed to parse XML", body=self.body, driver=EC2NodeDriver
@@ -884,6 +927,10 @@ class EC2Response(AWSBaseResponse):
         return "\n".join(err_list)
 
 
+class EC2RawResponse(EC2Response, RawResponse):
+    pass
+
+
 class EC2Connection(SignedAWSConnection):
     """
     Represents a single connection to the EC2 Endpoint.
@@ -892,6 +939,7 @@ class EC2Connection(SignedAWSConnection):
     version = API_VERSION
     host = REGION_DETAILS_PARTIAL["us-east-1"]["endpoint"]
     responseCls = EC2Response
+    rawResponseCls = EC2RawResponse
     service_name = "ec2"
 
 
@@ -1078,6 +1126,46 @@ class ElasticIP:
         )
 
 
+class ElasticIPIndex:
+    """
+    Elastic IP addresses indexed by the identifier of the instance they are
+    associated with.
+
+    :param      addresses: Elastic IP addresses.
+    :type       addresses: ``list`` of :class:`ElasticIP`
+    """
+
+    def __init__(self, addresses):
+        self.addresses = addresses
+        self._instance_addresses = {}
+
+        for address in addresses:
+            if address.instance_id:
+                self._instance_addresses.setdefault(address.instance_id, []).append(address)
+
+    def get_addresses(self, instance_id):
+        """
+        Return the addresses associated with the provided instance.
+
+        :rtype: ``list`` of :class:`ElasticIP`
+        """
+        return list(self._instance_addresses.get(instance_id, []))
+
+    def get_ips(self, instance_id):
+        """
+        Return the IPs of the addresses associated with the provided instance.
+
+        :rtype: ``list`` of ``str``
+        """
+        return [address.ip for address in self._instance_addresses.get(instance_id, [])]
+
+    def __repr__(self):
+        return ("<ElasticIPIndex: addresses=%s, instances=%s>") % (
+            len(self.addresses),
+            len(self._instance_addresses),
+        )
+
+
 class VPCInternetGateway:
     """
     Class which stores information about VPC Internet Gateways.
@@ -1297,6 +1385,23 @@ class BaseEC2NodeDriver(NodeDriver):
     region_name = ""
     country = ""
     signature_version = DEFAULT_SIGNATURE_VERSION
+    supports_refresh_nodes = True
+
+    # Number of items requested per page (``MaxResults``) by the paginated
+    # ``Describe*`` calls. None means the parameter is not sent and the API
+    # decides on the page size.
+    page_size = None
+
+    # Set to True to parse DescribeInstances responses incrementally as they
+    # are read from the connection instead of building the whole element tree
+    iterparse_list_responses = False
+
+    # Number of seconds for which the Elastic IP address index returned by
+    # ex_get_address_index is cached and reused by the other address lookups.
+    # 0 disables caching.
+    address_index_ttl = 0
+
+    _address_index = None
 
     NODE_STATE_MAP = {
         "pending": NodeState.PENDING,
@@ -1340,7 +1445,118 @@ class BaseEC2NodeDriver(NodeDriver):
 
         :rtype: ``list`` of :class:`Node`
         """
+        return list(self.iterate_nodes(ex_node_ids=ex_node_ids, ex_filters=ex_filters))
+
+    def iterate_nodes(
+        self, ex_node_ids=None, ex_filters=None, ex_page_size=None, ex_prefetch=False
+    ):
+        """
+        Return a generator of nodes.
+
+        Nodes are retrieved page by page (``NextToken`` is followed until
+        the last page is reached) and yielded as soon as a page has been
+        retrieved so the whole result set doesn't need to be held in memory.
+
+        :param      ex_node_ids: List of ``node.id``
+        :type       ex_node_ids: ``list`` of ``str``
+
+        :param      ex_filters: The filters so that the list includes
+                                information for certain nodes only.
+        :type       ex_filters: ``dict``
+
+        :param      ex_page_size: Maximum number of nodes retrieved per
+                                  request. Defaults to :attr:`page_size`.
+                                  Ignored if ``ex_node_ids`` is provided
+                                  since the API doesn't allow both.
+        :type       ex_page_size: ``int``
+
+        :param      ex_prefetch: True to retrieve the next page in a
+                                 background thread while the nodes of the
+                                 current page are being consumed. Pages are
+                                 then parsed as a whole even if
+                                 :attr:`iterparse_list_responses` is set.
+        :type       ex_prefetch: ``bool``
+
+        :return: A generator of Node instances.
+        :rtype: ``generator`` of :class:`Node`
+        """
+        params = self._get_list_nodes_params(ex_node_ids=ex_node_ids, ex_filters=ex_filters)
+        page_size = None if ex_node_ids else ex_page_size or self.page_size
+
+        if self.iterparse_list_responses and not ex_prefetch:
+            reservations = self._iterparse_paginated_responses(
+                params, xpath="reservationSet/item", page_size=page_size
+            )
+            nodes_lists = (self._to_nodes(elem, "instancesSet/item") for elem in reservations)
+        else:
+            pages = self._iterate_paginated_responses(
+                params, page_size=page_size, prefetch=ex_prefetch
+            )
+            nodes_lists = (self._to_reservations_nodes(elem) for elem in pages)
+
+        # Elastic IP addresses are retrieved once for the whole listing
+        address_index = None
 
+        for nodes in nodes_lists:
+            if nodes and address_index is None:
+                address_index = self._get_list_nodes_address_index()
+
+            if nodes:
+                nodes_elastic_ips_mappings = self._to_nodes_elastic_ip_mappings(
+                    address_index, nodes
+                )
+                self._add_elastic_ips_to_nodes(nodes, nodes_elastic_ips_mappings)
+
+            yield from nodes
+
+    def _refresh_nodes(self, nodes):
+        """
+        Instances are retrieved using an ``instance-id`` filter instead of
+        ``InstanceId`` parameters because the filter doesn't fail the request
+        for instances which aren't visible yet.
+
+        @inherits: :class:`NodeDriver._refresh_nodes`
+        """
+        node_ids = [node.id for node in nodes]
+        result = []
+
+        for index in range(0, len(node_ids), MAX_FILTER_VALUES):
+            filters = {"instance-id": node_ids[index : index + MAX_FILTER_VALUES]}
+            result.extend(self.list_nodes(ex_filters=filters))
+
+        return result
+
+    async def async_list_nodes(self, ex_node_ids=None, ex_filters=None):
+        """
+        Asynchronous version of :meth:`list_nodes`.
+
+        :rtype: ``list`` of :class:`Node`
+        """
+        params = self._get_list_nodes_params(ex_node_ids=ex_node_ids, ex_filters=ex_filters)
+
+        if self.page_size and not ex_node_ids:
+            params["MaxResults"] = self.page_size
+
+        nodes = []
+
+        while True:
+            response = await self.async_connection.request(self.path, params=params)
+            nodes.extend(self._to_reservations_nodes(response.object))
+
+            token = findtext(element=response.object, xpath="nextToken", namespace=NAMESPACE)
+
+            if not token:
+                break
+
+            params["NextToken"] = token
+
+        # Elastic IP addresses are retrieved once for all the pages
+        nodes_elastic_ips_mappings = await self.async_ex_describe_addresses(nodes)
+        self._add_elastic_ips_to_nodes(nodes, nodes_elastic_ips_mappings)
+
+        return nodes
+
+    def _get_list_nodes_params(self, ex_node_ids=None, ex_filters=None):
         params = {"Action": "DescribeInstances"}
 
         if ex_node_ids:
@@ -1349,33 +1565,139 @@ class BaseEC2NodeDriver(NodeDriver):
         if ex_filters:
             params.update(self._build_filters(ex_filters))
 
-        elem = self.connection.request(self.path, params=params).object
+        return params
 
+    def _to_reservations_nodes(self, elem):
         nodes = []
         for rs in findall(element=elem, xpath="reservationSet/item", namespace=NAMESPACE):
             nodes += self._to_nodes(rs, "instancesSet/item")
 
-        nodes_elastic_ips_mappings = self.ex_describe_addresses(nodes)
+        return nodes
 
+    def _get_list_nodes_address_index(self):
+        """
+        Return the Elastic IP address index used to add the addresses to the
+        nodes returned by :meth:`iterate_nodes`.
+
+        :rtype: :class:`ElasticIPIndex`
+        """
+        return self.ex_get_address_index()
+
+    def _add_elastic_ips_to_nodes(self, nodes, nodes_elastic_ips_mappings):
         for node in nodes:
             ips = nodes_elastic_ips_mappings[node.id]
             node.public_ips.extend(ips)
 
-        return nodes
+    def _iterparse_paginated_responses(self, params, xpath, page_size=None):
+        """
+        Issue a paginated ``Describe*`` request and incrementally parse the
+        responses, yielding the elements at the provided path as soon as
+        they have been read from the connection.
 
-    def list_sizes(self, location=None):
-        # NOTE: Those two imports are intentionally here and made lazy to
-        # avoid importing massive constant file in case it's not actually
-        # needed
-        from libcloud.compute.constants.ec2_instance_types import INSTANCE_TYPES
-        from libcloud.compute.constants.ec2_region_details_complete import REGION_DETAILS
+        :param params: Request parameters.
+        :type params: ``dict``
+
+        :param xpath: Path of the elements relative to the root element.
+        :type xpath: ``str``
+
+        :param page_size: Value of the ``MaxResults`` parameter.
+        :type page_size: ``int``
+
+        :rtype: ``generator`` of :class:`Element`
+        """
+        params = dict(params)
+
+        if page_size:
+            params["MaxResults"] = page_size
+
+        while True:
+            response = self.connection.request(self.path, params=params, raw=True, stream=True)
+
+            try:
+                elems = response.iterparse_body(xpath=xpath, namespace=NAMESPACE)
+                yield from elems
+            finally:
+                # Release the connection also when the caller stops iterating
+                # before the whole page has been read
+                response.close()
+
+            token = findtext(element=elems.root, xpath="nextToken", namespace=NAMESPACE)
+
+            if not token:
+                break
+
+            params["NextToken"] = token
+
+    def _iterate_paginated_responses(self, params, page_size=None, prefetch=False):
+        """
+        Issue a paginated ``Describe*`` request and yield the parsed response
+        of every page.
+
+        ``NextToken`` is followed until a response without ``nextToken`` is
+        returned.
+
+        :param params: Request parameters.
+        :type params: ``dict``
+
+        :param page_size: Value of the ``MaxResults`` parameter. If not
+                          provided, the parameter is not sent and the API
+                          decides on the page size.
+        :type page_size: ``int``
+
+        :param prefetch: True to request the next page in a background
+                         thread while the current one is being processed.
+        :type prefetch: ``bool``
+
+        :rtype: ``generator`` of :class:`Element`
+        """
+        params = dict(params)
+
+        if page_size:
+            params["MaxResults"] = page_size
+
+        def get_page(connection, token):
+            page_params = dict(params)
 
-        available_types = REGION_DETAILS[self.region_name]["instance_types"]
+            if token:
+                page_params["NextToken"] = token
+
+            return connection.request(self.path, params=page_params).object
+
+        def get_page_in_thread(token):
+            return get_page(self._get_thread_connection(), token)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+        try:
+            elem = get_page(self.connection, None)
+
+            while True:
+                token = findtext(element=elem, xpath="nextToken", namespace=NAMESPACE)
+                next_page = None
+
+                if token and executor:
+                    next_page = executor.submit(get_page_in_thread, token)
+
+                yield elem
+
+                if not token:
+                    break
+
+                if next_page:
+                    elem = next_page.result()
+                else:
+                    elem = get_page(self.connection, token)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def list_sizes(self, location=None):
+        catalog = get_sizes_catalog()
+        available_types = catalog["regions"][self.region_name]
         sizes = []
 
         for instance_type in available_types:
-            attributes = INSTANCE_TYPES[instance_type]
-            attributes = copy.deepcopy(attributes)
+            attributes = self._get_size_attributes(catalog, instance_type)
             try:
                 # we are only interested in pure size price so linux
                 price = get_size_price(
@@ -1394,6 +1716,15 @@ class BaseEC2NodeDriver(NodeDriver):
             sizes.append(NodeSize(driver=self, **attributes))
         return sizes
 
+    def _get_size_attributes(self, catalog, instance_type):
+        # Catalog entries are shared so they are copied. Only "extra" is a
+        # nested dictionary (with scalar values) so a shallow copy of both is
+        # enough and much cheaper than a deep copy.
+        attributes = dict(catalog["instance_types"][instance_type])
+        attributes["extra"] = dict(attributes["extra"])
+
+        return attributes
+
     def list_images(
         self,
         location=None,
@@ -1441,6 +1772,36 @@ class BaseEC2NodeDriver(NodeDriver):
 
         :rtype: ``list`` of :class:`NodeImage`
         """
+        return list(
+            self.iterate_images(
+                location=location,
+                ex_image_ids=ex_image_ids,
+                ex_owner=ex_owner,
+                ex_executableby=ex_executableby,
+                ex_filters=ex_filters,
+            )
+        )
+
+    def iterate_images(
+        self,
+        location=None,
+        ex_image_ids=None,
+        ex_owner=None,
+        ex_executableby=None,
+        ex_filters=None,
+        ex_page_size=None,
+        ex_prefetch=False,
+    ):
+        """
+        Return a generator of images.
+
+        Images are retrieved page by page and yielded as soon as a page has
+        been retrieved. See :meth:`list_images` for the description of the
+        filtering arguments and :meth:`iterate_nodes` for the description of
+        ``ex_page_size`` and ``ex_prefetch``.
+
+        :rtype: ``generator`` of :class:`NodeImage`
+        """
         params = {"Action": "DescribeImages"}
 
         if ex_owner:
@@ -1457,8 +1818,12 @@ class BaseEC2NodeDriver(NodeDriver):
         if ex_filters:
             params.update(self._build_filters(ex_filters))
 
-        images = self._to_images(self.connection.request(self.path, params=params).object)
-        return images
+        page_size = None if ex_image_ids else ex_page_size or self.page_size
+
+        for elem in self._iterate_paginated_responses(
+            params, page_size=page_size, prefetch=ex_prefetch
+        ):
+            yield from self._to_images(elem)
 
     def get_image(self, image_id):
         """
@@ -1512,11 +1877,14 @@ class BaseEC2NodeDriver(NodeDriver):
         if node or ex_filters:
             params.update(self._build_filters(ex_filters))
 
-        response = self.connection.request(self.path, params=params).object
-        volumes = [
-            self._to_volume(el)
-            for el in response.findall(fixxpath(xpath="volumeSet/item", namespace=NAMESPACE))
-        ]
+        volumes = []
+
+        for elem in self._iterate_paginated_responses(params, page_size=self.page_size):
+            volumes.extend(
+                self._to_volume(el)
+                for el in elem.findall(fixxpath(xpath="volumeSet/item", namespace=NAMESPACE))
+            )
+
         return volumes
 
     def create_node(
@@ -1765,18 +2133,64 @@ class BaseEC2NodeDriver(NodeDriver):
         else:
             return nodes
 
+    def _get_create_nodes_batches(self, specs):
+        """
+        Group identical specs so all the nodes in a group are launched with
+        a single RunInstances request.
+
+        @inherits: :class:`NodeDriver._get_create_nodes_batches`
+        """
+        batches = []
+
+        for index, spec in enumerate(specs):
+            batch = None
+
+            if "ex_mincount" not in spec and "ex_maxcount" not in spec:
+                batch = next((b for b in batches if specs[b[0]] == spec), None)
+
+            if batch is None:
+                batches.append([index])
+            else:
+                batch.append(index)
+
+        return batches
+
+    def _create_nodes_batch(self, specs):
+        """
+        @inherits: :class:`NodeDriver._create_nodes_batch`
+        """
+        if len(specs) == 1:
+            return [self.create_node(**specs[0])]
+
+        # Specs in a batch are identical, MinCount makes the request fail
+        # unless all the instances can be launched
+        nodes = self.create_node(ex_mincount=len(specs), ex_maxcount=len(specs), **specs[0])
+        return nodes if isinstance(nodes, list) else [nodes]
+
     def reboot_node(self, node):
         params = {"Action": "RebootInstances"}
         params.update(self._pathlist("InstanceId", [node.id]))
         res = self.connection.request(self.path, params=params).object
         return self._get_boolean(res)
 
+    async def async_reboot_node(self, node):
+        params = {"Action": "RebootInstances"}
+        params.update(self._pathlist("InstanceId", [node.id]))
+        response = await self.async_connection.request(self.path, params=params)
+        return self._get_boolean(response.object)
+
     def destroy_node(self, node):
         params = {"Action": "TerminateInstances"}
         params.update(self._pathlist("InstanceId", [node.id]))
         res = self.connection.request(self.path, params=params).object
         return self._get_terminate_boolean(res)
 
+    async def async_destroy_node(self, node):
+        params = {"Action": "TerminateInstances"}
+        params.update(self._pathlist("InstanceId", [node.id]))
+        response = await self.async_connection.request(self.path, params=params)
+        return self._get_terminate_boolean(response.object)
+
     def create_volume(
         self,
         size,
@@ -1963,8 +2377,13 @@ class BaseEC2NodeDriver(NodeDriver):
             params.update({"SnapshotId.1": snapshot.id})
         if owner:
             params.update({"Owner.1": owner})
-        response = self.connection.request(self.path, params=params).object
-        snapshots = self._to_snapshots(response)
+
+        page_size = None if snapshot else self.page_size
+        snapshots = []
+
+        for elem in self._iterate_paginated_responses(params, page_size=page_size):
+            snapshots.extend(self._to_snapshots(elem))
+
         return snapshots
 
     def destroy_volume_snapshot(self, snapshot):
@@ -3226,6 +3645,7 @@ class BaseEC2NodeDriver(NodeDriver):
             params["Domain"] = domain
 
         response = self.connection.request(self.path, params=params).object
+        self._address_index = None
 
         return self._to_address(response, only_associated=False)
 
@@ -3254,6 +3674,8 @@ class BaseEC2NodeDriver(NodeDriver):
             params["AllocationId"] = elastic_ip.extra["allocation_id"]
 
         response = self.connection.request(self.path, params=params).object
+        self._address_index = None
+
         return self._get_boolean(response)
 
     def ex_describe_all_addresses(self, only_associated=False):
@@ -3268,13 +3690,54 @@ class BaseEC2NodeDriver(NodeDriver):
         :return:  List of Elastic IP addresses.
         :rtype:   ``list`` of :class:`ElasticIP`
         """
-        params = {"Action": "DescribeAddresses"}
+        addresses = self.ex_get_address_index().addresses
 
-        response = self.connection.request(self.path, params=params).object
+        if only_associated:
+            addresses = [address for address in addresses if address.instance_id]
+
+        return list(addresses)
+
+    def ex_get_address_index(self, refresh=False):
+        """
+        Returns all the Elastic IP addresses for this account indexed by the
+        identifier of the instance they are associated with.
+
+        If :attr:`address_index_ttl` is set, the index is cached for that
+        many seconds and shared by :meth:`list_nodes`,
+        :meth:`ex_describe_addresses`, :meth:`ex_describe_addresses_for_node`
+        and :meth:`ex_describe_all_addresses`. Allocating, releasing,
+        associating and disassociating an address invalidates the cache.
+
+        :param    refresh: True to ignore the cached index.
+        :type     refresh: ``bool``
+
+        :rtype:   :class:`ElasticIPIndex`
+        """
+        index = None if refresh else self._get_cached_address_index()
+
+        if index is None:
+            params = {"Action": "DescribeAddresses"}
+            response = self.connection.request(self.path, params=params).object
+
+            index = self._to_address_index(response)
+            self._set_cached_address_index(index)
 
-        # We will send our only_associated boolean over to
-        # shape how the return data is sent back
-        return self._to_addresses(response, only_associated)
+        return index
+
+    def _get_cached_address_index(self):
+        if not self.address_index_ttl or not self._address_index:
+            return None
+
+        timestamp, index = self._address_index
+
+        if time.time() - timestamp >= self.address_index_ttl:
+            return None
+
+        return index
+
+    def _set_cached_address_index(self, index):
+        if self.address_index_ttl:
+            self._address_index = (time.time(), index)
 
     def ex_associate_address_with_node(self, node, elastic_ip, domain=None):
         """
@@ -3305,6 +3768,8 @@ class BaseEC2NodeDriver(NodeDriver):
             params.update({"AllocationId": elastic_ip.extra["allocation_id"]})
 
         response = self.connection.request(self.path, params=params).object
+        self._address_index = None
+
         association_id = findtext(element=response, xpath="associationId", namespace=NAMESPACE)
         return association_id
 
@@ -3342,6 +3807,8 @@ class BaseEC2NodeDriver(NodeDriver):
             params["AssociationId"] = elastic_ip.extra["association_id"]
 
         res = self.connection.request(self.path, params=params).object
+        self._address_index = None
+
         return self._get_boolean(res)
 
     def ex_describe_addresses(self, nodes):
@@ -3359,29 +3826,49 @@ class BaseEC2NodeDriver(NodeDriver):
         if not nodes:
             return {}
 
-        params = {"Action": "DescribeAddresses"}
+        if len(nodes) > 1:
+            return self._to_nodes_elastic_ip_mappings(self.ex_get_address_index(), nodes)
 
-        if len(nodes) == 1:
-            self._add_instance_filter(params, nodes[0])
+        index = self._get_cached_address_index()
 
-        result = self.connection.request(self.path, params=params).object
+        if index is None:
+            params = self._get_describe_addresses_params(nodes)
+            result = self.connection.request(self.path, params=params).object
+            index = self._to_address_index(result)
 
-        node_instance_ids = [node.id for node in nodes]
-        nodes_elastic_ip_mappings = {}
+        return self._to_nodes_elastic_ip_mappings(index, nodes)
 
-        # We will set only_associated to True so that we only get back
-        # IPs which are associated with instances
-        only_associated = True
+    async def async_ex_describe_addresses(self, nodes):
+        """
+        Asynchronous version of :meth:`ex_describe_addresses`.
 
-        for node_id in node_instance_ids:
-            nodes_elastic_ip_mappings.setdefault(node_id, [])
-            for addr in self._to_addresses(result, only_associated):
-                instance_id = addr.instance_id
+        :rtype: ``dict``
+        """
+        if not nodes:
+            return {}
 
-                if node_id == instance_id:
-                    nodes_elastic_ip_mappings[instance_id].append(addr.ip)
+        index = self._get_cached_address_index()
 
-        return nodes_elastic_ip_mappings
+        if index is None:
+            params = self._get_describe_addresses_params(nodes)
+            response = await self.async_connection.request(self.path, params=params)
+            index = self._to_address_index(response.object)
+
+            if len(nodes) > 1:
+                self._set_cached_address_index(index)
+
+        return self._to_nodes_elastic_ip_mappings(index, nodes)
+
+    def _get_describe_addresses_params(self, nodes):
+        params = {"Action": "DescribeAddresses"}
+
+        if len(nodes) == 1:
+            self._add_instance_filter(params, nodes[0])
+
+        return params
+
+    def _to_nodes_elastic_ip_mappings(self, index, nodes):
+        return {node.id: index.get_ips(node.id) for node in nodes}
 
     def ex_describe_addresses_for_node(self, node):
         """
@@ -4697,6 +5184,9 @@ class BaseEC2NodeDriver(NodeDriver):
 
         return addresses
 
+    def _to_address_index(self, response):
+        return ElasticIPIndex(self._to_addresses(response, only_associated=False))
+
     def _to_address(self, element, only_associated):
         instance_id = findtext(element=element, xpath="instanceId", namespace=NAMESPACE)
 
@@ -5365,6 +5855,7 @@ class EC2NodeDriver(BaseEC2NodeDriver):
     name = "Amazon EC2"
     website = "http://aws.amazon.com/ec2/"
     path = "/"
+    page_size = 500
 
     NODE_STATE_MAP = {
         "pending": NodeState.PENDING,
@@ -5547,14 +6038,12 @@ class NimbusNodeDriver(BaseEC2NodeDriver):
     signature_version = "2"
 
     def list_sizes(self, location=None):
-        from libcloud.compute.constants.ec2_instance_types import INSTANCE_TYPES
-
+        catalog = get_sizes_catalog()
         available_types = REGION_DETAILS_NIMBUS["instance_types"]
         sizes = []
 
         for instance_type in available_types:
-            attributes = INSTANCE_TYPES[instance_type]
-            attributes = copy.deepcopy(attributes)
+            attributes = self._get_size_attributes(catalog, instance_type)
             attributes["price"] = None  # pricing not available
             sizes.append(NodeSize(driver=self, **attributes))
 
@@ -5572,6 +6061,22 @@ class NimbusNodeDriver(BaseEC2NodeDriver):
             nodes_elastic_ip_mappings[node.id] = []
         return nodes_elastic_ip_mappings
 
+    def _get_list_nodes_address_index(self):
+        """
+        Nimbus doesn't support elastic IPs, so the index is empty.
+
+        @inherits: :class:`EC2NodeDriver._get_list_nodes_address_index`
+        """
+        return ElasticIPIndex([])
+
+    async def async_ex_describe_addresses(self, nodes):
+        """
+        Nimbus doesn't support elastic IPs, so this is a pass-through.
+
+        @inherits: :class:`EC2NodeDriver.async_ex_describe_addresses`
+        """
+        return self.ex_describe_addresses(nodes)
+
     def ex_create_tags(self, resource, tags):
         """
         Nimbus doesn't support creating tags, so this is a pass-through.
@@ -18,15 +18,19 @@ Module for Google Compute Engine Driver.
 """
 
 
+import re
 import sys
+import copy
 import time
 import datetime
 import itertools
 
+from libcloud.http import ThreadLocalAttribute
 from libcloud.pricing import get_pricing
-from libcloud.common.base import LazyObject
+from libcloud.common.base import LazyObject, PollingStrategy
 from libcloud.common.types import LibcloudError
 from libcloud.compute.base import (
+    REFRESH_NODES_MAX_REQUESTS,
     Node,
     NodeSize,
     NodeImage,
@@ -51,6 +55,12 @@ from libcloud.compute.providers import Provider
 API_VERSION = "v1"
 DEFAULT_TASK_COMPLETION_TIMEOUT = 180
 
+# Maximum number of operations whose status is requested with a single
+# filtered list request
+OPERATIONS_POLL_BATCH_SIZE = 50
+
+ZONE_OPERATION_RE = re.compile(r"^(?P<collection>.*/zones/[^/]+/operations)/(?P<name>[^/?]+)$")
+
 
 def timestamp_to_datetime(timestamp):
     """
@@ -104,6 +114,9 @@ class GCEConnection(GoogleBaseConnection):
     host = "www.googleapis.com"
     responseCls = GCEResponse
 
+    # Paging parameters are part of the request state
+    gce_params = ThreadLocalAttribute()
+
     def __init__(
         self,
         user_id,
@@ -155,6 +168,60 @@ class GCEConnection(GoogleBaseConnection):
 
         return {"items": items}
 
+    def poll_many(self, poll_request_kwargs):
+        """
+        Poll the status of multiple operations.
+
+        Pending operations which belong to the same zone are retrieved with a
+        single filtered list request instead of one request per operation.
+        Other operations and operations which have failed are polled one by
+        one so errors are raised the same way as by :meth:`async_request`.
+
+        @inherits: :class:`GoogleBaseConnection.poll_many`
+        """
+        pending = {}
+
+        for kwargs in poll_request_kwargs:
+            match = ZONE_OPERATION_RE.match(kwargs["action"])
+            if match:
+                names = pending.setdefault(match.group("collection"), [])
+                names.append(match.group("name"))
+
+        operations = {}
+
+        for collection, names in pending.items():
+            if len(names) < 2:
+                continue
+
+            names = sorted(set(names))
+            for index in range(0, len(names), OPERATIONS_POLL_BATCH_SIZE):
+                batch = names[index : index + OPERATIONS_POLL_BATCH_SIZE]
+                params = {
+                    "filter": " OR ".join('(name = "%s")' % (name) for name in batch),
+                    "maxResults": len(batch),
+                }
+                response = self.request(collection, method="GET", params=params)
+
+                for item in response.object.get("items", []):
+                    operations[(collection, item["name"])] = (response, item)
+
+        responses = []
+
+        for kwargs in poll_request_kwargs:
+            match = ZONE_OPERATION_RE.match(kwargs["action"])
+            key = match and (match.group("collection"), match.group("name"))
+
+            if key in operations and "error" not in operations[key][1]:
+                list_response, item = operations[key]
+                response = copy.copy(list_response)
+                response.object = item
+            else:
+                response = self.request(**kwargs)
+
+            responses.append(response)
+
+        return responses
+
     def request(self, *args, **kwargs):
         """
         Perform request then do GCE-specific processing of URL params.
@@ -1911,6 +1978,7 @@ class GCENodeDriver(NodeDriver):
     type = Provider.GCE
     website = "https://cloud.google.com/"
     features = {"create_node": ["ssh_key"]}
+    supports_refresh_nodes = True
 
     # Google Compute Engine node states are mapped to Libcloud node states
     # per the following dict. GCE does not have an actual 'stopped' state
@@ -2791,6 +2859,29 @@ class GCENodeDriver(NodeDriver):
         self._ex_volume_dict = {}
         return list_nodes
 
+    def _refresh_nodes(self, nodes):
+        """
+        Instances are retrieved one by one from their zone, so all the
+        instances are listed instead when waiting for many of them.
+
+        @inherits: :class:`NodeDriver._refresh_nodes`
+        """
+        if len(nodes) > REFRESH_NODES_MAX_REQUESTS:
+            return None
+
+        if not all(node.extra.get("zone") for node in nodes):
+            return None
+
+        result = []
+
+        for node in nodes:
+            try:
+                result.append(self.ex_get_node(node.name, node.extra["zone"]))
+            except ResourceNotFoundError:
+                continue
+
+        return result
+
     def ex_list_regions(self):
         """
         Return the list of regions.
@@ -5311,7 +5402,7 @@ class GCENodeDriver(NodeDriver):
         ex_metadata=None,
         ignore_errors=True,
         use_existing_disk=True,
-        poll_interval=2,
+        poll_interval=None,
         external_ip="ephemeral",
         internal_ip=None,
         ex_disk_type="pd-standard",
@@ -5374,8 +5465,10 @@ class GCENodeDriver(NodeDriver):
                                      disk instead of creating a new one.
         :type     use_existing_disk: ``bool``
 
-        :keyword  poll_interval: Number of seconds between status checks.
-        :type     poll_interval: ``int``
+        :keyword  poll_interval: Number of seconds between status checks. If
+                                 not set, the connection polling strategy
+                                 (exponential backoff) is used.
+        :type     poll_interval: ``int`` or ``None``
 
         :keyword  external_ip: The external IP address to use.  If 'ephemeral'
                                (default), a new non-static address will be
@@ -5536,24 +5629,38 @@ class GCENodeDriver(NodeDriver):
             status = {"name": name, "node_response": None, "node": None}
             status_list.append(status)
 
-        start_time = time.time()
-        complete = False
-        while not complete:
-            if time.time() - start_time >= timeout:
+        for status in status_list:
+            self._multi_create_node(status, node_attrs)
+
+        if poll_interval is None:
+            strategy = self.connection.get_poll_strategy()
+        else:
+            strategy = PollingStrategy(interval=poll_interval)
+
+        end = time.time() + timeout
+        attempt = 0
+        pending = [status for status in status_list if not status["node"]]
+        while pending:
+            if time.time() >= end:
                 raise Exception("Timeout (%s sec) while waiting for multiple " "instances")
-            complete = True
-            time.sleep(poll_interval)
-            for status in status_list:
-                # Create the node or check status if already in progress.
-                if not status["node"]:
-                    if not status["node_response"]:
-                        self._multi_create_node(status, node_attrs)
-                    else:
-                        self._multi_check_node(status, node_attrs)
-                # If any of the nodes have not been created (or failed) we are
-                # not done yet.
-                if not status["node"]:
-                    complete = False
+            attempt += 1
+            time.sleep(max(0, min(strategy.get_delay(attempt), end - time.time())))
+
+            # Check the state of all the pending operations at once, the
+            # operations which are done are then checked one by one.
+            poll_request_kwargs = [
+                {"action": status["node_response"]["selfLink"]} for status in pending
+            ]
+            try:
+                responses = self.connection.poll_many(poll_request_kwargs)
+            except GoogleBaseError:
+                responses = [None] * len(pending)
+
+            for status, response in zip(pending, responses):
+                if response is None or self.connection.has_completed(response):
+                    self._multi_check_node(status, node_attrs)
+
+            pending = [status for status in pending if not status["node"]]
 
         # Return list of nodes
         node_list = []
@@ -23,6 +23,7 @@ from libcloud.pricing import get_size_price
 from libcloud.utils.py3 import ET, b, next, httplib, parse_qs, urlparse
 from libcloud.utils.xml import findall
 from libcloud.compute.base import (
+    REFRESH_NODES_MAX_REQUESTS,
     Node,
     KeyPair,
     NodeSize,
@@ -223,30 +224,77 @@ class OpenStackNodeDriver(NodeDriver, OpenStackDriverMixin):
         loop_count = 0
         while True:
             data = connection.request(url, params=params)
-            values = data.object.get(obj, list())
-            objects.extend(values)
-            links = data.object.get("%s_links" % obj, list())
-            next_links = [n for n in links if n["rel"] == "next"]
-            if next_links:
-                next_link = next_links[0]
-                query = urlparse.urlparse(next_link["href"])
-                # The query[4] references the query parameters from the url
-                params.update(parse_qs(query[4]))
-            else:
+            objects.extend(data.object.get(obj, list()))
+
+            loop_count += 1
+            if not OpenStackNodeDriver._update_pagination_params(
+                url, obj, data.object, params, loop_count
+            ):
                 break
 
-            # Prevent the pagination from looping indefinitely in case
-            # the API returns a loop for some reason.
+        return {obj: objects}
+
+    @staticmethod
+    async def _async_paginated_request(url, obj, connection, params=None):
+        """
+        Asynchronous version of :meth:`_paginated_request`.
+
+        :param connection: The asyncio API connection to use to perform the
+                           request
+        :type connection: :class:`libcloud.common.base.AsyncConnection`
+        """
+        params = params or {}
+        objects = list()
+        loop_count = 0
+        while True:
+            data = await connection.request(url, params=params)
+            objects.extend(data.object.get(obj, list()))
+
             loop_count += 1
-            if loop_count > PAGINATION_LIMIT:
-                raise OpenStackException(
-                    "Pagination limit reached for %s, the limit is %d. "
-                    "This might indicate that your API is returning a "
-                    "looping next target for pagination!" % (url, PAGINATION_LIMIT),
-                    None,
-                )
+            if not OpenStackNodeDriver._update_pagination_params(
+                url, obj, data.object, params, loop_count
+            ):
+                break
+
         return {obj: objects}
 
+    @staticmethod
+    def _update_pagination_params(url, obj, data, params, loop_count):
+        """
+        Update the request parameters of a paginated request with the query
+        parameters of the link to the next page.
+
+        :param data: Parsed response of the current page.
+        :type data: ``dict``
+
+        :param loop_count: Number of pages which have been retrieved.
+        :type loop_count: ``int``
+
+        :return: False if the current page is the last one.
+        :rtype: ``bool``
+        """
+        links = data.get("%s_links" % obj, list())
+        next_links = [n for n in links if n["rel"] == "next"]
+        if not next_links:
+            return False
+
+        next_link = next_links[0]
+        query = urlparse.urlparse(next_link["href"])
+        # The query[4] references the query parameters from the url
+        params.update(parse_qs(query[4]))
+
+        # Prevent the pagination from looping indefinitely in case
+        # the API returns a loop for some reason.
+        if loop_count > PAGINATION_LIMIT:
+            raise OpenStackException(
+                "Pagination limit reached for %s, the limit is %d. "
+                "This might indicate that your API is returning a "
+                "looping next target for pagination!" % (url, PAGINATION_LIMIT),
+                None,
+            )
+
+        return True
+
     def _paginated_request_next(self, path, request_method, response_key):
         """
         Perform multiple calls and retrieve all the elements for a paginated
@@ -305,6 +353,11 @@ class OpenStackNodeDriver(NodeDriver, OpenStackDriverMixin):
         # agree.
         return resp.status in (httplib.NO_CONTENT, httplib.ACCEPTED)
 
+    async def async_destroy_node(self, node):
+        uri = "/servers/%s" % (node.id)
+        resp = await self.async_connection.request(uri, method="DELETE")
+        return resp.status in (httplib.NO_CONTENT, httplib.ACCEPTED)
+
     def reboot_node(self, node):
         # pylint: disable=no-member
         return self._reboot_node(node, reboot_type="HARD")
@@ -333,6 +386,20 @@ class OpenStackNodeDriver(NodeDriver, OpenStackDriverMixin):
         # pylint: disable=no-member
         return self._to_nodes(self.connection.request("/servers/detail", params=params).object)
 
+    async def async_list_nodes(self, ex_all_tenants=False):
+        """
+        Asynchronous version of :meth:`list_nodes`.
+
+        :rtype: ``list`` of :class:`Node`
+        """
+        params = {}
+        if ex_all_tenants:
+            params = {"all_tenants": 1}
+
+        response = await self.async_connection.request("/servers/detail", params=params)
+        # pylint: disable=no-member
+        return self._to_nodes(response.object)
+
     def create_volume(self, size, name, location=None, snapshot=None, ex_volume_type=None):
         """
         Create a new volume.
@@ -1412,6 +1479,7 @@ class OpenStack_1_1_NodeDriver(OpenStackNodeDriver):
     type = Provider.OPENSTACK
 
     features = {"create_node": ["generates_password"]}
+    supports_refresh_nodes = True
     _networks_url_prefix = "/os-networks"
 
     def __init__(self, *args, **kwargs):
@@ -2386,6 +2454,19 @@ class OpenStack_1_1_NodeDriver(OpenStackNodeDriver):
             ).object["server"]
         )
 
+    def _refresh_nodes(self, nodes):
+        """
+        Servers are retrieved one by one, so all the servers are listed
+        instead when waiting for many of them.
+
+        @inherits: :class:`NodeDriver._refresh_nodes`
+        """
+        if len(nodes) > REFRESH_NODES_MAX_REQUESTS:
+            return None
+
+        result = [self.ex_get_node_details(node.id) for node in nodes]
+        return [node for node in result if node is not None]
+
     def _to_node_from_obj(self, obj):
         return self._to_node(obj["server"])
 
@@ -2986,6 +3067,21 @@ class OpenStack_2_NodeDriver(OpenStack_1_1_NodeDriver):
             self._paginated_request("/servers/detail", "servers", self.connection, params=params)
         )
 
+    async def async_list_nodes(self, ex_all_tenants=False):
+        """
+        Asynchronous version of :meth:`list_nodes`.
+
+        :rtype: ``list`` of :class:`Node`
+        """
+        params = {}
+        if ex_all_tenants:
+            params = {"all_tenants": 1}
+        return self._to_nodes(
+            await self._async_paginated_request(
+                "/servers/detail", "servers", self.async_connection, params=params
+            )
+        )
+
     def get_image(self, image_id):
         """
         Get a NodeImage using the V2 Glance API
@@ -20,12 +20,15 @@ Wraps multiple ways to communicate over SSH.
 import os
 import re
 import time
+import codecs
 import logging
 import warnings
+import selectors
 import subprocess
-from typing import List, Type, Tuple, Union, Optional, cast
+from typing import List, Type, Tuple, Union, Callable, Optional, cast
 from os.path import join as pjoin
 from os.path import split as psplit
+from collections import deque
 
 from libcloud.utils.py3 import StringIO, b
 from libcloud.utils.logging import ExtraLogFormatter
@@ -50,6 +53,7 @@ __all__ = [
     "BaseSSHClient",
     "ParamikoSSHClient",
     "ShellOutSSHClient",
+    "SSHCommandOutput",
     "SSHCommandTimeoutError",
 ]
 
@@ -258,6 +262,64 @@ class BaseSSHClient:
         return logger
 
 
+class SSHCommandOutput:
+    """
+    Output of a command read from a SSH channel stream.
+
+    Data is decoded incrementally (a multi byte UTF-8 character can be split
+    over two reads), passed to the optional callback as soon as it has been
+    read and buffered in memory. If ``max_buffer_size`` is set, only the last
+    ``max_buffer_size`` characters are kept in memory.
+    """
+
+    def __init__(self, callback=None, max_buffer_size=None):
+        # type: (Optional[Callable[[str], None]], Optional[int]) -> None
+        """
+        :param callback: Function which is called with each decoded chunk of
+                         output (e.g. ``sys.stdout.write`` or ``fp.write``).
+        :type callback: ``callable``
+
+        :param max_buffer_size: Maximum number of characters kept in memory.
+        :type max_buffer_size: ``int``
+        """
+        self.callback = callback
+        self.max_buffer_size = max_buffer_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+        self._chunks = deque()  # type: deque
+        self._size = 0
+
+    def write(self, data):
+        # type: (str) -> None
+        if not data:
+            return
+
+        if self.callback:
+            self.callback(data)
+
+        self._chunks.append(data)
+        self._size += len(data)
+
+        if self.max_buffer_size is None:
+            return
+
+        # Drop the oldest output which doesn't fit into the buffer
+        while self._size > self.max_buffer_size:
+            excess = self._size - self.max_buffer_size
+            chunk = self._chunks[0]
+
+            if len(chunk) <= excess:
+                self._chunks.popleft()
+                self._size -= len(chunk)
+            else:
+                self._chunks[0] = chunk[excess:]
+                self._size -= excess
+
+    def getvalue(self):
+        # type: () -> str
+        return "".join(self._chunks)
+
+
 class ParamikoSSHClient(BaseSSHClient):
     """
     A SSH Client powered by Paramiko.
@@ -270,6 +332,10 @@ class ParamikoSSHClient(BaseSSHClient):
     # waiting)
     SLEEP_DELAY = 0.2
 
+    # Maximum time to block waiting for output from the command before the
+    # exit status and the timeout are checked again
+    SELECT_TIMEOUT = 1.0
+
     def __init__(
         self,
         hostname,  # type: str
@@ -499,13 +565,19 @@ class ParamikoSSHClient(BaseSSHClient):
         extra = {"_path": path}
         self.logger.debug("Deleting file", extra=extra)
 
-        sftp = self.client.open_sftp()
+        sftp = self._get_sftp_client()
         sftp.unlink(path)
-        sftp.close()
         return True
 
-    def run(self, cmd, timeout=None):
-        # type: (str, Optional[float]) -> Tuple[str, str, int]
+    def run(
+        self,
+        cmd,  # type: str
+        timeout=None,  # type: Optional[float]
+        stdout_callback=None,  # type: Optional[Callable[[str], None]]
+        stderr_callback=None,  # type: Optional[Callable[[str], None]]
+        max_buffer_size=None,  # type: Optional[int]
+    ):
+        # type: (...) -> Tuple[str, str, int]
         """
         Note: This function is based on paramiko's exec_command()
         method.
@@ -513,6 +585,23 @@ class ParamikoSSHClient(BaseSSHClient):
         :param timeout: How long to wait (in seconds) for the command to
                         finish (optional).
         :type timeout: ``float``
+
+        :param stdout_callback: Function which is called with each chunk of
+                                stdout as soon as it has been received
+                                (optional).
+        :type stdout_callback: ``callable``
+
+        :param stderr_callback: Function which is called with each chunk of
+                                stderr as soon as it has been received
+                                (optional).
+        :type stderr_callback: ``callable``
+
+        :param max_buffer_size: Maximum number of characters of stdout and
+                                stderr which are kept in memory. If the
+                                command produces more output, only the last
+                                ``max_buffer_size`` characters are returned
+                                (optional).
+        :type max_buffer_size: ``int``
         """
         extra1 = {"_cmd": cmd}
         self.logger.debug("Executing command", extra=extra1)
@@ -527,8 +616,8 @@ class ParamikoSSHClient(BaseSSHClient):
         start_time = time.time()
         chan.exec_command(cmd)
 
-        stdout = StringIO()
-        stderr = StringIO()
+        stdout = SSHCommandOutput(callback=stdout_callback, max_buffer_size=max_buffer_size)
+        stderr = SSHCommandOutput(callback=stderr_callback, max_buffer_size=max_buffer_size)
 
         # Create a stdin file and immediately close it to prevent any
         # interactive script from hanging the process.
@@ -543,40 +632,55 @@ class ParamikoSSHClient(BaseSSHClient):
         # Note #2: If you are going to remove "ready" checks inside the loop
         # you are going to have a bad time. Trying to consume from a channel
         # which is not ready will block for indefinitely.
-        exit_status_ready = chan.exit_status_ready()
+        #
+        # Note #3: Instead of sleeping between the checks we block on the
+        # channel file descriptor which becomes readable as soon as any output
+        # is received.
+        selector = self._get_channel_selector(chan)
+
+        try:
+            while True:
+                # It's possible that some data is already available when exit
+                # status is ready
+                exit_status_ready = chan.exit_status_ready()
 
-        if exit_status_ready:
-            # It's possible that some data is already available when exit
-            # status is ready
-            stdout.write(self._consume_stdout(chan).getvalue())
-            stderr.write(self._consume_stderr(chan).getvalue())
+                stdout.write(self._consume_stdout(chan, decoder=stdout.decoder).getvalue())
+                stderr.write(self._consume_stderr(chan, decoder=stderr.decoder).getvalue())
+
+                if exit_status_ready:
+                    break
 
-        while not exit_status_ready:
-            current_time = time.time()
-            elapsed_time = current_time - start_time
+                elapsed_time = time.time() - start_time
 
-            if timeout and (elapsed_time > timeout):
-                # TODO: Is this the right way to clean up?
-                chan.close()
+                if timeout and (elapsed_time > timeout):
+                    # TODO: Is this the right way to clean up?
+                    chan.close()
 
-                stdout_str = stdout.getvalue()  # type: str
-                stderr_str = stderr.getvalue()  # type: str
-                raise SSHCommandTimeoutError(
-                    cmd=cmd, timeout=timeout, stdout=stdout_str, stderr=stderr_str
-                )
+                    stdout_str = stdout.getvalue()  # type: str
+                    stderr_str = stderr.getvalue()  # type: str
+                    raise SSHCommandTimeoutError(
+                        cmd=cmd, timeout=timeout, stdout=stdout_str, stderr=stderr_str
+                    )
 
-            stdout.write(self._consume_stdout(chan).getvalue())
-            stderr.write(self._consume_stderr(chan).getvalue())
+                # Once EOF has been received the descriptor stays readable so
+                # we fall back to sleeping until the exit status arrives
+                if selector is not None and getattr(chan, "eof_received", False) is True:
+                    selector.close()
+                    selector = None
 
-            # We need to check the exist status here, because the command could
-            # print some output and exit during this sleep below.
-            exit_status_ready = chan.exit_status_ready()
+                if selector is None:
+                    # Short sleep to prevent busy waiting
+                    time.sleep(self.SLEEP_DELAY)
+                else:
+                    wait = self.SELECT_TIMEOUT
 
-            if exit_status_ready:
-                break
+                    if timeout:
+                        wait = max(0, min(wait, timeout - elapsed_time))
 
-            # Short sleep to prevent busy waiting
-            time.sleep(self.SLEEP_DELAY)
+                    selector.select(timeout=wait)
+        finally:
+            if selector is not None:
+                selector.close()
 
         # Receive the exit status code of the command we ran.
         status = chan.recv_exit_status()  # type: int
@@ -601,16 +705,16 @@ class ParamikoSSHClient(BaseSSHClient):
 
         return True
 
-    def _consume_stdout(self, chan):
+    def _consume_stdout(self, chan, decoder=None):
         """
         Try to consume stdout data from chan if it's receive ready.
         """
         stdout = self._consume_data_from_channel(
-            chan=chan, recv_method=chan.recv, recv_ready_method=chan.recv_ready
+            chan=chan, recv_method=chan.recv, recv_ready_method=chan.recv_ready, decoder=decoder
         )
         return stdout
 
-    def _consume_stderr(self, chan):
+    def _consume_stderr(self, chan, decoder=None):
         """
         Try to consume stderr data from chan if it's receive ready.
         """
@@ -618,15 +722,19 @@ class ParamikoSSHClient(BaseSSHClient):
             chan=chan,
             recv_method=chan.recv_stderr,
             recv_ready_method=chan.recv_stderr_ready,
+            decoder=decoder,
         )
         return stderr
 
-    def _consume_data_from_channel(self, chan, recv_method, recv_ready_method):
+    def _consume_data_from_channel(self, chan, recv_method, recv_ready_method, decoder=None):
         """
         Try to consume data from the provided channel.
 
         Keep in mind that data is only consumed if the channel is receive
         ready.
+
+        If an incremental ``decoder`` is provided, a multi byte character
+        which is split between two calls is decoded once it's complete.
         """
         result = StringIO()
         result_bytes = bytearray()
@@ -647,9 +755,30 @@ class ParamikoSSHClient(BaseSSHClient):
         # We only decode data at the end because a single chunk could contain
         # a part of multi byte UTF-8 character (whole multi bytes character
         # could be split over two chunks)
-        result.write(result_bytes.decode("utf-8", errors="ignore"))
+        if decoder is None:
+            result.write(result_bytes.decode("utf-8", errors="ignore"))
+        else:
+            result.write(decoder.decode(bytes(result_bytes)))
+
         return result
 
+    def _get_channel_selector(self, chan):
+        """
+        Return a selector which can be used to wait until the channel has
+        data to read or None if the channel doesn't expose a file descriptor.
+        """
+        try:
+            fileno = chan.fileno()
+        except Exception:
+            return None
+
+        if not isinstance(fileno, int):
+            return None
+
+        selector = selectors.DefaultSelector()
+        selector.register(fileno, selectors.EVENT_READ)
+        return selector
+
     def _get_pkey_object(self, key, password=None):
         """
         Try to detect private key type and return paramiko.PKey object.
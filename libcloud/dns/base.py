@@ -14,14 +14,51 @@
 # limitations under the License.
 
 
+import re
+import queue
 import datetime
-from typing import Any, Dict, List, Type, Union, Iterator, Optional
+import threading
+from typing import IO, Any, Dict, List, Type, Tuple, Union, Iterable, Iterator, Optional
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 from libcloud import __version__
 from libcloud.dns.types import RecordType
 from libcloud.common.base import BaseDriver, Connection, ConnectionUserAndKey
 
-__all__ = ["Zone", "Record", "DNSDriver"]
+__all__ = ["Zone", "Record", "RecordChange", "RecordChangeResult", "BindRecord", "DNSDriver"]
+
+# Default number of changes which are applied concurrently by apply_changes()
+# for drivers without a bulk API
+APPLY_CHANGES_CONCURRENCY = 8
+
+# Default number of zones whose records are retrieved concurrently by
+# iterate_all_records()
+ITERATE_ALL_RECORDS_CONCURRENCY = 8
+
+# Maximum number of records retrieved by iterate_all_records() which are
+# buffered until they are consumed
+ITERATE_ALL_RECORDS_BUFFER_SIZE = 1000
+
+# Record types whose data ends with a domain name
+BIND_DOMAIN_NAME_RECORD_TYPES = [
+    RecordType.CNAME,
+    RecordType.DNAME,
+    RecordType.MX,
+    RecordType.NS,
+    RecordType.PTR,
+    RecordType.SRV,
+]
+
+BIND_CLASSES = ["IN", "CH", "CS", "HS"]
+
+BIND_TTL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+BIND_TTL_RE = re.compile(r"(\d+)([smhdw]?)", re.IGNORECASE)
+
+# Record parsed from a BIND zone file by DNSDriver.parse_bind_zone(). Name is
+# relative to the zone origin (empty string for the zone apex).
+BindRecord = namedtuple("BindRecord", ["name", "type", "data", "ttl", "extra"])
 
 
 class Zone:
@@ -199,6 +236,111 @@ class Record:
         )
 
 
+class RecordChange:
+    """
+    Record change which is applied with :meth:`DNSDriver.apply_changes`.
+    """
+
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+    def __init__(
+        self,
+        action,  # type: str
+        name=None,  # type: Optional[str]
+        type=None,  # type: Optional[RecordType]
+        data=None,  # type: Optional[str]
+        extra=None,  # type: Optional[dict]
+        record=None,  # type: Optional[Record]
+    ):
+        """
+        :param action: Change action (``RecordChange.CREATE``,
+                       ``RecordChange.UPDATE`` or ``RecordChange.DELETE``).
+        :type action: ``str``
+
+        :param name: Record name without the domain name (create and update).
+        :type name: ``str``
+
+        :param type: DNS record type (create and update).
+        :type type: :class:`RecordType`
+
+        :param data: Data for the record (create and update).
+        :type data: ``str``
+
+        :param extra: (optional) Extra attributes (driver specific).
+        :type extra: ``dict``
+
+        :param record: Existing record (update and delete). For create
+                       changes, optionally an existing record with the same
+                       name and type which drivers that manage all the values
+                       of a name and type together use to merge the change.
+        :type record: :class:`Record`
+        """
+        if action not in (self.CREATE, self.UPDATE, self.DELETE):
+            raise ValueError("Invalid action: %s" % (action))
+
+        if action in (self.UPDATE, self.DELETE) and record is None:
+            raise ValueError("record argument is required for %s action" % (action))
+
+        self.action = action
+        self.name = name
+        self.type = type
+        self.data = data
+        self.extra = extra
+        self.record = record
+
+    def __repr__(self):
+        # type: () -> str
+        return "<RecordChange: action=%s, name=%s, type=%s, data=%s, record=%s>" % (
+            self.action,
+            self.name,
+            self.type,
+            self.data,
+            self.record,
+        )
+
+
+class RecordChangeResult:
+    """
+    Outcome of applying a single :class:`RecordChange`.
+    """
+
+    def __init__(
+        self,
+        change,  # type: RecordChange
+        record=None,  # type: Optional[Record]
+        error=None,  # type: Optional[Exception]
+    ):
+        """
+        :param change: Applied change.
+        :type change: :class:`RecordChange`
+
+        :param record: Created or updated record (None for deletions).
+        :type record: :class:`Record`
+
+        :param error: Exception raised while applying the change.
+        :type error: ``Exception``
+        """
+        self.change = change
+        self.record = record
+        self.error = error
+
+    @property
+    def success(self):
+        # type: () -> bool
+        return self.error is None
+
+    def __repr__(self):
+        # type: () -> str
+        return "<RecordChangeResult: action=%s, success=%s, record=%s, error=%r>" % (
+            self.change.action,
+            self.success,
+            self.record,
+            self.error,
+        )
+
+
 class DNSDriver(BaseDriver):
     """
     A base DNSDriver class to derive from
@@ -460,42 +602,387 @@ class DNSDriver(BaseDriver):
         """
         raise NotImplementedError("delete_record not implemented for this driver")
 
-    def export_zone_to_bind_format(self, zone):
-        # type: (Zone) -> str
+    def apply_changes(self, zone, changes, concurrency=APPLY_CHANGES_CONCURRENCY):
+        # type: (Zone, List[RecordChange], int) -> List[RecordChangeResult]
         """
-        Export Zone object to the BIND compatible format.
+        Apply multiple record changes to a zone.
 
-        :param zone: Zone to export.
+        Drivers for APIs with a bulk endpoint submit the changes in as few
+        requests as possible. Otherwise the changes are applied using
+        :meth:`create_record`, :meth:`update_record` and
+        :meth:`delete_record` calls which run concurrently using a bounded
+        pool of worker threads.
+
+        A failure to apply one change doesn't stop the remaining changes
+        from being applied (unless the API applies a batch of changes
+        atomically). The outcome of each change is reported in the returned
+        list.
+
+        :param zone: Zone to apply the changes to.
         :type  zone: :class:`Zone`
 
-        :return: Zone data in BIND compatible format.
-        :rtype: ``str``
+        :param changes: Changes to apply.
+        :type  changes: ``list`` of :class:`RecordChange`
+
+        :param concurrency: Maximum number of concurrent requests.
+        :type  concurrency: ``int``
+
+        :return: Result for each change, in the same order as ``changes``.
+        :rtype: ``list`` of :class:`RecordChangeResult`
         """
-        if zone.type != "master":
-            raise ValueError("You can only generate BIND out for master zones")
 
-        lines = []
+        def apply(change):
+            driver = self._get_thread_driver()
+
+            try:
+                if change.action == RecordChange.CREATE:
+                    record = driver.create_record(
+                        name=change.name,
+                        zone=zone,
+                        type=change.type,
+                        data=change.data,
+                        extra=change.extra,
+                    )
+                elif change.action == RecordChange.UPDATE:
+                    record = driver.update_record(
+                        record=change.record,
+                        name=change.name,
+                        type=change.type,
+                        data=change.data,
+                        extra=change.extra,
+                    )
+                else:
+                    driver.delete_record(record=change.record)
+                    record = None
+            except Exception as e:
+                return RecordChangeResult(change, error=e)
+
+            return RecordChangeResult(change, record=record)
+
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            return list(executor.map(apply, changes))
+
+    def diff_zone(self, zone, records, delete=True):
+        # type: (Zone, List[Record], bool) -> List[RecordChange]
+        """
+        Compute the changes needed to bring the records of a zone in line
+        with the provided (desired) records.
 
-        # For consistent output, records are sorted based on the id
-        records = zone.list_records()
-        records = sorted(records, key=Record._get_numeric_id)
+        Records are matched on name and type and then compared on data,
+        priority and TTL (a desired record without a TTL matches any TTL).
+        Records which already exist are left untouched, modified records
+        result in an update and the rest in create and delete changes.
 
-        date = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        values = {"version": __version__, "date": date}
+        Create changes for a name and type which already has records carry
+        one of those records (``record`` attribute) so drivers which manage
+        all the values of a name and type as one record set can merge the
+        changes of each record set.
 
-        lines.append("; Generated by Libcloud v%(version)s on %(date)s UTC" % values)
-        lines.append("$ORIGIN {domain}.".format(domain=zone.domain))
-        lines.append("$TTL {domain_ttl}\n".format(domain_ttl=zone.ttl))
+        SOA records and NS records of the zone apex are managed by the
+        provider and are ignored.
+
+        :param zone: Zone to compare the records with.
+        :type  zone: :class:`Zone`
+
+        :param records: Desired records. Only ``name``, ``type``, ``data``,
+                        ``ttl`` and ``extra`` attributes are used.
+        :type  records: ``list`` of :class:`Record`
+
+        :param delete: Delete records which aren't present in ``records``.
+        :type  delete: ``bool``
+
+        :return: Delete, update and create changes (in this order).
+        :rtype: ``list`` of :class:`RecordChange`
+        """
+        current = {}  # type: Dict[Any, List[Record]]
+        desired = {}  # type: Dict[Any, List[Record]]
+
+        for record in self._iterate_zone_records(zone):
+            key = self._get_sync_record_key(record)
+
+            if key is not None:
+                current.setdefault(key, []).append(record)
 
         for record in records:
-            line = self._get_bind_record_line(record=record)
-            lines.append(line)
+            key = self._get_sync_record_key(record)
+
+            if key is not None:
+                desired.setdefault(key, []).append(record)
+
+        deletes = []  # type: List[RecordChange]
+        updates = []  # type: List[RecordChange]
+        creates = []  # type: List[RecordChange]
+
+        for key, desired_records in desired.items():
+            name, type = key
+            stale = current.pop(key, [])
+            existing_records = list(stale)
+            missing = []
+
+            # Records which are already up to date are left untouched
+            for record in desired_records:
+                existing_record = self._find_sync_record(record, stale)
+
+                if existing_record is None:
+                    missing.append(record)
+                else:
+                    stale.remove(existing_record)
+
+            # Prefer updating records which only differ in TTL, the remaining
+            # records are updated in an arbitrary order
+            unmatched = []
+
+            for record in missing:
+                existing_record = self._find_sync_record(record, stale, compare_ttl=False)
+
+                if existing_record is None:
+                    unmatched.append(record)
+                else:
+                    stale.remove(existing_record)
+                    updates.append(self._get_sync_change(name, type, record, existing_record))
+
+            for record in unmatched:
+                if stale:
+                    existing_record = stale.pop(0)
+                    updates.append(self._get_sync_change(name, type, record, existing_record))
+                else:
+                    change = self._get_sync_change(name, type, record)
+                    change.record = existing_records[0] if existing_records else None
+                    creates.append(change)
+
+            if delete:
+                deletes.extend(RecordChange(RecordChange.DELETE, record=r) for r in stale)
+
+        if delete:
+            for current_records in current.values():
+                deletes.extend(RecordChange(RecordChange.DELETE, record=r) for r in current_records)
+
+        return deletes + updates + creates
+
+    def sync_zone(
+        self,
+        zone,  # type: Zone
+        records,  # type: List[Record]
+        delete=True,  # type: bool
+        dry_run=False,  # type: bool
+        concurrency=APPLY_CHANGES_CONCURRENCY,  # type: int
+    ):
+        # type: (...) -> Union[List[RecordChange], List[RecordChangeResult]]
+        """
+        Synchronize records of a zone with the provided (desired) records.
+
+        Only the changes computed by :meth:`diff_zone` are applied (using
+        :meth:`apply_changes`) so unchanged records don't result in any API
+        requests.
+
+        :param zone: Zone to synchronize.
+        :type  zone: :class:`Zone`
+
+        :param records: Desired records.
+        :type  records: ``list`` of :class:`Record`
+
+        :param delete: Delete records which aren't present in ``records``.
+        :type  delete: ``bool``
+
+        :param dry_run: Only compute and return the changes without applying
+                        them.
+        :type  dry_run: ``bool``
+
+        :param concurrency: Maximum number of concurrent requests.
+        :type  concurrency: ``int``
+
+        :return: Changes if ``dry_run`` is True, otherwise the result of each
+                 applied change.
+        :rtype: ``list`` of :class:`RecordChange` or ``list`` of
+                :class:`RecordChangeResult`
+        """
+        changes = self.diff_zone(zone=zone, records=records, delete=delete)
+
+        if dry_run or not changes:
+            return changes
 
-        output = "\n".join(lines)
+        return self.apply_changes(zone=zone, changes=changes, concurrency=concurrency)
+
+    def iterate_all_records(self, zones=None, concurrency=ITERATE_ALL_RECORDS_CONCURRENCY):
+        # type: (Optional[Iterable[Zone]], int) -> Iterator[Tuple[Zone, Record]]
+        """
+        Return a generator to iterate over records of multiple zones.
+
+        Records of up to ``concurrency`` zones are retrieved concurrently
+        (each zone is paginated by a separate worker thread) and yielded as
+        soon as they arrive so records of different zones are interleaved.
+
+        Requests are subject to the rate limiter of the connection class (if
+        any) which is shared by all the worker threads.
+
+        :param zones: Zones to list records for. Defaults to all the zones.
+        :type  zones: ``list`` of :class:`Zone`
+
+        :param concurrency: Maximum number of zones processed concurrently.
+        :type  concurrency: ``int``
+
+        :rtype: ``generator`` of ``tuple`` of (:class:`Zone`, :class:`Record`)
+        """
+        if zones is None:
+            if type(self).iterate_zones is DNSDriver.iterate_zones:
+                zones = self.list_zones()
+            else:
+                zones = self.iterate_zones()
+
+        items = queue.Queue(maxsize=ITERATE_ALL_RECORDS_BUFFER_SIZE)  # type: queue.Queue
+        stopped = threading.Event()
+
+        def put(item):
+            # Give up when the consumer has stopped iterating
+            while not stopped.is_set():
+                try:
+                    items.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+
+            return False
+
+        def fetch(zone):
+            if stopped.is_set():
+                return
+
+            try:
+                driver = self._get_thread_driver()
+
+                for record in driver._iterate_zone_records(zone):
+                    if not put((zone, record, None)):
+                        return
+            except Exception as e:
+                put((zone, None, e))
+            finally:
+                # Item without a record and an error marks the end of a zone
+                put((zone, None, None))
+
+        executor = ThreadPoolExecutor(max_workers=max(concurrency, 1))
+
+        try:
+            pending = 0
+
+            for zone in zones:
+                executor.submit(fetch, zone)
+                pending += 1
+
+            while pending:
+                zone, record, error = items.get()
+
+                if error is not None:
+                    raise error
+
+                if record is None:
+                    pending -= 1
+                    continue
+
+                yield zone, record
+        finally:
+            stopped.set()
+            executor.shutdown(wait=True)
+
+    ##
+    # Asyncio methods
+    ##
+
+    async def async_list_zones(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`list_zones`.
+
+        :rtype: ``list`` of :class:`Zone`
+        """
+        return await self._run_in_executor("list_zones", *args, **kwargs)
+
+    async def async_list_records(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`list_records`.
+
+        :rtype: ``list`` of :class:`Record`
+        """
+        return await self._run_in_executor("list_records", *args, **kwargs)
+
+    async def async_get_zone(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`get_zone`.
+
+        :rtype: :class:`Zone`
+        """
+        return await self._run_in_executor("get_zone", *args, **kwargs)
+
+    async def async_get_record(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`get_record`.
+
+        :rtype: :class:`Record`
+        """
+        return await self._run_in_executor("get_record", *args, **kwargs)
+
+    async def async_create_zone(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`create_zone`.
+
+        :rtype: :class:`Zone`
+        """
+        return await self._run_in_executor("create_zone", *args, **kwargs)
+
+    async def async_update_zone(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`update_zone`.
+
+        :rtype: :class:`Zone`
+        """
+        return await self._run_in_executor("update_zone", *args, **kwargs)
+
+    async def async_create_record(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`create_record`.
+
+        :rtype: :class:`Record`
+        """
+        return await self._run_in_executor("create_record", *args, **kwargs)
+
+    async def async_update_record(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`update_record`.
+
+        :rtype: :class:`Record`
+        """
+        return await self._run_in_executor("update_record", *args, **kwargs)
+
+    async def async_delete_zone(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`delete_zone`.
+
+        :rtype: ``bool``
+        """
+        return await self._run_in_executor("delete_zone", *args, **kwargs)
+
+    async def async_delete_record(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`delete_record`.
+
+        :rtype: ``bool``
+        """
+        return await self._run_in_executor("delete_record", *args, **kwargs)
+
+    def export_zone_to_bind_format(self, zone):
+        # type: (Zone) -> str
+        """
+        Export Zone object to the BIND compatible format.
+
+        :param zone: Zone to export.
+        :type  zone: :class:`Zone`
+
+        :return: Zone data in BIND compatible format.
+        :rtype: ``str``
+        """
+        output = "\n".join(self._iterate_bind_lines(zone=zone, sort=True))
         return output
 
-    def export_zone_to_bind_zone_file(self, zone, file_path):
-        # type: (Zone, str) -> None
+    def export_zone_to_bind_zone_file(self, zone, file_path, sort=True):
+        # type: (Zone, str, bool) -> None
         """
         Export Zone object to the BIND compatible format and write result to a
         file.
@@ -505,11 +992,189 @@ class DNSDriver(BaseDriver):
 
         :param file_path: File path where the output will be saved.
         :type  file_path: ``str``
-        """
-        result = self.export_zone_to_bind_format(zone=zone)
 
+        :param sort: Sort records based on the id. Sorting requires all the
+                     records to be retrieved before any output is written.
+        :type  sort: ``bool``
+        """
         with open(file_path, "w") as fp:
-            fp.write(result)
+            self.export_zone_to_bind_stream(zone=zone, stream=fp, sort=sort)
+
+    def export_zone_to_bind_stream(self, zone, stream, sort=False):
+        # type: (Zone, IO[str], bool) -> None
+        """
+        Export Zone object to the BIND compatible format and write result to
+        a file object.
+
+        Unless ``sort`` is True, each line is written as soon as the record
+        is retrieved so the whole zone is never held in memory.
+
+        :param zone: Zone to export.
+        :type  zone: :class:`Zone`
+
+        :param stream: File object the output is written to.
+        :type  stream: ``file``
+
+        :param sort: Sort records based on the id.
+        :type  sort: ``bool``
+        """
+        separator = ""
+
+        for line in self._iterate_bind_lines(zone=zone, sort=sort):
+            stream.write(separator + line)
+            separator = "\n"
+
+    def parse_bind_zone(self, stream, origin=None, ttl=None):
+        # type: (Iterable[str], Optional[str], Optional[int]) -> Iterator[BindRecord]
+        """
+        Parse records from a BIND zone file.
+
+        Lines are read and parsed one at a time so zone files of any size can
+        be imported using constant memory. Returned records can be passed to
+        :meth:`sync_zone` or used to create :class:`RecordChange` objects.
+
+        ``$ORIGIN`` and ``$TTL`` directives, comments and records spanning
+        multiple lines (in parentheses) are supported. ``$INCLUDE`` and
+        ``$GENERATE`` directives are not.
+
+        :param stream: File object (or any other iterable of lines) to read
+                       the zone from.
+        :type  stream: ``file``
+
+        :param origin: Zone domain name. Defaults to the value of the first
+                       ``$ORIGIN`` directive.
+        :type  origin: ``str``
+
+        :param ttl: Default TTL for records without an explicit TTL (until
+                    overridden by a ``$TTL`` directive).
+        :type  ttl: ``int``
+
+        :rtype: ``generator`` of :class:`BindRecord`
+        """
+        zone_origin = self._get_bind_fqdn(origin, ".") if origin else None
+        current_origin = zone_origin
+        default_ttl = ttl
+        owner = None
+
+        for line in self._iterate_bind_entries(stream):
+            if line[0] == "$":
+                directive, value = self._split_bind_token(line)
+                directive = directive.upper()
+
+                if directive == "$ORIGIN":
+                    current_origin = self._get_bind_fqdn(value.strip(), current_origin)
+                    zone_origin = zone_origin or current_origin
+                elif directive == "$TTL":
+                    default_ttl = self._parse_bind_ttl(value.strip())
+                else:
+                    raise ValueError("Unsupported directive: %s" % (directive))
+
+                continue
+
+            if line[0] in " \t":
+                # Lines starting with a whitespace use the previous owner name
+                if owner is None:
+                    raise ValueError("Missing owner name: %s" % (line.strip()))
+
+                rest = line
+            else:
+                name, rest = self._split_bind_token(line)
+                owner = self._get_bind_fqdn(name, current_origin)
+
+            record_ttl = None
+            token, rest = self._split_bind_token(rest)
+
+            # TTL and class can be specified in any order
+            while token[0].isdigit() or token.upper() in BIND_CLASSES:
+                if token[0].isdigit():
+                    record_ttl = self._parse_bind_ttl(token)
+
+                token, rest = self._split_bind_token(rest)
+
+            try:
+                type = self._string_to_record_type(token)
+            except AttributeError:
+                raise ValueError("Unsupported record type: %s" % (token))
+
+            extra = {}  # type: Dict[str, Any]
+
+            if type in [RecordType.MX, RecordType.SRV]:
+                priority, rest = self._split_bind_token(rest)
+                extra["priority"] = int(priority)
+
+            data = rest.strip() if '"' in rest else " ".join(rest.split())
+
+            if not data:
+                raise ValueError("Missing record data: %s" % (line.strip()))
+
+            if type in BIND_DOMAIN_NAME_RECORD_TYPES:
+                data = self._get_bind_record_data(data, current_origin)
+            elif type in [RecordType.TXT, RecordType.SPF]:
+                data = self._unquote_bind_data(data)
+
+            if record_ttl is None:
+                record_ttl = default_ttl
+
+            if record_ttl is not None:
+                extra["ttl"] = record_ttl
+
+            name = self._get_bind_relative_name(owner, zone_origin)
+            yield BindRecord(name=name, type=type, data=data, ttl=record_ttl, extra=extra)
+
+    def parse_bind_zone_file(self, file_path, origin=None, ttl=None):
+        # type: (str, Optional[str], Optional[int]) -> Iterator[BindRecord]
+        """
+        Parse records from a BIND zone file on disk.
+
+        See :meth:`parse_bind_zone` for details.
+
+        :param file_path: Path to the zone file.
+        :type  file_path: ``str``
+
+        :rtype: ``generator`` of :class:`BindRecord`
+        """
+        with open(file_path) as fp:
+            yield from self.parse_bind_zone(stream=fp, origin=origin, ttl=ttl)
+
+    def _iterate_zone_records(self, zone):
+        # type: (Zone) -> Iterator[Record]
+        """
+        Return an iterator over records for the provided zone.
+
+        Many drivers only implement :meth:`list_records` in which case all the
+        records are retrieved at once.
+        """
+        if type(self).iterate_records is DNSDriver.iterate_records:
+            return iter(self.list_records(zone))
+
+        return self.iterate_records(zone)
+
+    def _iterate_bind_lines(self, zone, sort=True):
+        # type: (Zone, bool) -> Iterator[str]
+        """
+        Return a generator of BIND zone file lines for the provided zone.
+        """
+        if zone.type != "master":
+            raise ValueError("You can only generate BIND out for master zones")
+
+        records = self._iterate_zone_records(zone)
+
+        if sort:
+            # For consistent output, records are sorted based on the id
+            records = iter(sorted(records, key=Record._get_numeric_id))
+
+        date = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        values = {"version": __version__, "date": date}
+
+        yield "; Generated by Libcloud v%(version)s on %(date)s UTC" % values
+        yield "$ORIGIN {domain}.".format(domain=zone.domain)
+
+        # Some providers don't have a zone wide default TTL
+        if zone.ttl is not None:
+            yield "$TTL {domain_ttl}\n".format(domain_ttl=zone.ttl)
+
+        for record in records:
+            yield self._get_bind_record_line(record=record)
 
     def _get_bind_record_line(self, record):
         # type: (Record) -> str
@@ -565,6 +1230,261 @@ class DNSDriver(BaseDriver):
         line = "\t".join(parts)
         return line
 
+    def _get_sync_record_key(self, record):
+        """
+        Return a (name, type) key which is used to match the records in
+        :meth:`diff_zone` or None for records which are ignored.
+        """
+        name = record.name or ""
+        type = self._string_to_record_type(record.type)
+
+        if type == RecordType.SOA or (type == RecordType.NS and not name):
+            return None
+
+        return name, type
+
+    def _get_sync_record_value(self, record):
+        """
+        Return a (data, priority, ttl) tuple which is used to compare the
+        records in :meth:`diff_zone`.
+        """
+        extra = record.extra or {}
+        ttl = record.ttl if record.ttl is not None else extra.get("ttl", None)
+        priority = extra.get("priority", None)
+        data = record.data
+
+        if data and self._string_to_record_type(record.type) in BIND_DOMAIN_NAME_RECORD_TYPES:
+            # Some providers return fully qualified domain names with and
+            # others without the trailing dot
+            data = data.rstrip(".").lower()
+
+        return (
+            data,
+            str(priority) if priority is not None else None,
+            int(ttl) if ttl is not None else None,
+        )
+
+    def _find_sync_record(self, record, candidates, compare_ttl=True):
+        """
+        Return the first record from ``candidates`` which has the same data
+        (and TTL if ``compare_ttl`` is True) as the provided record.
+        """
+        data, priority, ttl = self._get_sync_record_value(record)
+
+        for candidate in candidates:
+            candidate_data, candidate_priority, candidate_ttl = self._get_sync_record_value(
+                candidate
+            )
+
+            if (candidate_data, candidate_priority) != (data, priority):
+                continue
+
+            if not compare_ttl or ttl is None or ttl == candidate_ttl:
+                return candidate
+
+        return None
+
+    def _get_sync_change(self, name, type, record, existing_record=None):
+        """
+        Return a create (or update if ``existing_record`` is provided) change
+        for the provided desired record.
+        """
+        extra = dict(record.extra or {})
+
+        if record.ttl is not None:
+            extra.setdefault("ttl", record.ttl)
+
+        if existing_record is None:
+            return RecordChange(
+                RecordChange.CREATE, name=name, type=type, data=record.data, extra=extra
+            )
+
+        return RecordChange(
+            RecordChange.UPDATE,
+            name=name,
+            type=type,
+            data=record.data,
+            extra=extra,
+            record=existing_record,
+        )
+
+    def _iterate_bind_entries(self, stream):
+        # type: (Iterable[str]) -> Iterator[str]
+        """
+        Return a generator of non-empty BIND zone file entries without
+        comments. Entries spanning multiple lines are joined into one line.
+        """
+        buffer = None
+
+        for line in stream:
+            line = line.rstrip("\r\n")
+
+            if ";" in line:
+                line = self._strip_bind_comment(line)
+
+            if buffer is None and "(" not in line:
+                if line.strip():
+                    yield line
+
+                continue
+
+            buffer = line if buffer is None else buffer + " " + line
+            depth, entry = self._strip_bind_parentheses(buffer)
+
+            if depth > 0:
+                continue
+
+            buffer = None
+
+            if entry.strip():
+                yield entry
+
+        if buffer is not None:
+            raise ValueError("Unbalanced parentheses: %s" % (buffer.strip()))
+
+    def _strip_bind_comment(self, line):
+        # type: (str) -> str
+        if '"' not in line:
+            return line.split(";", 1)[0]
+
+        quoted = False
+        escaped = False
+
+        for index, char in enumerate(line):
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                quoted = not quoted
+            elif char == ";" and not quoted:
+                return line[:index]
+
+        return line
+
+    def _strip_bind_parentheses(self, line):
+        # type: (str) -> Tuple[int, str]
+        """
+        Return number of unclosed parentheses and the line with parentheses
+        (outside of quoted strings) removed.
+        """
+        if '"' not in line:
+            depth = line.count("(") - line.count(")")
+            return depth, line.replace("(", " ").replace(")", " ")
+
+        depth = 0
+        quoted = False
+        escaped = False
+        chars = []
+
+        for char in line:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                quoted = not quoted
+            elif char in "()" and not quoted:
+                depth += 1 if char == "(" else -1
+                char = " "
+
+            chars.append(char)
+
+        return depth, "".join(chars)
+
+    def _split_bind_token(self, value):
+        # type: (str) -> List[str]
+        parts = value.split(None, 1)
+
+        if not parts:
+            raise ValueError("Incomplete record line")
+
+        if len(parts) == 1:
+            parts.append("")
+
+        return parts
+
+    def _parse_bind_ttl(self, value):
+        # type: (str) -> int
+        if value.isdigit():
+            return int(value)
+
+        ttl = 0
+        position = 0
+
+        for match in BIND_TTL_RE.finditer(value):
+            if match.start() != position:
+                break
+
+            ttl += int(match.group(1)) * BIND_TTL_UNITS[(match.group(2) or "s").lower()]
+            position = match.end()
+
+        if position == 0 or position != len(value):
+            raise ValueError("Invalid TTL: %s" % (value))
+
+        return ttl
+
+    def _get_bind_fqdn(self, name, origin):
+        # type: (str, Optional[str]) -> str
+        """
+        Return fully qualified (absolute) version of the provided name.
+        """
+        if name.endswith("."):
+            return name
+
+        if origin is None:
+            raise ValueError("Relative name %s used without an origin" % (name))
+
+        if name == "@":
+            return origin
+
+        if origin == ".":
+            return name + "."
+
+        return name + "." + origin
+
+    def _get_bind_relative_name(self, fqdn, origin):
+        # type: (str, Optional[str]) -> str
+        """
+        Return record name relative to the zone origin.
+        """
+        if origin is not None:
+            if fqdn.lower() == origin.lower():
+                return ""
+
+            suffix = "." + origin
+
+            if fqdn.lower().endswith(suffix.lower()):
+                return fqdn[: -len(suffix)]
+
+        return fqdn.rstrip(".")
+
+    def _get_bind_record_data(self, data, origin):
+        # type: (str, Optional[str]) -> str
+        """
+        Return record data with the trailing domain name fully qualified and
+        without the trailing dot (as used by the drivers).
+        """
+        parts = data.split()
+        parts[-1] = self._get_bind_fqdn(parts[-1], origin).rstrip(".")
+        return " ".join(parts)
+
+    def _unquote_bind_data(self, data):
+        # type: (str) -> str
+        """
+        Remove quotes from data which consists of a single quoted string.
+        """
+        if len(data) < 2 or data[0] != '"' or data[-1] != '"':
+            return data
+
+        value = data[1:-1]
+
+        if '"' in value.replace('\\"', ""):
+            # Multiple strings, return them as is
+            return data
+
+        return re.sub(r"\\(.)", r"\1", value)
+
     def _string_to_record_type(self, string):
         # type: (str) -> RecordType
         """
@@ -17,6 +17,8 @@ __all__ = ["CloudFlareDNSDriver"]
 
 import json
 import itertools
+import threading
+from hashlib import sha256
 
 from libcloud.dns.base import Zone, Record, DNSDriver
 from libcloud.dns.types import (
@@ -30,10 +32,24 @@ from libcloud.dns.types import (
 from libcloud.utils.misc import reverse_dict, merge_valid_keys
 from libcloud.common.base import JsonResponse, ConnectionKey, ConnectionUserAndKey
 from libcloud.common.types import LibcloudError, InvalidCredsError
+from libcloud.utils.ratelimit import RateLimiter
 
 API_HOST = "api.cloudflare.com"
 API_BASE = "/client/v4"
 
+# CloudFlare API allows 1200 requests per 5 minutes. The limit is enforced
+# client side with a bucket shared by all the connections which use the same
+# credentials - the initial burst plus the refill never exceed the limit in
+# any 5 minute window. A different limiter can be passed to the driver using
+# the "rate_limiter" argument.
+RATE_LIMIT_REQUESTS = 1200
+RATE_LIMIT_PERIOD = 300
+RATE_LIMIT_BURST = 200
+
+# Rate limiters keyed by the hash of the credentials they are used for
+_RATE_LIMITERS = {}  # type: dict
+_RATE_LIMITERS_LOCK = threading.Lock()
+
 CLOUDFLARE_TO_LIBCLOUD_ZONE_TYPE = {
     "full": "master",
     "partial": "slave",
@@ -151,10 +167,42 @@ class CloudFlareDNSResponse(JsonResponse):
             raise exception_class(**kwargs)
 
 
+def _get_rate_limiter(user_id, key):
+    """
+    Return the rate limiter for the provided credentials.
+
+    CloudFlare rate limit applies to each user so the limiter is shared by
+    all the connections which use the same credentials.
+    """
+    name = sha256("{}:{}".format(user_id or "", key).encode("utf-8")).hexdigest()
+
+    with _RATE_LIMITERS_LOCK:
+        rate_limiter = _RATE_LIMITERS.get(name)
+
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(
+                rate=float(RATE_LIMIT_REQUESTS - RATE_LIMIT_BURST) / RATE_LIMIT_PERIOD,
+                burst=RATE_LIMIT_BURST,
+            )
+            _RATE_LIMITERS[name] = rate_limiter
+
+    return rate_limiter
+
+
 class BaseDNSConnection:
     host = API_HOST
     secure = True
     responseCls = CloudFlareDNSResponse
+    # Defaults to the limiter shared by the connections with the same
+    # credentials
+    rate_limiter = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if self.rate_limiter is None:
+            user_id = getattr(self, "user_id", None)
+            self.rate_limiter = _get_rate_limiter(user_id, getattr(self, "key", None))
 
     def encode_data(self, data):
         return json.dumps(data)
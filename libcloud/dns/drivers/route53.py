@@ -22,12 +22,12 @@ import base64
 import datetime
 from hashlib import sha1
 
-from libcloud.dns.base import Zone, Record, DNSDriver
+from libcloud.dns.base import Zone, Record, DNSDriver, RecordChange, RecordChangeResult
 from libcloud.dns.types import Provider, RecordType, ZoneDoesNotExistError, RecordDoesNotExistError
 from libcloud.utils.py3 import ET, b, httplib, urlencode
 from libcloud.utils.xml import findall, findtext, fixxpath
 from libcloud.common.aws import AWSGenericResponse, AWSTokenConnection
-from libcloud.common.base import ConnectionUserAndKey
+from libcloud.common.base import RawResponse, ConnectionUserAndKey
 from libcloud.common.types import LibcloudError
 
 API_VERSION = "2012-02-29"
@@ -36,6 +36,12 @@ API_ROOT = "/%s/" % (API_VERSION)
 
 NAMESPACE = "https://{}/doc{}".format(API_HOST, API_ROOT)
 
+# Limits for a single ChangeResourceRecordSets request - the maximum number of
+# ResourceRecord elements and the maximum number of characters in all the
+# record values
+MAX_CHANGES_PER_BATCH = 1000
+MAX_CHARACTERS_PER_BATCH = 32000
+
 
 class InvalidChangeBatch(LibcloudError):
     pass
@@ -55,9 +61,14 @@ class Route53DNSResponse(AWSGenericResponse):
     }
 
 
+class Route53DNSRawResponse(Route53DNSResponse, RawResponse):
+    pass
+
+
 class BaseRoute53Connection(ConnectionUserAndKey):
     host = API_HOST
     responseCls = Route53DNSResponse
+    rawResponseCls = Route53DNSRawResponse
 
     def pre_connect_hook(self, params, headers):
         time_string = datetime.datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")
@@ -109,6 +120,10 @@ class Route53DNSDriver(DNSDriver):
         RecordType.TXT: "TXT",
     }
 
+    # Set to True to parse record listing responses incrementally as they are
+    # read from the connection instead of building the whole element tree
+    iterparse_list_responses = False
+
     def __init__(self, *args, **kwargs):
         self.token = kwargs.pop("token", None)
         super().__init__(*args, **kwargs)
@@ -117,6 +132,9 @@ class Route53DNSDriver(DNSDriver):
         return self._get_more("zones")
 
     def iterate_records(self, zone):
+        if self.iterparse_list_responses:
+            return self._iterparse_records(zone=zone)
+
         return self._get_more("records", zone=zone)
 
     def get_zone(self, zone_id):
@@ -236,6 +254,62 @@ class Route53DNSDriver(DNSDriver):
             raise RecordDoesNotExistError(value="", driver=self, record_id=r.id)
         return True
 
+    def apply_changes(self, zone, changes, concurrency=None):
+        """
+        Route53 manages all the values of a name and type as a single record
+        set, so the changes are first grouped by record set. A new record set
+        is created with all of its values and an existing record set is
+        deleted and created again with the new values (or only deleted if no
+        values remain). Values of an existing record set which aren't changed
+        are taken from the ``_other_records`` of the changed records, so a
+        create change which adds a value to an existing record set needs to
+        carry one of its records (see :meth:`DNSDriver.diff_zone`).
+
+        The record set changes are packed into as few
+        ``ChangeResourceRecordSets`` requests as the Route53 limits (1000
+        values and 32000 characters per request) allow. Route53 applies each
+        request atomically so if a request fails, all the changes which were
+        part of it are reported as failed.
+
+        @inherits: :class:`DNSDriver.apply_changes`
+        """
+        results = [None] * len(changes)
+        batches = []
+        indexes, batch, characters = set(), [], 0
+
+        for record_set_indexes, items in self._get_record_set_changes(changes):
+            item_characters = sum(
+                len(self._get_record_value(data, extra)) for _, _, _, data, extra in items
+            )
+
+            if batch and (
+                len(batch) + len(items) > MAX_CHANGES_PER_BATCH
+                or characters + item_characters > MAX_CHARACTERS_PER_BATCH
+            ):
+                batches.append((indexes, batch))
+                indexes, batch, characters = set(), [], 0
+
+            indexes.update(record_set_indexes)
+            batch.extend(items)
+            characters += item_characters
+
+        if batch:
+            batches.append((indexes, batch))
+
+        for indexes, batch in batches:
+            try:
+                self._post_changeset(zone, batch)
+            except Exception as e:
+                for index in indexes:
+                    results[index] = RecordChangeResult(changes[index], error=e)
+
+        for index, change in enumerate(changes):
+            if results[index] is None:
+                record = self._to_changed_record(zone, change)
+                results[index] = RecordChangeResult(change, record=record)
+
+        return results
+
     def ex_create_multi_value_record(self, name, zone, type, data, extra=None):
         """
         Create a record with multiple values with a single call.
@@ -377,13 +451,147 @@ class Route53DNSDriver(DNSDriver):
 
         return response.status == httplib.OK
 
+    def _get_record_set_changes(self, changes):
+        """
+        Group the provided changes by record set (name and type).
+
+        :return: ``(indexes, items)`` tuple for each modified record set where
+                 ``indexes`` are the indexes of the changes which modify it
+                 and ``items`` are the ``_post_changeset`` items which apply
+                 the changes.
+        :rtype: ``list`` of ``tuple``
+        """
+        record_sets = {}
+
+        def get_record_set(name, type, record=None):
+            record_set = record_sets.setdefault(
+                (name, type), {"indexes": [], "current": None, "removed": [], "added": []}
+            )
+
+            if record is not None and record_set["current"] is None:
+                # Values of the existing record set
+                record_set["current"] = [(record.data, record.extra)] + [
+                    (other["data"], other["extra"])
+                    for other in record.extra.get("_other_records", [])
+                ]
+
+            return record_set
+
+        for index, change in enumerate(changes):
+            record = change.record
+
+            if change.action != RecordChange.CREATE:
+                record_set = get_record_set(record.name, record.type, record)
+                record_set["indexes"].append(index)
+                record_set["removed"].append(self._get_record_value(record.data, record.extra))
+
+            if change.action != RecordChange.DELETE:
+                name, type, data, extra = self._get_change_values(change)
+
+                if change.action == RecordChange.CREATE and record is not None:
+                    # Value is added to the record set of an existing record
+                    record_set = get_record_set(name, type, record)
+                else:
+                    record_set = get_record_set(name, type)
+
+                if index not in record_set["indexes"]:
+                    record_set["indexes"].append(index)
+
+                record_set["added"].append((data, extra))
+
+        result = []
+
+        for (name, type), record_set in record_sets.items():
+            current = record_set["current"]
+            values = {}
+
+            for data, extra in current or []:
+                value = self._get_record_value(data, extra)
+
+                if value not in record_set["removed"]:
+                    values[value] = (data, extra)
+
+            ttl = current[0][1].get("ttl", None) if current else None
+
+            for data, extra in record_set["added"]:
+                values[self._get_record_value(data, extra)] = (data, extra)
+                ttl = extra.get("ttl", ttl)
+
+            items = []
+
+            if current is not None:
+                # The existing record set needs to be deleted using its
+                # current values
+                items.extend(("DELETE", name, type, data, extra) for data, extra in current)
+
+            items.extend(
+                ("CREATE", name, type, data, dict(extra, ttl=ttl))
+                for data, extra in values.values()
+            )
+
+            result.append((record_set["indexes"], items))
+
+        return result
+
+    def _get_change_values(self, change):
+        """
+        Return name, type, data and extra of the record created by the
+        provided create or update change.
+        """
+        if change.action == RecordChange.CREATE:
+            data = change.data
+
+            if change.type in (RecordType.TXT, RecordType.SPF):
+                data = self._quote_data(data)
+
+            return change.name, change.type, data, change.extra or {}
+
+        record = change.record
+        data = change.data if change.data is not None else record.data
+        return (
+            change.name or record.name,
+            change.type or record.type,
+            data,
+            change.extra or record.extra,
+        )
+
+    def _to_changed_record(self, zone, change):
+        if change.action == RecordChange.DELETE:
+            return None
+
+        name, type, data, extra = self._get_change_values(change)
+        id = ":".join((self.RECORD_TYPE_MAP[type], name))
+        return Record(
+            id=id,
+            name=name,
+            type=type,
+            data=data,
+            zone=zone,
+            driver=self,
+            ttl=extra.get("ttl", None),
+            extra=extra,
+        )
+
+    def _get_record_value(self, data, extra):
+        if "weight" in extra and "port" in extra:
+            return "{} {} {} {}".format(extra["priority"], extra["weight"], extra["port"], data)
+        if "priority" in extra:
+            return "{} {}".format(extra["priority"], data)
+        return data
+
     def _post_changeset(self, zone, changes_list):
         attrs = {"xmlns": NAMESPACE}
         changeset = ET.Element("ChangeResourceRecordSetsRequest", attrs)
         batch = ET.SubElement(changeset, "ChangeBatch")
         changes = ET.SubElement(batch, "Changes")
 
+        # Values of the same record set need to be part of a single change
+        record_sets = {}
+
         for action, name, type_, data, extra in changes_list:
+            record_sets.setdefault((action, name, type_), []).append((data, extra))
+
+        for (action, name, type_), values in record_sets.items():
             change = ET.SubElement(changes, "Change")
             ET.SubElement(change, "Action").text = action
 
@@ -396,13 +604,13 @@ class Route53DNSDriver(DNSDriver):
 
             ET.SubElement(rrs, "Name").text = record_name
             ET.SubElement(rrs, "Type").text = self.RECORD_TYPE_MAP[type_]
-            ET.SubElement(rrs, "TTL").text = str(extra.get("ttl", "0"))
+            ET.SubElement(rrs, "TTL").text = str(values[0][1].get("ttl", "0"))
 
             rrecs = ET.SubElement(rrs, "ResourceRecords")
-            rrec = ET.SubElement(rrecs, "ResourceRecord")
-            if "priority" in extra:
-                data = "{} {}".format(extra["priority"], data)
-            ET.SubElement(rrec, "Value").text = data
+
+            for data, extra in values:
+                rrec = ET.SubElement(rrecs, "ResourceRecord")
+                ET.SubElement(rrec, "Value").text = self._get_record_value(data, extra)
 
         uri = API_ROOT + "hostedzone/" + zone.id + "/rrset"
         data = ET.tostring(changeset)
@@ -437,50 +645,53 @@ class Route53DNSDriver(DNSDriver):
             fixxpath(xpath="ResourceRecordSets/ResourceRecordSet", namespace=NAMESPACE)
         )
         for elem in elems:
-            record_set = elem.findall(
-                fixxpath(xpath="ResourceRecords/ResourceRecord", namespace=NAMESPACE)
-            )
-            record_count = len(record_set)
-            multiple_value_record = record_count > 1
+            records.extend(self._to_record_set_records(elem=elem, zone=zone))
 
-            record_set_records = []
+        return records
 
-            for index, record in enumerate(record_set):
-                # Need to special handling for records with multiple values for
-                # update to work correctly
-                record = self._to_record(elem=elem, zone=zone, index=index)
-                record.extra["_multi_value"] = multiple_value_record
+    def _to_record_set_records(self, elem, zone):
+        record_set = elem.findall(
+            fixxpath(xpath="ResourceRecords/ResourceRecord", namespace=NAMESPACE)
+        )
+        record_count = len(record_set)
+        multiple_value_record = record_count > 1
 
-                if multiple_value_record:
-                    record.extra["_other_records"] = []
+        record_set_records = []
 
-                record_set_records.append(record)
+        for index, record in enumerate(record_set):
+            # Need to special handling for records with multiple values for
+            # update to work correctly
+            record = self._to_record(elem=elem, zone=zone, index=index)
+            record.extra["_multi_value"] = multiple_value_record
 
-            # Store reference to other records so update works correctly
             if multiple_value_record:
-                for index in range(0, len(record_set_records)):
-                    record = record_set_records[index]
+                record.extra["_other_records"] = []
 
-                    for other_index, other_record in enumerate(record_set_records):
-                        if index == other_index:
-                            # Skip current record
-                            continue
+            record_set_records.append(record)
 
-                        extra = copy.deepcopy(other_record.extra)
-                        extra.pop("_multi_value")
-                        extra.pop("_other_records")
+        # Store reference to other records so update works correctly
+        if multiple_value_record:
+            for index in range(0, len(record_set_records)):
+                record = record_set_records[index]
 
-                        item = {
-                            "name": other_record.name,
-                            "data": other_record.data,
-                            "type": other_record.type,
-                            "extra": extra,
-                        }
-                        record.extra["_other_records"].append(item)
+                for other_index, other_record in enumerate(record_set_records):
+                    if index == other_index:
+                        # Skip current record
+                        continue
 
-            records.extend(record_set_records)
+                    extra = copy.deepcopy(other_record.extra)
+                    extra.pop("_multi_value")
+                    extra.pop("_other_records")
 
-        return records
+                    item = {
+                        "name": other_record.name,
+                        "data": other_record.data,
+                        "type": other_record.type,
+                        "extra": extra,
+                    }
+                    record.extra["_other_records"].append(item)
+
+        return record_set_records
 
     def _to_record(self, elem, zone, index=0):
         name = findtext(element=elem, xpath="Name", namespace=NAMESPACE)
@@ -531,6 +742,44 @@ class Route53DNSDriver(DNSDriver):
             items, last_key, exhausted = self._get_data(rtype, last_key, **kwargs)
             yield from items
 
+    def _iterparse_records(self, zone):
+        """
+        Retrieve the records page by page and parse the responses
+        incrementally so the records of a record set are yielded as soon as
+        the record set has been read from the connection.
+        """
+        path = API_ROOT + "hostedzone/%s/rrset" % (zone.id)
+        params = {}
+
+        while True:
+            self.connection.set_context({"zone_id": zone.id})
+            response = self.connection.request(path, params=params, raw=True, stream=True)
+
+            try:
+                if response.status != httplib.OK:
+                    # Same as for the regular listing, see _get_data
+                    return
+
+                elems = response.iterparse_body(
+                    xpath="ResourceRecordSets/ResourceRecordSet", namespace=NAMESPACE
+                )
+
+                for elem in elems:
+                    yield from self._to_record_set_records(elem=elem, zone=zone)
+            finally:
+                # Release the connection also when the caller stops iterating
+                # before the whole page has been read
+                response.close()
+
+            is_truncated = findtext(element=elems.root, xpath="IsTruncated", namespace=NAMESPACE)
+
+            if is_truncated != "true":
+                break
+
+            params["name"] = findtext(
+                element=elems.root, xpath="NextRecordName", namespace=NAMESPACE
+            )
+
     def _get_data(self, rtype, last_key, **kwargs):
         params = {}
         if last_key:
@@ -19,7 +19,10 @@ verification, depending on libcloud.security settings.
 """
 
 import os
+import ssl
+import asyncio
 import warnings
+import threading
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -35,7 +38,18 @@ except ImportError:
     from requests.packages.urllib3.poolmanager import PoolManager  # type: ignore
 
 
-__all__ = ["LibcloudBaseConnection", "LibcloudConnection"]
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+__all__ = [
+    "LibcloudBaseConnection",
+    "LibcloudConnection",
+    "AsyncLibcloudConnection",
+    "AsyncResponse",
+    "ThreadLocalAttribute",
+]
 
 ALLOW_REDIRECTS = 1
 
@@ -46,11 +60,54 @@ HTTP_PROXY_ENV_VARIABLE_NAME = "http_proxy"
 HTTPS_PROXY_ENV_VARIABLE_NAME = "https_proxy"
 
 
+class ThreadLocalAttribute:
+    """
+    Instance attribute which has a separate value in each thread when the
+    ``thread_safe`` attribute of the instance is True.
+
+    Otherwise the value is stored in the instance dictionary like a regular
+    attribute.
+    """
+
+    def __init__(self, default_factory=None):
+        """
+        :param default_factory: Callable which returns the default value.
+        :type default_factory: ``callable``
+        """
+        self.default_factory = default_factory
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def _get_storage(self, instance):
+        if not instance.thread_safe:
+            return instance.__dict__
+
+        # Note: dict.setdefault is atomic so all the threads get the same
+        # thread local object
+        thread_local = instance.__dict__.setdefault("_thread_local_state", threading.local())
+        return thread_local.__dict__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        storage = self._get_storage(instance)
+
+        if self.name not in storage:
+            storage[self.name] = self.default_factory() if self.default_factory else None
+
+        return storage[self.name]
+
+    def __set__(self, instance, value):
+        self._get_storage(instance)[self.name] = value
+
+
 class SignedHTTPSAdapter(HTTPAdapter):
-    def __init__(self, cert_file, key_file):
+    def __init__(self, cert_file, key_file, **kwargs):
         self.cert_file = cert_file
         self.key_file = key_file
-        super().__init__()
+        super().__init__(**kwargs)
 
     def init_poolmanager(self, connections, maxsize, block=False):
         self.poolmanager = PoolManager(
@@ -176,18 +233,51 @@ class LibcloudBaseConnection:
             else:
                 self.ca_cert = ca_certs_path
 
-    def _setup_signing(self, cert_file=None, key_file=None):
+    def _setup_signing(self, cert_file=None, key_file=None, pool_kwargs=None, **kwargs):
         """
         Setup request signing by mounting a signing
         adapter to the session
         """
-        self.session.mount("https://", SignedHTTPSAdapter(cert_file, key_file))
+        self.session.mount(
+            "https://", SignedHTTPSAdapter(cert_file, key_file, **(pool_kwargs or {}))
+        )
+
+    def _setup_pool(self, pool_connections=None, pool_maxsize=None):
+        """
+        Setup the size of the connection pool of the session.
+
+        :param pool_connections: Number of hosts for which connections are
+                                 kept in the pool.
+        :type pool_connections: ``int``
+
+        :param pool_maxsize: Maximum number of connections which are kept in
+                             the pool for a single host. It should be at
+                             least the number of threads which share the
+                             connection.
+        :type pool_maxsize: ``int``
+        """
+        pool_kwargs = {}
+
+        if pool_connections:
+            pool_kwargs["pool_connections"] = pool_connections
+
+        if pool_maxsize:
+            pool_kwargs["pool_maxsize"] = pool_maxsize
+
+        adapter = HTTPAdapter(**pool_kwargs)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
 
 class LibcloudConnection(LibcloudBaseConnection):
     timeout = None
     host = None
-    response = None
+
+    # Last response, it's local to each thread when the connection is
+    # thread-safe so a single connection (and its pool) can be shared
+    # between threads
+    response = ThreadLocalAttribute()
+    thread_safe = False
 
     def __init__(self, host, port, secure=None, **kwargs):
         scheme = "https" if secure is not None and secure else "http"
@@ -211,9 +301,21 @@ class LibcloudConnection(LibcloudBaseConnection):
         LibcloudBaseConnection.__init__(self)
 
         self.session.timeout = kwargs.pop("timeout", DEFAULT_REQUEST_TIMEOUT)
+        self.thread_safe = kwargs.pop("thread_safe", False)
+
+        pool_kwargs = {}
+
+        for name in ("pool_connections", "pool_maxsize"):
+            value = kwargs.pop(name, None)
+
+            if value:
+                pool_kwargs[name] = value
+
+        if pool_kwargs:
+            self._setup_pool(**pool_kwargs)
 
         if "cert_file" in kwargs or "key_file" in kwargs:
-            self._setup_signing(**kwargs)
+            self._setup_signing(pool_kwargs=pool_kwargs, **kwargs)
 
         if proxy_url:
             self.set_http_proxy(proxy_url=proxy_url)
@@ -340,3 +442,152 @@ class HttpLibResponseProxy:
         # NOTE: We use property to avoid saving whole response body into RAM
         # See https://github.com/apache/libcloud/pull/1132 for details
         return self._response.content
+
+
+class AsyncResponse:
+    """
+    A fully read response of :class:`AsyncLibcloudConnection`.
+
+    It provides the attributes of :class:`requests.Response` which are used
+    by the :class:`libcloud.common.base.Response` classes so those can be
+    used with asynchronous requests as well.
+    """
+
+    def __init__(self, status_code, reason, headers, content, encoding=None, request=None):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        self.request = request
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for index in range(0, len(self.content), chunk_size):
+            yield self.content[index : index + chunk_size]
+
+
+class AsyncLibcloudConnection(LibcloudBaseConnection):
+    """
+    Asyncio HTTP transport which is used by
+    :class:`libcloud.common.base.AsyncConnection`.
+
+    Unlike :class:`LibcloudConnection` it isn't bound to a single host,
+    requests are made to absolute URLs. It requires the aiohttp library.
+    """
+
+    timeout = None
+
+    def __init__(self, timeout=None, proxy_url=None):
+        if aiohttp is None:
+            raise ImportError(
+                "Missing aiohttp dependency, you can install it using pip: "
+                "pip install apache-libcloud[async]"
+            )
+
+        https_proxy_url_env = os.environ.get(HTTPS_PROXY_ENV_VARIABLE_NAME, None)
+        http_proxy_url_env = os.environ.get(HTTP_PROXY_ENV_VARIABLE_NAME, https_proxy_url_env)
+
+        # Connection argument has precedence over environment variables
+        proxy_url = proxy_url or http_proxy_url_env
+
+        self._setup_verify()
+        self._setup_ca_cert()
+
+        self.timeout = timeout or DEFAULT_REQUEST_TIMEOUT
+        self.proxy_url = None
+        self._loop = None
+
+        if proxy_url:
+            self.set_http_proxy(proxy_url=proxy_url)
+
+    def set_http_proxy(self, proxy_url):
+        """
+        Set a HTTP proxy which will be used with this connection.
+
+        :param proxy_url: Proxy URL (e.g. http://<hostname>:<port>).
+        :type proxy_url: ``str``
+        """
+        result = self._parse_proxy_url(proxy_url=proxy_url)
+
+        (
+            self.proxy_scheme,
+            self.proxy_host,
+            self.proxy_port,
+            self.proxy_username,
+            self.proxy_password,
+        ) = result
+        self.http_proxy_used = True
+        self.proxy_url = proxy_url
+
+    def _get_session(self):
+        # Sessions are bound to the event loop they were created in
+        loop = asyncio.get_running_loop()
+
+        if self.session is not None and self._loop is not loop:
+            self._close_stale_session()
+
+        if self.session is None:
+            if self.verify is False:
+                ssl_context = False
+            else:
+                ssl_context = ssl.create_default_context(cafile=self.ca_cert)
+
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=ssl_context),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._loop = loop
+
+        return self.session
+
+    def _close_stale_session(self):
+        """
+        Close the session which was created in a different event loop than
+        the running one.
+        """
+        session, loop = self.session, self._loop
+        self.session = None
+        self._loop = None
+
+        if loop.is_running():
+            # The loop runs in a different thread, the session is closed there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            # The connections of a loop which doesn't run anymore can't be
+            # closed gracefully, the session is only marked as closed
+            session.detach()
+
+    async def request(self, method, url, body=None, headers=None):
+        """
+        Perform a request and read the whole response body.
+
+        :rtype: :class:`AsyncResponse`
+        """
+        session = self._get_session()
+
+        async with session.request(
+            method=method,
+            url=url,
+            data=body,
+            headers=headers,
+            allow_redirects=bool(ALLOW_REDIRECTS),
+            proxy=self.proxy_url,
+            # Like requests, don't add a Content-Type header which wasn't
+            # provided (it could invalidate request signatures)
+            skip_auto_headers=("Content-Type",),
+        ) as response:
+            content = await response.read()
+
+            return AsyncResponse(
+                status_code=response.status,
+                reason=response.reason,
+                headers=dict(response.headers),
+                content=content,
+                encoding=response.charset,
+                request=response.request_info,
+            )
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
@@ -15,16 +15,27 @@
 
 __all__ = ["ApplicationLBDriver"]
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from libcloud.utils.xml import findall, findtext
 from libcloud.common.aws import AWSGenericResponse, SignedAWSConnection
 from libcloud.loadbalancer.base import Driver, Member, LoadBalancer
-from libcloud.loadbalancer.types import State
+from libcloud.loadbalancer.types import State, LibcloudLBError
 
 VERSION = "2015-12-01"
 HOST = "elasticloadbalancing.%s.amazonaws.com"
 ROOT = "/%s/" % (VERSION)
 NS = "http://elasticloadbalancing.amazonaws.com/doc/{}/".format(VERSION)
 
+# Maximum number of ARNs which can be passed to a single DescribeLoadBalancers
+# or DescribeTags call
+MAX_ARNS_PER_REQUEST = 20
+
+# Maximum number of concurrent DescribeListeners calls issued when load
+# balancers are retrieved (the call only accepts a single load balancer)
+DESCRIBE_LISTENERS_CONCURRENCY = 8
+
 
 class ALBResponse(AWSGenericResponse):
     """
@@ -32,7 +43,7 @@ class ALBResponse(AWSGenericResponse):
     """
 
     namespace = NS
-    exceptions = {}
+    exceptions = {"LoadBalancerNotFound": LibcloudLBError}
     xpath = "Error"
 
 
@@ -91,9 +102,7 @@ class ALBTargetGroup:
     @property
     def balancers(self):
         if not self._balancers and self._balancers_arns:
-            self._balancers = []
-            for balancer_arn in self._balancers_arns:
-                self._balancers.append(self._driver.get_balancer(balancer_arn))
+            self._balancers = self._driver.ex_get_balancers(self._balancers_arns)
         return self._balancers
 
     @balancers.setter
@@ -224,10 +233,20 @@ class ApplicationLBDriver(Driver):
     connectionCls = ALBConnection
     signature_version = "4"
 
-    def __init__(self, access_id, secret, region, token=None):
+    def __init__(self, access_id, secret, region, token=None, cache_ttl=0):
+        """
+        :param cache_ttl: Number of seconds for which load balancers and
+                          target group members are cached by ARN and reused
+                          when the same resource is resolved again. Load
+                          balancers changed by the driver methods are
+                          removed from the cache. 0 disables caching.
+        :type cache_ttl: ``int``
+        """
         self.token = token
         self.region = region
         self.region_name = region
+        self.cache_ttl = cache_ttl
+        self._cache = {}
         super().__init__(access_id, secret, token=token, host=HOST % region, region=region)
 
     def list_protocols(self):
@@ -257,12 +276,49 @@ class ApplicationLBDriver(Driver):
 
         :rtype: :class:`LoadBalancer`
         """
-        params = {
-            "Action": "DescribeLoadBalancers",
-            "LoadBalancerArns.member.1": balancer_id,
-        }
-        data = self.connection.request(ROOT, params=params).object
-        return self._to_balancers(data)[0]
+        return self.ex_get_balancers([balancer_id])[0]
+
+    def ex_get_balancers(self, balancer_ids):
+        """
+        Get load balancer objects for multiple ARNs.
+
+        Load balancers are retrieved using as few DescribeLoadBalancers calls
+        as possible and, if ``cache_ttl`` is set, served from the cache.
+
+        :param  balancer_ids: ARNs of load balancers you wish to fetch.
+        :type  balancer_ids: ``list`` of ``str``
+
+        :return: Load balancers in the same order as the provided ARNs
+        :rtype: ``list`` of :class:`LoadBalancer`
+        """
+        balancers = {}
+        missing_ids = []
+
+        for balancer_id in balancer_ids:
+            balancer = self._get_cached("balancer", balancer_id)
+
+            if balancer is not None:
+                balancers[balancer_id] = balancer
+            elif balancer_id not in missing_ids:
+                missing_ids.append(balancer_id)
+
+        for i in range(0, len(missing_ids), MAX_ARNS_PER_REQUEST):
+            params = {"Action": "DescribeLoadBalancers"}
+
+            for idx, balancer_id in enumerate(missing_ids[i : i + MAX_ARNS_PER_REQUEST], 1):
+                params["LoadBalancerArns.member." + str(idx)] = balancer_id
+
+            data = self.connection.request(ROOT, params=params).object
+
+            for balancer in self._to_balancers(data):
+                self._set_cached("balancer", balancer.id, balancer)
+                balancers[balancer.id] = balancer
+
+        for balancer_id in balancer_ids:
+            if balancer_id not in balancers:
+                raise LibcloudLBError("Load balancer not found: %s" % (balancer_id), driver=self)
+
+        return [balancers[balancer_id] for balancer_id in balancer_ids]
 
     def create_balancer(
         self,
@@ -547,6 +603,8 @@ class ApplicationLBDriver(Driver):
         for el in findall(element=data, xpath=xpath, namespace=NS):
             target_group = self._to_target_group(el)
 
+        self._clear_cached_balancers(target_group._balancers_arns)
+
         return target_group
 
     def ex_register_targets(self, target_group, members=None):
@@ -583,6 +641,8 @@ class ApplicationLBDriver(Driver):
 
         # RegisterTargets doesn't return any useful data
         self.connection.request(ROOT, params=params)
+        self._cache.pop(("target_health", target_group.id), None)
+        self._clear_cached_balancers(target_group._balancers_arns)
 
         target_group.members = members
 
@@ -657,6 +717,8 @@ class ApplicationLBDriver(Driver):
             listener = self._to_listener(el)
             listener.balancer = balancer
 
+        self._clear_cached_balancers([balancer.id])
+
         return listener
 
     def ex_create_listener_rule(
@@ -717,6 +779,8 @@ class ApplicationLBDriver(Driver):
             rule = self._to_rule(el)
             rule.listener = listener
 
+        self._clear_cached_balancers([listener._balancer_arn])
+
         return rule
 
     def ex_get_target_group(self, target_group_id):
@@ -740,6 +804,47 @@ class ApplicationLBDriver(Driver):
 
         return self._to_target_groups(data)[0]
 
+    def ex_list_target_groups(self):
+        """
+        List all target groups.
+
+        Load balancers of all the returned target groups are resolved at once
+        using batched DescribeLoadBalancers calls.
+
+        :rtype: ``list`` of :class:`ALBTargetGroup`
+        """
+        params = {"Action": "DescribeTargetGroups"}
+        target_groups = []
+
+        while True:
+            data = self.connection.request(ROOT, params=params).object
+            target_groups.extend(self._to_target_groups(data))
+
+            marker = findtext(
+                element=data, xpath="DescribeTargetGroupsResult/NextMarker", namespace=NS
+            )
+
+            if not marker:
+                break
+
+            params["Marker"] = marker
+
+        balancer_ids = []
+
+        for target_group in target_groups:
+            for balancer_id in target_group._balancers_arns:
+                if balancer_id not in balancer_ids:
+                    balancer_ids.append(balancer_id)
+
+        balancers = {balancer.id: balancer for balancer in self.ex_get_balancers(balancer_ids)}
+
+        for target_group in target_groups:
+            target_group._balancers = [
+                balancers[balancer_id] for balancer_id in target_group._balancers_arns
+            ]
+
+        return target_groups
+
     def ex_get_listener(self, listener_id):
         """
         Get listener object by ARN
@@ -795,7 +900,7 @@ class ApplicationLBDriver(Driver):
 
         return listener
 
-    def _to_balancer(self, el):
+    def _to_balancer(self, el, tags=None, listeners=None):
         balancer = LoadBalancer(
             id=findtext(element=el, xpath="LoadBalancerArn", namespace=NS),
             name=findtext(element=el, xpath="LoadBalancerName", namespace=NS),
@@ -806,8 +911,10 @@ class ApplicationLBDriver(Driver):
         )
 
         balancer.extra = {
-            "listeners": self._ex_get_balancer_listeners(balancer),
-            "tags": self._ex_get_balancer_tags(balancer),
+            "listeners": (
+                self._ex_get_balancer_listeners(balancer) if listeners is None else listeners
+            ),
+            "tags": self._ex_get_balancer_tags(balancer) if tags is None else tags,
             "vpc": findtext(el, xpath="VpcId", namespace=NS),
         }
 
@@ -820,7 +927,21 @@ class ApplicationLBDriver(Driver):
 
     def _to_balancers(self, data):
         xpath = "DescribeLoadBalancersResult/LoadBalancers/member"
-        return [self._to_balancer(el) for el in findall(element=data, xpath=xpath, namespace=NS)]
+        elements = findall(element=data, xpath=xpath, namespace=NS)
+
+        # Tags for all the balancers are retrieved in batches instead of
+        # issuing a DescribeTags call per balancer and listeners are retrieved
+        # concurrently
+        balancer_ids = [
+            findtext(element=el, xpath="LoadBalancerArn", namespace=NS) for el in elements
+        ]
+        tags = self._ex_get_resources_tags(balancer_ids)
+        listeners = self._ex_get_balancers_listeners(balancer_ids)
+
+        return [
+            self._to_balancer(el, tags=tags.get(balancer_id, {}), listeners=listeners[balancer_id])
+            for el, balancer_id in zip(elements, balancer_ids)
+        ]
 
     def _to_tags(self, data):
         """
@@ -837,6 +958,25 @@ class ApplicationLBDriver(Driver):
 
         return tags
 
+    def _to_resources_tags(self, data):
+        """
+        return dict of tags dicts keyed by resource ARN
+        """
+        resources_tags = {}
+        xpath = "DescribeTagsResult/TagDescriptions/member"
+
+        for el in findall(element=data, xpath=xpath, namespace=NS):
+            resource_arn = findtext(element=el, xpath="ResourceArn", namespace=NS)
+            tags = resources_tags.setdefault(resource_arn, {})
+
+            for tag_el in findall(element=el, xpath="Tags/member", namespace=NS):
+                key = findtext(element=tag_el, xpath="Key", namespace=NS)
+                value = findtext(element=tag_el, xpath="Value", namespace=NS)
+                if key:
+                    tags[key] = value
+
+        return resources_tags
+
     def _to_rule(self, el):
         def __to_bool__(val):
             return val.lower() in ("yes", "true", "t", "1")
@@ -937,9 +1077,15 @@ class ApplicationLBDriver(Driver):
         :rtype: ``list`` of :class:`Member`
         """
 
-        params = {"Action": "DescribeTargetHealth", "TargetGroupArn": target_group.id}
+        # Responses are cached so target group objects with the same ARN share
+        # the same DescribeTargetHealth result
+        data = self._get_cached("target_health", target_group.id)
+
+        if data is None:
+            params = {"Action": "DescribeTargetHealth", "TargetGroupArn": target_group.id}
+            data = self.connection.request(ROOT, params=params).object
+            self._set_cached("target_health", target_group.id, data)
 
-        data = self.connection.request(ROOT, params=params).object
         target_group_members = []
         for tg_member in self._to_target_group_members(data):
             tg_member.extra["target_group"] = target_group
@@ -957,10 +1103,39 @@ class ApplicationLBDriver(Driver):
         :return: list of listener objects
         :rtype: ``list`` of :class:`ALBListener`
         """
-        params = {"Action": "DescribeListeners", "LoadBalancerArn": balancer.id}
+        return self._describe_listeners(self.connection, balancer.id)
 
-        data = self.connection.request(ROOT, params=params).object
+    def _ex_get_balancers_listeners(self, balancer_ids):
+        """
+        Get listeners for multiple load balancers.
+
+        DescribeListeners only accepts a single load balancer so the calls
+        are issued concurrently, using a connection per thread.
 
+        :param balancer_ids: ARNs of the load balancers to fetch listeners for
+        :type balancer_ids: ``list`` of ``str``
+
+        :return: Dictionary of listener lists keyed by load balancer ARN
+        :rtype: ``dict``
+        """
+
+        if len(balancer_ids) <= 1:
+            return {
+                balancer_id: self._describe_listeners(self.connection, balancer_id)
+                for balancer_id in balancer_ids
+            }
+
+        def get_listeners(balancer_id):
+            return self._describe_listeners(self._get_thread_connection(), balancer_id)
+
+        max_workers = min(DESCRIBE_LISTENERS_CONCURRENCY, len(balancer_ids))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(balancer_ids, executor.map(get_listeners, balancer_ids)))
+
+    def _describe_listeners(self, connection, balancer_id):
+        params = {"Action": "DescribeListeners", "LoadBalancerArn": balancer_id}
+        data = connection.request(ROOT, params=params).object
         return self._to_listeners(data)
 
     def _ex_get_rules_for_listener(self, listener):
@@ -997,6 +1172,66 @@ class ApplicationLBDriver(Driver):
         data = self.connection.request(ROOT, params=params).object
         return self._to_tags(data)
 
+    def _ex_get_resources_tags(self, resource_ids):
+        """
+        Get tags for multiple resources using as few DescribeTags calls as
+        possible.
+
+        :param resource_ids: ARNs of the resources to fetch tags for
+        :type resource_ids: ``list`` of ``str``
+
+        :return: Dictionary of tags dictionaries keyed by resource ARN
+        :rtype: ``dict``
+        """
+        resources_tags = {}
+
+        for i in range(0, len(resource_ids), MAX_ARNS_PER_REQUEST):
+            params = {"Action": "DescribeTags"}
+
+            for idx, resource_id in enumerate(resource_ids[i : i + MAX_ARNS_PER_REQUEST], 1):
+                params["ResourceArns.member." + str(idx)] = resource_id
+
+            data = self.connection.request(ROOT, params=params).object
+            resources_tags.update(self._to_resources_tags(data))
+
+        return resources_tags
+
+    def _get_cached(self, kind, arn):
+        """
+        Return the cached value for the provided resource ARN or None if it's
+        not cached or it has expired.
+        """
+        item = self._cache.get((kind, arn))
+
+        if item is None:
+            return None
+
+        expires_at, value = item
+
+        if time.time() >= expires_at:
+            del self._cache[(kind, arn)]
+            return None
+
+        return value
+
+    def _set_cached(self, kind, arn, value):
+        if self.cache_ttl:
+            self._cache[(kind, arn)] = (time.time() + self.cache_ttl, value)
+
+    def _clear_cached_balancers(self, balancer_ids):
+        """
+        Remove the load balancers which have been changed from the cache.
+        """
+        for balancer_id in balancer_ids:
+            self._cache.pop(("balancer", balancer_id), None)
+
+    def ex_clear_cache(self):
+        """
+        Remove all the load balancers and target group members from the
+        cache.
+        """
+        self._cache.clear()
+
     def _ex_connection_class_kwargs(self):
         pdriver = super()
         kwargs = pdriver._ex_connection_class_kwargs()
@@ -19,9 +19,12 @@ A class which handles loading the pricing files.
 
 
 import re
+import mmap
 import os.path
+import threading
 from typing import Dict, Union, Optional
 from os.path import join as pjoin
+from collections import OrderedDict
 
 try:
     import simplejson as json
@@ -63,6 +66,34 @@ VALID_PRICING_DRIVER_TYPES = ["compute", "storage"]
 # one for the drivers which are used
 CACHE_ALL_PRICING_DATA = False
 
+# Maximum number of driver pricing sections loaded from the pricing file which
+# are cached in memory. When the limit is reached, the least recently used
+# section is evicted. Pricing set using set_pricing() is never evicted.
+PRICING_CACHE_MAX_SIZE = 32
+
+# (driver_type, driver_name) tuples of the pricing sections which have been
+# loaded from the pricing file, ordered from the least to the most recently
+# used one
+_PRICING_CACHE_LRU = OrderedDict()  # type: OrderedDict
+
+# Byte offsets of the driver sections in the pricing files keyed by the file
+# path, modification time and size
+_PRICING_FILE_INDEXES = {}  # type: Dict[tuple, Optional[Dict]]
+
+# Memoized get_size_price() results keyed by (driver_type, driver_name). Each
+# value is a (pricing, prices) tuple so the results are discarded when the
+# driver pricing is replaced.
+_SIZE_PRICES = {}  # type: Dict[tuple, tuple]
+
+# Guards the pricing data cache and the LRU bookkeeping which are shared by
+# all the threads
+_PRICING_LOCK = threading.RLock()
+
+# Prefixes of the lines with top level keys and driver names in pricing files
+# which are formatted the same way as the default one (4 spaces indentation)
+_SECTION_KEY_PREFIX = b'\n    "'
+_DRIVER_KEY_PREFIX = b'\n        "'
+
 
 def get_pricing_file_path(file_path=None):
     # type: (Optional[str]) -> str
@@ -108,12 +139,27 @@ def get_pricing(driver_type, driver_name, pricing_file_path=None, cache_all=Fals
     if driver_type not in VALID_PRICING_DRIVER_TYPES:
         raise AttributeError("Invalid driver type: %s", driver_type)
 
-    if driver_name in PRICING_DATA[driver_type]:
-        return PRICING_DATA[driver_type][driver_name]
+    with _PRICING_LOCK:
+        if driver_name in PRICING_DATA[driver_type]:
+            key = (driver_type, driver_name)
+
+            if key in _PRICING_CACHE_LRU:
+                _PRICING_CACHE_LRU.move_to_end(key)
+
+            return PRICING_DATA[driver_type][driver_name]
 
     if not pricing_file_path:
         pricing_file_path = get_pricing_file_path(file_path=pricing_file_path)
 
+    if not cache_all:
+        driver_pricing = _read_driver_pricing(pricing_file_path, driver_type, driver_name)
+
+        if driver_pricing is not None:
+            _cache_driver_pricing(driver_type, driver_name, driver_pricing)
+            return driver_pricing
+
+    # The file layout is not supported by the index or all the data should be
+    # cached so the whole file is parsed
     with open(pricing_file_path) as fp:
         content = fp.read()
 
@@ -125,20 +171,148 @@ def get_pricing(driver_type, driver_name, pricing_file_path=None, cache_all=Fals
     # memory
 
     if cache_all:
-        for driver_type in VALID_PRICING_DRIVER_TYPES:
-            # pylint: disable=maybe-no-member
-            pricing = pricing_data.get(driver_type, None)
+        with _PRICING_LOCK:
+            for driver_type in VALID_PRICING_DRIVER_TYPES:
+                # pylint: disable=maybe-no-member
+                pricing = pricing_data.get(driver_type, None)
 
-            if not pricing:
-                continue
+                if not pricing:
+                    continue
 
-            PRICING_DATA[driver_type] = pricing
+                PRICING_DATA[driver_type] = pricing
     else:
-        set_pricing(driver_type=driver_type, driver_name=driver_name, pricing=driver_pricing)
+        _cache_driver_pricing(driver_type, driver_name, driver_pricing)
 
     return driver_pricing
 
 
+def _cache_driver_pricing(driver_type, driver_name, pricing):
+    """
+    Cache pricing loaded from the pricing file and evict the least recently
+    used driver pricing if the cache is full.
+    """
+    with _PRICING_LOCK:
+        set_pricing(driver_type=driver_type, driver_name=driver_name, pricing=pricing)
+        _PRICING_CACHE_LRU[(driver_type, driver_name)] = True
+
+        while len(_PRICING_CACHE_LRU) > PRICING_CACHE_MAX_SIZE:
+            evicted_type, evicted_name = _PRICING_CACHE_LRU.popitem(last=False)[0]
+            PRICING_DATA[evicted_type].pop(evicted_name, None)
+            _SIZE_PRICES.pop((evicted_type, evicted_name), None)
+
+
+def _read_driver_pricing(file_path, driver_type, driver_name):
+    """
+    Read pricing for a single driver from the pricing file without parsing the
+    rest of the file.
+
+    Returns None if the file layout is not supported by the index in which
+    case the caller needs to parse the whole file.
+
+    :rtype: ``dict``
+    """
+    stat = os.stat(file_path)
+
+    with open(file_path, "rb") as fp:
+        try:
+            data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            return None
+
+        with data:
+            cache_key = (file_path, stat.st_mtime_ns, stat.st_size)
+
+            with _PRICING_LOCK:
+                if cache_key not in _PRICING_FILE_INDEXES:
+                    _PRICING_FILE_INDEXES[cache_key] = _index_pricing_file(data)
+
+                index = _PRICING_FILE_INDEXES[cache_key]
+
+            if index is None or driver_type not in index:
+                return None
+
+            if driver_name not in index[driver_type]:
+                raise KeyError(driver_name)
+
+            start, end = index[driver_type][driver_name]
+
+            try:
+                return json.loads(data[start:end].decode("utf-8"))
+            except JSONDecodeError:
+                return None
+
+
+def _index_pricing_file(data):
+    """
+    Build an index with the byte offsets of each driver pricing section in the
+    provided pricing file content.
+
+    The index is only built for files which are formatted the same way as the
+    default pricing file. None is returned for other files.
+
+    :rtype: ``dict``
+    """
+    if data[:1] != b"{":
+        return None
+
+    sections = _find_keys(data, _SECTION_KEY_PREFIX, 0, len(data))
+
+    if not sections:
+        return None
+
+    index = {}
+
+    for i, (section_type, section_start) in enumerate(sections):
+        if section_type not in VALID_PRICING_DRIVER_TYPES:
+            continue
+
+        section_end = sections[i + 1][1] if i + 1 < len(sections) else len(data)
+        drivers = _find_keys(data, _DRIVER_KEY_PREFIX, section_start, section_end)
+        index[section_type] = {}
+
+        for j, (driver_name, start) in enumerate(drivers):
+            if j + 1 < len(drivers):
+                end = data.rfind(b"\n", start, drivers[j + 1][1])
+            else:
+                # Closing brace of the section
+                end = data.rfind(b"\n    }", start, section_end)
+
+            if end == -1:
+                return None
+
+            # Strip trailing whitespace and the separating comma
+            while data[end - 1 : end] in (b" ", b"\r", b","):
+                end -= 1
+
+            index[section_type][driver_name] = (start, end)
+
+    return index
+
+
+def _find_keys(data, prefix, start, end):
+    """
+    Return (key, value offset) tuples for all the lines between start and end
+    which start with the provided prefix.
+
+    :rtype: ``list`` of ``tuple``
+    """
+    keys = []
+    position = data.find(prefix, start, end)
+
+    while position != -1:
+        key_start = position + len(prefix)
+        key_end = data.find(b'": ', key_start, end)
+
+        if key_end == -1:
+            break
+
+        keys.append((data[key_start:key_end].decode("utf-8"), key_end + 3))
+        position = data.find(prefix, key_end, end)
+
+    return keys
+
+
 def set_pricing(driver_type, driver_name, pricing):
     # type: (str, str, dict) -> None
     """
@@ -154,7 +328,9 @@ def set_pricing(driver_type, driver_name, pricing):
     :param pricing: Dictionary where a key is a size ID and a value is a price.
     """
 
-    PRICING_DATA[driver_type][driver_name] = pricing
+    with _PRICING_LOCK:
+        PRICING_DATA[driver_type][driver_name] = pricing
+        _PRICING_CACHE_LRU.pop((driver_type, driver_name), None)
 
 
 def get_size_price(driver_type, driver_name, size_id, region=None):
@@ -178,6 +354,18 @@ def get_size_price(driver_type, driver_name, size_id, region=None):
     pricing = get_pricing(driver_type=driver_type, driver_name=driver_name)
     assert pricing is not None
 
+    with _PRICING_LOCK:
+        cached = _SIZE_PRICES.get((driver_type, driver_name))
+
+        if cached is None or cached[0] is not pricing:
+            cached = (pricing, {})
+            _SIZE_PRICES[(driver_type, driver_name)] = cached
+
+        prices = cached[1]
+
+        if (size_id, region) in prices:
+            return prices[(size_id, region)]
+
     price = None  # Type: Optional[float]
 
     try:
@@ -189,6 +377,8 @@ def get_size_price(driver_type, driver_name, size_id, region=None):
         # Price not available
         price = None
 
+    prices[(size_id, region)] = price
+
     return price
 
 
@@ -289,8 +479,11 @@ def invalidate_pricing_cache():
     """
     Invalidate pricing cache for all the drivers.
     """
-    PRICING_DATA["compute"] = {}
-    PRICING_DATA["storage"] = {}
+    with _PRICING_LOCK:
+        PRICING_DATA["compute"] = {}
+        PRICING_DATA["storage"] = {}
+        _PRICING_CACHE_LRU.clear()
+        _SIZE_PRICES.clear()
 
 
 def clear_pricing_data():
@@ -315,8 +508,10 @@ def invalidate_module_pricing_cache(driver_type, driver_name):
     :type driver_name: ``str``
     :param driver_name: Driver name
     """
-    if driver_name in PRICING_DATA[driver_type]:
-        del PRICING_DATA[driver_type][driver_name]
+    with _PRICING_LOCK:
+        PRICING_DATA[driver_type].pop(driver_name, None)
+        _PRICING_CACHE_LRU.pop((driver_type, driver_name), None)
+        _SIZE_PRICES.pop((driver_type, driver_name), None)
 
 
 def download_pricing_file(file_url=DEFAULT_FILE_URL_S3_BUCKET, file_path=CUSTOM_PRICING_FILE_PATH):
@@ -20,11 +20,17 @@ Provides base classes for working with storage
 # Backward compatibility for Python 2.5
 
 import errno
+import heapq
+import queue
 import hashlib
 import os.path  # pylint: disable-msg=W0404
 import warnings
-from typing import Dict, List, Type, Iterator, Optional
+import threading
+from typing import Dict, List, Type, Union, Iterable, Iterator, Optional
 from os.path import join as pjoin
+from itertools import islice
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import libcloud.utils.files
 from libcloud.utils.py3 import b, httplib
@@ -32,10 +38,32 @@ from libcloud.common.base import BaseDriver, Connection, ConnectionUserAndKey
 from libcloud.common.types import LibcloudError
 from libcloud.storage.types import ObjectDoesNotExistError
 
-__all__ = ["Object", "Container", "StorageDriver", "CHUNK_SIZE", "DEFAULT_CONTENT_TYPE"]
+__all__ = [
+    "Object",
+    "Container",
+    "ObjectDeletionResult",
+    "StorageDriver",
+    "CHUNK_SIZE",
+    "DEFAULT_CONTENT_TYPE",
+]
 
 CHUNK_SIZE = 8096
 
+# Size of a single range request and default number of concurrent range
+# requests used by parallel downloads
+PARALLEL_DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+PARALLEL_DOWNLOAD_WORKERS = 4
+
+# Default number of concurrent requests used by bulk object deletion
+DELETE_OBJECTS_WORKERS = 8
+
+# Default number of shards which are listed concurrently by sharded listing,
+# number of objects which are handed over from a worker thread at once and
+# number of such batches which are buffered per shard
+LIST_SHARDS_WORKERS = 8
+LIST_SHARDS_BATCH_SIZE = 1000
+LIST_SHARDS_QUEUE_SIZE = 2
+
 # Default Content-Type which is sent when uploading an object if one is not
 # supplied and can't be detected when using non-strict mode.
 DEFAULT_CONTENT_TYPE = "application/octet-stream"
@@ -259,6 +287,10 @@ class Container:
         # type: (Object) -> bool
         return self.driver.delete_object(obj)
 
+    def delete_objects(self, objects, workers=DELETE_OBJECTS_WORKERS):
+        # type: (Iterable[Union[Object, str]], int) -> List[ObjectDeletionResult]
+        return self.driver.delete_objects(container=self, objects=objects, workers=workers)
+
     def delete(self):
         # type: () -> bool
         return self.driver.delete_container(self)
@@ -267,6 +299,40 @@ class Container:
         return "<Container: name={}, provider={}>".format(self.name, self.driver.name)
 
 
+class ObjectDeletionResult:
+    """
+    Outcome of deleting a single object with
+    :meth:`StorageDriver.delete_objects`.
+    """
+
+    def __init__(
+        self,
+        name,  # type: str
+        error=None,  # type: Optional[Exception]
+    ):
+        """
+        :param name: Object name.
+        :type name: ``str``
+
+        :param error: Exception raised while deleting the object.
+        :type error: ``Exception``
+        """
+        self.name = name
+        self.error = error
+
+    @property
+    def success(self):
+        # type: () -> bool
+        return self.error is None
+
+    def __repr__(self):
+        return "<ObjectDeletionResult: name=%s, success=%s, error=%r>" % (
+            self.name,
+            self.success,
+            self.error,
+        )
+
+
 class StorageDriver(BaseDriver):
     """
     A base StorageDriver to derive from.
@@ -281,6 +347,11 @@ class StorageDriver(BaseDriver):
     # provided and none can be detected when uploading an object
     strict_mode = False  # type: bool
 
+    # Maximum number of objects which are deleted with a single request by
+    # delete_objects(). Drivers which support batch deletion override
+    # _delete_objects() and increase this value.
+    delete_objects_batch_size = 1  # type: int
+
     def iterate_containers(self):
         # type: () -> Iterator[Container]
         """
@@ -320,6 +391,68 @@ class StorageDriver(BaseDriver):
         """
         raise NotImplementedError("iterate_container_objects not implemented for this driver")
 
+    def iterate_container_objects_sharded(
+        self,
+        container,  # type: Container
+        prefixes=None,  # type: Optional[Iterable[str]]
+        prefix=None,  # type: Optional[str]
+        delimiter="/",  # type: str
+        workers=LIST_SHARDS_WORKERS,  # type: int
+        sort=False,  # type: bool
+    ):
+        # type: (...) -> Iterator[Object]
+        """
+        Return a iterator of objects for the given container which lists
+        multiple prefixes (shards) of the container concurrently.
+
+        Each shard is listed with ``iterate_container_objects`` in a pool of
+        worker threads and the results are combined into a single iterator.
+
+        If ``prefixes`` is not provided, shards are discovered by listing
+        ``prefix`` with ``delimiter``, each common prefix becomes a shard.
+        Discovery runs in a background thread, shards are listed as soon as
+        they are discovered and objects directly under ``prefix`` are
+        returned while they are being listed. Drivers which don't support
+        delimiter listing list the container as a single shard.
+
+        Shard prefixes must not overlap (no prefix may start with another
+        one), otherwise objects are returned multiple times.
+
+        :param container: Container instance.
+        :type container: :class:`libcloud.storage.base.Container`
+
+        :param prefixes: Prefixes of the shards which are listed.
+        :type  prefixes: ``list`` of ``str``
+
+        :param prefix: Prefix which is listed to discover the shards. Only
+                       used if ``prefixes`` is not provided.
+        :type  prefix: ``str``
+
+        :param delimiter: Delimiter which is used to discover the shards.
+        :type  delimiter: ``str``
+
+        :param workers: Number of shards which are listed concurrently.
+        :type  workers: ``int``
+
+        :param sort: Return objects sorted by name. Otherwise, objects are
+                     returned in the order in which they are listed.
+        :type  sort: ``bool``
+
+        :return: A iterator of Object instances.
+        :rtype: ``iterator`` of :class:`libcloud.storage.base.Object`
+        """
+        if prefixes is not None:
+            prefixes = sorted(prefixes)
+
+        return self._iterate_shards(
+            container,
+            prefixes=prefixes,
+            prefix=prefix,
+            delimiter=delimiter,
+            workers=workers,
+            sort=sort,
+        )
+
     def list_container_objects(self, container, prefix=None, ex_prefix=None):
         # type: (Container, Optional[str], Optional[str]) -> List[Object]
         """
@@ -350,6 +483,175 @@ class StorageDriver(BaseDriver):
 
         return prefix
 
+    def _iterate_container_prefixes(self, container, prefix=None, delimiter="/"):
+        # type: (Container, Optional[str], str) -> Iterator[Union[Object, str]]
+        """
+        Iterate over objects and common prefixes directly under ``prefix``.
+
+        Drivers which support delimiter listing override this method, this
+        implementation returns ``prefix`` as the only common prefix.
+
+        :return: A iterator of objects and common prefixes ordered by name.
+        :rtype: ``iterator`` of :class:`Object` and ``str``
+        """
+        return iter([prefix])
+
+    def _merge_container_prefixes(self, objects, prefixes):
+        """
+        Merge objects and common prefixes of a single listing page by name.
+        """
+        return heapq.merge(
+            objects, prefixes, key=lambda item: item.name if isinstance(item, Object) else item
+        )
+
+    def _iterate_shards(self, container, prefixes, prefix, delimiter, workers, sort):
+        """
+        List each of the shards in a worker thread and yield the listed
+        objects.
+
+        If ``prefixes`` is None, shards are discovered in a background thread
+        which also yields the objects directly under ``prefix``.
+
+        If ``sort`` is True, objects are yielded in the order of the shards.
+        Otherwise, objects are yielded as soon as they are listed.
+        """
+        stop = threading.Event()
+        futures = []
+
+        def put(objects_queue, item):
+            # Give up once the consumer stopped iterating
+            while not stop.is_set():
+                try:
+                    objects_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+
+            return False
+
+        def list_shard(objects_queue, shard_prefix):
+            if stop.is_set():
+                return
+
+            try:
+                driver = self._get_thread_driver()
+                batch = []
+
+                for obj in driver.iterate_container_objects(container, prefix=shard_prefix):
+                    batch.append(obj)
+
+                    if len(batch) >= LIST_SHARDS_BATCH_SIZE:
+                        if not put(objects_queue, batch):
+                            return
+
+                        batch = []
+
+                if put(objects_queue, batch):
+                    # Marks the end of the shard
+                    put(objects_queue, None)
+            except Exception as e:
+                put(objects_queue, e)
+
+        def discover(executor, discovery_queue):
+            # Objects directly under the prefix are put on the discovery queue
+            # in batches and each discovered shard is submitted right away. In
+            # sorted mode the queue of each shard is put on the discovery queue
+            # in order so the consumer reads the shards in order.
+            try:
+                if prefixes is None:
+                    driver = self._get_thread_driver()
+                    items = driver._iterate_container_prefixes(
+                        container, prefix=prefix, delimiter=delimiter
+                    )
+                else:
+                    items = iter(prefixes)
+
+                batch = []
+                shards = 0
+
+                for item in items:
+                    if isinstance(item, Object):
+                        batch.append(item)
+
+                        if len(batch) >= LIST_SHARDS_BATCH_SIZE:
+                            if not put(discovery_queue, batch):
+                                return
+
+                            batch = []
+
+                        continue
+
+                    if batch and not put(discovery_queue, batch):
+                        return
+
+                    batch = []
+
+                    if stop.is_set():
+                        return
+
+                    if sort:
+                        shard_queue = queue.Queue(maxsize=LIST_SHARDS_QUEUE_SIZE)
+
+                        if not put(discovery_queue, shard_queue):
+                            return
+                    else:
+                        shard_queue = discovery_queue
+
+                    futures.append(executor.submit(list_shard, shard_queue, item))
+                    shards += 1
+
+                if put(discovery_queue, batch):
+                    # Marks the end of the discovery with the number of shards
+                    put(discovery_queue, shards)
+            except Exception as e:
+                put(discovery_queue, e)
+
+        def get(objects_queue):
+            item = objects_queue.get()
+
+            if isinstance(item, Exception):
+                raise item
+
+            return item
+
+        discovery_queue = queue.Queue(maxsize=LIST_SHARDS_QUEUE_SIZE * workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            discovery = threading.Thread(target=discover, args=(executor, discovery_queue))
+            discovery.daemon = True
+            discovery.start()
+
+            try:
+                shards = None
+                finished = 0
+
+                while shards is None or finished < shards:
+                    item = get(discovery_queue)
+
+                    if isinstance(item, list):
+                        yield from item
+                    elif isinstance(item, queue.Queue):
+                        # Next shard in sorted mode
+                        shard_item = get(item)
+
+                        while shard_item is not None:
+                            yield from shard_item
+                            shard_item = get(item)
+
+                        finished += 1
+                    elif item is None:
+                        finished += 1
+                    else:
+                        shards = item
+            finally:
+                # Consumer stopped iterating or a shard failed
+                stop.set()
+
+                for future in futures:
+                    future.cancel()
+
+                discovery.join()
+
     def _filter_listed_container_objects(self, objects, prefix):
         if prefix is not None:
             warnings.warn(
@@ -556,6 +858,212 @@ class StorageDriver(BaseDriver):
         """
         raise NotImplementedError("download_object_range_as_stream not implemented for this driver")
 
+    def download_object_parallel(
+        self,
+        obj,
+        destination_path,
+        overwrite_existing=False,
+        delete_on_failure=True,
+        workers=PARALLEL_DOWNLOAD_WORKERS,
+        part_size=PARALLEL_DOWNLOAD_PART_SIZE,
+    ):
+        # type: (Object, str, bool, bool, int, int) -> bool
+        """
+        Download an object to the specified destination path using multiple
+        concurrent range requests.
+
+        Object is split into ranges of ``part_size`` bytes which are fetched
+        using :meth:`download_object_range_as_stream` and written directly to
+        their offset in the destination file. Small objects and objects with
+        an unknown size are downloaded using :meth:`download_object`.
+
+        :class:`LibcloudError` is raised if a range request doesn't return
+        exactly the requested number of bytes (e.g. because the server
+        ignored the ``Range`` header).
+
+        :param obj: Object instance.
+        :type obj: :class:`libcloud.storage.base.Object`
+
+        :param destination_path: Full path to a file or a directory where the
+                                 incoming file will be saved.
+        :type destination_path: ``str``
+
+        :param overwrite_existing: True to overwrite an existing file,
+                                   defaults to False.
+        :type overwrite_existing: ``bool``
+
+        :param delete_on_failure: True to delete a partially downloaded file if
+                                   the download was not successful (file
+                                   size).
+        :type delete_on_failure: ``bool``
+
+        :param workers: Maximum number of concurrent range requests.
+        :type workers: ``int``
+
+        :param part_size: Size of a single range request (in bytes).
+        :type part_size: ``int``
+
+        :return: True if an object has been successfully downloaded, False
+                 otherwise.
+        :rtype: ``bool``
+        """
+        size = int(obj.size or 0)
+
+        if workers <= 1 or size <= part_size:
+            return self.download_object(
+                obj=obj,
+                destination_path=destination_path,
+                overwrite_existing=overwrite_existing,
+                delete_on_failure=delete_on_failure,
+            )
+
+        file_path = self._get_save_file_path(obj, destination_path, overwrite_existing)
+
+        def download_range(start_bytes, end_bytes):
+            driver = self._get_thread_driver()
+            stream = driver.download_object_range_as_stream(
+                obj=obj, start_bytes=start_bytes, end_bytes=end_bytes, chunk_size=CHUNK_SIZE
+            )
+
+            expected_bytes = end_bytes - start_bytes
+            bytes_transferred = 0
+
+            with open(file_path, "r+b") as file_handle:
+                file_handle.seek(start_bytes)
+
+                for chunk in stream:
+                    chunk = b(chunk)
+
+                    # Server which ignores the Range header returns the whole
+                    # object which would overwrite the other ranges
+                    if bytes_transferred + len(chunk) > expected_bytes:
+                        raise LibcloudError(
+                            value="Range %s-%s of object %s returned more than %s bytes"
+                            % (start_bytes, end_bytes, obj.name, expected_bytes),
+                            driver=self,
+                        )
+
+                    file_handle.write(chunk)
+                    bytes_transferred += len(chunk)
+
+            if bytes_transferred != expected_bytes:
+                raise LibcloudError(
+                    value="Range %s-%s of object %s returned %s bytes"
+                    % (start_bytes, end_bytes, obj.name, bytes_transferred),
+                    driver=self,
+                )
+
+            return bytes_transferred
+
+        # Preallocate the file so each range can be written at its offset
+        with open(file_path, "wb") as file_handle:
+            file_handle.truncate(size)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(download_range, start_bytes, end_bytes)
+                    for start_bytes, end_bytes in self._get_parallel_download_ranges(
+                        size, part_size
+                    )
+                ]
+
+                try:
+                    bytes_transferred = sum(future.result() for future in futures)
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        except Exception:
+            if delete_on_failure:
+                self._remove_file(file_path)
+            raise
+
+        if bytes_transferred != size:
+            if delete_on_failure:
+                self._remove_file(file_path)
+
+            return False
+
+        return True
+
+    def download_object_as_stream_parallel(
+        self,
+        obj,
+        chunk_size=None,
+        workers=PARALLEL_DOWNLOAD_WORKERS,
+        part_size=PARALLEL_DOWNLOAD_PART_SIZE,
+    ):
+        # type: (Object, Optional[int], int, int) -> Iterator[bytes]
+        """
+        Return a iterator which yields object data which is fetched using
+        multiple concurrent range requests.
+
+        Up to ``workers`` ranges are fetched ahead of the consumer and
+        buffered in memory so memory usage is bounded by
+        ``workers * part_size`` bytes. Data is yielded in order.
+
+        :param obj: Object instance
+        :type obj: :class:`libcloud.storage.base.Object`
+
+        :param chunk_size: Optional chunk size (in bytes).
+        :type chunk_size: ``int``
+
+        :param workers: Maximum number of concurrent range requests.
+        :type workers: ``int``
+
+        :param part_size: Size of a single range request (in bytes).
+        :type part_size: ``int``
+
+        :rtype: ``iterator`` of ``bytes``
+        """
+        size = int(obj.size or 0)
+
+        if workers <= 1 or size <= part_size:
+            yield from self.download_object_as_stream(obj=obj, chunk_size=chunk_size)
+            return
+
+        def download_range(start_bytes, end_bytes):
+            driver = self._get_thread_driver()
+            stream = driver.download_object_range_as_stream(
+                obj=obj, start_bytes=start_bytes, end_bytes=end_bytes, chunk_size=chunk_size
+            )
+            data = b("").join(b(chunk) for chunk in stream)
+
+            if len(data) != end_bytes - start_bytes:
+                raise LibcloudError(
+                    value="Range %s-%s of object %s returned %s bytes"
+                    % (start_bytes, end_bytes, obj.name, len(data)),
+                    driver=self,
+                )
+
+            return data
+
+        ranges = iter(self._get_parallel_download_ranges(size, part_size))
+        futures = deque()  # type: deque
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for start_bytes, end_bytes in islice(ranges, workers):
+                    futures.append(executor.submit(download_range, start_bytes, end_bytes))
+
+                while futures:
+                    data = futures.popleft().result()
+                    next_range = next(ranges, None)
+
+                    if next_range is not None:
+                        futures.append(executor.submit(download_range, *next_range))
+
+                    if chunk_size:
+                        for index in range(0, len(data), chunk_size):
+                            yield data[index : index + chunk_size]
+                    else:
+                        yield data
+            finally:
+                # Consumer stopped iterating or a range failed
+                for future in futures:
+                    future.cancel()
+
     def upload_object(
         self,
         file_path,
@@ -648,6 +1156,72 @@ class StorageDriver(BaseDriver):
         """
         raise NotImplementedError("delete_object not implemented for this driver")
 
+    def delete_objects(self, container, objects, workers=DELETE_OBJECTS_WORKERS):
+        # type: (Container, Iterable[Union[Object, str]], int) -> List[ObjectDeletionResult]
+        """
+        Delete multiple objects from a container.
+
+        Drivers which support batch deletion delete up to
+        ``delete_objects_batch_size`` objects with a single request, other
+        drivers delete objects one by one. In both cases, requests are issued
+        concurrently by a pool of worker threads.
+
+        Failure to delete an object doesn't stop the deletion of other
+        objects, the outcome of each object is reported in the returned list
+        instead. Note that some providers report objects which don't exist as
+        deleted.
+
+        :param container: Container instance.
+        :type container: :class:`libcloud.storage.base.Container`
+
+        :param objects: Objects or names of the objects to delete.
+        :type objects: ``iterable`` of :class:`libcloud.storage.base.Object`
+                       or ``str``
+
+        :param workers: Number of concurrent requests.
+        :type workers: ``int``
+
+        :return: Result for each object, in the same order as ``objects``.
+        :rtype: ``list`` of :class:`ObjectDeletionResult`
+        """
+        names = enumerate(obj if isinstance(obj, str) else obj.name for obj in objects)
+        batches = iter(lambda: list(islice(names, self.delete_objects_batch_size)), [])
+
+        results = {}  # type: Dict[int, ObjectDeletionResult]
+
+        def delete(batch):
+            # Each name is only deleted once, objects with the same name share
+            # the outcome of the request
+            object_names = list(dict.fromkeys(name for _, name in batch))
+
+            try:
+                errors = self._get_thread_driver()._delete_objects(container, object_names)
+            except Exception as e:
+                errors = {name: e for name in object_names}
+
+            return {
+                index: ObjectDeletionResult(name=name, error=errors[name]) for index, name in batch
+            }
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Only a limited number of batches is queued so the objects
+            # iterator can be lazy
+            pending = set()
+
+            for batch in batches:
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        results.update(future.result())
+
+                pending.add(executor.submit(delete, batch))
+
+            for future in pending:
+                results.update(future.result())
+
+        return [results[index] for index in range(len(results))]
+
     def create_container(self, container_name):
         # type: (str) -> Container
         """
@@ -674,6 +1248,66 @@ class StorageDriver(BaseDriver):
         """
         raise NotImplementedError("delete_container not implemented for this driver")
 
+    ##
+    # Asyncio methods
+    ##
+
+    async def async_list_containers(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`list_containers`.
+
+        :rtype: ``list`` of :class:`Container`
+        """
+        return await self._run_in_executor("list_containers", *args, **kwargs)
+
+    async def async_list_container_objects(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`list_container_objects`.
+
+        :rtype: ``list`` of :class:`Object`
+        """
+        return await self._run_in_executor("list_container_objects", *args, **kwargs)
+
+    async def async_get_container(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`get_container`.
+
+        :rtype: :class:`Container`
+        """
+        return await self._run_in_executor("get_container", *args, **kwargs)
+
+    async def async_get_object(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`get_object`.
+
+        :rtype: :class:`Object`
+        """
+        return await self._run_in_executor("get_object", *args, **kwargs)
+
+    async def async_create_container(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`create_container`.
+
+        :rtype: :class:`Container`
+        """
+        return await self._run_in_executor("create_container", *args, **kwargs)
+
+    async def async_delete_container(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`delete_container`.
+
+        :rtype: ``bool``
+        """
+        return await self._run_in_executor("delete_container", *args, **kwargs)
+
+    async def async_delete_object(self, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`delete_object`.
+
+        :rtype: ``bool``
+        """
+        return await self._run_in_executor("delete_object", *args, **kwargs)
+
     def _get_object(self, obj, callback, callback_kwargs, response, success_status_code=None):
         """
         Call passed callback and start transfer of the object'
@@ -757,6 +1391,42 @@ class StorageDriver(BaseDriver):
 
         chunk_size = chunk_size or CHUNK_SIZE
 
+        file_path = self._get_save_file_path(obj, destination_path, overwrite_existing)
+
+        bytes_transferred = 0
+
+        with open(file_path, "wb") as file_handle:
+            for chunk in response._response.iter_content(chunk_size):
+                file_handle.write(b(chunk))
+                bytes_transferred += len(chunk)
+
+        if not partial_download and int(obj.size) != int(bytes_transferred):
+            # Transfer failed, support retry?
+            # NOTE: We only perform this check if this is a regular and not a
+            # partial / range download
+            if delete_on_failure:
+                self._remove_file(file_path)
+
+            return False
+
+        return True
+
+    def _get_save_file_path(self, obj, destination_path, overwrite_existing=False):
+        """
+        Return path of the file an object is saved to.
+
+        :param obj: Object instance.
+        :type obj: :class:`Object`
+
+        :param destination_path: Destination file or directory.
+        :type destination_path: ``str``
+
+        :param overwrite_existing: True to overwrite a local path if it already
+                                   exists.
+        :type overwrite_existing: ``bool``
+
+        :rtype: ``str``
+        """
         base_name = os.path.basename(destination_path)
 
         if not base_name and not os.path.exists(destination_path):
@@ -773,26 +1443,23 @@ class StorageDriver(BaseDriver):
                 driver=self,
             )
 
-        bytes_transferred = 0
-
-        with open(file_path, "wb") as file_handle:
-            for chunk in response._response.iter_content(chunk_size):
-                file_handle.write(b(chunk))
-                bytes_transferred += len(chunk)
-
-        if not partial_download and int(obj.size) != int(bytes_transferred):
-            # Transfer failed, support retry?
-            # NOTE: We only perform this check if this is a regular and not a
-            # partial / range download
-            if delete_on_failure:
-                try:
-                    os.unlink(file_path)
-                except Exception:
-                    pass
+        return file_path
 
-            return False
+    def _remove_file(self, file_path):
+        try:
+            os.unlink(file_path)
+        except Exception:
+            pass
 
-        return True
+    def _get_parallel_download_ranges(self, size, part_size):
+        """
+        Return a list of (start_bytes, end_bytes) tuples which cover an object
+        of the provided size. End offset is non-inclusive.
+        """
+        return [
+            (start_bytes, min(start_bytes + part_size, size))
+            for start_bytes in range(0, size, part_size)
+        ]
 
     def _upload_object(
         self,
@@ -822,37 +1489,145 @@ class StorageDriver(BaseDriver):
             content_type, object_name, file_path=file_path
         )
 
+        # Data is hashed while it's being sent so it only needs to be read
+        # once. Any data which wasn't consumed by the request (e.g. because
+        # the server responded early) is hashed afterwards. Seekable streams
+        # are rewound so the uploaded data always matches the returned hash.
         if stream:
+            self._seek_stream_to_start(stream)
+            reader = libcloud.utils.files.HashingReader(stream, self._get_hash_function())
             response = self.connection.request(
                 request_path,
                 method=request_method,
-                data=stream,
+                data=reader,
                 headers=headers,
                 raw=True,
             )
-            stream_hash, stream_length = self._hash_buffered_stream(
-                stream, self._get_hash_function()
-            )
+            reader.exhaust()
         else:
             with open(file_path, "rb") as file_stream:
+                reader = libcloud.utils.files.HashingReader(file_stream, self._get_hash_function())
                 response = self.connection.request(
                     request_path,
                     method=request_method,
-                    data=file_stream,
+                    data=reader,
                     headers=headers,
                     raw=True,
                 )
-            with open(file_path, "rb") as file_stream:
-                stream_hash, stream_length = self._hash_buffered_stream(
-                    file_stream, self._get_hash_function()
-                )
+                reader.exhaust()
 
         return {
             "response": response,
-            "bytes_transferred": stream_length,
-            "data_hash": stream_hash,
+            "bytes_transferred": reader.bytes_read,
+            "data_hash": reader.hexdigest(),
         }
 
+    def _upload_chunks_concurrently(self, chunks, upload_chunk, workers, max_in_flight):
+        """
+        Upload chunks of data using a pool of worker threads.
+
+        ``chunks`` is consumed in the calling thread. ``upload_chunk`` is
+        called in a worker thread with the chunk number (starting with 1), the
+        chunk data and a connection which is private to the worker thread.
+
+        Reading from ``chunks`` blocks while the chunks which are not uploaded
+        yet would use more than ``max_in_flight`` bytes so memory usage stays
+        bounded. A single chunk is always allowed. If uploading any of the
+        chunks fails, chunks which are still queued are cancelled and the
+        exception is propagated.
+
+        :param chunks: Iterator which yields chunk data.
+        :type chunks: ``iterator`` of ``bytes``
+
+        :param upload_chunk: Function which uploads a single chunk.
+        :type upload_chunk: ``callable``
+
+        :param workers: Number of chunks which are uploaded concurrently.
+        :type workers: ``int``
+
+        :param max_in_flight: Maximum number of bytes which are read but not
+                              uploaded yet.
+        :type max_in_flight: ``int``
+
+        :return: Values returned by ``upload_chunk`` ordered by chunk number.
+        :rtype: ``list``
+        """
+        results = {}
+
+        # Maps futures of the chunks which are being uploaded to a tuple of
+        # (chunk number, chunk size)
+        pending = {}
+        pending_bytes = 0
+
+        def upload(number, data):
+            return upload_chunk(number, data, self._get_thread_connection())
+
+        def collect(futures):
+            nonlocal pending_bytes
+
+            for future in futures:
+                number, size = pending.pop(future)
+                pending_bytes -= size
+                results[number] = future.result()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for number, data in enumerate(chunks, 1):
+                    while pending and pending_bytes + len(data) > max_in_flight:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+
+                    future = executor.submit(upload, number, data)
+                    pending[future] = (number, len(data))
+                    pending_bytes += len(data)
+
+                collect(list(pending))
+            except Exception:
+                # Don't start uploading chunks which are still queued
+                for future in pending:
+                    future.cancel()
+                raise
+
+        return [results[number] for number in sorted(results)]
+
+    def _delete_objects(self, container, object_names):
+        # type: (Container, List[str]) -> Dict[str, Optional[Exception]]
+        """
+        Delete a batch of at most ``delete_objects_batch_size`` objects.
+
+        This implementation deletes objects one by one using
+        ``delete_object``.
+
+        :return: A dictionary which maps object name to ``None`` if the
+                 object was deleted or to the exception which was raised
+                 while deleting it.
+        :rtype: ``dict``
+        """
+        results = {}  # type: Dict[str, Optional[Exception]]
+
+        for name in object_names:
+            obj = Object(
+                name=name,
+                size=None,
+                hash=None,
+                extra={},
+                meta_data={},
+                container=container,
+                driver=self,
+            )
+
+            try:
+                if self.delete_object(obj):
+                    results[name] = None
+                else:
+                    results[name] = LibcloudError(
+                        "Unable to delete object %s" % (name), driver=self
+                    )
+            except Exception as e:
+                results[name] = e
+
+        return results
+
     def _determine_content_type(self, content_type, object_name, file_path=None):
         if content_type:
             return content_type
@@ -872,23 +1647,7 @@ class StorageDriver(BaseDriver):
         total_len = 0
 
         if hasattr(stream, "__next__") or hasattr(stream, "next"):
-            # Ensure we start from the beginning of a stream in case stream is
-            # not at the beginning
-            if hasattr(stream, "seek"):
-                try:
-                    stream.seek(0)
-                except OSError as e:
-                    if e.errno != errno.ESPIPE:
-                        # This represents "OSError: [Errno 29] Illegal seek"
-                        # error. This could either mean that the underlying
-                        # handle doesn't support seek operation (e.g. pipe) or
-                        # that the invalid seek position is provided. Sadly
-                        # there is no good robust way to distinghuish that so
-                        # we simply ignore all the "Illeal seek" errors so
-                        # this function works correctly with pipes.
-                        # See https://github.com/apache/libcloud/pull/1427 for
-                        # details
-                        raise e
+            self._seek_stream_to_start(stream)
 
             for chunk in libcloud.utils.files.read_in_chunks(iterator=stream):
                 hasher.update(b(chunk))
@@ -911,6 +1670,29 @@ class StorageDriver(BaseDriver):
 
         return (hasher.hexdigest(), total_len)
 
+    def _seek_stream_to_start(self, stream):
+        """
+        Ensure we start from the beginning of a stream in case stream is not
+        at the beginning.
+        """
+        if not hasattr(stream, "seek"):
+            return
+
+        try:
+            stream.seek(0)
+        except OSError as e:
+            if e.errno != errno.ESPIPE:
+                # This represents "OSError: [Errno 29] Illegal seek"
+                # error. This could either mean that the underlying
+                # handle doesn't support seek operation (e.g. pipe) or
+                # that the invalid seek position is provided. Sadly
+                # there is no good robust way to distinghuish that so
+                # we simply ignore all the "Illeal seek" errors so
+                # this function works correctly with pipes.
+                # See https://github.com/apache/libcloud/pull/1427 for
+                # details
+                raise e
+
     def _get_hash_function(self):
         """
         Return instantiated hash function for the hash type supported by
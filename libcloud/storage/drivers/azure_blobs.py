@@ -16,15 +16,22 @@
 
 import os
 import hmac
+import time
+import uuid
 import base64
 import hashlib
 import binascii
+import threading
 from datetime import datetime, timedelta
 
 from libcloud.utils.py3 import ET, b, httplib, tostring, urlquote, urlencode
 from libcloud.utils.xml import fixxpath
 from libcloud.utils.files import read_in_chunks
-from libcloud.common.azure import AzureConnection, AzureActiveDirectoryConnection
+from libcloud.common.azure import (
+    AZURE_TIME_FORMAT,
+    AzureConnection,
+    AzureActiveDirectoryConnection,
+)
 from libcloud.common.types import LibcloudError
 from libcloud.storage.base import Object, Container, StorageDriver
 from libcloud.storage.types import (
@@ -57,6 +64,14 @@ AZURE_DOWNLOAD_CHUNK_SIZE = (
 # released using the lease_id (which is not exposed to the user)
 AZURE_LEASE_PERIOD = int(os.getenv("LIBCLOUD_AZURE_LEASE_PERIOD_SECONDS", "60"))
 
+# Minimum time period (in seconds) between lease renewals when blocks are
+# uploaded in parallel. Leases are obtained for 60 seconds so this leaves
+# plenty of time for a renewal to complete.
+AZURE_LEASE_RENEW_INTERVAL = 15
+
+# Maximum number of subrequests in a single Blob Batch request
+AZURE_BATCH_MAX_SUBREQUESTS = 256
+
 AZURE_STORAGE_HOST_SUFFIX = "blob.core.windows.net"
 AZURE_STORAGE_HOST_SUFFIX_CHINA = "blob.core.chinacloudapi.cn"
 AZURE_STORAGE_HOST_SUFFIX_GOVERNMENT = "blob.core.usgovcloudapi.net"
@@ -99,25 +114,48 @@ class AzureBlobLease:
         self.lease_id = None
         self.params = {"comp": "lease"}
 
-    def renew(self):
+        # Time when the lease was last obtained or renewed. Lease can be
+        # renewed from multiple worker threads so access is synchronized.
+        self.renewed_at = None
+        self._lock = threading.Lock()
+
+    def renew(self, connection=None, min_interval=None):
         """
         Renew the lease if it is older than a predefined time period
+
+        :param connection: Connection used to renew the lease (defaults to the
+                           driver connection). Worker threads must provide
+                           their own connection.
+        :type connection: :class:`Connection`
+
+        :param min_interval: If provided, lease is only renewed if it was
+                             obtained or renewed more than this many seconds
+                             ago.
+        :type min_interval: ``int``
         """
         if self.lease_id is None:
             return
 
-        headers = {
-            "x-ms-lease-action": "renew",
-            "x-ms-lease-id": self.lease_id,
-            "x-ms-lease-duration": "60",
-        }
+        with self._lock:
+            if min_interval is not None and time.time() - self.renewed_at < min_interval:
+                return
 
-        response = self.driver.connection.request(
-            self.object_path, headers=headers, params=self.params, method="PUT"
-        )
+            connection = connection or self.driver.connection
 
-        if response.status != httplib.OK:
-            raise LibcloudError("Unable to obtain lease", driver=self)
+            headers = {
+                "x-ms-lease-action": "renew",
+                "x-ms-lease-id": self.lease_id,
+                "x-ms-lease-duration": "60",
+            }
+
+            response = connection.request(
+                self.object_path, headers=headers, params=self.params, method="PUT"
+            )
+
+            if response.status != httplib.OK:
+                raise LibcloudError("Unable to obtain lease", driver=self)
+
+            self.renewed_at = time.time()
 
     def update_headers(self, headers):
         """
@@ -142,6 +180,7 @@ class AzureBlobLease:
             raise LibcloudError("Unable to obtain lease", driver=self)
 
         self.lease_id = response.headers["x-ms-lease-id"]
+        self.renewed_at = time.time()
         return self
 
     def __exit__(self, type, value, traceback):
@@ -240,6 +279,7 @@ class AzureBlobsStorageDriver(StorageDriver):
     connectionCls = AzureBlobsConnection
     hash_type = "md5"
     supports_chunked_encoding = False
+    delete_objects_batch_size = AZURE_BATCH_MAX_SUBREQUESTS
 
     def __init__(
         self,
@@ -262,6 +302,10 @@ class AzureBlobsStorageDriver(StorageDriver):
 
         if self._auth_type == "azureAd":
             self.connectionCls = AzureBlobsActiveDirectoryConnection
+
+            # Azure AD connections always send an XML Content-Type header
+            # so Blob Batch requests can't be used
+            self.delete_objects_batch_size = 1
         else:
             # B64decode() this key and keep it, so that we don't have to do
             # so for every request. Minor performance improvement
@@ -566,6 +610,49 @@ class AzureBlobsStorageDriver(StorageDriver):
             if not params["marker"]:
                 break
 
+    def _iterate_container_prefixes(self, container, prefix=None, delimiter="/"):
+        params = {
+            "restype": "container",
+            "comp": "list",
+            "maxresults": RESPONSES_PER_REQUEST,
+            "include": "metadata",
+            "delimiter": delimiter,
+        }
+
+        if prefix:
+            params["prefix"] = prefix
+
+        container_path = self._get_container_path(container)
+
+        while True:
+            response = self.connection.request(container_path, params=params)
+
+            if response.status == httplib.NOT_FOUND:
+                raise ContainerDoesNotExistError(
+                    value=None, driver=self, container_name=container.name
+                )
+
+            elif response.status != httplib.OK:
+                raise LibcloudError("Unexpected status code: %s" % (response.status), driver=self)
+
+            body = response.parse_body()
+            blobs = body.find(fixxpath(xpath="Blobs"))
+
+            objects = [
+                self._xml_to_object(container, blob)
+                for blob in blobs.findall(fixxpath(xpath="Blob"))
+            ]
+            prefixes = [
+                blob_prefix.findtext(fixxpath(xpath="Name"))
+                for blob_prefix in blobs.findall(fixxpath(xpath="BlobPrefix"))
+            ]
+
+            yield from self._merge_container_prefixes(objects, prefixes)
+
+            params["marker"] = body.findtext("NextMarker")
+            if not params["marker"]:
+                break
+
     def get_container(self, container_name):
         """
         @inherits: :class:`StorageDriver.get_container`
@@ -853,9 +940,14 @@ class AzureBlobsStorageDriver(StorageDriver):
         file_path,
         verify_hash,
         headers,
+        workers=None,
     ):
         """
         Uploads data from an iterator in fixed sized chunks to Azure Storage
+
+        If ``workers`` is greater than 1, blocks are uploaded concurrently by
+        a pool of worker threads. At most ``workers`` blocks (plus the one
+        which is being read) are buffered in memory.
         """
 
         data_hash = None
@@ -863,55 +955,50 @@ class AzureBlobsStorageDriver(StorageDriver):
             data_hash = self._get_hash_function()
 
         bytes_transferred = 0
-        count = 1
-        chunks = []
         headers = headers or {}
 
         lease.update_headers(headers)
 
-        params = {"comp": "block"}
+        def read_blocks():
+            nonlocal bytes_transferred
 
-        # Read the input data in chunk sizes suitable for Azure
-        for data in read_in_chunks(stream, AZURE_UPLOAD_CHUNK_SIZE, fill_size=True):
-            data = b(data)
-            content_length = len(data)
-            bytes_transferred += content_length
+            # Read the input data in chunk sizes suitable for Azure
+            for data in read_in_chunks(stream, AZURE_UPLOAD_CHUNK_SIZE, fill_size=True):
+                data = b(data)
+                bytes_transferred += len(data)
 
-            if verify_hash:
-                data_hash.update(data)
+                if verify_hash:
+                    data_hash.update(data)
 
-            chunk_hash = self._get_hash_function()
-            chunk_hash.update(data)
-            chunk_hash = base64.b64encode(b(chunk_hash.digest()))
+                yield data
 
-            headers["Content-MD5"] = chunk_hash.decode("utf-8")
-            headers["Content-Length"] = str(content_length)
+        if workers and workers > 1:
 
-            # Block id can be any unique string that is base64 encoded
-            # A 10 digit number can hold the max value of 50000 blocks
-            # that are allowed for azure
-            block_id = base64.b64encode(b("%10d" % (count)))
-            block_id = block_id.decode("utf-8")
-            params["blockid"] = block_id
+            def upload_block(count, data, connection):
+                # Put Block calls are independent so the lease only needs to
+                # be renewed periodically instead of before every block
+                lease.renew(connection=connection, min_interval=AZURE_LEASE_RENEW_INTERVAL)
 
-            # Keep this data for a later commit
-            chunks.append(block_id)
-
-            # Renew lease before updating
-            lease.renew()
+                return self._upload_block(
+                    object_path, count, data, headers=headers, connection=connection
+                )
 
-            resp = self.connection.request(
-                object_path, method="PUT", data=data, headers=headers, params=params
+            # Keep this data for a later commit
+            chunks = self._upload_chunks_concurrently(
+                chunks=read_blocks(),
+                upload_chunk=upload_block,
+                workers=workers,
+                max_in_flight=workers * AZURE_UPLOAD_CHUNK_SIZE,
             )
+        else:
+            chunks = []
 
-            if resp.status != httplib.CREATED:
-                resp.parse_error()
-                raise LibcloudError(
-                    "Error uploading chunk %d. Code: %d" % (count, resp.status),
-                    driver=self,
-                )
+            for count, data in enumerate(read_blocks(), 1):
+                # Renew lease before updating
+                lease.renew()
 
-            count += 1
+                # Keep this data for a later commit
+                chunks.append(self._upload_block(object_path, count, data, headers=headers))
 
         if verify_hash:
             data_hash = base64.b64encode(b(data_hash.digest()))
@@ -942,6 +1029,43 @@ class AzureBlobsStorageDriver(StorageDriver):
             "bytes_transferred": bytes_transferred,
         }
 
+    def _upload_block(self, object_path, count, data, headers, connection=None):
+        """
+        Uploads a single block which is committed later.
+
+        :return: The block id
+        :rtype: ``str``
+        """
+        connection = connection or self.connection
+        headers = dict(headers)
+
+        chunk_hash = self._get_hash_function()
+        chunk_hash.update(data)
+        chunk_hash = base64.b64encode(b(chunk_hash.digest()))
+
+        headers["Content-MD5"] = chunk_hash.decode("utf-8")
+        headers["Content-Length"] = str(len(data))
+
+        # Block id can be any unique string that is base64 encoded
+        # A 10 digit number can hold the max value of 50000 blocks
+        # that are allowed for azure
+        block_id = base64.b64encode(b("%10d" % (count)))
+        block_id = block_id.decode("utf-8")
+        params = {"comp": "block", "blockid": block_id}
+
+        resp = connection.request(
+            object_path, method="PUT", data=data, headers=headers, params=params
+        )
+
+        if resp.status != httplib.CREATED:
+            resp.parse_error()
+            raise LibcloudError(
+                "Error uploading chunk %d. Code: %d" % (count, resp.status),
+                driver=self,
+            )
+
+        return block_id
+
     def _commit_blocks(
         self,
         object_path,
@@ -1007,6 +1131,7 @@ class AzureBlobsStorageDriver(StorageDriver):
         extra=None,
         headers=None,
         ex_use_lease=False,
+        ex_upload_workers=None,
         **deprecated_kwargs,
     ):
         """
@@ -1016,6 +1141,11 @@ class AzureBlobsStorageDriver(StorageDriver):
 
         :param ex_use_lease: Indicates if we must take a lease before upload
         :type ex_use_lease: ``bool``
+
+        :param ex_upload_workers: Number of blocks which are uploaded
+                                  concurrently. By default, blocks are
+                                  uploaded one after another.
+        :type ex_upload_workers: ``int``
         """
         if deprecated_kwargs:
             raise ValueError(
@@ -1035,6 +1165,7 @@ class AzureBlobsStorageDriver(StorageDriver):
                 blob_size=blob_size,
                 file_path=file_path,
                 stream=fobj,
+                workers=ex_upload_workers,
             )
 
     def upload_object_via_stream(
@@ -1046,6 +1177,7 @@ class AzureBlobsStorageDriver(StorageDriver):
         extra=None,
         headers=None,
         ex_use_lease=False,
+        ex_upload_workers=None,
         **deprecated_kwargs,
     ):
         """
@@ -1053,6 +1185,11 @@ class AzureBlobsStorageDriver(StorageDriver):
 
         :param ex_use_lease: Indicates if we must take a lease before upload
         :type ex_use_lease: ``bool``
+
+        :param ex_upload_workers: Number of blocks which are uploaded
+                                  concurrently. By default, blocks are
+                                  uploaded one after another.
+        :type ex_upload_workers: ``int``
         """
         if deprecated_kwargs:
             raise ValueError(
@@ -1068,6 +1205,7 @@ class AzureBlobsStorageDriver(StorageDriver):
             headers=headers,
             blob_size=None,
             stream=iterator,
+            workers=ex_upload_workers,
         )
 
     def delete_object(self, obj):
@@ -1084,6 +1222,122 @@ class AzureBlobsStorageDriver(StorageDriver):
 
         return False
 
+    def _delete_objects(self, container, object_names):
+        """
+        Delete a batch of blobs using a single Blob Batch request.
+        """
+        if self._auth_type == "azureAd":
+            return super()._delete_objects(container, object_names)
+
+        connection = self.connection
+        boundary = "batch_%s" % (uuid.uuid4())
+        date = time.strftime(AZURE_TIME_FORMAT, time.gmtime())
+        lines = []
+
+        for content_id, name in enumerate(object_names):
+            path = connection.morph_action_hook(self._get_object_path(container, name))
+
+            # Each subrequest is authorized separately
+            headers = {"x-ms-date": date}
+            headers["Authorization"] = connection._get_azure_auth_signature(
+                method="DELETE",
+                headers=headers,
+                params={},
+                account=connection.user_id,
+                secret_key=connection.key,
+                path=path,
+            )
+            headers["Content-Length"] = "0"
+
+            lines.extend(
+                [
+                    "--%s" % (boundary),
+                    "Content-Type: application/http",
+                    "Content-Transfer-Encoding: binary",
+                    "Content-ID: %d" % (content_id),
+                    "",
+                    "DELETE %s HTTP/1.1" % (path),
+                ]
+            )
+            lines.extend("{}: {}".format(key, value) for key, value in headers.items())
+            lines.append("")
+
+        lines.extend(["--%s--" % (boundary), ""])
+        data = b("\r\n".join(lines))
+
+        headers = {
+            "Content-Type": "multipart/mixed; boundary=%s" % (boundary),
+            "Content-Length": str(len(data)),
+        }
+        response = connection.request(
+            "/", params={"comp": "batch"}, headers=headers, data=data, method="POST", raw=True
+        )
+
+        if response.status != httplib.ACCEPTED:
+            raise LibcloudError("Unexpected status code: %s" % (response.status), driver=self)
+
+        statuses = self._parse_batch_response(
+            body=response.body, content_type=response.headers["content-type"]
+        )
+
+        if len(statuses) != len(object_names):
+            raise LibcloudError(
+                "Expected %d batch responses, got %d" % (len(object_names), len(statuses)),
+                driver=self,
+            )
+
+        results = {}
+
+        for name, (status, error) in zip(object_names, statuses):
+            if status == httplib.ACCEPTED:
+                results[name] = None
+            elif status == httplib.NOT_FOUND:
+                results[name] = ObjectDoesNotExistError(value=None, driver=self, object_name=name)
+            else:
+                results[name] = LibcloudError(
+                    "Error deleting object {}: {} ({})".format(name, error, status),
+                    driver=self,
+                )
+
+        return results
+
+    def _parse_batch_response(self, body, content_type):
+        """
+        Parse the multipart body of a Blob Batch response.
+
+        :return: A list of (status code, error) tuples ordered by the
+                 position of the subrequest in the batch.
+        :rtype: ``list`` of ``tuple``
+        """
+        boundary = content_type.split("boundary=", 1)[1].strip().strip('"')
+        body = body.decode("utf-8").replace("\r\n", "\n")
+
+        statuses = {}
+
+        # Skip the preamble and the epilogue
+        for index, part in enumerate(body.split("--%s" % (boundary))[1:-1]):
+            part_headers, _, http_response = part.strip("\n").partition("\n\n")
+
+            for line in part_headers.split("\n"):
+                key, _, value = line.partition(":")
+
+                if key.strip().lower() == "content-id":
+                    index = int(value)
+
+            status_line, _, http_response = http_response.partition("\n")
+            _, status, reason = status_line.split(" ", 2)
+            error = reason
+
+            for line in http_response.split("\n\n")[0].split("\n"):
+                key, _, value = line.partition(":")
+
+                if key.strip().lower() == "x-ms-error-code":
+                    error = value.strip()
+
+            statuses[index] = (int(status), error)
+
+        return [statuses[index] for index in sorted(statuses)]
+
     def _fix_headers(self, headers):
         """
         Update common HTTP headers to their equivalent in Azure Storage
@@ -1134,6 +1388,7 @@ class AzureBlobsStorageDriver(StorageDriver):
         blob_size=None,
         file_path=None,
         use_lease=False,
+        workers=None,
     ):
         """
         Control function that does the real job of uploading data to a blob
@@ -1169,6 +1424,7 @@ class AzureBlobsStorageDriver(StorageDriver):
                     object_name=object_name,
                     file_path=file_path,
                     verify_hash=verify_hash,
+                    workers=workers,
                 )
 
             response = result_dict["response"]
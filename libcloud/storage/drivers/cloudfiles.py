@@ -19,7 +19,7 @@ import atexit
 from time import time
 from hashlib import sha1
 
-from libcloud.utils.py3 import b, httplib, urlquote, urlencode
+from libcloud.utils.py3 import b, httplib, urlquote, urlencode, urlunquote
 from libcloud.common.base import Response, RawResponse
 from libcloud.utils.files import read_in_chunks
 from libcloud.common.types import LibcloudError, MalformedResponseError
@@ -50,6 +50,11 @@ API_VERSION = "v1.0"
 INTERNAL_ENDPOINT_KEY = "internalURL"
 PUBLIC_ENDPOINT_KEY = "publicURL"
 
+# Maximum number of objects which can be deleted with a single bulk delete
+# request (default value of the max_deletes_per_request option of the bulk
+# middleware)
+BULK_DELETE_MAX_OBJECTS = 10000
+
 
 class CloudFilesResponse(Response):
     valid_response_codes = [httplib.NOT_FOUND, httplib.CONFLICT]
@@ -261,6 +266,7 @@ class CloudFilesStorageDriver(StorageDriver, OpenStackDriverMixin):
     connectionCls = CloudFilesConnection
     hash_type = "md5"
     supports_chunked_encoding = True
+    delete_objects_batch_size = BULK_DELETE_MAX_OBJECTS
 
     def __init__(
         self,
@@ -561,6 +567,54 @@ class CloudFilesStorageDriver(StorageDriver, OpenStackDriverMixin):
 
         raise LibcloudError("Unexpected status code: %s" % (response.status))
 
+    def _delete_objects(self, container, object_names):
+        """
+        Delete a batch of objects using the bulk delete middleware.
+
+        If the middleware is not enabled, objects are deleted one by one.
+        Objects which don't exist are reported as deleted.
+        """
+        container_name = self._encode_container_name(container.name)
+        paths = {}
+
+        for name in object_names:
+            paths["/{}/{}".format(urlunquote(container_name), name)] = name
+
+        data = "\n".join(
+            "/{}/{}".format(container_name, self._encode_object_name(name)) for name in object_names
+        )
+        headers = {"Content-Type": "text/plain", "Accept": "application/json"}
+
+        response = self.connection.request(
+            "", method="POST", params={"bulk-delete": ""}, data=data, headers=headers
+        )
+
+        if response.status == httplib.NO_CONTENT:
+            # Without the bulk middleware, the request is handled as an
+            # account metadata update and nothing is deleted
+            return super()._delete_objects(container, object_names)
+        elif response.status != httplib.OK:
+            raise LibcloudError("Unexpected status code: %s" % (response.status))
+
+        result = response.object
+        results = {name: None for name in object_names}
+
+        for path, status in result.get("Errors", []):
+            name = paths.get(urlunquote(path), path)
+            results[name] = LibcloudError(
+                "Error deleting object {}: {}".format(name, status), driver=self
+            )
+
+        if not result.get("Errors") and not result["Response Status"].startswith("2"):
+            raise LibcloudError(
+                "Bulk delete failed: {} {}".format(
+                    result["Response Status"], result.get("Response Body", "")
+                ),
+                driver=self,
+            )
+
+        return results
+
     def ex_purge_object_from_cdn(self, obj, email=None):
         """
         Purge edge cache for the specified object.
@@ -201,6 +201,8 @@ class GoogleStorageDriver(BaseS3StorageDriver):
     namespace = NAMESPACE
     supports_chunked_encoding = False
     supports_s3_multipart_upload = False
+    supports_s3_multi_object_delete = False
+    delete_objects_batch_size = 1
     http_vendor_prefix = "x-goog"
 
     def __init__(self, key, secret=None, project=None, **kwargs):
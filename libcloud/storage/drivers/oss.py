@@ -25,7 +25,7 @@ from hashlib import sha1
 from libcloud.utils.py3 import ET, b, httplib, tostring, urlquote, urlencode
 from libcloud.utils.xml import findtext, fixxpath
 from libcloud.common.base import RawResponse, XmlResponse, ConnectionUserAndKey
-from libcloud.utils.files import read_in_chunks
+from libcloud.utils.files import HashingReader, read_in_chunks
 from libcloud.common.types import LibcloudError, InvalidCredsError, MalformedResponseError
 from libcloud.storage.base import Object, Container, StorageDriver
 from libcloud.storage.types import (
@@ -617,37 +617,39 @@ class OSSStorageDriver(StorageDriver):
             content_type, object_name, file_path=file_path
         )
 
+        # Data is hashed while it's being sent so it only needs to be read
+        # once. Any data which wasn't consumed by the request (e.g. because
+        # the server responded early) is hashed afterwards. Seekable streams
+        # are rewound so the uploaded data always matches the returned hash.
         if stream:
+            self._seek_stream_to_start(stream)
+            reader = HashingReader(stream, self._get_hash_function())
             response = self.connection.request(
                 request_path,
                 method=request_method,
-                data=stream,
+                data=reader,
                 headers=headers,
                 raw=True,
                 container=container,
             )
-            stream_hash, stream_length = self._hash_buffered_stream(
-                stream, self._get_hash_function()
-            )
+            reader.exhaust()
         else:
             with open(file_path, "rb") as file_stream:
+                reader = HashingReader(file_stream, self._get_hash_function())
                 response = self.connection.request(
                     request_path,
                     method=request_method,
-                    data=file_stream,
+                    data=reader,
                     headers=headers,
                     raw=True,
                     container=container,
                 )
-            with open(file_path, "rb") as file_stream:
-                stream_hash, stream_length = self._hash_buffered_stream(
-                    file_stream, self._get_hash_function()
-                )
+                reader.exhaust()
 
         return {
             "response": response,
-            "bytes_transferred": stream_length,
-            "data_hash": stream_hash,
+            "bytes_transferred": reader.bytes_read,
+            "data_hash": reader.hexdigest(),
         }
 
     def _put_object(
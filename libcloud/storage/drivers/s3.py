@@ -18,12 +18,12 @@ import hmac
 import time
 import base64
 from typing import Dict, Optional
-from hashlib import sha1
+from hashlib import md5, sha1
 from datetime import datetime
 
 import libcloud.utils.py3
 from libcloud.utils.py3 import b, httplib, tostring, urlquote, urlencode
-from libcloud.utils.xml import findtext, fixxpath
+from libcloud.utils.xml import findall, findtext, fixxpath
 from libcloud.common.aws import (
     AWSDriver,
     AWSBaseResponse,
@@ -116,6 +116,14 @@ NAMESPACE = "http://s3.amazonaws.com/doc/%s/" % (API_VERSION)
 # AWS multi-part chunks must be minimum 5MB
 CHUNK_SIZE = 5 * 1024 * 1024
 
+# Default number of multipart chunks which can be buffered in memory per
+# worker thread when uploading multipart chunks in parallel
+MULTIPART_IN_FLIGHT_CHUNKS_PER_WORKER = 2
+
+# Maximum number of keys which can be deleted with a single Multi-Object
+# Delete request
+S3_MULTI_OBJECT_DELETE_MAX_KEYS = 1000
+
 # Desired number of items in each response inside a paginated request in
 # ex_iterate_multipart_uploads.
 RESPONSES_PER_REQUEST = 100
@@ -319,7 +327,13 @@ class BaseS3StorageDriver(StorageDriver):
     hash_type = "md5"
     supports_chunked_encoding = False
     supports_s3_multipart_upload = True
+    supports_s3_multi_object_delete = True
+    delete_objects_batch_size = S3_MULTI_OBJECT_DELETE_MAX_KEYS
     ex_location_name = ""
+
+    # Set to True to parse object listing responses incrementally as they
+    # are read from the connection instead of building the whole element tree
+    iterparse_list_responses = False
     namespace = NAMESPACE
     http_vendor_prefix = "x-amz"
 
@@ -331,6 +345,13 @@ class BaseS3StorageDriver(StorageDriver):
 
         raise LibcloudError("Unexpected status code: %s" % (response.status), driver=self)
 
+    async def async_list_containers(self):
+        response = await self.async_connection.request("/")
+        if response.status == httplib.OK:
+            return self._to_containers(obj=response.object, xpath="Buckets/Bucket")
+
+        raise LibcloudError("Unexpected status code: %s" % (response.status), driver=self)
+
     def iterate_container_objects(self, container, prefix=None, ex_prefix=None):
         """
         Return a generator of objects for the given container.
@@ -347,37 +368,155 @@ class BaseS3StorageDriver(StorageDriver):
         :return: A generator of Object instances.
         :rtype: ``generator`` of :class:`Object`
         """
-        prefix = self._normalize_prefix_argument(prefix, ex_prefix)
+        params = self._get_list_objects_params(prefix=prefix, ex_prefix=ex_prefix)
+        container_path = self._get_container_path(container)
+
+        while True:
+            if self.iterparse_list_responses:
+                root, last_key = yield from self._iterparse_objects(
+                    container, container_path, params
+                )
+            else:
+                response = self.connection.request(container_path, params=params)
+                objects = self._to_objects_page(response, container)
+                yield from objects
+
+                root = response.object
+                last_key = objects[-1].name if objects else None
+
+            if not self._update_list_objects_params(params, root, last_key):
+                break
+
+    async def async_list_container_objects(self, container, prefix=None, ex_prefix=None):
+        """
+        Asynchronous version of :meth:`list_container_objects`.
+
+        :rtype: ``list`` of :class:`Object`
+        """
+        params = self._get_list_objects_params(prefix=prefix, ex_prefix=ex_prefix)
+        container_path = self._get_container_path(container)
+        objects = []
+
+        while True:
+            response = await self.async_connection.request(container_path, params=params)
+            page = self._to_objects_page(response, container)
+            objects.extend(page)
+
+            last_key = page[-1].name if page else None
+
+            if not self._update_list_objects_params(params, response.object, last_key):
+                break
+
+        return objects
 
+    def _get_list_objects_params(self, prefix=None, ex_prefix=None):
+        prefix = self._normalize_prefix_argument(prefix, ex_prefix)
         params = {}
 
         if prefix:
             params["prefix"] = prefix
 
-        last_key = None
-        exhausted = False
-        container_path = self._get_container_path(container)
+        return params
 
-        while not exhausted:
-            if last_key:
-                params["marker"] = last_key
+    def _to_objects_page(self, response, container):
+        """
+        Parse a single page of the object listing.
 
-            response = self.connection.request(container_path, params=params)
+        :rtype: ``list`` of :class:`Object`
+        """
+        if response.status != httplib.OK:
+            raise LibcloudError("Unexpected status code: %s" % (response.status), driver=self)
+
+        return self._to_objs(obj=response.object, xpath="Contents", container=container)
+
+    def _update_list_objects_params(self, params, root, last_key):
+        """
+        Update the object listing parameters to request the next page.
+
+        :param root: Root element of the current page.
+        :param last_key: Name of the last object of the current page.
+
+        :return: False if the current page is the last one.
+        :rtype: ``bool``
+        """
+        is_truncated = findtext(element=root, xpath="IsTruncated", namespace=self.namespace)
 
+        if is_truncated.lower() == "false" or not last_key:
+            return False
+
+        params["marker"] = last_key
+        return True
+
+    def _iterparse_objects(self, container, container_path, params):
+        """
+        Request a single page of the object listing, parse it incrementally
+        and yield the objects as soon as they have been read from the
+        connection.
+
+        :return: A tuple of (root element of the page, name of the last
+                 object).
+        :rtype: ``tuple``
+        """
+        response = self.connection.request(container_path, params=params, raw=True, stream=True)
+
+        try:
             if response.status != httplib.OK:
                 raise LibcloudError("Unexpected status code: %s" % (response.status), driver=self)
 
-            objects = self._to_objs(obj=response.object, xpath="Contents", container=container)
-            is_truncated = response.object.findtext(
-                fixxpath(xpath="IsTruncated", namespace=self.namespace)
-            ).lower()
-            exhausted = is_truncated == "false"
-
+            elements = response.iterparse_body(xpath="Contents", namespace=self.namespace)
             last_key = None
-            for obj in objects:
+
+            for element in elements:
+                obj = self._to_obj(element, container)
                 last_key = obj.name
                 yield obj
 
+            return elements.root, last_key
+        finally:
+            # Release the connection also when the caller stops iterating
+            # before the whole page has been read
+            response.close()
+
+    def _iterate_container_prefixes(self, container, prefix=None, delimiter="/"):
+        params = {"delimiter": delimiter}
+
+        if prefix:
+            params["prefix"] = prefix
+
+        container_path = self._get_container_path(container)
+
+        while True:
+            response = self.connection.request(container_path, params=params)
+
+            if response.status != httplib.OK:
+                raise LibcloudError("Unexpected status code: %s" % (response.status), driver=self)
+
+            objects = self._to_objs(obj=response.object, xpath="Contents", container=container)
+            prefixes = [
+                findtext(element=element, xpath="Prefix", namespace=self.namespace)
+                for element in findall(
+                    element=response.object, xpath="CommonPrefixes", namespace=self.namespace
+                )
+            ]
+
+            yield from self._merge_container_prefixes(objects, prefixes)
+
+            is_truncated = findtext(
+                element=response.object, xpath="IsTruncated", namespace=self.namespace
+            )
+
+            if is_truncated.lower() == "false":
+                break
+
+            # NextMarker is returned when a delimiter is used, it can be
+            # either a key or a common prefix
+            marker = findtext(element=response.object, xpath="NextMarker", namespace=self.namespace)
+
+            if not marker:
+                marker = max([obj.name for obj in objects[-1:]] + prefixes[-1:])
+
+            params["marker"] = marker
+
     def get_container(self, container_name):
         try:
             response = self.connection.request("/%s" % container_name, method="HEAD")
@@ -404,6 +543,32 @@ class BaseS3StorageDriver(StorageDriver):
 
         raise ObjectDoesNotExistError(value=None, driver=self, object_name=object_name)
 
+    async def async_get_container(self, container_name):
+        try:
+            response = await self.async_connection.request("/%s" % container_name, method="HEAD")
+            if response.status == httplib.NOT_FOUND:
+                raise ContainerDoesNotExistError(
+                    value=None, driver=self, container_name=container_name
+                )
+        except InvalidCredsError:
+            # This just means the user doesn't have IAM permissions to do a
+            # HEAD request but other requests might work.
+            pass
+        return Container(name=container_name, extra=None, driver=self)
+
+    async def async_get_object(self, container_name, object_name):
+        container = await self.async_get_container(container_name=container_name)
+        object_path = self._get_object_path(container, object_name)
+        response = await self.async_connection.request(object_path, method="HEAD")
+
+        if response.status == httplib.OK:
+            obj = self._headers_to_object(
+                object_name=object_name, container=container, headers=response.headers
+            )
+            return obj
+
+        raise ObjectDoesNotExistError(value=None, driver=self, object_name=object_name)
+
     def _get_container_path(self, container):
         """
         Return a container path
@@ -664,7 +829,6 @@ class BaseS3StorageDriver(StorageDriver):
         bytes_transferred = 0
         count = 1
         chunks = []
-        params = {"uploadId": upload_id}
 
         request_path = self._get_object_path(container, object_name)
 
@@ -675,37 +839,150 @@ class BaseS3StorageDriver(StorageDriver):
             if calculate_hash:
                 data_hash.update(data)
 
-            chunk_hash = self._get_hash_function()
-            chunk_hash.update(data)
-            chunk_hash = base64.b64encode(chunk_hash.digest()).decode("utf-8")
+            # Keep this data for a later commit
+            chunks.append(self._upload_multipart_chunk(request_path, upload_id, count, data))
+            count += 1
 
-            # The Content-MD5 header provides an extra level of data check and
-            # is recommended by amazon
-            headers = {
-                "Content-Length": len(data),
-                "Content-MD5": chunk_hash,
-            }
+        if calculate_hash:
+            data_hash = data_hash.hexdigest()
 
-            params["partNumber"] = count
+        return (chunks, data_hash, bytes_transferred)
 
-            resp = self.connection.request(
-                request_path, method="PUT", data=data, headers=headers, params=params
-            )
+    def _upload_multipart_chunks_parallel(
+        self,
+        container,
+        object_name,
+        upload_id,
+        stream,
+        workers,
+        max_in_flight=None,
+        calculate_hash=True,
+    ):
+        """
+        Uploads data from an iterator in fixed sized chunks to S3 using a pool
+        of worker threads.
 
-            if resp.status != httplib.OK:
-                raise LibcloudError("Error uploading chunk", driver=self)
+        Chunks are read from the stream in the calling thread and uploaded by
+        the workers, each of which uses its own connection. See
+        :meth:`StorageDriver._upload_chunks_concurrently` for details.
 
-            server_hash = resp.headers["etag"].replace('"', "")
+        :param container: The destination container
+        :type container: :class:`Container`
 
-            # Keep this data for a later commit
-            chunks.append((count, server_hash))
-            count += 1
+        :param object_name: The name of the object which we are uploading
+        :type object_name: ``str``
+
+        :param upload_id: The upload id allocated for this multipart upload
+        :type upload_id: ``str``
+
+        :param stream: The generator for fetching the upload data
+        :type stream: ``generator``
+
+        :param workers: Number of chunks which are uploaded concurrently
+        :type workers: ``int``
+
+        :keyword max_in_flight: Maximum number of bytes which are read from
+            the stream but not uploaded yet (defaults to
+            ``workers * MULTIPART_IN_FLIGHT_CHUNKS_PER_WORKER * CHUNK_SIZE``).
+            A single chunk is always allowed.
+        :type max_in_flight: ``int``
+
+        :keyword calculate_hash: Indicates if we must calculate the data hash
+        :type calculate_hash: ``bool``
+
+        :return: A tuple of (chunk info, checksum, bytes transferred)
+        :rtype: ``tuple``
+        """
+        if max_in_flight is None:
+            max_in_flight = workers * MULTIPART_IN_FLIGHT_CHUNKS_PER_WORKER * CHUNK_SIZE
+
+        data_hash = None
+        if calculate_hash:
+            data_hash = self._get_hash_function()
+
+        bytes_transferred = 0
+        request_path = self._get_object_path(container, object_name)
+
+        def read_chunks():
+            nonlocal bytes_transferred
+
+            # Read the input data in chunk sizes suitable for AWS
+            for data in read_in_chunks(
+                stream, chunk_size=CHUNK_SIZE, fill_size=True, yield_empty=True
+            ):
+                bytes_transferred += len(data)
+
+                if calculate_hash:
+                    data_hash.update(data)
+
+                yield data
+
+        def upload_chunk(part_number, data, connection):
+            return self._upload_multipart_chunk(
+                request_path, upload_id, part_number, data, connection=connection
+            )
+
+        chunks = self._upload_chunks_concurrently(
+            chunks=read_chunks(),
+            upload_chunk=upload_chunk,
+            workers=workers,
+            max_in_flight=max_in_flight,
+        )
 
         if calculate_hash:
             data_hash = data_hash.hexdigest()
 
         return (chunks, data_hash, bytes_transferred)
 
+    def _upload_multipart_chunk(self, request_path, upload_id, part_number, data, connection=None):
+        """
+        Uploads a single chunk of a multipart upload to S3
+
+        :param request_path: The object path
+        :type request_path: ``str``
+
+        :param upload_id: The upload id allocated for this multipart upload
+        :type upload_id: ``str``
+
+        :param part_number: The number of this chunk (starting with 1)
+        :type part_number: ``int``
+
+        :param data: The chunk data
+        :type data: ``bytes``
+
+        :keyword connection: Connection which is used for the request
+            (defaults to ``self.connection``)
+        :type connection: :class:`Connection`
+
+        :return: A tuple of (part number, chunk hash)
+        :rtype: ``tuple``
+        """
+        connection = connection or self.connection
+
+        chunk_hash = self._get_hash_function()
+        chunk_hash.update(data)
+        chunk_hash = base64.b64encode(chunk_hash.digest()).decode("utf-8")
+
+        # The Content-MD5 header provides an extra level of data check and
+        # is recommended by amazon
+        headers = {
+            "Content-Length": len(data),
+            "Content-MD5": chunk_hash,
+        }
+
+        params = {"uploadId": upload_id, "partNumber": part_number}
+
+        resp = connection.request(
+            request_path, method="PUT", data=data, headers=headers, params=params
+        )
+
+        if resp.status != httplib.OK:
+            raise LibcloudError("Error uploading chunk", driver=self)
+
+        server_hash = resp.headers["etag"].replace('"', "")
+
+        return (part_number, server_hash)
+
     def _commit_multipart(self, container, object_name, upload_id, chunks):
         """
         Makes a final commit of the data.
@@ -788,12 +1065,23 @@ class BaseS3StorageDriver(StorageDriver):
         extra=None,
         headers=None,
         ex_storage_class=None,
+        ex_multipart_workers=None,
+        ex_multipart_max_in_flight=None,
     ):
         """
         @inherits: :class:`StorageDriver.upload_object_via_stream`
 
         :param ex_storage_class: Storage class
         :type ex_storage_class: ``str``
+
+        :param ex_multipart_workers: Number of multipart chunks which are
+            uploaded concurrently. By default, chunks are uploaded one after
+            another. Only used by drivers which support S3 multipart uploads.
+        :type ex_multipart_workers: ``int``
+
+        :param ex_multipart_max_in_flight: Maximum number of bytes which are
+            buffered in memory while uploading chunks concurrently.
+        :type ex_multipart_max_in_flight: ``int``
         """
 
         method = "PUT"
@@ -811,6 +1099,8 @@ class BaseS3StorageDriver(StorageDriver):
                 verify_hash=False,
                 headers=headers,
                 storage_class=ex_storage_class,
+                workers=ex_multipart_workers,
+                max_in_flight=ex_multipart_max_in_flight,
             )
         return self._put_object(
             container=container,
@@ -834,6 +1124,68 @@ class BaseS3StorageDriver(StorageDriver):
 
         return False
 
+    async def async_delete_object(self, obj):
+        object_path = self._get_object_path(obj.container, obj.name)
+        response = await self.async_connection.request(object_path, method="DELETE")
+        if response.status == httplib.NO_CONTENT:
+            return True
+        elif response.status == httplib.NOT_FOUND:
+            raise ObjectDoesNotExistError(value=None, driver=self, object_name=obj.name)
+
+        return False
+
+    def _delete_objects(self, container, object_names):
+        """
+        Delete a batch of objects using a single Multi-Object Delete request.
+
+        Keys which don't exist are reported as deleted by S3.
+        """
+        if not self.supports_s3_multi_object_delete:
+            return super()._delete_objects(container, object_names)
+
+        root = Element("Delete")
+
+        # Only report errors in the response
+        quiet = SubElement(root, "Quiet")
+        quiet.text = "true"
+
+        for name in object_names:
+            obj = SubElement(root, "Object")
+            key = SubElement(obj, "Key")
+            key.text = name
+
+        data = tostring(root)
+
+        # Content-MD5 header is required for Multi-Object Delete requests
+        headers = {
+            "Content-Length": len(data),
+            "Content-MD5": base64.b64encode(md5(b(data)).digest()).decode("utf-8"),
+        }
+        params = {"delete": ""}
+        request_path = self._get_container_path(container)
+        response = self.connection.request(
+            request_path, headers=headers, params=params, data=data, method="POST"
+        )
+
+        if response.status != httplib.OK:
+            raise LibcloudError(
+                "Unexpected status code: %s" % (response.status),
+                driver=self,
+            )
+
+        results = {name: None for name in object_names}
+
+        for element in findall(element=response.object, xpath="Error", namespace=self.namespace):
+            name = findtext(element=element, xpath="Key", namespace=self.namespace)
+            code = findtext(element=element, xpath="Code", namespace=self.namespace)
+            message = findtext(element=element, xpath="Message", namespace=self.namespace)
+            results[name] = LibcloudError(
+                "Error deleting object {}: {} ({})".format(name, message, code),
+                driver=self,
+            )
+
+        return results
+
     def ex_iterate_multipart_uploads(self, container, prefix=None, delimiter=None):
         """
         Extension method for listing all in-progress S3 multipart uploads.
@@ -1025,6 +1377,8 @@ class BaseS3StorageDriver(StorageDriver):
         verify_hash=False,
         headers=None,
         storage_class=None,
+        workers=None,
+        max_in_flight=None,
     ):
         """
         Uploads an object using the S3 multipart algorithm.
@@ -1050,6 +1404,14 @@ class BaseS3StorageDriver(StorageDriver):
         :keyword storage_class: The name of the S3 object's storage class
         :type extra: ``str``
 
+        :keyword workers: Number of chunks which are uploaded concurrently. If
+            not provided, chunks are uploaded sequentially.
+        :type workers: ``int``
+
+        :keyword max_in_flight: Maximum number of bytes which are buffered
+            in memory when uploading chunks concurrently.
+        :type max_in_flight: ``int``
+
         :return: The uploaded object
         :rtype: :class:`Object`
         """
@@ -1075,9 +1437,20 @@ class BaseS3StorageDriver(StorageDriver):
         upload_id = self._initiate_multipart(container, object_name, headers=headers)
 
         try:
-            result = self._upload_multipart_chunks(
-                container, object_name, upload_id, stream, calculate_hash=verify_hash
-            )
+            if workers and workers > 1:
+                result = self._upload_multipart_chunks_parallel(
+                    container,
+                    object_name,
+                    upload_id,
+                    stream,
+                    workers=workers,
+                    max_in_flight=max_in_flight,
+                    calculate_hash=verify_hash,
+                )
+            else:
+                result = self._upload_multipart_chunks(
+                    container, object_name, upload_id, stream, calculate_hash=verify_hash
+                )
             chunks, data_hash, bytes_transferred = result
 
             # Commit the chunk info and complete the upload
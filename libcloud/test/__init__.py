@@ -20,7 +20,7 @@ import unittest
 import requests
 import requests_mock
 
-from libcloud.http import LibcloudConnection
+from libcloud.http import AsyncResponse, LibcloudConnection
 from libcloud.utils.py3 import PY2, httplib, parse_qs, urlparse, urlquote, parse_qsl
 from libcloud.common.base import Response
 
@@ -245,6 +245,40 @@ class MockHttp(LibcloudConnection):
                 assert params[key] == value
 
 
+class AsyncMockHttp:
+    """
+    A mock asyncio HTTP transport which returns the responses of the mock
+    methods of the provided :class:`MockHttp` instance.
+
+    Usage: driver.async_connection.connection = AsyncMockHttp(mock_http)
+    """
+
+    def __init__(self, mock_http):
+        self.mock_http = mock_http
+
+    async def request(self, method, url, body=None, headers=None):
+        headers = self.mock_http._normalize_headers(headers=headers)
+        r_status, r_body, r_headers, r_reason = self.mock_http._get_request(
+            method, url, body, headers
+        )
+
+        if r_body is None:
+            r_body = ""
+
+        if not isinstance(r_body, bytes):
+            r_body = r_body.encode("utf-8")
+
+        return AsyncResponse(
+            status_code=r_status,
+            reason=r_reason,
+            headers=r_headers or {},
+            content=r_body,
+        )
+
+    async def close(self):
+        pass
+
+
 class MockConnection:
     def __init__(self, action):
         self.action = action
@@ -0,0 +1,146 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import tracemalloc
+
+import pytest
+
+from libcloud.dns.base import Zone, Record, DNSDriver
+from libcloud.dns.types import RecordType
+
+# Upper bound for the peak traced memory when streaming a zone. It doesn't
+# depend on the number of records (it's about 35KB locally).
+MAX_STREAMING_PEAK_MEMORY = 256 * 1024
+
+
+class SyntheticZoneDNSDriver(DNSDriver):
+    def __init__(self, record_count):
+        super().__init__("key", "secret")
+        self.record_count = record_count
+
+    def iterate_records(self, zone):
+        for index in range(self.record_count):
+            yield Record(
+                id=index + 1,
+                name="host%s" % (index),
+                type=RecordType.A,
+                data="10.%s.%s.%s" % ((index >> 16) & 255, (index >> 8) & 255, index & 255),
+                zone=zone,
+                driver=self,
+            )
+
+
+def get_peak_memory(func, *args, **kwargs):
+    """
+    Return the peak memory (in bytes) traced while running the function.
+    """
+    tracemalloc.start()
+
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# fmt: off
+@pytest.mark.parametrize(
+    "record_count",
+    [
+        1000,
+        100000,
+        1000000,
+    ],
+    ids=[
+        "1000",
+        "100k",
+        "1mil",
+    ],
+)
+@pytest.mark.parametrize(
+    "sort",
+    [
+        True,
+        False,
+    ],
+    ids=[
+        "sort",
+        "no_sort",
+    ],
+)
+# fmt: on
+def test_export_zone_to_bind_zone_file(benchmark, record_count, sort):
+    """
+    Micro benchmark which measures how long exporting a zone with a lot of records to a BIND zone
+    file takes.
+    """
+    driver = SyntheticZoneDNSDriver(record_count=record_count)
+    zone = Zone(id=1, domain="example.com", type="master", ttl=900, driver=driver)
+    fd, file_path = tempfile.mkstemp()
+    os.close(fd)
+
+    try:
+        benchmark(driver.export_zone_to_bind_zone_file, zone=zone, file_path=file_path, sort=sort)
+
+        if not sort:
+            # Records are written as they are retrieved
+            peak = get_peak_memory(
+                driver.export_zone_to_bind_zone_file, zone=zone, file_path=file_path, sort=sort
+            )
+            assert peak < MAX_STREAMING_PEAK_MEMORY
+    finally:
+        os.remove(file_path)
+
+
+# fmt: off
+@pytest.mark.parametrize(
+    "record_count",
+    [
+        1000,
+        100000,
+        1000000,
+    ],
+    ids=[
+        "1000",
+        "100k",
+        "1mil",
+    ],
+)
+# fmt: on
+def test_parse_bind_zone_file(benchmark, record_count):
+    """
+    Micro benchmark which measures how long parsing a BIND zone file with a lot of records takes.
+    """
+    driver = SyntheticZoneDNSDriver(record_count=record_count)
+    zone = Zone(id=1, domain="example.com", type="master", ttl=900, driver=driver)
+    fd, file_path = tempfile.mkstemp()
+    os.close(fd)
+
+    def run_benchmark():
+        count = 0
+
+        for _ in driver.parse_bind_zone_file(file_path):
+            count += 1
+
+        return count
+
+    try:
+        driver.export_zone_to_bind_zone_file(zone=zone, file_path=file_path, sort=False)
+        assert benchmark(run_benchmark) == record_count
+        assert get_peak_memory(run_benchmark) < MAX_STREAMING_PEAK_MEMORY
+    finally:
+        os.remove(file_path)
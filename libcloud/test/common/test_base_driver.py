@@ -14,10 +14,12 @@
 # limitations under the License.
 
 import sys
+import threading
 from unittest.mock import Mock
 
 from libcloud.test import unittest
-from libcloud.common.base import BaseDriver
+from libcloud.common.base import BaseDriver, Connection
+from libcloud.utils.ratelimit import RateLimiter
 
 
 class BaseDriverTestCase(unittest.TestCase):
@@ -61,6 +63,45 @@ class BaseDriverTestCase(unittest.TestCase):
         self.assertEqual(call_kwargs["timeout"], 14)
         self.assertEqual(call_kwargs["retry_delay"], 10)
 
+    def test_get_thread_connection(self):
+        class DummyDriver(BaseDriver):
+            pass
+
+        DummyDriver.connectionCls = Connection
+        driver = DummyDriver(key="foo")
+
+        connection1 = driver._get_thread_connection()
+        connection2 = driver._get_thread_connection()
+
+        # Connection is reused inside the same thread
+        self.assertIs(connection1, connection2)
+        self.assertIsNot(connection1, driver.connection)
+        self.assertIsNot(connection1.connection, driver.connection.connection)
+        self.assertIs(connection1.driver, driver)
+
+        result = []
+        thread = threading.Thread(target=lambda: result.append(driver._get_thread_connection()))
+        thread.start()
+        thread.join()
+
+        # Each thread gets its own connection
+        self.assertIsNot(result[0], connection1)
+        self.assertIsNot(result[0].connection, connection1.connection)
+
+    def test_rate_limiter_is_shared(self):
+        class DummyDriver(BaseDriver):
+            pass
+
+        DummyDriver.connectionCls = Connection
+        rate_limiter = RateLimiter(rate=10)
+        driver1 = DummyDriver(key="foo", rate_limiter=rate_limiter)
+        driver2 = DummyDriver(key="bar", rate_limiter=rate_limiter)
+
+        self.assertIs(driver1.connection.rate_limiter, rate_limiter)
+        self.assertIs(driver2.connection.rate_limiter, rate_limiter)
+        self.assertIs(driver1._get_thread_connection().rate_limiter, rate_limiter)
+        self.assertIsNone(DummyDriver(key="foo").connection.rate_limiter)
+
 
 if __name__ == "__main__":
     sys.exit(unittest.main())
@@ -34,6 +34,9 @@ class OpenStackBaseConnectionTest(unittest.TestCase):
     def tearDown(self):
         OpenStackBaseConnection.conn_class = LibcloudConnection
 
+        if "default_content_type" in OpenStackBaseConnection.__dict__:
+            del OpenStackBaseConnection.default_content_type
+
     def test_base_connection_timeout(self):
         self.connection.connect()
         self.assertEqual(self.connection.timeout, self.timeout)
@@ -76,6 +79,14 @@ class OpenStackBaseConnectionTest(unittest.TestCase):
             raw=False,
         )
 
+    @patch("libcloud.common.base.ConnectionUserAndKey.request")
+    def test_request_explicit_content_type(self, mock_request):
+        OpenStackBaseConnection.default_content_type = "application/json"
+        self.connection.request(
+            "/path", data="somedata", headers={"content-type": "text/plain"}, method="POST"
+        )
+        self.assertEqual(mock_request.call_args[1]["headers"], {"content-type": "text/plain"})
+
     @patch("libcloud.test.common.test_openstack.OpenStackBaseConnection.connect", Mock())
     def test_connection_is_reused_when_details_dont_change(self):
         url = "https://example.com"
@@ -14,6 +14,7 @@
 # limitations under the License.
 import sys
 import unittest
+from unittest import mock
 
 from libcloud.common.base import Connection, ConnectionKey, ConnectionUserAndKey
 from libcloud.common.types import LibcloudError
@@ -26,7 +27,7 @@ from libcloud.compute.base import (
     NodeAuthSSHKey,
     NodeAuthPassword,
 )
-from libcloud.compute.types import StorageVolumeState
+from libcloud.compute.types import NodeState, StorageVolumeState
 
 
 class FakeDriver:
@@ -117,5 +118,161 @@ class TestValidateAuth(unittest.TestCase):
         self.assertRaises(LibcloudError, n._get_and_check_auth, auth)
 
 
+class CreateNodesTests(unittest.TestCase):
+    class TestNodeDriver(NodeDriver):
+        def create_node(self, name, size=None, image=None):
+            if name == "fail":
+                raise LibcloudError("Quota exceeded", driver=self)
+
+            return Node(
+                id=name,
+                name=name,
+                state=NodeState.PENDING,
+                public_ips=[],
+                private_ips=[],
+                driver=self,
+            )
+
+    def setUp(self):
+        self.driver = self.TestNodeDriver("foo")
+
+    def test_create_nodes(self):
+        specs = [{"name": "node-%s" % (index)} for index in range(10)]
+        specs[3] = {"name": "fail"}
+
+        results = self.driver.create_nodes(specs, concurrency=4)
+        self.assertEqual(len(results), 10)
+        self.assertEqual([result.spec for result in results], specs)
+
+        failed = results.pop(3)
+        self.assertFalse(failed.success)
+        self.assertIsNone(failed.node)
+        self.assertTrue("Quota exceeded" in str(failed.error))
+
+        for result in results:
+            self.assertTrue(result.success)
+            self.assertEqual(result.node.name, result.spec["name"])
+
+    def test_create_nodes_wait_until_running(self):
+        specs = [{"name": "node-1"}, {"name": "fail"}, {"name": "node-2"}]
+
+        def wait_until_running(nodes, **kwargs):
+            for node in nodes:
+                node.state = NodeState.RUNNING
+            return [(node, ["10.0.0.1"]) for node in nodes]
+
+        with mock.patch.object(
+            self.driver, "wait_until_running", side_effect=wait_until_running
+        ) as mock_wait:
+            results = self.driver.create_nodes(
+                specs, wait_until_running=True, wait_kwargs={"timeout": 10}
+            )
+
+        # All the created nodes are waited for together
+        self.assertEqual(mock_wait.call_count, 1)
+        names = [node.name for node in mock_wait.call_args[1]["nodes"]]
+        self.assertEqual(names, ["node-1", "node-2"])
+        self.assertEqual(mock_wait.call_args[1]["timeout"], 10)
+        self.assertEqual(results[0].node.state, NodeState.RUNNING)
+        self.assertFalse(results[1].success)
+        self.assertEqual(results[2].node.state, NodeState.RUNNING)
+
+
+class WaitUntilRunningTests(unittest.TestCase):
+    class TestNodeDriver(NodeDriver):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # Number of list_nodes / _refresh_nodes calls after which the
+            # nodes are running
+            self.running_after = 3
+            self.calls = []
+
+        def _get_nodes(self, ids):
+            state = NodeState.PENDING
+
+            if len(self.calls) >= self.running_after:
+                state = NodeState.RUNNING
+
+            return [
+                Node(
+                    id=node_id,
+                    name=node_id,
+                    state=state,
+                    public_ips=["10.0.0.1"],
+                    private_ips=[],
+                    driver=self,
+                )
+                for node_id in ids
+            ]
+
+        def list_nodes(self, **kwargs):
+            self.calls.append("list_nodes")
+            return self._get_nodes(["1", "2", "3"])
+
+    class TestRefreshNodeDriver(TestNodeDriver):
+        supports_refresh_nodes = True
+
+        def _refresh_nodes(self, nodes):
+            self.calls.append("_refresh_nodes")
+            return self._get_nodes([node.id for node in nodes])
+
+    def _get_nodes(self, driver):
+        return [
+            Node(id=node_id, name=node_id, state=None, public_ips=[], private_ips=[], driver=driver)
+            for node_id in ["1", "2"]
+        ]
+
+    @mock.patch("time.sleep")
+    def test_wait_until_running_lists_all_nodes(self, mock_sleep):
+        driver = self.TestNodeDriver("foo")
+        result = driver.wait_until_running(self._get_nodes(driver), wait_period=1)
+
+        self.assertEqual([node.id for node, _ in result], ["1", "2"])
+        self.assertEqual(driver.calls, ["list_nodes"] * 3)
+
+    @mock.patch("time.sleep")
+    def test_wait_until_running_refreshes_nodes(self, mock_sleep):
+        driver = self.TestRefreshNodeDriver("foo")
+        result = driver.wait_until_running(self._get_nodes(driver), wait_period=1)
+
+        self.assertEqual([node.id for node, _ in result], ["1", "2"])
+        self.assertEqual(driver.calls, ["_refresh_nodes"] * 3)
+
+        # Driver specific list_nodes arguments can only be passed to
+        # list_nodes
+        driver.calls = []
+        driver.running_after = 0
+        driver.list_nodes = mock.Mock(wraps=driver.list_nodes)
+        driver.wait_until_running(self._get_nodes(driver), ex_list_nodes_kwargs={})
+        driver.wait_until_running(self._get_nodes(driver), ex_list_nodes_kwargs={"foo": 1})
+        self.assertEqual(driver.calls, ["_refresh_nodes", "list_nodes"])
+        driver.list_nodes.assert_called_once_with(foo=1)
+
+    @mock.patch("time.sleep")
+    def test_wait_until_running_wait_period_grows(self, mock_sleep):
+        driver = self.TestNodeDriver("foo")
+        driver.running_after = 5
+        driver.wait_until_running(self._get_nodes(driver), wait_period=2, max_wait_period=5)
+
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 4)
+        self.assertAlmostEqual(delays[0], 2, places=1)
+        self.assertAlmostEqual(delays[1], 3, places=1)
+        self.assertAlmostEqual(delays[2], 4.5, places=1)
+        self.assertAlmostEqual(delays[3], 5, places=1)
+
+    @mock.patch("time.sleep")
+    def test_wait_until_running_wait_period_constant_by_default(self, mock_sleep):
+        driver = self.TestNodeDriver("foo")
+        driver.running_after = 5
+        driver.wait_until_running(self._get_nodes(driver), wait_period=2)
+
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 4)
+
+        for delay in delays:
+            self.assertAlmostEqual(delay, 2, places=1)
+
+
 if __name__ == "__main__":
     sys.exit(unittest.main())
@@ -220,6 +220,28 @@ class DeploymentTests(unittest.TestCase):
         expected = file_path
         client.run.assert_called_once_with(expected, timeout=None)
 
+    def test_script_deployment_output_streaming(self):
+        client = Mock()
+        client.put.return_value = FILE_PATH
+        client.run.return_value = ("", "", 0)
+
+        stdout_callback = Mock()
+        sd = ScriptDeployment(
+            script='echo "foo"',
+            name="relative.sh",
+            stdout_callback=stdout_callback,
+            max_output_size=1024,
+        )
+        sd.run(self.node, client)
+
+        client.run.assert_called_once_with(
+            FILE_PATH,
+            timeout=None,
+            stdout_callback=stdout_callback,
+            stderr_callback=None,
+            max_buffer_size=1024,
+        )
+
     def test_script_file_deployment_with_arguments(self):
         file_path = os.path.abspath(__file__)
         client = Mock()
@@ -493,6 +515,94 @@ class DeploymentTests(unittest.TestCase):
         self.assertEqual(ssh_client.connect.call_count, 2)
         self.assertEqual(ssh_client.close.call_count, 2 + 1)
 
+    @patch("libcloud.compute.base.SSHClient")
+    def test_deploy_nodes(self, mock_ssh_client_cls):
+        RackspaceMockHttp.type = "MULTIPLE_NODES"
+
+        def run_step(node, client):
+            if node.id == "123456":
+                raise Exception("step failed")
+
+            return node
+
+        step1 = Mock(spec=Deployment)
+        step1.run.side_effect = lambda node, client: node
+        step2 = Mock(spec=Deployment)
+        step2.run.side_effect = run_step
+        deploy = MultiStepDeployment([step1, MultiStepDeployment([step2])])
+        progress = []
+
+        results = self.driver.deploy_nodes(
+            nodes=[self.node, self.node2],
+            deploy=deploy,
+            wait_period=0.1,
+            max_tries=1,
+            concurrency=2,
+            progress_callback=lambda node, step, duration: progress.append((node.id, step)),
+        )
+
+        self.assertEqual([result.node.id for result in results], ["12345", "123456"])
+        self.assertTrue(results[0].success)
+        self.assertEqual([step for step, _ in results[0].step_timings], [step1, step2])
+        self.assertFalse(results[1].success)
+        self.assertTrue(isinstance(results[1].error, DeploymentError))
+        self.assertEqual([step for step, _ in results[1].step_timings], [step1])
+
+        self.assertEqual(
+            sorted(progress, key=lambda item: item[0]),
+            [("12345", step1), ("12345", step2), ("123456", step1)],
+        )
+
+        # One SSH connection per node which is reused by all the steps
+        hostnames = sorted(call[1]["hostname"] for call in mock_ssh_client_cls.call_args_list)
+        self.assertEqual(hostnames, ["67.23.21.33", "67.23.21.34"])
+        self.assertEqual(mock_ssh_client_cls.return_value.close.call_count, 2)
+
+    @patch("libcloud.compute.base.SSHClient")
+    def test_deploy_nodes_node_never_ready(self, mock_ssh_client_cls):
+        node3 = Node(
+            id=1234567,
+            name="test",
+            state=NodeState.RUNNING,
+            public_ips=["1.2.3.6"],
+            private_ips=[],
+            driver=Rackspace,
+            extra={"password": "generated"},
+        )
+
+        def wait_until_running(nodes, **kwargs):
+            if self.node2 in nodes:
+                raise LibcloudError(value="Timed out after 1 seconds", driver=self.driver)
+
+            return [(node, node.public_ips) for node in nodes]
+
+        deploy = Mock(spec=Deployment)
+        deploy.run.side_effect = lambda node, client: node
+
+        with patch.object(
+            self.driver, "wait_until_running", side_effect=wait_until_running
+        ) as mock_wait:
+            results = self.driver.deploy_nodes(
+                nodes=[self.node, self.node2, node3], deploy=deploy, wait_period=0.1
+            )
+
+        # The nodes are waited for together first, then one by one
+        self.assertEqual(mock_wait.call_count, 4)
+        self.assertEqual(mock_wait.call_args_list[0][1]["nodes"], [self.node, self.node2, node3])
+
+        self.assertEqual([result.success for result in results], [True, False, True])
+        self.assertTrue(isinstance(results[1].error, DeploymentError))
+        self.assertTrue("Timed out" in str(results[1].error.value))
+        self.assertEqual(results[1].step_timings, [])
+
+        # Only the nodes which are running are connected to, the generated
+        # password is used when no auth is provided
+        calls = sorted(
+            (call[1]["hostname"], call[1]["password"])
+            for call in mock_ssh_client_cls.call_args_list
+        )
+        self.assertEqual(calls, [("1.2.3.4", None), ("1.2.3.6", "generated")])
+
     @patch("libcloud.compute.base.SSHClient")
     @patch("libcloud.compute.ssh")
     def test_deploy_node_success(self, mock_ssh_module, _):
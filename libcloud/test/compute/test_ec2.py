@@ -17,10 +17,12 @@
 import os
 import sys
 import base64
+import asyncio
 from datetime import datetime
+from unittest import mock
 from collections import OrderedDict
 
-from libcloud.test import MockHttp, LibcloudTestCase, unittest
+from libcloud.test import MockHttp, AsyncMockHttp, LibcloudTestCase, unittest
 from libcloud.utils.py3 import b, httplib, parse_qs
 from libcloud.compute.base import (
     Node,
@@ -49,6 +51,7 @@ from libcloud.compute.drivers.ec2 import (
     IdempotentParamError,
     ExEC2AvailabilityZone,
     OutscaleSASNodeDriver,
+    get_sizes_catalog,
 )
 
 null_fingerprint = "00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:" + "00:00:00:00:00"
@@ -95,6 +98,26 @@ class BaseEC2Tests(LibcloudTestCase):
         if unsupported_regions:
             self.fail("Cannot list sizes from ec2 regions: %s" % unsupported_regions)
 
+    def test_sizes_catalog_matches_constants(self):
+        from libcloud.compute.constants.ec2_instance_types import INSTANCE_TYPES
+        from libcloud.compute.constants.ec2_region_details_complete import REGION_DETAILS
+
+        catalog = get_sizes_catalog()
+        self.assertIs(get_sizes_catalog(), catalog)
+        self.assertEqual(catalog["instance_types"], INSTANCE_TYPES)
+        self.assertEqual(
+            catalog["regions"],
+            {name: details["instance_types"] for name, details in REGION_DETAILS.items()},
+        )
+
+    def test_list_sizes_doesnt_share_catalog_attributes(self):
+        driver = EC2NodeDriver(*EC2_PARAMS, **{"region": "us-east-1"})
+        size = driver.list_sizes()[0]
+        size.extra["foo"] = "bar"
+
+        self.assertNotIn("foo", driver.list_sizes()[0].extra)
+        self.assertNotIn("foo", get_sizes_catalog()["instance_types"][size.id]["extra"])
+
 
 class EC2Tests(LibcloudTestCase, TestCaseMixin):
     image_name = "ec2-public-images/fedora-8-i386-base-v1.04.manifest.xml"
@@ -193,6 +216,32 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         self.assertEqual(node.extra["tags"]["Name"], "foo")
         self.assertEqual(len(node.extra["tags"]), 1)
 
+    def test_refresh_nodes_filters_by_instance_id(self):
+        EC2MockHttp.type = "refresh"
+        nodes = [
+            Node("i-4382922a", None, None, None, None, self.driver),
+            Node("i-pending", None, None, None, None, self.driver),
+        ]
+
+        refreshed = self.driver._refresh_nodes(nodes)
+        self.assertEqual(refreshed[0].id, "i-4382922a")
+        self.assertEqual(EC2MockHttp.filter_values, ["i-4382922a", "i-pending"])
+
+    def test_create_nodes_launches_identical_specs_together(self):
+        image = NodeImage(id="ami-be3adfd7", name=self.image_name, driver=self.driver)
+        size = NodeSize("m1.small", "Small Instance", None, None, None, None, driver=self.driver)
+        specs = [{"name": "foo", "image": image, "size": size}] * 2
+        specs.append({"name": "bar", "image": image, "size": size})
+
+        EC2MockHttp.type = "create_nodes"
+        EC2MockHttp.run_instances_counts = []
+        results = self.driver.create_nodes(specs)
+
+        self.assertEqual(sorted(EC2MockHttp.run_instances_counts), [("1", "1"), ("2", "2")])
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual([result.node.id for result in results[:2]], ["i-2ba64342", "i-2ba64343"])
+        self.assertEqual(results[2].node.name, "bar")
+
     def test_create_node_with_ex_assign_public_ip(self):
         # assertions are done in _create_ex_assign_public_ip_RunInstances
         EC2MockHttp.type = "create_ex_assign_public_ip"
@@ -475,6 +524,97 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         ret = self.driver.destroy_node(node)
         self.assertTrue(ret)
 
+    def test_async_list_nodes(self):
+        self.driver.async_connection.connection = AsyncMockHttp(self.driver.connection.connection)
+
+        nodes = asyncio.run(self.driver.async_list_nodes())
+        expected_nodes = self.driver.list_nodes()
+
+        self.assertEqual([node.id for node in nodes], [node.id for node in expected_nodes])
+        self.assertEqual(nodes[0].public_ips, expected_nodes[0].public_ips)
+        self.assertEqual(nodes[0].extra["image_id"], "ami-3215fe5a")
+
+    def test_iterate_nodes_follows_next_token(self):
+        EC2MockHttp.type = "paginated"
+
+        expected_nodes = list(self.driver.iterate_nodes())
+        self.assertEqual([node.id for node in expected_nodes], ["i-4382922a", "i-8474834a"])
+        page_size = str(self.driver.page_size) if self.driver.page_size else None
+        self.assertEqual(EC2MockHttp.max_results, [page_size, page_size])
+
+        nodes = list(self.driver.iterate_nodes(ex_page_size=10, ex_prefetch=True))
+        self.assertEqual([node.id for node in nodes], ["i-4382922a", "i-8474834a"])
+        self.assertEqual(nodes[0].public_ips, expected_nodes[0].public_ips)
+        self.assertEqual(EC2MockHttp.max_results, ["10", "10"])
+
+    def test_iterate_nodes_iterparse(self):
+        EC2MockHttp.type = "paginated"
+        self.driver.iterparse_list_responses = True
+
+        nodes = self.driver.iterate_nodes()
+
+        # Nodes are yielded as soon as they have been parsed
+        self.assertEqual(next(nodes).id, "i-4382922a")
+        self.assertEqual(len(EC2MockHttp.max_results), 1)
+        self.assertEqual([node.id for node in nodes], ["i-8474834a"])
+        self.assertEqual(len(EC2MockHttp.max_results), 2)
+
+        self.driver.iterparse_list_responses = False
+        expected_nodes = list(self.driver.iterate_nodes())
+        self.assertEqual([node.id for node in expected_nodes], ["i-4382922a", "i-8474834a"])
+
+    def test_iterate_nodes_iterparse_stopped_early_closes_response(self):
+        EC2MockHttp.type = "paginated"
+        self.driver.iterparse_list_responses = True
+
+        with mock.patch("libcloud.common.base.RawResponse.close") as mock_close:
+            nodes = self.driver.iterate_nodes()
+            next(nodes)
+            self.assertFalse(mock_close.called)
+
+            nodes.close()
+            self.assertEqual(mock_close.call_count, 1)
+
+    def test_iterate_nodes_node_ids_no_max_results(self):
+        EC2MockHttp.type = "paginated"
+
+        nodes = list(self.driver.iterate_nodes(ex_node_ids=["i-4382922a", "i-8474834a"]))
+        self.assertEqual(len(nodes), 2)
+        self.assertEqual(EC2MockHttp.max_results, [None, None])
+
+    def test_list_nodes_paginated(self):
+        EC2MockHttp.type = "paginated"
+
+        nodes = self.driver.list_nodes()
+        EC2MockHttp.type = None
+        expected_nodes = self.driver.list_nodes()
+
+        self.assertEqual([node.id for node in nodes], [node.id for node in expected_nodes])
+
+    def test_async_list_nodes_paginated(self):
+        EC2MockHttp.type = "paginated"
+        EC2MockHttp.describe_addresses_count = 0
+        self.driver.async_connection.connection = AsyncMockHttp(self.driver.connection.connection)
+
+        nodes = asyncio.run(self.driver.async_list_nodes())
+        self.assertEqual([node.id for node in nodes], ["i-4382922a", "i-8474834a"])
+        self.assertEqual(EC2MockHttp.describe_addresses_count, 1)
+
+    def test_list_nodes_paginated_describes_addresses_once(self):
+        EC2MockHttp.type = "paginated"
+        EC2MockHttp.describe_addresses_count = 0
+
+        nodes = self.driver.list_nodes()
+        self.assertEqual([node.id for node in nodes], ["i-4382922a", "i-8474834a"])
+        self.assertIn("1.2.3.4", nodes[0].public_ips)
+        self.assertEqual(EC2MockHttp.describe_addresses_count, 1)
+
+    def test_async_destroy_node(self):
+        self.driver.async_connection.connection = AsyncMockHttp(self.driver.connection.connection)
+
+        node = Node("i-4382922a", None, None, None, None, self.driver)
+        self.assertTrue(asyncio.run(self.driver.async_destroy_node(node)))
+
     def test_list_sizes(self):
         region_old = self.driver.region_name
 
@@ -563,6 +703,15 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         self.assertEqual(size, 20)
         self.assertIsNone(images[2].extra["creation_date"])
 
+    def test_iterate_images_follows_next_token(self):
+        EC2MockHttp.type = "paginated"
+
+        images = list(self.driver.iterate_images(ex_owner="all", ex_prefetch=True))
+        self.assertEqual(len(images), 6)
+        self.assertEqual(images[0].id, "ami-57ba933a")
+        self.assertEqual(images[3].id, "ami-57ba933a")
+        self.assertEqual(len(self.driver.list_images(ex_owner="all")), 6)
+
     def test_list_images_with_image_ids(self):
         EC2MockHttp.type = "ex_imageids"
         images = self.driver.list_images(ex_image_ids=["ami-57ba933a"])
@@ -839,6 +988,55 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         self.assertEqual("1.2.3.5", elastic_ips2[1].ip)
         self.assertEqual("vpc", elastic_ips2[1].domain)
 
+    def test_ex_describe_addresses_multiple_nodes(self):
+        node1 = Node("i-4382922a", None, None, None, None, self.driver)
+        node2 = Node("i-4382922b", None, None, None, None, self.driver)
+        node3 = Node("i-4382922g", None, None, None, None, self.driver)
+        nodes_elastic_ips = self.driver.ex_describe_addresses([node1, node2, node3])
+
+        self.assertEqual(nodes_elastic_ips[node1.id], ["1.2.3.4"])
+        self.assertEqual(sorted(nodes_elastic_ips[node2.id]), ["1.2.3.5", "1.2.3.6"])
+        self.assertEqual(nodes_elastic_ips[node3.id], [])
+
+    def test_ex_get_address_index(self):
+        EC2MockHttp.type = "all_addresses"
+        index = self.driver.ex_get_address_index()
+
+        self.assertEqual(len(index.addresses), 4)
+        self.assertEqual(index.get_ips("i-4382922a"), ["1.2.3.4"])
+        self.assertEqual([address.ip for address in index.get_addresses("i-4382922b")], ["1.2.3.5"])
+        self.assertEqual(index.get_ips("i-unknown"), [])
+
+    def test_ex_get_address_index_cache(self):
+        EC2MockHttp.type = "all_addresses"
+
+        with mock.patch.object(
+            self.driver.connection, "request", wraps=self.driver.connection.request
+        ) as request:
+            # Caching is disabled by default
+            self.driver.ex_get_address_index()
+            self.driver.ex_get_address_index()
+            self.assertEqual(request.call_count, 2)
+
+            self.driver.address_index_ttl = 60
+            request.reset_mock()
+
+            index = self.driver.ex_get_address_index()
+            self.assertIs(self.driver.ex_get_address_index(), index)
+            self.assertEqual(len(self.driver.ex_describe_all_addresses()), 4)
+            self.assertEqual(len(self.driver.ex_describe_all_addresses(only_associated=True)), 2)
+            self.assertEqual(request.call_count, 1)
+
+            self.assertIsNot(self.driver.ex_get_address_index(refresh=True), index)
+            self.assertEqual(request.call_count, 2)
+
+            # Modifying addresses invalidates the cache
+            EC2MockHttp.type = None
+            self.driver.ex_release_address(index.addresses[0])
+            EC2MockHttp.type = "all_addresses"
+            self.driver.ex_get_address_index()
+            self.assertEqual(request.call_count, 4)
+
     def test_ex_allocate_address(self):
         elastic_ip = self.driver.ex_allocate_address()
         self.assertEqual("192.0.2.1", elastic_ip.ip)
@@ -1477,11 +1675,53 @@ class EC2SAEastTests(EC2Tests):
 
 class EC2MockHttp(MockHttp, unittest.TestCase):
     fixtures = ComputeFileFixtures("ec2")
+    describe_addresses_count = 0
 
     def _DescribeInstances(self, method, url, body, headers):
         body = self.fixtures.load("describe_instances.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _refresh_DescribeInstances(self, method, url, body, headers):
+        params = self._get_params(url)
+        self.assertEqual(params["Filter.1.Name"], ["instance-id"])
+        self.assertFalse("InstanceId.1" in params)
+        values = [params["Filter.1.Value.%s" % (i)][0] for i in range(1, 3)]
+        EC2MockHttp.filter_values = values
+
+        body = self.fixtures.load("describe_instances.xml")
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _refresh_DescribeAddresses(self, method, url, body, headers):
+        return self._DescribeAddresses(method, url, body, headers)
+
+    def _paginated_DescribeInstances(self, method, url, body, headers):
+        params = self._get_params(url)
+
+        if "NextToken" not in params:
+            EC2MockHttp.max_results = []
+            body = self.fixtures.load("describe_instances_paginated_1.xml")
+        else:
+            self.assertEqual(params["NextToken"], ["page-2-token"])
+            body = self.fixtures.load("describe_instances_paginated_2.xml")
+
+        EC2MockHttp.max_results.append(params.get("MaxResults", [None])[0])
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _paginated_DescribeAddresses(self, method, url, body, headers):
+        EC2MockHttp.describe_addresses_count += 1
+        return self._DescribeAddresses(method, url, body, headers)
+
+    def _paginated_DescribeImages(self, method, url, body, headers):
+        params = self._get_params(url)
+        body = self.fixtures.load("describe_images.xml")
+
+        if "NextToken" not in params:
+            body = body.replace("</imagesSet>", "</imagesSet><nextToken>images-2</nextToken>")
+        else:
+            self.assertEqual(params["NextToken"], ["images-2"])
+
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _DescribeReservedInstances(self, method, url, body, headers):
         body = self.fixtures.load("describe_reserved_instances.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
@@ -1542,15 +1782,30 @@ class EC2MockHttp(MockHttp, unittest.TestCase):
         body = self.fixtures.load("run_instances.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
-    def _ex_user_data_RunInstances(self, method, url, body, headers):
-        # test_create_node_with_ex_userdata
+    def _create_nodes_RunInstances(self, method, url, body, headers):
+        params = self._get_params(url)
+        count = (params["MinCount"][0], params["MaxCount"][0])
+        EC2MockHttp.run_instances_counts.append(count)
+
+        if count == ("1", "1"):
+            body = self.fixtures.load("run_instances.xml")
+        else:
+            body = self.fixtures.load("run_instances_multiple.xml")
+
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _get_params(self, url):
         if url.startswith("/"):
             url = url[1:]
 
         if url.startswith("?"):
             url = url[1:]
 
-        params = parse_qs(url)
+        return parse_qs(url)
+
+    def _ex_user_data_RunInstances(self, method, url, body, headers):
+        # test_create_node_with_ex_userdata
+        params = self._get_params(url)
 
         self.assertTrue(
             "UserData" in params,
@@ -1958,6 +2213,34 @@ class NimbusTests(EC2Tests):
         self.assertEqual(len(nodes_elastic_ips), 1)
         self.assertEqual(len(nodes_elastic_ips[node.id]), 0)
 
+    def test_ex_describe_addresses_multiple_nodes(self):
+        # overridden from EC2Tests -- Nimbus doesn't support elastic IPs.
+        node1 = Node("i-4382922a", None, None, None, None, self.driver)
+        node2 = Node("i-4382922b", None, None, None, None, self.driver)
+        nodes_elastic_ips = self.driver.ex_describe_addresses([node1, node2])
+
+        self.assertEqual(nodes_elastic_ips, {node1.id: [], node2.id: []})
+
+    def test_async_list_nodes_paginated(self):
+        # overridden from EC2Tests -- Nimbus doesn't support elastic IPs.
+        EC2MockHttp.type = "paginated"
+        EC2MockHttp.describe_addresses_count = 0
+        self.driver.async_connection.connection = AsyncMockHttp(self.driver.connection.connection)
+
+        nodes = asyncio.run(self.driver.async_list_nodes())
+        self.assertEqual([node.id for node in nodes], ["i-4382922a", "i-8474834a"])
+        self.assertEqual(EC2MockHttp.describe_addresses_count, 0)
+
+    def test_list_nodes_paginated_describes_addresses_once(self):
+        # overridden from EC2Tests -- Nimbus doesn't support elastic IPs.
+        EC2MockHttp.type = "paginated"
+        EC2MockHttp.describe_addresses_count = 0
+
+        nodes = self.driver.list_nodes()
+        self.assertEqual([node.id for node in nodes], ["i-4382922a", "i-8474834a"])
+        self.assertEqual(nodes[0].public_ips, ["1.2.3.4"])
+        self.assertEqual(EC2MockHttp.describe_addresses_count, 0)
+
     def test_list_sizes(self):
         sizes = self.driver.list_sizes()
 
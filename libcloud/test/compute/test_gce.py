@@ -16,13 +16,16 @@
 Tests for Google Compute Engine Driver
 """
 
+import re
 import sys
+import json
+import asyncio
 import datetime
 import unittest
 from unittest import mock
 
 from libcloud.test import MockHttp
-from libcloud.utils.py3 import httplib
+from libcloud.utils.py3 import httplib, parse_qs, urlparse
 from libcloud.compute.base import Node, StorageVolume
 from libcloud.test.compute import TestCaseMixin
 from libcloud.test.secrets import GCE_PARAMS, GCE_KEYWORD_PARAMS
@@ -72,6 +75,7 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
         GCENodeDriver.connectionCls.conn_class = GCEMockHttp
         GoogleBaseAuthConnection.conn_class = GoogleAuthMockHttp
         GCEMockHttp.type = None
+        GCEMockHttp.operations_list_filters = []
         kwargs = GCE_KEYWORD_PARAMS.copy()
         kwargs["auth_type"] = "IA"
         kwargs["datacenter"] = self.datacenter
@@ -699,6 +703,16 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
         self.assertEqual(networks[2].name, "default")
         self.assertEqual(networks[2].mode, "legacy")
 
+    def test_async_list_nodes(self):
+        # GCE doesn't provide a native implementation, the blocking method
+        # is called from an executor
+        nodes = asyncio.run(self.driver.async_list_nodes(ex_zone="all"))
+        self.assertEqual(len(nodes), 8)
+        self.assertEqual(
+            [node.name for node in nodes],
+            [node.name for node in self.driver.list_nodes(ex_zone="all")],
+        )
+
     def test_list_nodes(self):
         nodes = self.driver.list_nodes()
         nodes_all = self.driver.list_nodes(ex_zone="all")
@@ -1616,6 +1630,60 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
         self.assertEqual(nodes[1].name, "%s-001" % base_name)
         self.assertEqual(nodes[0].extra["boot_disk"].size, disk_size)
         self.assertEqual(nodes[1].extra["boot_disk"].size, disk_size)
+        # Both pending operations are polled with one list request
+        self.assertEqual(
+            GCEMockHttp.operations_list_filters,
+            ['(name = "operation-zones_us-central1-a_instances_post")'],
+        )
+
+    def test_ex_create_multiple_nodes_default_poll_strategy(self):
+        image = self.driver.ex_get_image("debian-7")
+        size = self.driver.ex_get_size("n1-standard-1")
+        strategy = self.driver.connection.get_poll_strategy()
+
+        with mock.patch("libcloud.compute.drivers.gce.time.sleep") as sleep, mock.patch.object(
+            strategy, "get_delay", return_value=0.5
+        ) as get_delay:
+            nodes = self.driver.ex_create_multiple_nodes("lcnode", size, image, 2)
+
+        self.assertEqual(len(nodes), 2)
+        get_delay.assert_called_once_with(1)
+        sleep.assert_called_once_with(0.5)
+
+    def test_poll_many_batches_zone_operations(self):
+        link = "https://www.googleapis.com/compute/v1/projects/project_name/%s/operations/%s"
+        poll_request_kwargs = [
+            {
+                "action": link
+                % ("zones/us-central1-a", "operation-zones_us-central1-a_instances_post")
+            },
+            {
+                "action": link
+                % (
+                    "zones/us-central1-a",
+                    "operation-zones_us-central1-a_instances_node-name_reset_post",
+                )
+            },
+            {"action": link % ("global", "operation-global_firewalls_post")},
+        ]
+        responses = self.driver.connection.poll_many(poll_request_kwargs)
+
+        self.assertEqual(
+            GCEMockHttp.operations_list_filters,
+            [
+                '(name = "operation-zones_us-central1-a_instances_node-name_reset_post") OR '
+                '(name = "operation-zones_us-central1-a_instances_post")'
+            ],
+        )
+        self.assertEqual(
+            [response.object["name"] for response in responses],
+            [
+                "operation-zones_us-central1-a_instances_post",
+                "operation-zones_us-central1-a_instances_node-name_reset_post",
+                "operation-global_firewalls_post",
+            ],
+        )
+        self.assertTrue(all(self.driver.connection.has_completed(r) for r in responses))
 
     def test_ex_create_multiple_nodes_image_family(self):
         base_name = "lcnode"
@@ -2147,6 +2215,26 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
         self.assertEqual(network.extra["gatewayIPv4"], "10.11.0.1")
         self.assertEqual(network.extra["description"], "A custom network")
 
+    def test_refresh_nodes(self):
+        node = self.driver.ex_get_node("node-name", "us-central1-a")
+        removed_node = Node(
+            "1234",
+            "libcloud-lb-demo-www-002",
+            None,
+            [],
+            [],
+            self.driver,
+            extra={"zone": self.driver.ex_get_zone("us-central1-b")},
+        )
+
+        refreshed = self.driver._refresh_nodes([node, removed_node])
+        self.assertEqual([n.name for n in refreshed], ["node-name"])
+        self.assertEqual(refreshed[0].id, node.id)
+
+        # Nodes without a zone can't be retrieved individually
+        removed_node.extra = {}
+        self.assertIsNone(self.driver._refresh_nodes([node, removed_node]))
+
     def test_ex_get_node(self):
         node_name = "node-name"
         zone = "us-central1-a"
@@ -2494,6 +2582,7 @@ class GCENodeDriverTest2(GoogleTestCase):
 class GCEMockHttp(MockHttp, unittest.TestCase):
     fixtures = ComputeFileFixtures("gce")
     json_hdr = {"content-type": "application/json; charset=UTF-8"}
+    operations_list_filters = []  # type: list
 
     def _get_method_name(self, type, use_param, qs, path):
         api_path = "/compute/%s" % API_VERSION
@@ -3720,6 +3809,17 @@ class GCEMockHttp(MockHttp, unittest.TestCase):
         body = self.fixtures.load("zones_europe-west1-a_diskTypes_pd_standard.json")
         return (httplib.OK, body, self.json_hdr, httplib.responses[httplib.OK])
 
+    def _zones_us_central1_a_operations(self, method, url, body, headers):
+        query = parse_qs(urlparse.urlparse(url).query)
+        operations_filter = query["filter"][0]
+        self.operations_list_filters.append(operations_filter)
+        items = [
+            json.loads(self.fixtures.load("operations_%s.json" % (name.replace("-", "_", 1))))
+            for name in re.findall(r'name = "([^"]+)"', operations_filter)
+        ]
+        body = json.dumps({"kind": "compute#operationList", "items": items})
+        return (httplib.OK, body, self.json_hdr, httplib.responses[httplib.OK])
+
     def _zones_us_central1_a_instances(self, method, url, body, headers):
         if method == "POST":
             body = self.fixtures.load("zones_us-central1-a_instances_post.json")
@@ -16,6 +16,7 @@
 
 import os
 import sys
+import asyncio
 import datetime
 import unittest
 from unittest import mock
@@ -24,7 +25,7 @@ from unittest.mock import Mock, patch
 import pytest
 import requests_mock
 
-from libcloud.test import XML_HEADERS, MockHttp
+from libcloud.test import XML_HEADERS, MockHttp, AsyncMockHttp
 from libcloud.pricing import set_pricing, clear_pricing_data
 from libcloud.utils.py3 import u, httplib, method_type
 from libcloud.common.base import LibcloudConnection
@@ -1013,6 +1014,13 @@ class OpenStack_1_1_Tests(unittest.TestCase, TestCaseMixin):
         self.assertTrue(node.extra.get("service_name") is not None)
         self.assertTrue(node.extra.get("uri") is not None)
 
+    def test_async_list_nodes(self):
+        self.driver.async_connection.connection = AsyncMockHttp(self.driver.connection.connection)
+
+        nodes = asyncio.run(self.driver.async_list_nodes())
+        self.assertEqual([node.id for node in nodes], ["12065", "12064"])
+        self.assertEqual(nodes[0].public_ips, self.driver.list_nodes()[0].public_ips)
+
     def test_list_nodes_no_image_id_attribute(self):
         # Regression test for LIBCLOD-455
         self.driver_klass.connectionCls.conn_class.type = "ERROR_STATE_NO_IMAGE_ID"
@@ -1405,6 +1413,19 @@ class OpenStack_1_1_Tests(unittest.TestCase, TestCaseMixin):
         node = self.driver.ex_get_node_details("does-not-exist")
         self.assertTrue(node is None)
 
+    def test_refresh_nodes(self):
+        nodes = [
+            Node("12064", None, None, None, None, self.driver),
+            Node("does-not-exist", None, None, None, None, self.driver),
+        ]
+
+        refreshed = self.driver._refresh_nodes(nodes)
+        self.assertEqual([node.id for node in refreshed], ["12064"])
+        self.assertEqual(refreshed[0].name, "lc-test")
+
+        # Too many nodes to retrieve one by one
+        self.assertIsNone(self.driver._refresh_nodes(nodes * 13))
+
     def test_ex_get_node_details_microversion_2_47(self):
         node_id = "12064247"
         node = self.driver.ex_get_node_details(node_id)
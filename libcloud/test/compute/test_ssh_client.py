@@ -22,7 +22,12 @@ from unittest.mock import Mock, MagicMock, call, patch
 from libcloud import _init_once
 from libcloud.test import LibcloudTestCase, unittest
 from libcloud.utils.py3 import StringIO, u, assertRaisesRegex
-from libcloud.compute.ssh import ParamikoSSHClient, ShellOutSSHClient, have_paramiko
+from libcloud.compute.ssh import (
+    SSHCommandOutput,
+    ParamikoSSHClient,
+    ShellOutSSHClient,
+    have_paramiko,
+)
 
 if not have_paramiko:
     ParamikoSSHClient = None  # NOQA
@@ -616,6 +621,100 @@ class ParamikoSSHClientTests(LibcloudTestCase):
             self.assertEqual("\x00\x00\x00\x01&ab", stderr)
         self.assertEqual(len(stderr), 7)
 
+    def test_command_output_max_buffer_size(self):
+        chunks = []
+        output = SSHCommandOutput(callback=chunks.append, max_buffer_size=5)
+
+        for data in ["abc", "", "defg", "h"]:
+            output.write(data)
+
+        self.assertEqual(output.getvalue(), "defgh")
+        self.assertEqual(chunks, ["abc", "defg", "h"])
+
+        output.write("123456")
+        self.assertEqual(output.getvalue(), "23456")
+
+    @patch("time.sleep")
+    def test_run_streams_output(self, mock_sleep):
+        class FakeChannel:
+            """
+            Channel which receives one chunk of stdout and stderr per
+            iteration of the read loop.
+            """
+
+            def __init__(self, stdout_chunks, stderr_chunks):
+                self.stdout_chunks = stdout_chunks
+                self.stderr_chunks = stderr_chunks
+                self.stdout = b""
+                self.stderr = b""
+                self.rounds = 0
+                self.eof_received = False
+
+                # Descriptor which is always readable
+                self.read_fd, self.write_fd = os.pipe()
+                os.write(self.write_fd, b"x")
+
+            def fileno(self):
+                return self.read_fd
+
+            def exec_command(self, cmd):
+                pass
+
+            def makefile(self, *args):
+                return Mock()
+
+            def exit_status_ready(self):
+                if self.rounds < len(self.stdout_chunks):
+                    self.stdout = self.stdout_chunks[self.rounds]
+                    self.stderr = self.stderr_chunks[self.rounds]
+
+                self.rounds += 1
+                return self.rounds > len(self.stdout_chunks)
+
+            def recv_ready(self):
+                return bool(self.stdout)
+
+            def recv(self, size):
+                data, self.stdout = self.stdout, b""
+                return data
+
+            def recv_stderr_ready(self):
+                return bool(self.stderr)
+
+            def recv_stderr(self, size):
+                data, self.stderr = self.stderr, b""
+                return data
+
+            def recv_exit_status(self):
+                return 0
+
+        # Multi byte character is split between two reads
+        chan = FakeChannel([b"foo\xf0\x9f", b"\xa4\xa6bar", b"baz"], [b"err1", b"", b"err2"])
+        self.addCleanup(os.close, chan.read_fd)
+        self.addCleanup(os.close, chan.write_fd)
+
+        client = ParamikoSSHClient(hostname="dummy.host.org", username="ubuntu")
+        client._get_transport = Mock()
+        client._get_transport.return_value.open_session.return_value = chan
+
+        stdout_chunks = []
+        stderr_chunks = []
+        stdout, stderr, status = client.run(
+            "build.sh",
+            stdout_callback=stdout_chunks.append,
+            stderr_callback=stderr_chunks.append,
+            max_buffer_size=6,
+        )
+
+        self.assertEqual(stdout_chunks, ["foo", "🤦bar", "baz"])
+        self.assertEqual(stderr_chunks, ["err1", "err2"])
+        self.assertEqual(stdout, "barbaz")
+        self.assertEqual(stderr, "r1err2")
+        self.assertEqual(status, 0)
+
+        # The channel descriptor is waited on instead of sleeping
+        self.assertEqual(mock_sleep.call_count, 0)
+
     def test_keep_alive_and_compression(self):
         conn_params = {"hostname": "dummy.host.org", "username": "ubuntu"}
         client = ParamikoSSHClient(**conn_params)
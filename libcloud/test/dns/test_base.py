@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 
 
+import io
 import sys
 import datetime
 import tempfile
@@ -20,7 +21,7 @@ from unittest.mock import Mock
 
 from libcloud import __version__
 from libcloud.test import unittest
-from libcloud.dns.base import Zone, Record, DNSDriver
+from libcloud.dns.base import Zone, Record, DNSDriver, BindRecord, RecordChange
 from libcloud.dns.types import RecordType
 from libcloud.utils.py3 import assertRegex
 
@@ -136,6 +137,154 @@ class BaseTestCase(unittest.TestCase):
                 r"example.com\.\s+900\s+IN\s+SRV\s+20\s+10 3333 example.com",
             )
 
+    def test_export_zone_to_bind_stream(self):
+        zone = Zone(id=1, domain="example.com", type="master", ttl=900, driver=self.driver)
+        records = [
+            Record(id=10, name="www", type=RecordType.A, data="127.0.0.1", zone=zone, driver=None),
+            Record(id=2, name="", type=RecordType.A, data="127.0.0.2", zone=zone, driver=None),
+        ]
+
+        self.driver.iterate_records = Mock(return_value=iter(records))
+        stream = io.StringIO()
+        self.driver.export_zone_to_bind_stream(zone=zone, stream=stream)
+        lines = stream.getvalue().split("\n")
+
+        # Records are written in the order they are returned by the API
+        self.assertEqual(len(lines), 2 + 1 + 3)
+        assertRegex(self, lines[4], r"www.example.com\.\s+900\s+IN\s+A\s+127\.0\.0\.1")
+        assertRegex(self, lines[5], r"example.com\.\s+900\s+IN\s+A\s+127\.0\.0\.2")
+
+        self.driver.iterate_records = Mock(return_value=iter(records))
+        stream = io.StringIO()
+        self.driver.export_zone_to_bind_stream(zone=zone, stream=stream, sort=True)
+        lines = stream.getvalue().split("\n")
+        assertRegex(self, lines[4], r"example.com\.\s+900\s+IN\s+A\s+127\.0\.0\.2")
+
+    def test_parse_bind_zone_exported_zone(self):
+        zone = Zone(id=1, domain="example.com", type="master", ttl=900, driver=self.driver)
+        records = []
+
+        for values in MOCK_RECORDS_VALUES:
+            values = values.copy()
+            values["driver"] = self.driver
+            values["zone"] = zone
+            records.append(Record(**values))
+
+        self.driver.list_records = Mock(return_value=records)
+        self.driver.export_zone_to_bind_zone_file(zone=zone, file_path=self.tmp_path)
+
+        result = list(self.driver.parse_bind_zone_file(self.tmp_path))
+
+        self.assertEqual(len(result), len(records))
+
+        for parsed, record in zip(result, records):
+            self.assertEqual(parsed.name, record.name)
+            self.assertEqual(parsed.type, record.type)
+            self.assertEqual(parsed.data, record.data)
+            self.assertEqual(parsed.ttl, record.extra.get("ttl", 900))
+            self.assertEqual(parsed.extra.get("priority"), record.extra.get("priority"))
+
+    def test_parse_bind_zone(self):
+        content = "\n".join(
+            [
+                "$TTL 1h",
+                "@   IN SOA ns1 admin ( 2024 ; serial",
+                "    3600 900 )",
+                "@ 300 IN NS ns1",
+                "www 900 IN A 127.0.0.1",
+                "    IN A 127.0.0.2 ; second value",
+                "mail IN 60 MX 10 mx1",
+                'txt TXT "foo ; bar (baz)"',
+                'multi TXT ( "foo"',
+                '  "bar" )',
+                "$ORIGIN sub.example.com.",
+                "host CNAME @",
+                "ext.example.org. A 1.2.3.4",
+            ]
+        )
+
+        result = list(self.driver.parse_bind_zone(io.StringIO(content), origin="example.com"))
+
+        self.assertEqual(
+            result[1:],
+            [
+                BindRecord("", RecordType.NS, "ns1.example.com", 300, {"ttl": 300}),
+                BindRecord("www", RecordType.A, "127.0.0.1", 900, {"ttl": 900}),
+                BindRecord("www", RecordType.A, "127.0.0.2", 3600, {"ttl": 3600}),
+                BindRecord(
+                    "mail", RecordType.MX, "mx1.example.com", 60, {"priority": 10, "ttl": 60}
+                ),
+                BindRecord("txt", RecordType.TXT, "foo ; bar (baz)", 3600, {"ttl": 3600}),
+                BindRecord("multi", RecordType.TXT, '"foo"   "bar"', 3600, {"ttl": 3600}),
+                BindRecord("host.sub", RecordType.CNAME, "sub.example.com", 3600, {"ttl": 3600}),
+                BindRecord("ext.example.org", RecordType.A, "1.2.3.4", 3600, {"ttl": 3600}),
+            ],
+        )
+        self.assertEqual(result[0].type, RecordType.SOA)
+        self.assertEqual(result[0].data, "ns1 admin 2024 3600 900")
+
+    def test_parse_bind_zone_invalid_content(self):
+        for content in [
+            "www IN A 127.0.0.1",
+            "$ORIGIN example.com.\n    IN A 127.0.0.1",
+            "$ORIGIN example.com.\nwww IN FOO bar",
+            "$ORIGIN example.com.\nwww IN A",
+            "$ORIGIN example.com.\nwww 1x IN A 127.0.0.1",
+            "$ORIGIN example.com.\nwww IN SOA ( ns1",
+            "$INCLUDE other.zone",
+        ]:
+            records = self.driver.parse_bind_zone(io.StringIO(content))
+            self.assertRaises(ValueError, list, records)
+
+    def test_iterate_all_records(self):
+        zones = [
+            Zone(id=index, domain="example%s.com" % (index), type="master", ttl=900, driver=None)
+            for index in range(1, 6)
+        ]
+
+        def iterate_records(zone):
+            for index in range(int(zone.id) * 10):
+                yield Record(
+                    id=index,
+                    name="host%s" % (index),
+                    type=RecordType.A,
+                    data="127.0.0.1",
+                    zone=zone,
+                    driver=self.driver,
+                )
+
+        self.driver.iterate_records = Mock(side_effect=iterate_records)
+        self.driver.list_zones = Mock(return_value=zones)
+
+        result = list(self.driver.iterate_all_records(concurrency=3))
+
+        self.assertEqual(len(result), 10 + 20 + 30 + 40 + 50)
+
+        for zone in zones:
+            records = [record for record_zone, record in result if record_zone is zone]
+            self.assertEqual(len(records), int(zone.id) * 10)
+            self.assertTrue(all(record.zone is zone for record in records))
+
+        result = list(self.driver.iterate_all_records(zones=zones[:1]))
+        self.assertEqual(len(result), 10)
+
+    def test_iterate_all_records_error(self):
+        zones = [
+            Zone(id=index, domain="example%s.com" % (index), type="master", ttl=900, driver=None)
+            for index in range(1, 3)
+        ]
+
+        def iterate_records(zone):
+            if zone.id == "2":
+                raise ValueError("listing failed")
+
+            return iter([])
+
+        self.driver.iterate_records = Mock(side_effect=iterate_records)
+
+        records = self.driver.iterate_all_records(zones=zones)
+        self.assertRaisesRegex(ValueError, "listing failed", list, records)
+
     def test_get_numeric_id(self):
         values = MOCK_RECORDS_VALUES[0].copy()
         values["driver"] = self.driver
@@ -162,6 +311,125 @@ class BaseTestCase(unittest.TestCase):
         result = record._get_numeric_id()
         self.assertEqual(result, "")
 
+    def test_apply_changes(self):
+        zone = Zone(id=1, domain="example.com", type="master", ttl=900, driver=self.driver)
+        record = Record(
+            id=1, name="www", type=RecordType.A, data="127.0.0.1", zone=zone, driver=self.driver
+        )
+
+        self.driver.create_record = Mock(return_value=record)
+        self.driver.update_record = Mock(side_effect=ValueError("update failed"))
+        self.driver.delete_record = Mock(return_value=True)
+
+        changes = [
+            RecordChange(RecordChange.CREATE, name="www", type=RecordType.A, data="127.0.0.1"),
+            RecordChange(RecordChange.UPDATE, record=record, data="127.0.0.2"),
+            RecordChange(RecordChange.DELETE, record=record),
+        ]
+        results = self.driver.apply_changes(zone, changes, concurrency=2)
+
+        self.assertEqual([result.change for result in results], changes)
+        self.assertEqual([result.success for result in results], [True, False, True])
+        self.assertEqual(results[0].record, record)
+        self.assertEqual(str(results[1].error), "update failed")
+        self.assertIsNone(results[2].record)
+        self.driver.delete_record.assert_called_once_with(record=record)
+
+    def _get_sync_records(self, zone, values):
+        return [
+            Record(
+                id=index,
+                name=name,
+                type=type,
+                data=data,
+                zone=zone,
+                driver=self.driver,
+                extra=extra,
+            )
+            for index, (name, type, data, extra) in enumerate(values)
+        ]
+
+    def test_diff_zone(self):
+        zone = Zone(id=1, domain="example.com", type="master", ttl=900, driver=self.driver)
+        current = self._get_sync_records(
+            zone,
+            [
+                ("", RecordType.SOA, "ns1.example.com. admin.example.com. 1", {}),
+                ("", RecordType.NS, "ns1.example.com", {}),
+                ("www", RecordType.A, "127.0.0.1", {"ttl": 300}),
+                ("www", RecordType.A, "127.0.0.2", {"ttl": 300}),
+                ("", RecordType.MX, "mx1.example.com", {"priority": 10}),
+                ("api", RecordType.CNAME, "www.example.com", {}),
+                ("old", RecordType.A, "127.0.0.9", {}),
+            ],
+        )
+        desired = self._get_sync_records(
+            None,
+            [
+                # Unchanged
+                ("www", "a", "127.0.0.1", {}),
+                # TTL change
+                ("www", RecordType.A, "127.0.0.2", {"ttl": 600}),
+                # New value
+                ("www", RecordType.A, "127.0.0.3", {}),
+                # Data change
+                ("", RecordType.MX, "mx2.example.com", {"priority": 10}),
+                # Trailing dot of domain names is ignored
+                ("api", RecordType.CNAME, "www.example.com.", {}),
+                ("new", RecordType.TXT, "foo", {}),
+            ],
+        )
+        self.driver.iterate_records = Mock(return_value=iter(current))
+
+        changes = self.driver.diff_zone(zone, desired)
+
+        self.assertEqual(
+            [(change.action, change.name, change.type, change.data) for change in changes],
+            [
+                (RecordChange.DELETE, None, None, None),
+                (RecordChange.UPDATE, "www", RecordType.A, "127.0.0.2"),
+                (RecordChange.UPDATE, "", RecordType.MX, "mx2.example.com"),
+                (RecordChange.CREATE, "www", RecordType.A, "127.0.0.3"),
+                (RecordChange.CREATE, "new", RecordType.TXT, "foo"),
+            ],
+        )
+        self.assertEqual(changes[0].record, current[6])
+        self.assertEqual(changes[1].record, current[3])
+        self.assertEqual(changes[1].extra, {"ttl": 600})
+        self.assertEqual(changes[2].record, current[4])
+        # New value of an existing record set refers to one of its records
+        self.assertEqual(changes[3].record, current[2])
+        self.assertIsNone(changes[4].record)
+
+        self.driver.iterate_records = Mock(return_value=iter(current))
+        changes = self.driver.diff_zone(zone, desired, delete=False)
+        self.assertNotIn(RecordChange.DELETE, [change.action for change in changes])
+
+    def test_sync_zone(self):
+        zone = Zone(id=1, domain="example.com", type="master", ttl=900, driver=self.driver)
+        current = self._get_sync_records(zone, [("www", RecordType.A, "127.0.0.1", {})])
+        desired = self._get_sync_records(None, [("www", RecordType.A, "127.0.0.2", {})])
+
+        self.driver.iterate_records = Mock(side_effect=lambda zone: iter(current))
+        self.driver.apply_changes = Mock(return_value=[])
+
+        changes = self.driver.sync_zone(zone, desired, dry_run=True)
+        self.assertEqual([change.action for change in changes], [RecordChange.UPDATE])
+        self.assertFalse(self.driver.apply_changes.called)
+
+        self.driver.sync_zone(zone, desired, concurrency=4)
+        kwargs = self.driver.apply_changes.call_args[1]
+        self.assertEqual(kwargs["concurrency"], 4)
+        self.assertEqual([change.data for change in kwargs["changes"]], ["127.0.0.2"])
+
+        self.driver.apply_changes.reset_mock()
+        self.assertEqual(self.driver.sync_zone(zone, current), [])
+        self.assertFalse(self.driver.apply_changes.called)
+
+    def test_record_change_invalid_arguments(self):
+        self.assertRaises(ValueError, RecordChange, "rename")
+        self.assertRaises(ValueError, RecordChange, RecordChange.DELETE)
+
 
 def zero_pad(value: int) -> str:
     if value < 10:
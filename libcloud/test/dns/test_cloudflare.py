@@ -21,6 +21,7 @@ from libcloud.dns.types import RecordType, ZoneDoesNotExistError, RecordDoesNotE
 from libcloud.utils.py3 import httplib, urlparse
 from libcloud.common.types import LibcloudError
 from libcloud.test.secrets import DNS_PARAMS_CLOUDFLARE
+from libcloud.utils.ratelimit import RateLimiter
 from libcloud.test.file_fixtures import DNSFileFixtures
 from libcloud.dns.drivers.cloudflare import (
     ZONE_EXTRA_ATTRIBUTES,
@@ -49,6 +50,23 @@ class CloudFlareDNSDriverTestCase(unittest.TestCase):
         driver = CloudFlareDNSDriver("sometoken")
         self.assertEqual(driver.connectionCls, TokenDNSConnection)
 
+    def test_rate_limiter_is_shared_per_credentials(self):
+        driver1 = CloudFlareDNSDriver("user@example.com", "key")
+        driver2 = CloudFlareDNSDriver("user@example.com", "key")
+        driver3 = CloudFlareDNSDriver("other@example.com", "key")
+        driver4 = CloudFlareDNSDriver("sometoken")
+
+        self.assertIsNotNone(driver1.connection.rate_limiter)
+        self.assertIs(driver1.connection.rate_limiter, driver2.connection.rate_limiter)
+        self.assertIsNot(driver1.connection.rate_limiter, driver3.connection.rate_limiter)
+        self.assertIsNot(driver1.connection.rate_limiter, driver4.connection.rate_limiter)
+
+    def test_rate_limiter_argument(self):
+        rate_limiter = RateLimiter(rate=1)
+        driver = CloudFlareDNSDriver("user@example.com", "key", rate_limiter=rate_limiter)
+
+        self.assertIs(driver.connection.rate_limiter, rate_limiter)
+
     def test_list_record_types(self):
         record_types = self.driver.list_record_types()
         self.assertEqual(len(record_types), 9)
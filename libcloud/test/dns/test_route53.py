@@ -17,17 +17,19 @@ import sys
 import unittest
 
 from libcloud.test import MockHttp
+from libcloud.dns.base import RecordChange
 from libcloud.dns.types import RecordType, ZoneDoesNotExistError, RecordDoesNotExistError
-from libcloud.utils.py3 import httplib
+from libcloud.utils.py3 import ET, httplib
 from libcloud.test.secrets import DNS_PARAMS_ROUTE53
 from libcloud.test.file_fixtures import DNSFileFixtures
-from libcloud.dns.drivers.route53 import Route53DNSDriver
+from libcloud.dns.drivers.route53 import NAMESPACE, Route53DNSDriver
 
 
 class Route53Tests(unittest.TestCase):
     def setUp(self):
         Route53DNSDriver.connectionCls.conn_class = Route53MockHttp
         Route53MockHttp.type = None
+        Route53MockHttp.post_bodies = []
         self.driver = Route53DNSDriver(*DNS_PARAMS_ROUTE53)
 
     def test_list_record_types(self):
@@ -73,6 +75,26 @@ class Route53Tests(unittest.TestCase):
         self.assertEqual(record.extra["weight"], 10)
         self.assertEqual(record.extra["port"], 5269)
 
+    def test_list_records_iterparse(self):
+        zone = self.driver.list_zones()[0]
+        self.driver.iterparse_list_responses = True
+        records = self.driver.list_records(zone=zone)
+
+        self.driver.iterparse_list_responses = False
+        expected_records = self.driver.list_records(zone=zone)
+
+        self.assertEqual([record.id for record in records], [r.id for r in expected_records])
+        self.assertEqual([record.extra for record in records], [r.extra for r in expected_records])
+
+    def test_list_records_iterparse_unexpected_status(self):
+        zone = self.driver.list_zones()[0]
+        Route53MockHttp.type = "ACCEPTED"
+
+        self.assertEqual(self.driver.list_records(zone=zone), [])
+
+        self.driver.iterparse_list_responses = True
+        self.assertEqual(self.driver.list_records(zone=zone), [])
+
     def test_get_zone(self):
         zone = self.driver.get_zone(zone_id="47234")
         self.assertEqual(zone.id, "47234")
@@ -295,9 +317,211 @@ class Route53Tests(unittest.TestCase):
         else:
             self.fail("Exception was not thrown")
 
+    def test_apply_changes(self):
+        zone = self.driver.list_zones()[0]
+        record = self.driver.list_records(zone=zone)[0]
+
+        changes = [
+            RecordChange(
+                RecordChange.CREATE, name="www%s" % (i), type=RecordType.A, data="127.0.0.1"
+            )
+            for i in range(999)
+        ]
+        changes.append(RecordChange(RecordChange.UPDATE, record=record, data="127.0.0.2"))
+        changes.append(RecordChange(RecordChange.DELETE, record=record))
+
+        Route53MockHttp.post_requests = 0
+        results = self.driver.apply_changes(zone, changes)
+
+        # Update consists of two changes which need to be in the same batch
+        self.assertEqual(Route53MockHttp.post_requests, 2)
+        self.assertEqual(len(results), 1001)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(results[0].record.id, "A:www0")
+        self.assertEqual(results[999].record.data, "127.0.0.2")
+        self.assertIsNone(results[1000].record)
+
+    def test_apply_changes_characters_limit(self):
+        zone = self.driver.list_zones()[0]
+        changes = [
+            RecordChange(
+                RecordChange.CREATE, name="txt%s" % (i), type=RecordType.TXT, data="a" * 10000
+            )
+            for i in range(4)
+        ]
+
+        Route53MockHttp.post_requests = 0
+        results = self.driver.apply_changes(zone, changes)
+
+        self.assertEqual(Route53MockHttp.post_requests, 2)
+        self.assertEqual(results[0].record.data, '"%s"' % ("a" * 10000))
+
+    def _get_posted_changes(self):
+        changes = []
+
+        for body in Route53MockHttp.post_bodies:
+            for change in ET.XML(body).findall(".//{%s}Change" % (NAMESPACE)):
+                rrs = change.find("{%s}ResourceRecordSet" % (NAMESPACE))
+                values = sorted(value.text for value in rrs.findall(".//{%s}Value" % (NAMESPACE)))
+                changes.append(
+                    (
+                        change.findtext("{%s}Action" % (NAMESPACE)),
+                        rrs.findtext("{%s}Name" % (NAMESPACE)),
+                        rrs.findtext("{%s}Type" % (NAMESPACE)),
+                        rrs.findtext("{%s}TTL" % (NAMESPACE)),
+                        values,
+                    )
+                )
+
+        return changes
+
+    def test_apply_changes_multi_value_create(self):
+        zone = self.driver.list_zones()[0]
+        changes = [
+            RecordChange(
+                RecordChange.CREATE,
+                name="mail",
+                type=RecordType.MX,
+                data="mx%s.t.com." % (i),
+                extra={"priority": i * 10, "ttl": 300},
+            )
+            for i in range(1, 3)
+        ]
+
+        results = self.driver.apply_changes(zone, changes)
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(
+            self._get_posted_changes(),
+            [("CREATE", "mail.t.com", "MX", "300", ["10 mx1.t.com.", "20 mx2.t.com."])],
+        )
+
+    def test_apply_changes_multi_value_delete(self):
+        zone = self.driver.list_zones()[0]
+        records = self.driver.list_records(zone=zone)
+        mx_records = [record for record in records if record.type == RecordType.MX]
+        srv_records = [record for record in records if record.type == RecordType.SRV]
+
+        results = self.driver.apply_changes(
+            zone,
+            [
+                RecordChange(RecordChange.DELETE, record=mx_records[1]),
+                RecordChange(RecordChange.DELETE, record=mx_records[2]),
+                RecordChange(
+                    RecordChange.UPDATE,
+                    record=srv_records[0],
+                    extra=dict(srv_records[0].extra, ttl=60),
+                ),
+            ],
+        )
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(len(Route53MockHttp.post_bodies), 1)
+
+        # The record set is replaced by one with the remaining values
+        mx_values = [
+            "1 ASPMX.L.GOOGLE.COM.",
+            "5 ALT1.ASPMX.L.GOOGLE.COM.",
+            "5 ALT2.ASPMX.L.GOOGLE.COM.",
+            "10 ASPMX2.GOOGLEMAIL.COM.",
+            "10 ASPMX3.GOOGLEMAIL.COM.",
+        ]
+        srv_values = ["1 10 5269 xmpp-server.example.com.", "2 12 5060 sip-server.example.com."]
+        mx_name = "%s.t.com" % (mx_records[0].name)
+        srv_name = "%s.t.com" % (srv_records[0].name)
+        self.assertEqual(
+            self._get_posted_changes(),
+            [
+                ("DELETE", mx_name, "MX", "3600", sorted(mx_values)),
+                ("CREATE", mx_name, "MX", "3600", sorted([mx_values[0]] + mx_values[3:])),
+                ("DELETE", srv_name, "SRV", "300", srv_values),
+                ("CREATE", srv_name, "SRV", "60", srv_values),
+            ],
+        )
+
+        # Deleting the last values deletes the record set
+        Route53MockHttp.post_bodies = []
+        self.driver.apply_changes(
+            zone, [RecordChange(RecordChange.DELETE, record=record) for record in srv_records]
+        )
+        self.assertEqual(
+            self._get_posted_changes(), [("DELETE", srv_name, "SRV", "300", srv_values)]
+        )
+
+    def test_sync_zone_bind_multi_value_records(self):
+        zone = self.driver.list_zones()[0]
+        Route53MockHttp.type = "SYNC"
+
+        # Zone exported to BIND format and parsed back is in sync
+        bind_zone = self.driver.export_zone_to_bind_format(zone)
+        records = list(self.driver.parse_bind_zone(bind_zone.splitlines()))
+        self.assertEqual(len(records), 8)
+        self.assertEqual(self.driver.sync_zone(zone, records), [])
+
+        bind_zone = "\n".join(
+            [
+                "$ORIGIN t.com.",
+                "$TTL 300",
+                "@ 3600 IN MX 10 mx1.t.com.",
+                "@ 3600 IN MX 20 mx2.t.com.",
+                "@ 3600 IN MX 30 mx3.t.com.",
+                "ftp IN CNAME www",
+                "www IN A 192.0.2.1",
+                "www IN A 192.0.2.3",
+                "api IN A 192.0.2.4",
+                "api IN A 192.0.2.5",
+            ]
+        )
+        records = list(self.driver.parse_bind_zone(bind_zone.splitlines()))
+        results = self.driver.sync_zone(zone, records)
+
+        self.assertEqual(
+            [(result.change.action, result.change.name) for result in results],
+            [
+                (RecordChange.DELETE, None),
+                (RecordChange.UPDATE, "www"),
+                (RecordChange.CREATE, ""),
+                (RecordChange.CREATE, "api"),
+                (RecordChange.CREATE, "api"),
+            ],
+        )
+        self.assertTrue(all(result.success for result in results))
+
+        # Each modified record set is replaced as a whole in a single request
+        mx_values = ["10 mx1.t.com.", "20 mx2.t.com."]
+        self.assertEqual(
+            self._get_posted_changes(),
+            [
+                ("DELETE", "old.t.com", "A", "300", ["192.0.2.9"]),
+                ("DELETE", "www.t.com", "A", "300", ["192.0.2.1", "192.0.2.2"]),
+                ("CREATE", "www.t.com", "A", "300", ["192.0.2.1", "192.0.2.3"]),
+                ("DELETE", "t.com", "MX", "3600", mx_values),
+                ("CREATE", "t.com", "MX", "3600", mx_values + ["30 mx3.t.com"]),
+                ("CREATE", "api.t.com", "A", "300", ["192.0.2.4", "192.0.2.5"]),
+            ],
+        )
+
+    def test_apply_changes_failed_batch(self):
+        zone = self.driver.list_zones()[0]
+        record = self.driver.list_records(zone=zone)[0]
+        Route53MockHttp.type = "RECORD_DOES_NOT_EXIST"
+
+        results = self.driver.apply_changes(
+            zone,
+            [
+                RecordChange(RecordChange.DELETE, record=record),
+                RecordChange(RecordChange.CREATE, name="www", type=RecordType.A, data="127.0.0.1"),
+            ],
+        )
+
+        self.assertEqual([result.success for result in results], [False, False])
+        self.assertIs(results[0].error, results[1].error)
+
 
 class Route53MockHttp(MockHttp):
     fixtures = DNSFileFixtures("route53")
+    post_requests = 0
+    post_bodies = []  # type: list
 
     def _2012_02_29_hostedzone_47234(self, method, url, body, headers):
         body = self.fixtures.load("get_zone.xml")
@@ -312,9 +536,23 @@ class Route53MockHttp(MockHttp):
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
     def _2012_02_29_hostedzone_47234_rrset(self, method, url, body, headers):
+        if method == "POST":
+            Route53MockHttp.post_requests += 1
+            Route53MockHttp.post_bodies.append(body)
         body = self.fixtures.load("list_records.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _2012_02_29_hostedzone_47234_rrset_SYNC(self, method, url, body, headers):
+        if method == "POST":
+            Route53MockHttp.post_bodies.append(body)
+            body = self.fixtures.load("list_records.xml")
+        else:
+            body = self.fixtures.load("list_records_sync.xml")
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _2012_02_29_hostedzone_47234_rrset_ACCEPTED(self, method, url, body, headers):
+        return (httplib.ACCEPTED, "", {}, httplib.responses[httplib.ACCEPTED])
+
     def _2012_02_29_hostedzone_47234_rrset_ZONE_DOES_NOT_EXIST(self, method, url, body, headers):
         body = self.fixtures.load("zone_does_not_exist.xml")
         return (httplib.NOT_FOUND, body, {}, httplib.responses[httplib.NOT_FOUND])
@@ -15,12 +15,13 @@
 
 import sys
 import unittest
+from unittest import mock
 
 from libcloud.test import MockHttp
-from libcloud.utils.py3 import httplib
+from libcloud.utils.py3 import httplib, parse_qs, urlparse
 from libcloud.test.secrets import LB_ALB_PARAMS
 from libcloud.loadbalancer.base import Member
-from libcloud.loadbalancer.types import State
+from libcloud.loadbalancer.types import State, LibcloudLBError
 from libcloud.test.file_fixtures import LoadBalancerFileFixtures
 from libcloud.loadbalancer.drivers.alb import ApplicationLBDriver
 
@@ -41,6 +42,7 @@ class ApplicationLBTests(unittest.TestCase):
         ApplicationLBDriver.connectionCls.conn_class = ApplicationLBMockHttp
         ApplicationLBMockHttp.type = None
         ApplicationLBMockHttp.use_param = "Action"
+        ApplicationLBMockHttp.listeners_requests = []
         self.driver = ApplicationLBDriver(*LB_ALB_PARAMS)
 
     def test_instantiate_driver_with_token(self):
@@ -298,6 +300,93 @@ class ApplicationLBTests(unittest.TestCase):
             'Target group member is missing "health" field',
         )
 
+    def test_ex_get_balancers_batched(self):
+        ApplicationLBMockHttp.type = "batch"
+        balancer_ids = [self.balancer_id[:-2] + "%02d" % (i) for i in range(25)]
+
+        with mock.patch.object(
+            self.driver.connection, "request", wraps=self.driver.connection.request
+        ) as request:
+            balancers = self.driver.ex_get_balancers(balancer_ids + balancer_ids[:2])
+
+        self.assertEqual([b.id for b in balancers], balancer_ids + balancer_ids[:2])
+        self.assertEqual(balancers[3].extra["tags"], {"project": balancer_ids[3]})
+        self.assertEqual(len(balancers[3].extra["listeners"]), 1)
+        self.assertEqual(balancers[3].port, balancers[3].extra["listeners"][0].port)
+
+        actions = [call[1]["params"]["Action"] for call in request.call_args_list]
+        self.assertEqual(actions.count("DescribeLoadBalancers"), 2)
+        self.assertEqual(actions.count("DescribeTags"), 2)
+
+        # Listeners are retrieved concurrently, once per load balancer
+        self.assertEqual(sorted(ApplicationLBMockHttp.listeners_requests), balancer_ids)
+
+    def test_ex_get_balancers_not_found(self):
+        balancer_id = self.balancer_id[:-2] + "00"
+
+        with self.assertRaisesRegex(LibcloudLBError, "Load balancer not found"):
+            self.driver.ex_get_balancers([self.balancer_id, balancer_id])
+
+    def test_ex_get_balancers_cache(self):
+        driver = ApplicationLBDriver(*LB_ALB_PARAMS, cache_ttl=60)
+
+        with mock.patch.object(
+            driver.connection, "request", wraps=driver.connection.request
+        ) as request:
+            balancer = driver.get_balancer(self.balancer_id)
+            self.assertIs(driver.get_balancer(self.balancer_id), balancer)
+            self.assertEqual(request.call_count, 3)
+
+            target_group = driver.ex_get_target_group(self.target_group_id)
+            self.assertEqual(target_group.balancers, [balancer])
+            self.assertEqual(request.call_count, 4)
+
+            members = driver._ex_get_target_group_members(target_group)
+            other_target_group = driver.ex_get_target_group(self.target_group_id)
+            other_members = driver._ex_get_target_group_members(other_target_group)
+            self.assertEqual([m.id for m in members], [m.id for m in other_members])
+            self.assertEqual(request.call_count, 6)
+
+            driver.ex_clear_cache()
+            driver.get_balancer(self.balancer_id)
+            self.assertEqual(request.call_count, 9)
+
+    def test_ex_get_balancers_cache_cleared_on_changes(self):
+        driver = ApplicationLBDriver(*LB_ALB_PARAMS, cache_ttl=60)
+        balancer = driver.get_balancer(self.balancer_id)
+        target_group = driver.ex_get_target_group(self.target_group_id)
+
+        driver.ex_create_listener(
+            balancer=balancer, port=443, proto="HTTPS", target_group=target_group
+        )
+        listener_balancer = driver.get_balancer(self.balancer_id)
+        self.assertIsNot(listener_balancer, balancer)
+
+        listener = driver.ex_get_listener(self.listener_id)
+        driver.ex_create_listener_rule(listener=listener, priority=10, target_group=target_group)
+        rule_balancer = driver.get_balancer(self.balancer_id)
+        self.assertIsNot(rule_balancer, listener_balancer)
+
+        members = [Member("i-01111111111111111", "10.0.0.0", 443)]
+        driver.ex_register_targets(target_group=target_group, members=members)
+        self.assertIsNot(driver.get_balancer(self.balancer_id), rule_balancer)
+
+    def test_ex_list_target_groups(self):
+        with mock.patch.object(
+            self.driver.connection, "request", wraps=self.driver.connection.request
+        ) as request:
+            target_groups = self.driver.ex_list_target_groups()
+
+            self.assertEqual(len(target_groups), 1)
+            self.assertEqual(target_groups[0].id, self.target_group_id)
+            self.assertEqual(target_groups[0].balancers[0].id, self.balancer_id)
+
+        actions = [call[1]["params"]["Action"] for call in request.call_args_list]
+        self.assertEqual(
+            actions,
+            ["DescribeTargetGroups", "DescribeLoadBalancers", "DescribeTags", "DescribeListeners"],
+        )
+
     def test_ex_get_balancer_listeners(self):
         balancer = self.driver.get_balancer(balancer_id=self.balancer_id)
         listeners = self.driver._ex_get_balancer_listeners(balancer)
@@ -347,6 +436,7 @@ class ApplicationLBTests(unittest.TestCase):
 
 class ApplicationLBMockHttp(MockHttp):
     fixtures = LoadBalancerFileFixtures("alb")
+    listeners_requests = []
 
     def _2015_12_01_DescribeLoadBalancers(self, method, url, body, headers):
         body = self.fixtures.load("describe_load_balancers.xml")
@@ -368,6 +458,45 @@ class ApplicationLBMockHttp(MockHttp):
         body = self.fixtures.load("describe_target_health.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _2015_12_01_batch_DescribeLoadBalancers(self, method, url, body, headers):
+        # Return a copy of the fixture load balancer for each requested ARN
+        params = parse_qs(urlparse.urlparse(url).query)
+        body = self.fixtures.load("describe_load_balancers.xml")
+        start = body.index("<LoadBalancers>") + len("<LoadBalancers>")
+        end = body.index("</LoadBalancers>")
+        arn = ApplicationLBTests.balancer_id
+
+        members = [
+            body[start:end].replace(arn, params["LoadBalancerArns.member.%s" % (idx)][0])
+            for idx in range(1, 21)
+            if "LoadBalancerArns.member.%s" % (idx) in params
+        ]
+        body = body[:start] + "".join(members) + body[end:]
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _2015_12_01_batch_DescribeTags(self, method, url, body, headers):
+        # Return a "project" tag with the ARN value for each requested ARN
+        params = parse_qs(urlparse.urlparse(url).query)
+        body = self.fixtures.load("describe_tags.xml")
+        start = body.index("<TagDescriptions>") + len("<TagDescriptions>")
+        end = body.index("</TagDescriptions>")
+        arn = ApplicationLBTests.balancer_id
+
+        members = [
+            body[start:end]
+            .replace(arn, params["ResourceArns.member.%s" % (idx)][0])
+            .replace("lima", params["ResourceArns.member.%s" % (idx)][0])
+            for idx in range(1, 21)
+            if "ResourceArns.member.%s" % (idx) in params
+        ]
+        body = body[:start] + "".join(members) + body[end:]
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _2015_12_01_batch_DescribeListeners(self, method, url, body, headers):
+        params = parse_qs(urlparse.urlparse(url).query)
+        ApplicationLBMockHttp.listeners_requests.append(params["LoadBalancerArn"][0])
+        return self._2015_12_01_DescribeListeners(method, url, body, headers)
+
     def _2015_12_01_DescribeTags(self, method, url, body, headers):
         body = self.fixtures.load("describe_tags.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
@@ -17,8 +17,12 @@
 import os
 import sys
 import json
+import time
+import base64
 import tempfile
+import threading
 from io import BytesIO
+from unittest import mock
 
 from libcloud.test import generate_random_data  # pylint: disable-msg=E0611
 from libcloud.test import unittest
@@ -38,6 +42,7 @@ from libcloud.test.storage.base import BaseRangeDownloadMockHttp
 from libcloud.test.file_fixtures import StorageFileFixtures  # pylint: disable-msg=E0611
 from libcloud.storage.drivers.azure_blobs import (
     AZURE_UPLOAD_CHUNK_SIZE,
+    AzureBlobLease,
     AzureBlobsStorageDriver,
     AzureBlobsActiveDirectoryConnection,
 )
@@ -121,6 +126,14 @@ class AzureBlobsMockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
 
         return (httplib.OK, body, self.base_headers, httplib.responses[httplib.OK])
 
+    def _test_container_DELIMITER(self, method, url, body, headers):
+        # test_iterate_container_prefixes
+        query = parse_qs(urlparse.urlsplit(url).query)
+        self.assertEqual(query["delimiter"], ["/"])
+
+        body = self.fixtures.load("list_objects_delimiter.xml")
+        return (httplib.OK, body, self.base_headers, httplib.responses[httplib.OK])
+
     def _test_container100(self, method, url, body, headers):
         body = ""
 
@@ -475,6 +488,17 @@ class AzureBlobsTests(unittest.TestCase):
         self.assertTrue("content_encoding" in obj.extra)
         self.assertTrue("content_language" in obj.extra)
 
+    def test_iterate_container_prefixes(self):
+        self.mock_response_klass.type = "DELIMITER"
+        container = Container(name="test_container", extra={}, driver=self.driver)
+
+        items = list(self.driver._iterate_container_prefixes(container))
+
+        self.assertEqual([item for item in items if isinstance(item, str)], ["dir1/", "dir2/"])
+        self.assertEqual(
+            [item.name for item in items if not isinstance(item, str)], ["object3.txt"]
+        )
+
     def test_get_container_doesnt_exist(self):
         self.mock_response_klass.type = None
         try:
@@ -896,6 +920,119 @@ class AzureBlobsTests(unittest.TestCase):
         self.assertEqual(obj.size, 3)
         self.mock_response_klass.use_param = None
 
+    def test_upload_big_block_object_via_stream_parallel(self):
+        self.mock_response_klass.use_param = "comp"
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+
+        uploaded = {}
+        threads = set()
+
+        def mock_upload_block(object_path, count, data, headers, connection=None):
+            self.assertEqual(headers["x-ms-lease-id"], "someleaseid")
+            self.assertIsNot(connection, self.driver.connection)
+            uploaded[count] = data
+            threads.add(threading.current_thread())
+            time.sleep(0.01)
+            return base64.b64encode(b("%10d" % (count))).decode("utf-8")
+
+        self.driver._upload_block = mock_upload_block
+
+        data = b("0") * (AZURE_UPLOAD_CHUNK_SIZE * 3) + b("1")
+        iterator = BytesIO(data)
+
+        with mock.patch.object(
+            self.driver, "_commit_blocks", wraps=self.driver._commit_blocks
+        ) as commit_blocks:
+            obj = self.driver.upload_object_via_stream(
+                container=container,
+                object_name="foo_test_upload",
+                iterator=iterator,
+                ex_use_lease=True,
+                ex_upload_workers=2,
+            )
+
+        self.assertEqual(obj.size, len(data))
+        self.assertEqual(sorted(uploaded), [1, 2, 3, 4])
+        self.assertEqual(b("").join(uploaded[count] for count in sorted(uploaded)), data)
+        self.assertNotIn(threading.current_thread(), threads)
+
+        # Blocks are committed in the order in which they were read
+        chunks = commit_blocks.call_args[1]["chunks"]
+        expected = [base64.b64encode(b("%10d" % (count))).decode("utf-8") for count in range(1, 5)]
+        self.assertEqual(chunks, expected)
+        self.mock_response_klass.use_param = None
+
+    def test_upload_big_block_object_via_stream_parallel_error(self):
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+
+        def mock_upload_block(object_path, count, data, headers, connection=None):
+            if count == 2:
+                raise LibcloudError("Error uploading chunk 2", driver=self.driver)
+            return "blockid"
+
+        self.driver._upload_block = mock_upload_block
+        self.driver._commit_blocks = mock.Mock()
+
+        iterator = BytesIO(b("0") * (AZURE_UPLOAD_CHUNK_SIZE * 3))
+
+        with self.assertRaisesRegex(LibcloudError, "Error uploading chunk 2"):
+            self.driver.upload_object_via_stream(
+                container=container,
+                object_name="foo_test_upload",
+                iterator=iterator,
+                ex_upload_workers=2,
+            )
+
+        self.assertFalse(self.driver._commit_blocks.called)
+
+    def test_lease_renew_min_interval(self):
+        connection = mock.Mock()
+        connection.request.return_value.status = httplib.OK
+
+        lease = AzureBlobLease(self.driver, "/foo_bar_container/foo_test_upload", True)
+        lease.lease_id = "someleaseid"
+        lease.renewed_at = time.time()
+
+        lease.renew(connection=connection, min_interval=15)
+        self.assertFalse(connection.request.called)
+
+        lease.renewed_at = time.time() - 20
+        lease.renew(connection=connection, min_interval=15)
+        self.assertEqual(connection.request.call_count, 1)
+        headers = connection.request.call_args[1]["headers"]
+        self.assertEqual(headers["x-ms-lease-action"], "renew")
+        self.assertEqual(headers["x-ms-lease-id"], "someleaseid")
+
+    def test_delete_objects(self):
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+        content_type = (
+            "multipart/mixed; boundary=batchresponse_66925647-d0cb-4109-b6d3-28efe3e1e5ed"
+        )
+        response = mock.Mock(
+            status=httplib.ACCEPTED,
+            headers={"content-type": content_type},
+            body=b(AzureBlobsMockHttp.fixtures.load("delete_objects_batch.txt")),
+        )
+
+        with mock.patch.object(self.driver.connection, "request", return_value=response) as request:
+            results = self.driver.delete_objects(container, ["foo", "bar", "baz"])
+
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual(request.call_args[1]["params"], {"comp": "batch"})
+
+        body = request.call_args[1]["data"].decode("utf-8")
+        self.assertEqual(body.count("Authorization: SharedKey "), 3)
+
+        for name in ["foo", "bar", "baz"]:
+            path = self.driver.connection.morph_action_hook("/foo_bar_container/%s" % (name))
+            self.assertIn("DELETE %s HTTP/1.1\r\n" % (path), body)
+
+        self.assertEqual([result.name for result in results], ["foo", "bar", "baz"])
+        self.assertIsNone(results[0].error)
+        self.assertIsInstance(results[1].error, ObjectDoesNotExistError)
+        self.assertIsInstance(results[2].error, LibcloudError)
+        self.assertIn("AuthenticationFailed", str(results[2].error))
+
     def test_delete_object_not_found(self):
         self.mock_response_klass.type = "NOT_FOUND"
         container = Container(name="foo_bar_container", extra={}, driver=self.driver)
@@ -13,16 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
 import errno
 import hashlib
+import tempfile
+import threading
 from io import BytesIO
 from unittest import mock
 from unittest.mock import Mock
 
 from libcloud.test import MockHttp, BodyStream, unittest
-from libcloud.utils.py3 import PY2, StringIO, b, httplib, assertRaisesRegex
-from libcloud.storage.base import DEFAULT_CONTENT_TYPE, StorageDriver
+from libcloud.utils.py3 import StringIO, b, httplib, assertRaisesRegex
+from libcloud.utils.files import HashingReader
+from libcloud.common.types import LibcloudError
+from libcloud.storage.base import DEFAULT_CONTENT_TYPE, Object, Container, StorageDriver
+from libcloud.storage.types import ObjectDoesNotExistError
 from libcloud.common.exceptions import RateLimitReachedError
 from libcloud.test.storage.base import BaseRangeDownloadMockHttp
 
@@ -136,27 +142,30 @@ class BaseStorageTests(unittest.TestCase):
         )
 
     @mock.patch("libcloud.utils.files.exhaust_iterator")
-    @mock.patch("libcloud.utils.files.read_in_chunks")
-    def test_upload_object_hash_calculation_is_efficient(
-        self, mock_read_in_chunks, mock_exhaust_iterator
-    ):
+    def test_upload_object_hash_calculation_is_efficient(self, mock_exhaust_iterator):
         # Verify that we don't buffer whole file in memory when calculating
-        # object has when iterator has __next__ method, but instead read and
-        # calculate hash in chunks
+        # object hash, but instead calculate hash while the data is being
+        # sent so each chunk is only read once
         size = 100
 
+        def mock_request(*args, **kwargs):
+            # Consume request body the same way as the HTTP client does
+            body = kwargs["data"]
+            self.assertIsInstance(body, HashingReader)
+
+            while body.read(16):
+                pass
+
+            return Mock()
+
         self.driver1.connection = Mock()
+        self.driver1.connection.request.side_effect = mock_request
 
         # stream has __next__ method and next() method
-        mock_read_in_chunks.return_value = "a" * size
-
         iterator = BodyStream("a" * size)
         self.assertTrue(hasattr(iterator, "__next__"))
         self.assertTrue(hasattr(iterator, "next"))
 
-        self.assertEqual(mock_read_in_chunks.call_count, 0)
-        self.assertEqual(mock_exhaust_iterator.call_count, 0)
-
         result = self.driver1._upload_object(
             object_name="test1", content_type=None, request_path="/", stream=iterator
         )
@@ -168,29 +177,21 @@ class BaseStorageTests(unittest.TestCase):
         self.assertEqual(result["data_hash"], expected_hash)
         self.assertEqual(result["bytes_transferred"], size)
 
+        # stream is not rewound and read again after the upload
+        self.assertEqual(iterator.read(), "")
+
         headers = self.driver1.connection.request.call_args[-1]["headers"]
         self.assertEqual(headers["Content-Type"], DEFAULT_CONTENT_TYPE)
 
-        self.assertEqual(mock_read_in_chunks.call_count, 1)
-        self.assertEqual(mock_exhaust_iterator.call_count, 0)
+        # stream only has __next__ method
+        consumed = []
 
-        # stream has only has next() method
-        mock_read_in_chunks.return_value = "b" * size
+        def generator():
+            for value in ["b" * 60, "b" * 40]:
+                consumed.append(value)
+                yield value
 
-        iterator = iter([str(v) for v in ["b" * size]])
-
-        if PY2:
-            self.assertFalse(hasattr(iterator, "__next__"))
-            self.assertTrue(hasattr(iterator, "next"))
-        else:
-            self.assertTrue(hasattr(iterator, "__next__"))
-            self.assertFalse(hasattr(iterator, "next"))
-
-        self.assertEqual(mock_read_in_chunks.call_count, 1)
-        self.assertEqual(mock_exhaust_iterator.call_count, 0)
-
-        self.assertEqual(mock_read_in_chunks.call_count, 1)
-        self.assertEqual(mock_exhaust_iterator.call_count, 0)
+        iterator = generator()
 
         result = self.driver1._upload_object(
             object_name="test2", content_type=None, request_path="/", stream=iterator
@@ -202,13 +203,52 @@ class BaseStorageTests(unittest.TestCase):
 
         self.assertEqual(result["data_hash"], expected_hash)
         self.assertEqual(result["bytes_transferred"], size)
+        self.assertEqual(consumed, ["b" * 60, "b" * 40])
 
-        headers = self.driver1.connection.request.call_args[-1]["headers"]
-        self.assertEqual(headers["Content-Type"], DEFAULT_CONTENT_TYPE)
+        # file is only opened and read once
+        _, file_path = tempfile.mkstemp()
+
+        with open(file_path, "wb") as fp:
+            fp.write(b("c") * size)
+
+        with mock.patch("builtins.open", wraps=open) as mock_open:
+            result = self.driver1._upload_object(
+                object_name="test3", content_type=None, request_path="/", file_path=file_path
+            )
+
+        os.unlink(file_path)
+
+        hasher = hashlib.md5()
+        hasher.update(b("c") * size)
+        expected_hash = hasher.hexdigest()
+
+        self.assertEqual(result["data_hash"], expected_hash)
+        self.assertEqual(result["bytes_transferred"], size)
+        self.assertEqual(mock_open.call_count, 1)
 
-        self.assertEqual(mock_read_in_chunks.call_count, 2)
         self.assertEqual(mock_exhaust_iterator.call_count, 0)
 
+    def test_upload_object_data_not_consumed_by_request_is_hashed(self):
+        # If the request doesn't consume the whole body, remaining data is
+        # still included in the hash
+        size = 100
+
+        self.driver1.connection = Mock()
+
+        result = self.driver1._upload_object(
+            object_name="test1",
+            content_type=None,
+            request_path="/",
+            stream=iter(["a" * size]),
+        )
+
+        hasher = hashlib.md5()
+        hasher.update(b("a") * size)
+        expected_hash = hasher.hexdigest()
+
+        self.assertEqual(result["data_hash"], expected_hash)
+        self.assertEqual(result["bytes_transferred"], size)
+
     def test_upload_object_via_stream_illegal_seek_errors_are_ignored(self):
         # Illegal seek errors should be ignored
         size = 100
@@ -252,6 +292,246 @@ class BaseStorageTests(unittest.TestCase):
             stream=iterator,
         )
 
+    def test_download_object_parallel_size_mismatch(self):
+        obj = Mock()
+        obj.name = "foo"
+        obj.size = 100
+
+        def mock_range_stream(obj, start_bytes, end_bytes=None, chunk_size=None):
+            # Ranges are truncated
+            return iter([b("a") * min(end_bytes - start_bytes, 25)])
+
+        _, destination_path = tempfile.mkstemp()
+
+        with mock.patch.object(
+            StorageDriver,
+            "download_object_range_as_stream",
+            side_effect=mock_range_stream,
+        ):
+            self.assertRaisesRegex(
+                LibcloudError,
+                "returned 25 bytes",
+                self.driver1.download_object_parallel,
+                obj,
+                destination_path,
+                overwrite_existing=True,
+                workers=2,
+                part_size=30,
+            )
+            self.assertFalse(os.path.exists(destination_path))
+
+            stream = self.driver1.download_object_as_stream_parallel(obj, workers=2, part_size=30)
+            self.assertRaisesRegex(LibcloudError, "returned 25 bytes", list, stream)
+
+    def test_download_object_parallel_range_ignored(self):
+        obj = Mock()
+        obj.name = "foo"
+        obj.size = 100
+
+        def mock_range_stream(obj, start_bytes, end_bytes=None, chunk_size=None):
+            # Range header is ignored and the whole object is returned
+            return iter([b("a") * 20] * 5)
+
+        _, destination_path = tempfile.mkstemp()
+
+        with mock.patch.object(
+            StorageDriver,
+            "download_object_range_as_stream",
+            side_effect=mock_range_stream,
+        ):
+            self.assertRaisesRegex(
+                LibcloudError,
+                "returned more than",
+                self.driver1.download_object_parallel,
+                obj,
+                destination_path,
+                overwrite_existing=True,
+                delete_on_failure=False,
+                workers=2,
+                part_size=30,
+            )
+
+        # Nothing is written past the end of the ranges
+        self.assertEqual(os.path.getsize(destination_path), 100)
+        os.remove(destination_path)
+
+    def test_download_object_parallel_small_object(self):
+        obj = Mock()
+        obj.size = 10
+
+        with mock.patch.object(
+            StorageDriver, "download_object", return_value=True
+        ) as mock_download_object, mock.patch.object(
+            StorageDriver, "download_object_as_stream", return_value=iter([b("a")])
+        ) as mock_download_object_as_stream:
+            self.assertTrue(self.driver1.download_object_parallel(obj, "/tmp/foo", part_size=30))
+            self.assertEqual(list(self.driver1.download_object_as_stream_parallel(obj)), [b("a")])
+
+        self.assertEqual(mock_download_object.call_count, 1)
+        self.assertEqual(mock_download_object_as_stream.call_count, 1)
+
+    def test_delete_objects(self):
+        container = Container(name="container", extra={}, driver=self.driver1)
+        obj = Object(
+            name="foo",
+            size=10,
+            hash=None,
+            extra={},
+            meta_data={},
+            container=container,
+            driver=self.driver1,
+        )
+
+        def delete_object(obj):
+            if obj.name == "baz":
+                raise ObjectDoesNotExistError(value=None, driver=self.driver1, object_name="baz")
+
+            self.assertEqual(obj.container, container)
+            return obj.name == "foo"
+
+        with mock.patch.object(StorageDriver, "delete_object", side_effect=delete_object):
+            results = self.driver1.delete_objects(container, iter([obj, "bar", "baz"]))
+
+        self.assertEqual([result.name for result in results], ["foo", "bar", "baz"])
+        self.assertTrue(results[0].success)
+        self.assertIsNone(results[0].error)
+        self.assertFalse(results[1].success)
+        self.assertIsInstance(results[1].error, LibcloudError)
+        self.assertIsInstance(results[2].error, ObjectDoesNotExistError)
+
+    def test_delete_objects_duplicate_names(self):
+        container = Container(name="container", extra={}, driver=self.driver1)
+        self.driver1.delete_objects_batch_size = 3
+        batches = []
+
+        def delete_objects(container, object_names):
+            batches.append(object_names)
+            return {name: None for name in object_names}
+
+        with mock.patch.object(StorageDriver, "_delete_objects", side_effect=delete_objects):
+            results = self.driver1.delete_objects(container, ["a", "b", "a"])
+
+        self.assertEqual(batches, [["a", "b"]])
+        self.assertEqual([result.name for result in results], ["a", "b", "a"])
+        self.assertTrue(all(result.success for result in results))
+
+    def test_delete_objects_batches(self):
+        container = Container(name="container", extra={}, driver=self.driver1)
+        self.driver1.delete_objects_batch_size = 2
+        batches = []
+
+        def delete_objects(container, object_names):
+            batches.append(object_names)
+
+            if "c" in object_names:
+                raise LibcloudError("Batch failed")
+
+            return {name: None for name in object_names}
+
+        with mock.patch.object(StorageDriver, "_delete_objects", side_effect=delete_objects):
+            results = self.driver1.delete_objects(container, ["a", "b", "c", "d", "e"], workers=2)
+
+        self.assertEqual(sorted(batches), [["a", "b"], ["c", "d"], ["e"]])
+        self.assertEqual([result.name for result in results], ["a", "b", "c", "d", "e"])
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[4].error)
+        self.assertIsInstance(results[2].error, LibcloudError)
+        self.assertIsInstance(results[3].error, LibcloudError)
+
+    def _get_sharded_listing_objects(self, container):
+        names = {
+            "a/": ["a/%03d" % (index) for index in range(250)],
+            "b/": ["b/1", "b/2"],
+            "c/": [],
+        }
+
+        def iterate_container_objects(container, prefix=None):
+            for name in names[prefix]:
+                yield Object(name, 0, None, {}, {}, container, self.driver1)
+
+        return iterate_container_objects, names
+
+    def test_iterate_container_objects_sharded(self):
+        container = Container(name="container", extra={}, driver=self.driver1)
+        iterate_container_objects, names = self._get_sharded_listing_objects(container)
+        top_level = [Object(name, 0, None, {}, {}, container, self.driver1) for name in ["0", "b0"]]
+        expected = sorted(["0", "b0"] + names["a/"] + names["b/"])
+
+        def iterate_container_prefixes(container, prefix=None, delimiter="/"):
+            return self.driver1._merge_container_prefixes(top_level, ["a/", "b/", "c/"])
+
+        with mock.patch.object(
+            StorageDriver, "iterate_container_objects", side_effect=iterate_container_objects
+        ), mock.patch.object(
+            StorageDriver, "_iterate_container_prefixes", side_effect=iterate_container_prefixes
+        ), mock.patch(
+            "libcloud.storage.base.LIST_SHARDS_BATCH_SIZE", 10
+        ):
+            objects = self.driver1.iterate_container_objects_sharded(container, sort=True)
+            self.assertEqual([obj.name for obj in objects], expected)
+
+            objects = self.driver1.iterate_container_objects_sharded(container, workers=2)
+            self.assertEqual(sorted(obj.name for obj in objects), expected)
+
+            objects = self.driver1.iterate_container_objects_sharded(container, prefixes=["b/"])
+            self.assertEqual([obj.name for obj in objects], ["b/1", "b/2"])
+
+    def test_iterate_container_objects_sharded_streams_top_level_objects(self):
+        container = Container(name="container", extra={}, driver=self.driver1)
+        listed = threading.Event()
+
+        def iterate_container_prefixes(container, prefix=None, delimiter="/"):
+            yield Object("0", 0, None, {}, {}, container, self.driver1)
+
+            # Top level objects are returned before the discovery finishes
+            self.assertTrue(listed.wait(5))
+            yield Object("1", 0, None, {}, {}, container, self.driver1)
+
+        with mock.patch.object(
+            StorageDriver, "_iterate_container_prefixes", side_effect=iterate_container_prefixes
+        ), mock.patch("libcloud.storage.base.LIST_SHARDS_BATCH_SIZE", 1):
+            for sort in [False, True]:
+                listed.clear()
+                objects = self.driver1.iterate_container_objects_sharded(container, sort=sort)
+
+                self.assertEqual(next(objects).name, "0")
+                listed.set()
+                self.assertEqual([obj.name for obj in objects], ["1"])
+
+    def test_iterate_container_objects_sharded_stop_iteration(self):
+        container = Container(name="container", extra={}, driver=self.driver1)
+        iterate_container_objects, names = self._get_sharded_listing_objects(container)
+
+        with mock.patch.object(
+            StorageDriver, "iterate_container_objects", side_effect=iterate_container_objects
+        ), mock.patch("libcloud.storage.base.LIST_SHARDS_BATCH_SIZE", 1):
+            objects = self.driver1.iterate_container_objects_sharded(
+                container, prefixes=["a/", "b/"], workers=2, sort=True
+            )
+            self.assertEqual(next(objects).name, "a/000")
+
+            # Worker threads which are blocked on a full queue exit
+            objects.close()
+
+    def test_iterate_container_objects_sharded_error(self):
+        container = Container(name="container", extra={}, driver=self.driver1)
+
+        def iterate_container_objects(container, prefix=None):
+            if prefix == "b/":
+                raise LibcloudError("Listing failed")
+
+            yield Object("a/1", 0, None, {}, {}, container, self.driver1)
+
+        with mock.patch.object(
+            StorageDriver, "iterate_container_objects", side_effect=iterate_container_objects
+        ):
+            objects = self.driver1.iterate_container_objects_sharded(
+                container, prefixes=["a/", "b/"], sort=True
+            )
+
+            with self.assertRaisesRegex(LibcloudError, "Listing failed"):
+                list(objects)
+
     def test_get_standard_range_str(self):
         result = self.driver1._get_standard_range_str(0, 5)
         self.assertEqual(result, "bytes=0-4")
@@ -30,7 +30,7 @@ from libcloud.test import MockHttp  # pylint: disable-msg=E0611
 from libcloud.test import unittest, make_response, generate_random_data
 from libcloud.utils.py3 import StringIO, b, httplib, urlquote
 from libcloud.utils.files import exhaust_iterator
-from libcloud.common.types import MalformedResponseError
+from libcloud.common.types import LibcloudError, MalformedResponseError
 from libcloud.storage.base import CHUNK_SIZE, Object, Container
 from libcloud.storage.types import (
     ObjectDoesNotExistError,
@@ -672,6 +672,39 @@ class CloudFilesTests(unittest.TestCase):
         status = self.driver.delete_object(obj=obj)
         self.assertTrue(status)
 
+    def test_delete_objects_bulk_delete(self):
+        CloudFilesMockHttp.type = "BULK_DELETE"
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+
+        results = self.driver.delete_objects(container, ["foo", "bar object", "baz"])
+
+        self.assertEqual([result.name for result in results], ["foo", "bar object", "baz"])
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[2].error)
+        self.assertIsInstance(results[1].error, LibcloudError)
+        self.assertIn("409 Conflict", str(results[1].error))
+
+    def test_delete_objects_bulk_delete_default_content_type(self):
+        # Bulk delete request body must be sent as text/plain even if the
+        # connection has a default content type
+        CloudFilesMockHttp.type = "BULK_DELETE"
+        self.driver.connection.default_content_type = "application/json"
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+
+        results = self.driver.delete_objects(container, ["foo", "bar object", "baz"])
+
+        self.assertIsNone(results[0].error)
+        self.assertIsInstance(results[1].error, LibcloudError)
+
+    def test_delete_objects_bulk_delete_not_enabled(self):
+        # Account POST request without the bulk middleware returns 204
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+
+        results = self.driver.delete_objects(container, ["foo_bar_object"])
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].name, "foo_bar_object")
+        self.assertTrue(results[0].success)
+
     def test_delete_object_not_found(self):
         CloudFilesMockHttp.type = "NOT_FOUND"
         container = Container(name="foo_bar_container", extra={}, driver=self)
@@ -1110,6 +1143,23 @@ class CloudFilesMockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
             status_code = httplib.NO_CONTENT
         return (status_code, body, headers, httplib.responses[httplib.OK])
 
+    def _v1_MossoCloudFS_BULK_DELETE(self, method, url, body, headers):
+        # test_delete_objects_bulk_delete
+        self.assertEqual(method, "POST")
+        self.assertTrue("bulk-delete" in url)
+        self.assertEqual(headers["Content-Type"], "text/plain")
+        self.assertEqual(
+            body.split("\n"),
+            [
+                "/foo_bar_container/foo",
+                "/foo_bar_container/bar%20object",
+                "/foo_bar_container/baz",
+            ],
+        )
+
+        body = self.fixtures.load("bulk_delete.json")
+        return (httplib.OK, body, self.base_headers, httplib.responses[httplib.OK])
+
     def _v1_MossoCloudFS_not_found(self, method, url, body, headers):
         # test_get_object_not_found
         if method == "HEAD":
@@ -635,6 +635,56 @@ class LocalTests(unittest.TestCase):
         container.delete()
         self.remove_tmp_file(tmppath)
 
+    def test_download_object_parallel_success(self):
+        content = os.urandom(10 * 1024 + 7)
+        tmppath = self.make_tmp_file(content=content)
+        container = self.driver.create_container("test6")
+        obj = container.upload_object(tmppath, "test")
+
+        destination_path = tmppath + ".temp"
+        result = self.driver.download_object_parallel(
+            obj=obj,
+            destination_path=destination_path,
+            workers=4,
+            part_size=1024,
+        )
+        self.assertTrue(result)
+
+        with open(destination_path, "rb") as fp:
+            self.assertEqual(fp.read(), content)
+
+        self.assertRaisesRegex(
+            LibcloudError,
+            "overwrite_existing=False",
+            self.driver.download_object_parallel,
+            obj=obj,
+            destination_path=destination_path,
+            part_size=1024,
+        )
+
+        obj.delete()
+        container.delete()
+        self.remove_tmp_file(tmppath)
+        os.unlink(destination_path)
+
+    def test_download_object_as_stream_parallel_success(self):
+        content = os.urandom(10 * 1024 + 7)
+        tmppath = self.make_tmp_file(content=content)
+        container = self.driver.create_container("test6")
+        obj = container.upload_object(tmppath, "test")
+
+        stream = self.driver.download_object_as_stream_parallel(
+            obj=obj, chunk_size=512, workers=3, part_size=1024
+        )
+        chunks = list(stream)
+
+        self.assertEqual(b"".join(chunks), content)
+        self.assertEqual(max(len(chunk) for chunk in chunks), 512)
+
+        obj.delete()
+        container.delete()
+        self.remove_tmp_file(tmppath)
+
 
 if not LocalStorageDriver:
 
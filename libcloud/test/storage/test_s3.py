@@ -16,16 +16,19 @@
 import os
 import sys
 import hmac
+import time
 import base64
+import asyncio
 import tempfile
+import threading
 from io import BytesIO
-from hashlib import sha1
+from hashlib import md5, sha1
 from unittest import mock
 from unittest.mock import Mock, PropertyMock
 
 import libcloud.utils.files  # NOQA: F401
 from libcloud.test import MockHttp  # pylint: disable-msg=E0611  # noqa
-from libcloud.test import unittest, make_response, generate_random_data
+from libcloud.test import AsyncMockHttp, unittest, make_response, generate_random_data
 from libcloud.utils.py3 import ET, StringIO, b, httplib, parse_qs, urlparse
 from libcloud.utils.files import exhaust_iterator
 from libcloud.common.types import LibcloudError, InvalidCredsError, MalformedResponseError
@@ -219,6 +222,39 @@ class S3MockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
         # test_delete_object
         return (httplib.NO_CONTENT, body, headers, httplib.responses[httplib.OK])
 
+    def _foo_bar_container_SHARDED(self, method, url, body, headers):
+        # test_iterate_container_objects_sharded
+        query = parse_qs(urlparse.urlsplit(url).query)
+
+        if "delimiter" in query:
+            if "marker" not in query:
+                file_name = "list_container_prefixes_1.xml"
+            else:
+                self.assertEqual(query["marker"], ["a/"])
+                file_name = "list_container_prefixes_2.xml"
+        elif query["prefix"] == ["a/"]:
+            file_name = "list_container_objects_shard_a.xml"
+        else:
+            self.assertEqual(query["prefix"], ["b/"])
+            file_name = "list_container_objects_shard_b.xml"
+
+        body = self.fixtures.load(file_name)
+        return (httplib.OK, body, self.base_headers, httplib.responses[httplib.OK])
+
+    def _foo_bar_container_DELETE(self, method, url, body, headers):
+        # test_delete_objects
+        self.assertEqual(method, "POST")
+        self.assertIn("delete", parse_qs(urlparse.urlsplit(url).query, keep_blank_values=True))
+
+        keys = [key.text for key in ET.XML(body).findall("Object/Key")]
+        self.assertEqual(keys, ["foo", "bar", "baz"])
+
+        content_md5 = base64.b64encode(md5(b(body)).digest()).decode("utf-8")
+        self.assertEqual(headers["Content-MD5"], content_md5)
+
+        body = self.fixtures.load("delete_objects.xml")
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _foo_bar_container_foo_test_stream_data(self, method, url, body, headers):
         # test_upload_object_via_stream
         body = ""
@@ -475,6 +511,60 @@ class S3Tests(unittest.TestCase):
         self.assertTrue(obj in objects)
         self.assertEqual(len(objects), 5)
 
+    def test_iterate_container_objects_iterparse(self):
+        self.mock_response_klass.type = "ITERATOR"
+        self.driver.iterparse_list_responses = True
+        container = Container(name="test_container", extra={}, driver=self.driver)
+        request = self.driver.connection.request
+
+        with mock.patch.object(self.driver.connection, "request", side_effect=request) as m:
+            objects = self.driver.iterate_container_objects(container=container)
+
+            # Objects are yielded as soon as they have been parsed
+            self.assertEqual(next(objects).name, "1.zip")
+            self.assertEqual(m.call_count, 1)
+            self.assertTrue(m.call_args[1]["stream"])
+
+            self.assertEqual([obj.name for obj in objects], ["2.zip", "3.zip", "4.zip", "5.zip"])
+            self.assertEqual(m.call_count, 2)
+
+    def test_iterate_container_objects_iterparse_stopped_early_closes_response(self):
+        self.mock_response_klass.type = "ITERATOR"
+        self.driver.iterparse_list_responses = True
+        container = Container(name="test_container", extra={}, driver=self.driver)
+
+        with mock.patch("libcloud.common.base.RawResponse.close") as mock_close:
+            objects = self.driver.iterate_container_objects(container=container)
+            self.assertEqual(next(objects).name, "1.zip")
+            self.assertFalse(mock_close.called)
+
+            objects.close()
+            self.assertEqual(mock_close.call_count, 1)
+
+    def test_list_container_objects_no_iterparse(self):
+        self.mock_response_klass.type = "ITERATOR"
+        self.driver.iterparse_list_responses = False
+        container = Container(name="test_container", extra={}, driver=self.driver)
+        objects = self.driver.list_container_objects(container=container)
+
+        self.assertEqual(
+            [obj.name for obj in objects], ["1.zip", "2.zip", "3.zip", "4.zip", "5.zip"]
+        )
+        self.assertEqual(objects[0].hash, "4397da7a7649e8085de9916c240e8166")
+        self.assertEqual(objects[0].size, 1234567)
+        self.assertEqual(objects[0].container.name, "test_container")
+
+    def test_async_list_container_objects(self):
+        self.mock_response_klass.type = "ITERATOR"
+        self.driver.async_connection.connection = AsyncMockHttp(self.driver.connection.connection)
+        container = Container(name="test_container", extra={}, driver=self.driver)
+        objects = asyncio.run(self.driver.async_list_container_objects(container=container))
+
+        self.assertEqual(
+            [obj.name for obj in objects], ["1.zip", "2.zip", "3.zip", "4.zip", "5.zip"]
+        )
+        self.assertEqual(objects[0].hash, "4397da7a7649e8085de9916c240e8166")
+
     def test_list_container_objects_with_prefix(self):
         self.mock_response_klass.type = None
         container = Container(name="test_container", extra={}, driver=self.driver)
@@ -487,6 +577,17 @@ class S3Tests(unittest.TestCase):
         self.assertEqual(obj.container.name, "test_container")
         self.assertTrue("owner" in obj.meta_data)
 
+    def test_iterate_container_objects_sharded(self):
+        self.mock_response_klass.type = "SHARDED"
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+
+        # Requests are issued by a single worker thread, mock HTTP connections
+        # don't support concurrent requests
+        objects = self.driver.iterate_container_objects_sharded(container, workers=1, sort=True)
+        names = [obj.name for obj in objects]
+
+        self.assertEqual(names, ["1.zip", "a/1.zip", "a/2.zip", "b/1.zip", "c.zip"])
+
     def test_get_container_doesnt_exist(self):
         self.mock_response_klass.type = "get_container"
         try:
@@ -555,6 +656,16 @@ class S3Tests(unittest.TestCase):
         self.assertEqual(obj.extra["content_type"], "application/zip")
         self.assertEqual(obj.meta_data["rabbits"], "monkeys")
 
+    def test_async_get_object_success(self):
+        self.mock_response_klass.type = "get_object"
+        self.driver.async_connection.connection = AsyncMockHttp(self.driver.connection.connection)
+        obj = asyncio.run(self.driver.async_get_object(container_name="test2", object_name="test"))
+
+        self.assertEqual(obj.name, "test")
+        self.assertEqual(obj.container.name, "test2")
+        self.assertEqual(obj.size, 12345)
+        self.assertEqual(obj.meta_data["rabbits"], "monkeys")
+
     def test_get_object_unable_to_determine_object_size(self):
         self.mock_response_klass.type = "get_object_no_content_length"
 
@@ -1126,6 +1237,124 @@ class S3Tests(unittest.TestCase):
         self.assertEqual(obj.name, object_name)
         self.assertEqual(obj.size, CHUNK_SIZE * 3)
 
+    def test_upload_big_object_via_stream_parallel(self):
+        if not self.driver.supports_s3_multipart_upload:
+            return
+
+        self.mock_response_klass.type = "MULTIPART"
+
+        uploaded = {}
+        lock = threading.Lock()
+
+        def mock_upload_chunk(request_path, upload_id, part_number, data, connection=None):
+            # Later chunks finish first so results arrive out of order
+            time.sleep(0.01 * (5 - part_number))
+            self.assertIsNot(connection, self.driver.connection)
+
+            with lock:
+                uploaded[part_number] = data
+
+            return (part_number, "etag-%s" % (part_number))
+
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+        object_name = "foo_test_stream_data"
+        data = b("1" * CHUNK_SIZE + "2" * CHUNK_SIZE + "3" * CHUNK_SIZE + "4")
+
+        with mock.patch.object(
+            self.driver, "_upload_multipart_chunk", side_effect=mock_upload_chunk
+        ), mock.patch.object(
+            self.driver, "_commit_multipart", return_value="0cc175b9c0f1b6a831c399e269772661"
+        ) as mock_commit:
+            obj = self.driver.upload_object_via_stream(
+                container=container,
+                object_name=object_name,
+                iterator=BytesIO(data),
+                ex_multipart_workers=4,
+            )
+
+        self.assertEqual(obj.name, object_name)
+        self.assertEqual(obj.size, len(data))
+        self.assertEqual(b("").join(uploaded[i] for i in sorted(uploaded)), data)
+
+        chunks = mock_commit.call_args[0][3]
+        self.assertEqual(chunks, [(i, "etag-%s" % (i)) for i in range(1, 5)])
+
+    def test_upload_big_object_via_stream_parallel_max_in_flight(self):
+        if not self.driver.supports_s3_multipart_upload:
+            return
+
+        self.mock_response_klass.type = "MULTIPART"
+
+        in_flight = []
+        max_in_flight = [0]
+        lock = threading.Lock()
+        concurrent = threading.Event()
+
+        def mock_upload_chunk(request_path, upload_id, part_number, data, connection=None):
+            with lock:
+                in_flight.append(part_number)
+                max_in_flight[0] = max(max_in_flight[0], len(in_flight))
+
+                if len(in_flight) == 2:
+                    concurrent.set()
+
+            # Give other chunks a chance to start uploading
+            concurrent.wait(0.5)
+            time.sleep(0.01)
+
+            with lock:
+                in_flight.remove(part_number)
+
+            return (part_number, "etag")
+
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+
+        with mock.patch.object(
+            self.driver, "_upload_multipart_chunk", side_effect=mock_upload_chunk
+        ), mock.patch.object(self.driver, "_commit_multipart", return_value="etag"):
+            obj = self.driver.upload_object_via_stream(
+                container=container,
+                object_name="foo_test_stream_data",
+                iterator=BytesIO(b("0" * CHUNK_SIZE * 6)),
+                ex_multipart_workers=4,
+                ex_multipart_max_in_flight=CHUNK_SIZE * 2,
+            )
+
+        self.assertEqual(obj.size, CHUNK_SIZE * 6)
+        self.assertEqual(max_in_flight[0], 2)
+
+    def test_upload_object_via_stream_parallel_abort(self):
+        if not self.driver.supports_s3_multipart_upload:
+            return
+
+        self.mock_response_klass.type = "MULTIPART"
+
+        def mock_upload_chunk(request_path, upload_id, part_number, data, connection=None):
+            if part_number == 2:
+                raise LibcloudError("Error uploading chunk", driver=self.driver)
+
+            return (part_number, "etag")
+
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+
+        with mock.patch.object(
+            self.driver, "_upload_multipart_chunk", side_effect=mock_upload_chunk
+        ), mock.patch.object(self.driver, "_abort_multipart") as mock_abort, mock.patch.object(
+            self.driver, "_commit_multipart"
+        ) as mock_commit:
+            self.assertRaisesRegex(
+                LibcloudError,
+                "Error uploading chunk",
+                self.driver.upload_object_via_stream,
+                container=container,
+                object_name="foo_test_stream_data",
+                iterator=BytesIO(b("0" * CHUNK_SIZE * 3)),
+                ex_multipart_workers=2,
+            )
+
+        self.assertEqual(mock_abort.call_count, 1)
+        self.assertEqual(mock_commit.call_count, 0)
+
     def test_upload_object_via_stream_guess_file_mime_type(self):
         if self.driver.supports_s3_multipart_upload:
             self.mock_response_klass.type = "MULTIPART"
@@ -1201,6 +1430,30 @@ class S3Tests(unittest.TestCase):
 
         self.driver.ex_cleanup_all_multipart_uploads(container)
 
+    def test_delete_objects(self):
+        if not self.driver.supports_s3_multi_object_delete:
+            return
+
+        self.mock_response_klass.type = "DELETE"
+        container = Container(name="foo_bar_container", extra={}, driver=self.driver)
+        obj = Object(
+            name="foo",
+            size=1234,
+            hash=None,
+            extra=None,
+            meta_data=None,
+            container=container,
+            driver=self.driver,
+        )
+
+        results = self.driver.delete_objects(container, [obj, "bar", "baz"])
+
+        self.assertEqual([result.name for result in results], ["foo", "bar", "baz"])
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[2].error)
+        self.assertIsInstance(results[1].error, LibcloudError)
+        self.assertIn("AccessDenied", str(results[1].error))
+
     def test_delete_object_not_found(self):
         self.mock_response_klass.type = "NOT_FOUND"
         container = Container(name="foo_bar_container", extra={}, driver=self.driver)
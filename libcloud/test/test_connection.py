@@ -17,6 +17,8 @@ import os
 import ssl
 import sys
 import socket
+import asyncio
+import threading
 from unittest import mock
 from unittest.mock import Mock, patch
 
@@ -24,11 +26,28 @@ import requests_mock
 from requests.exceptions import ConnectTimeout
 
 import libcloud.common.base
-from libcloud.http import LibcloudConnection, SignedHTTPSAdapter, LibcloudBaseConnection
+from libcloud.http import (
+    AsyncResponse,
+    LibcloudConnection,
+    SignedHTTPSAdapter,
+    LibcloudBaseConnection,
+    AsyncLibcloudConnection,
+)
 from libcloud.test import unittest, no_internet
 from libcloud.utils.py3 import assertRaisesRegex
-from libcloud.common.base import Response, Connection, CertificateConnection
-from libcloud.utils.retry import RETRY_EXCEPTIONS, Retry, RetryForeverOnRateLimitError
+from libcloud.common.base import (
+    Response,
+    Connection,
+    JsonResponse,
+    AsyncConnection,
+    PollingStrategy,
+    PollingConnection,
+    CertificateConnection,
+    ExponentialBackoffPollingStrategy,
+)
+from libcloud.utils.retry import RETRY_EXCEPTIONS, Retry, AsyncRetry, RetryForeverOnRateLimitError
+from libcloud.common.types import LibcloudError
+from libcloud.utils.ratelimit import TokenBucket
 from libcloud.common.exceptions import RateLimitReachedError
 
 
@@ -607,6 +626,372 @@ class ConnectionClassTestCase(unittest.TestCase):
 
         self.assertEqual(result.success(), True)
 
+    def test_request_acquires_rate_limiter_token(self):
+        con = Connection()
+        con.connection = Mock()
+        con.rate_limiter = Mock()
+
+        con.request(action="/", params={"foo": "bar"})
+        con.request(action="/")
+
+        self.assertEqual(con.rate_limiter.acquire.call_count, 2)
+        con.rate_limiter.acquire.assert_called_with(method="GET", path="/")
+        self.assertEqual(con.rate_limiter.update.call_count, 2)
+
+    def test_request_rate_limit_error_updates_rate_limiter(self):
+        con = Connection()
+        con.connection = Mock()
+        con.rate_limiter = Mock()
+        con.responseCls = Mock(side_effect=RateLimitReachedError(headers={"retry-after": "5"}))
+
+        self.assertRaises(RateLimitReachedError, con.request, action="/")
+        con.rate_limiter.update.assert_called_once_with(method="GET", path="/", retry_after=5)
+
+    def test_request_with_token_bucket_rate_limiter(self):
+        con = Connection()
+        con.connection = Mock()
+        con.rate_limiter = TokenBucket(rate=1, burst=2)
+
+        with patch.object(con.rate_limiter, "adjust") as mock_adjust:
+            con.request(action="/")
+            self.assertEqual(con.rate_limiter._state["tokens"], 1)
+            self.assertFalse(mock_adjust.called)
+
+            con.responseCls = Mock(side_effect=RateLimitReachedError(headers={"retry-after": "5"}))
+            self.assertRaises(RateLimitReachedError, con.request, action="/")
+            mock_adjust.assert_called_once_with(reset=5)
+
+
+class ThreadSafeConnectionClassTestCase(unittest.TestCase):
+    def test_request_state_is_local_to_each_thread(self):
+        con = Connection(host="api.example.com")
+        con.thread_safe = True
+        con.action = "/main"
+        con.context = {"thread": "main"}
+
+        result = {}
+
+        def run():
+            result["initial"] = (con.action, dict(con.context))
+            con.action = "/worker"
+            con.context["thread"] = "worker"
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(result["initial"], (None, {}))
+        self.assertEqual(con.action, "/main")
+        self.assertEqual(con.context, {"thread": "main"})
+
+    def test_request_state_is_shared_by_default(self):
+        con = Connection(host="api.example.com")
+        con.action = "/main"
+
+        thread = threading.Thread(target=lambda: setattr(con, "action", "/worker"))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(con.action, "/worker")
+
+    def test_connect_pool_size(self):
+        con = Connection(host="api.example.com")
+        con.thread_safe = True
+        con.pool_maxsize = 64
+        con.connect()
+
+        self.assertTrue(con.connection.thread_safe)
+
+        adapter = con.connection.session.get_adapter("https://api.example.com/")
+        self.assertEqual(adapter._pool_maxsize, 64)
+
+    @patch("libcloud.http.LibcloudConnection.getresponse")
+    def test_concurrent_requests(self, mock_getresponse):
+        con = Connection(host="api.example.com")
+        con.thread_safe = True
+        con.connect()
+
+        barrier = threading.Barrier(4)
+        actions = []
+
+        def mock_request(method, url, body=None, headers=None, stream=False):
+            # All the threads prepare their requests before any of them is
+            # sent
+            barrier.wait(timeout=5)
+            actions.append((url, con.action))
+
+        con.connection.request = mock_request
+        mock_getresponse.return_value = Mock(status_code=200, content=b"", encoding=None)
+
+        threads = [
+            threading.Thread(target=con.request, args=("/action-%s" % (index),))
+            for index in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(actions), 4)
+
+        for url, action in actions:
+            self.assertEqual(url, action)
+
+
+class AsyncConnectionClassTestCase(unittest.TestCase):
+    class MockAsyncHttp:
+        def __init__(self, responses):
+            self.responses = list(responses)
+            self.requests = []
+
+        async def request(self, method, url, body=None, headers=None):
+            self.requests.append((method, url, body, headers))
+            response = self.responses.pop(0)
+
+            if isinstance(response, Exception):
+                raise response
+
+            return response
+
+    def _get_connection(self, responses):
+        class TestConnection(Connection):
+            responseCls = JsonResponse
+
+            def add_default_params(self, params):
+                params["key"] = "secret"
+                return params
+
+        con = TestConnection(host="api.example.com")
+        con.connect()
+
+        async_con = AsyncConnection(con)
+        async_con.connection = self.MockAsyncHttp(responses)
+
+        return async_con
+
+    def test_request(self):
+        headers = {"Content-Type": "application/json"}
+        response = AsyncResponse(status_code=200, reason="OK", headers=headers, content=b"[1]")
+        con = self._get_connection([response])
+
+        result = asyncio.run(con.request("/items", params={"a": "b"}))
+        self.assertTrue(isinstance(result, JsonResponse))
+        self.assertEqual(result.object, [1])
+        self.assertEqual(result.headers, {"content-type": "application/json"})
+
+        method, url, _, headers = con.connection.requests[0]
+        self.assertEqual(method, "GET")
+        self.assertEqual(url, "https://api.example.com/items?a=b&key=secret")
+        self.assertTrue(headers["User-Agent"].startswith("libcloud/"))
+
+    def test_request_prepared_in_thread(self):
+        response = AsyncResponse(status_code=200, reason="OK", headers={}, content=b"{}")
+        con = self._get_connection([response])
+        calls = []
+
+        def add_default_headers(headers):
+            calls.append((threading.current_thread(), con.driver_connection.context))
+            return headers
+
+        con.driver_connection.add_default_headers = add_default_headers
+
+        async def request():
+            con.driver_connection.set_context({"id": "1"})
+            return await con.request("/")
+
+        asyncio.run(request())
+
+        # Hooks don't run on the event loop thread but get the request context
+        self.assertEqual(len(calls), 1)
+        self.assertIsNot(calls[0][0], threading.current_thread())
+        self.assertEqual(calls[0][1], {"id": "1"})
+
+    def test_request_rate_limiter(self):
+        headers = {"X-RateLimit-Remaining": "10"}
+        response = AsyncResponse(status_code=200, reason="OK", headers=headers, content=b"{}")
+        con = self._get_connection([response])
+        con.driver_connection.rate_limiter = Mock()
+        threads = []
+
+        def acquire(method, path):
+            threads.append(threading.current_thread())
+
+        con.driver_connection.rate_limiter.acquire.side_effect = acquire
+
+        asyncio.run(con.request("/items", params={"a": "b"}))
+
+        # Acquiring a token can block so it doesn't run on the event loop
+        rate_limiter = con.driver_connection.rate_limiter
+        rate_limiter.acquire.assert_called_once_with(method="GET", path="/items")
+        self.assertIsNot(threads[0], threading.current_thread())
+        rate_limiter.update.assert_called_once_with(
+            method="GET", path="/items", headers={"x-ratelimit-remaining": "10"}
+        )
+
+    def test_request_rate_limit_error_updates_rate_limiter(self):
+        headers = {"Retry-After": "5"}
+        response = AsyncResponse(status_code=429, reason="", headers=headers, content=b"{}")
+        con = self._get_connection([response])
+        con.driver_connection.rate_limiter = Mock()
+
+        self.assertRaises(RateLimitReachedError, asyncio.run, con.request("/items"))
+        con.driver_connection.rate_limiter.update.assert_called_once_with(
+            method="GET", path="/items", retry_after=5
+        )
+
+    def test_session_closed_on_loop_change(self):
+        con = AsyncLibcloudConnection()
+
+        async def get_session():
+            return con._get_session()
+
+        session1 = asyncio.run(get_session())
+        session2 = asyncio.run(get_session())
+
+        self.assertIsNot(session1, session2)
+        self.assertTrue(session1.closed)
+        self.assertFalse(session2.closed)
+
+        asyncio.run(con.close())
+        self.assertTrue(session2.closed)
+
+    def test_request_retry(self):
+        response = AsyncResponse(status_code=200, reason="OK", headers={}, content=b"{}")
+        con = self._get_connection([socket.error(), response])
+        con.driver_connection.retry_delay = 0.01
+
+        result = asyncio.run(con.request("/", retry_failed=True))
+        self.assertEqual(result.object, {})
+        self.assertEqual(len(con.connection.requests), 2)
+
+    def test_async_retry_rate_limit_error(self):
+        calls = []
+
+        async def request():
+            calls.append(1)
+
+            if len(calls) < 2:
+                raise RateLimitReachedError(headers={"retry-after": 0.1})
+
+            return "success"
+
+        retry_request = AsyncRetry(timeout=1, retry_delay=0.1, backoff=1)
+        self.assertEqual(asyncio.run(retry_request(request)()), "success")
+        self.assertEqual(len(calls), 2)
+
+
+class PollingConnectionClassTestCase(unittest.TestCase):
+    class TestConnection(PollingConnection):
+        timeout = 5
+
+        def __init__(self, statuses):
+            super().__init__(host="api.example.com")
+            # Mapping of job ID to the statuses returned by subsequent polls
+            self.statuses = statuses
+            self.requests = []
+
+        def request(self, action, params=None, data=None, headers=None, method="GET"):
+            self.requests.append(action)
+            response = Mock(headers={})
+
+            if action == "/jobs":
+                response.object = {"id": data}
+            else:
+                job_id = action.split("/")[-1]
+                response.object = {"status": self.statuses[job_id].pop(0)}
+
+            return response
+
+        def get_poll_request_kwargs(self, response, context, request_kwargs):
+            return {"action": "/jobs/%s" % (response.object["id"])}
+
+        def has_completed(self, response):
+            return response.object["status"] == "done"
+
+    def test_exponential_backoff_strategy(self):
+        strategy = ExponentialBackoffPollingStrategy(
+            interval=1, max_interval=5, backoff=2, jitter=0
+        )
+        delays = [strategy.get_delay(attempt) for attempt in range(1, 6)]
+        self.assertEqual(delays, [1, 2, 4, 5, 5])
+
+        strategy.jitter = 0.5
+
+        for _ in range(20):
+            self.assertTrue(2 <= strategy.get_delay(3) <= 4)
+
+    def test_strategy_honors_retry_after(self):
+        strategy = PollingStrategy(interval=1)
+
+        self.assertEqual(strategy.get_delay(1, Mock(headers={"retry-after": "10"})), 10)
+        self.assertEqual(strategy.get_delay(1, Mock(headers={"retry-after": "0"})), 1)
+        self.assertEqual(strategy.get_delay(1, Mock(headers={"retry-after": "invalid"})), 1)
+        self.assertEqual(strategy.get_delay(1, Mock(headers={})), 1)
+
+        retry_after = strategy.get_retry_after(
+            Mock(headers={"retry-after": "Fri, 31 Dec 1999 23:59:59 GMT"})
+        )
+        self.assertEqual(retry_after, 0)
+
+    @patch("time.sleep")
+    def test_async_request_uses_poll_strategy(self, mock_sleep):
+        con = self.TestConnection({"1": ["pending", "pending", "done"]})
+        con.poll_strategy = ExponentialBackoffPollingStrategy(interval=0.1, jitter=0)
+
+        response = con.async_request("/jobs", data="1", method="POST")
+        self.assertEqual(response.object["status"], "done")
+        self.assertEqual(con.requests, ["/jobs", "/jobs/1", "/jobs/1", "/jobs/1"])
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertAlmostEqual(delays[0], 0.1, places=2)
+        self.assertAlmostEqual(delays[1], 0.2, places=2)
+
+    @patch("time.sleep")
+    def test_async_request_default_strategy_uses_poll_interval(self, mock_sleep):
+        con = self.TestConnection({"1": ["pending", "done"]})
+        con.poll_interval = 0.3
+
+        con.async_request("/jobs", data="1", method="POST")
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.3, places=2)
+
+    @patch("time.sleep")
+    def test_async_request_many(self, mock_sleep):
+        con = self.TestConnection(
+            {"1": ["done"], "2": ["pending", "done"], "3": ["pending", "pending", "done"]}
+        )
+        con.poll_many = Mock(wraps=con.poll_many)
+
+        responses = con.async_request_many(
+            [{"action": "/jobs", "data": job_id, "method": "POST"} for job_id in ["1", "2", "3"]]
+        )
+        self.assertEqual([r.object["status"] for r in responses], ["done"] * 3)
+
+        # Pending jobs are polled together in rounds and finished jobs are
+        # not polled again
+        polled = [
+            [kwargs["action"] for kwargs in call[0][0]] for call in con.poll_many.call_args_list
+        ]
+        self.assertEqual(
+            polled, [["/jobs/1", "/jobs/2", "/jobs/3"], ["/jobs/2", "/jobs/3"], ["/jobs/3"]]
+        )
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch("time.sleep")
+    def test_async_request_many_timeout(self, mock_sleep):
+        con = self.TestConnection({"1": ["done"], "2": ["pending"] * 100})
+        con.timeout = 0
+
+        expected_msg = "2 of 2 jobs did not complete in 0 seconds"
+        assertRaisesRegex(
+            self,
+            LibcloudError,
+            expected_msg,
+            con.async_request_many,
+            [{"action": "/jobs", "data": job_id} for job_id in ["1", "2"]],
+        )
+
 
 class CertificateConnectionClassTestCase(unittest.TestCase):
     def setUp(self):
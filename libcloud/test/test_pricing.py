@@ -13,9 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
+import json
 import os.path
+import tempfile
 import unittest
+import threading
 
 import libcloud.pricing
 
@@ -26,7 +30,9 @@ class PricingTestCase(unittest.TestCase):
     def setUp(self):
         super().setUp()
 
+        libcloud.pricing.invalidate_pricing_cache()
         libcloud.pricing.PRICING_DATA = {"compute": {}, "storage": {}}
+        libcloud.pricing.CACHE_ALL_PRICING_DATA = False
 
     def test_get_pricing_success(self):
         self.assertFalse("foo" in libcloud.pricing.PRICING_DATA["compute"])
@@ -179,6 +185,114 @@ class PricingTestCase(unittest.TestCase):
         self.assertTrue("bar" in libcloud.pricing.PRICING_DATA["compute"])
         self.assertTrue("baz" in libcloud.pricing.PRICING_DATA["compute"])
 
+    def test_get_pricing_indexed_file_matches_full_parse(self):
+        file_path = libcloud.pricing.DEFAULT_PRICING_FILE_PATH
+
+        with open(file_path) as fp:
+            pricing_data = json.load(fp)
+
+        for driver_name in ["azure_linux", "ec2_linux", "rackspacenovaus"]:
+            pricing = libcloud.pricing._read_driver_pricing(file_path, "compute", driver_name)
+            self.assertEqual(pricing, pricing_data["compute"][driver_name])
+
+        for driver_name in ["foo", "bar", "baz"]:
+            pricing = libcloud.pricing._read_driver_pricing(
+                PRICING_FILE_PATH, "compute", driver_name
+            )
+            self.assertEqual(pricing["2"], {"foo": 2.0, "bar": 4.0, "baz": 6.0}[driver_name])
+
+        self.assertRaises(
+            KeyError,
+            libcloud.pricing._read_driver_pricing,
+            PRICING_FILE_PATH,
+            "compute",
+            "inexistent",
+        )
+
+    def test_get_pricing_unsupported_file_layout(self):
+        fd, file_path = tempfile.mkstemp(suffix=".json")
+        self.addCleanup(os.remove, file_path)
+
+        with os.fdopen(fd, "w") as fp:
+            json.dump({"compute": {"foo": {"1": 1.5}}}, fp)
+
+        self.assertIsNone(libcloud.pricing._read_driver_pricing(file_path, "compute", "foo"))
+
+        pricing = libcloud.pricing.get_pricing(
+            driver_type="compute",
+            driver_name="foo",
+            pricing_file_path=file_path,
+        )
+        self.assertEqual(pricing, {"1": 1.5})
+
+    def test_get_pricing_cache_evicts_least_recently_used(self):
+        old_max_size = libcloud.pricing.PRICING_CACHE_MAX_SIZE
+        libcloud.pricing.PRICING_CACHE_MAX_SIZE = 2
+        self.addCleanup(setattr, libcloud.pricing, "PRICING_CACHE_MAX_SIZE", old_max_size)
+
+        libcloud.pricing.set_pricing(driver_type="compute", driver_name="custom", pricing={})
+
+        for driver_name in ["foo", "bar", "foo", "baz"]:
+            libcloud.pricing.get_pricing(
+                driver_type="compute",
+                driver_name=driver_name,
+                pricing_file_path=PRICING_FILE_PATH,
+            )
+
+        # Pricing set using set_pricing is never evicted
+        self.assertEqual(
+            sorted(libcloud.pricing.PRICING_DATA["compute"].keys()),
+            ["baz", "custom", "foo"],
+        )
+
+    def test_get_pricing_cache_concurrent_eviction(self):
+        old_max_size = libcloud.pricing.PRICING_CACHE_MAX_SIZE
+        libcloud.pricing.PRICING_CACHE_MAX_SIZE = 1
+        self.addCleanup(setattr, libcloud.pricing, "PRICING_CACHE_MAX_SIZE", old_max_size)
+
+        # Switch threads as often as possible to make races likely
+        old_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, old_switch_interval)
+
+        errors = []
+
+        def get_pricing():
+            try:
+                for _ in range(200):
+                    for driver_name in ["foo", "bar", "baz"]:
+                        libcloud.pricing.get_pricing(
+                            driver_type="compute",
+                            driver_name=driver_name,
+                            pricing_file_path=PRICING_FILE_PATH,
+                        )
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=get_pricing) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(libcloud.pricing._PRICING_CACHE_LRU), 1)
+
+    def test_get_size_price_pricing_replaced(self):
+        libcloud.pricing.set_pricing(driver_type="compute", driver_name="foo", pricing={"1": 1})
+        price = libcloud.pricing.get_size_price(
+            driver_type="compute", driver_name="foo", size_id="1"
+        )
+        self.assertEqual(price, 1)
+
+        libcloud.pricing.set_pricing(driver_type="compute", driver_name="foo", pricing={"1": 2})
+        price = libcloud.pricing.get_size_price(
+            driver_type="compute", driver_name="foo", size_id="1"
+        )
+        self.assertEqual(price, 2)
+
     def test_get_gce_image_price_non_premium_image(self):
         image_name = "debian-10-buster-v20220519"
         cores = 4
@@ -88,6 +88,29 @@ class ResponseClassesTests(unittest.TestCase):
         parsed = response.parse_body()
         self.assertEqual(parsed, "")
 
+    def test_JsonResponse_class_body_is_decoded_lazily(self):
+        with requests_mock.mock() as m:
+            body = ' {"foo": "b\u00e4r"} '.encode("utf-8")
+            m.register_uri("GET", "mock://test.com/", content=body)
+            response_obj = requests.get("mock://test.com/")
+            response = JsonResponse(response=response_obj, connection=self.mock_connection)
+
+        # Body is parsed without decoding it to text first
+        self.assertEqual(response.object, {"foo": "b\u00e4r"})
+        self.assertIsNone(response._body)
+
+        # Default encoding is used when the server doesn't specify a charset
+        self.assertEqual(response.body, '{"foo": "b\u00e4r"}')
+
+    def test_Response_class_body_override(self):
+        with requests_mock.mock() as m:
+            m.register_uri("GET", "mock://test.com/", text="<foo>bar</foo>")
+            response_obj = requests.get("mock://test.com/")
+            response = XmlResponse(response=response_obj, connection=self.mock_connection)
+
+        response.body = "<foo>baz</foo>"
+        self.assertEqual(response.parse_body().text, "baz")
+
     def test_RawResponse_class_read_method(self):
         """
         Test that the RawResponse class includes a response
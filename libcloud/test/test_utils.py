@@ -17,20 +17,26 @@ import sys
 import random
 import socket
 import string
+import hashlib
 import os.path
 import platform
+import tempfile
 import unittest
 import warnings
+from io import BytesIO
+from unittest import mock
 from itertools import chain
 
 import pytest
 
 import libcloud.utils.files
 from libcloud.utils.py3 import StringIO, b, bchr, urlquote, hexadigits
+from libcloud.utils.xml import IterParser, findall, findtext
 from libcloud.utils.misc import get_driver, set_driver, get_secure_random_string
 from libcloud.common.types import LibcloudError
 from libcloud.compute.types import Provider
 from libcloud.utils.publickey import get_pubkey_ssh2_fingerprint, get_pubkey_openssh_fingerprint
+from libcloud.utils.ratelimit import RateLimiter, TokenBucket, FileTokenBucket, parse_retry_after
 from libcloud.utils.decorators import wrap_non_libcloud_exceptions
 from libcloud.utils.networking import (
     is_public_subnet,
@@ -360,6 +366,70 @@ class TestUtils(unittest.TestCase):
         result = libcloud.utils.files.exhaust_iterator(iterator=iterator)
         self.assertEqual(result, b(data))
 
+    def test_hashing_reader_filelike(self):
+        data = b("0123456789" * 10)
+        reader = libcloud.utils.files.HashingReader(BytesIO(data), hashlib.md5())
+
+        # Size is exposed so a Content-Length header can be sent
+        self.assertEqual(reader.len, len(data))
+
+        self.assertEqual(reader.read(15), data[:15])
+        self.assertEqual(b("").join(reader), data[15:])
+        self.assertEqual(reader.read(10), b(""))
+
+        self.assertEqual(reader.bytes_read, len(data))
+        self.assertEqual(reader.hexdigest(), hashlib.md5(data).hexdigest())
+
+    def test_hashing_reader_iterator(self):
+        def iterator_func():
+            for x in range(0, 10):
+                yield "0123456789"
+
+        data = b("0123456789" * 10)
+        reader = libcloud.utils.files.HashingReader(iterator_func(), hashlib.sha1())
+
+        self.assertFalse(hasattr(reader, "len"))
+
+        self.assertEqual(reader.read(15), data[:15])
+        self.assertEqual(reader.read(3), data[15:18])
+        reader.exhaust()
+
+        self.assertEqual(reader.bytes_read, len(data))
+        self.assertEqual(reader.hexdigest(), hashlib.sha1(data).hexdigest())
+
+    def test_hashing_reader_iterator_large_chunks(self):
+        chunks = [b("a" * 1000), b(""), b("b" * 1000)]
+        data = b("").join(chunks)
+        reader = libcloud.utils.files.HashingReader(iter(chunks), hashlib.md5())
+
+        # Small reads are served from the current chunk
+        pieces = [reader.read(7) for _ in range(150)]
+        self.assertEqual(b("").join(pieces), data[:1050])
+        self.assertEqual(reader.read(), data[1050:])
+        self.assertEqual(reader.read(), b(""))
+
+        self.assertEqual(reader.bytes_read, len(data))
+        self.assertEqual(reader.hexdigest(), hashlib.md5(data).hexdigest())
+
+    def test_iterparser(self):
+        namespace = "http://s3.amazonaws.com/doc/2006-03-01/"
+        data = b(
+            '<Result xmlns="%s"><Items><Item><Name>a</Name></Item>'
+            "<Item><Name>b</Name></Item></Items><Item>c</Item>"
+            "<IsTruncated>false</IsTruncated></Result>" % (namespace)
+        )
+        chunks = [data[index : index + 7] for index in range(0, len(data), 7)]
+
+        parser = IterParser(chunks, xpath="Items/Item", namespace=namespace)
+        names = [findtext(element, "Name", namespace) for element in parser]
+
+        self.assertEqual(names, ["a", "b"])
+        self.assertEqual(findtext(parser.root, "IsTruncated", namespace), "false")
+
+        # Matching elements are removed from the document after use
+        self.assertEqual(len(findall(parser.root, "Items/Item", namespace)), 0)
+        self.assertEqual(len(findall(parser.root, "Item", namespace)), 1)
+
     def test_unicode_urlquote(self):
         # Regression tests for LIBCLOUD-429
         # Note: this is a unicode literal
@@ -478,6 +548,135 @@ class NetworkingUtilsTestCase(unittest.TestCase):
             self.assertEqual(result, incremented_ip)
 
 
+class TokenBucketTestCase(unittest.TestCase):
+    @mock.patch("libcloud.utils.ratelimit.time")
+    def test_acquire(self, mock_time):
+        mock_time.monotonic.return_value = 100
+        bucket = TokenBucket(rate=2, burst=3)
+
+        # Burst is available immediately
+        self.assertEqual([bucket.acquire() for _ in range(3)], [0, 0, 0])
+        self.assertFalse(mock_time.sleep.called)
+
+        # Each subsequent request needs to wait for a refill
+        self.assertEqual(bucket.acquire(), 0.5)
+        self.assertEqual(bucket.acquire(), 1.0)
+        mock_time.sleep.assert_called_with(1.0)
+
+        # Bucket never holds more than burst tokens
+        mock_time.monotonic.return_value = 200
+        self.assertEqual(bucket.acquire(tokens=3), 0)
+        self.assertEqual(bucket.acquire(), 0.5)
+
+    @mock.patch("libcloud.utils.ratelimit.time")
+    def test_adjust(self, mock_time):
+        mock_time.monotonic.return_value = 100
+        bucket = TokenBucket(rate=10, burst=10)
+
+        # Server reports 2 remaining requests in the next 10 seconds
+        bucket.adjust(remaining=2, reset=10)
+        self.assertEqual([bucket.acquire() for _ in range(2)], [0, 0])
+        self.assertEqual(bucket.acquire(), 10.1)
+
+        # Original rate is restored once the quota is reset
+        mock_time.monotonic.return_value = 111
+        self.assertEqual(bucket.acquire(), 0)
+
+        # Retry-After blocks all the requests until the given time
+        bucket.adjust(reset=5)
+        self.assertEqual(bucket.acquire(), 5.1)
+
+    def test_invalid_rate(self):
+        self.assertRaises(ValueError, TokenBucket, rate=0)
+
+    @mock.patch("libcloud.utils.ratelimit.time")
+    def test_file_token_bucket_shares_state(self, mock_time):
+        mock_time.time.return_value = 100
+        path = os.path.join(tempfile.mkdtemp(), "bucket.json")
+
+        bucket1 = FileTokenBucket(path=path, rate=1, burst=2)
+        bucket2 = FileTokenBucket(path=path, rate=1, burst=2)
+
+        self.assertEqual(bucket1.acquire(), 0)
+        self.assertEqual(bucket2.acquire(), 0)
+        self.assertEqual(bucket1.acquire(), 1)
+        self.assertEqual(bucket2.acquire(), 2)
+
+        # Corrupted state file is ignored
+        with open(path, "w") as fp:
+            fp.write("invalid")
+
+        self.assertEqual(bucket1.acquire(), 0)
+
+    @mock.patch("libcloud.utils.ratelimit.time")
+    def test_rate_limiter(self, mock_time):
+        mock_time.monotonic.return_value = 100
+        limiter = RateLimiter(
+            rate=1,
+            burst=1,
+            endpoints={r"POST /zones": (2, 2)},
+            costs={r"GET /export": 3},
+        )
+
+        # Separate bucket for the endpoint
+        self.assertEqual(limiter.acquire("post", "/zones/1/records?a=b"), 0)
+        self.assertEqual(limiter.acquire("POST", "/zones"), 0)
+        self.assertEqual(limiter.acquire("POST", "/zones"), 0.5)
+
+        # Default bucket with request costs
+        self.assertEqual(limiter.acquire("GET", "/zones"), 0)
+        self.assertEqual(limiter.acquire("GET", "/export"), 3)
+
+    @mock.patch("libcloud.utils.ratelimit.time")
+    def test_rate_limiter_update(self, mock_time):
+        mock_time.monotonic.return_value = 100
+        mock_time.time.return_value = 1700000000
+        limiter = RateLimiter(rate=10, burst=10)
+
+        limiter.update("GET", "/", headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": "4"})
+        self.assertEqual(limiter.acquire("GET", "/"), 4.1)
+
+        mock_time.monotonic.return_value = 200
+        limiter.update(
+            "GET", "/", headers={"ratelimit-remaining": "0", "ratelimit-reset": "1700000002"}
+        )
+        self.assertEqual(limiter.acquire("GET", "/"), 2.1)
+
+        mock_time.monotonic.return_value = 300
+        limiter.update("GET", "/", retry_after=3)
+        self.assertEqual(limiter.acquire("GET", "/"), 3.1)
+
+        mock_time.monotonic.return_value = 400
+        limiter.update("GET", "/", headers={"x-ratelimit-remaining": "invalid"})
+        self.assertEqual(limiter.acquire("GET", "/"), 0)
+
+        # Retry-After header in the HTTP-date format
+        mock_time.monotonic.return_value = 500
+        limiter.update("GET", "/", headers={"retry-after": "Tue, 14 Nov 2023 22:13:25 GMT"})
+        self.assertEqual(limiter.acquire("GET", "/"), 5.1)
+
+    @mock.patch("libcloud.utils.ratelimit.time")
+    def test_token_bucket_update(self, mock_time):
+        mock_time.monotonic.return_value = 100
+        bucket = TokenBucket(rate=10, burst=10)
+
+        # Bucket can be used in place of a RateLimiter
+        self.assertEqual(bucket.acquire(method="GET", path="/"), 0)
+        bucket.update(method="GET", path="/", headers={"retry-after": "2"})
+        self.assertEqual(bucket.acquire(method="GET", path="/"), 2.1)
+
+    @mock.patch("libcloud.utils.ratelimit.time")
+    def test_parse_retry_after(self, mock_time):
+        mock_time.time.return_value = 1700000000
+
+        self.assertEqual(parse_retry_after("5"), 5)
+        self.assertEqual(parse_retry_after("-5"), 0)
+        self.assertEqual(parse_retry_after("Tue, 14 Nov 2023 22:13:25 GMT"), 5)
+        self.assertEqual(parse_retry_after("Tue, 14 Nov 2023 22:13:15 GMT"), 0)
+        self.assertIsNone(parse_retry_after("invalid"))
+        self.assertIsNone(parse_retry_after(None))
+
+
 class TestPublicKeyUtils(unittest.TestCase):
     PUBKEY = (
         "ssh-rsa AAAAB3NzaC1yc2EAAAADAQABAAABAQDOfbWSXOlqvYjZmRO84/lIoV4gvuX+"
@@ -17,11 +17,13 @@ import os
 import mimetypes
 from typing import Generator
 
+from requests.utils import super_len
+
 from libcloud.utils.py3 import b, next
 
 CHUNK_SIZE = 8096
 
-__all__ = ["read_in_chunks", "exhaust_iterator", "guess_file_mime_type"]
+__all__ = ["read_in_chunks", "exhaust_iterator", "guess_file_mime_type", "HashingReader"]
 
 
 def read_in_chunks(iterator, chunk_size=None, fill_size=False, yield_empty=False):
@@ -131,3 +133,117 @@ def guess_file_mime_type(file_path):
     filename = os.path.basename(file_path)
     (mimetype, encoding) = mimetypes.guess_type(filename)
     return mimetype, encoding
+
+
+class HashingReader:
+    """
+    File like object which wraps a file object or an iterator and calculates
+    hash and size of the data while it's being read.
+
+    This allows data to be hashed while it's being sent as a request body so
+    each byte is only read once.
+    """
+
+    def __init__(self, stream, hasher, chunk_size=None):
+        """
+        :param stream: File like object with read method or an object which
+                       implements an iterator interface.
+        :type stream: :class:`object`
+
+        :param hasher: Hash object (e.g. ``hashlib.md5()``).
+        :type hasher: :class:`object`
+
+        :param chunk_size: Chunk size used when reader is iterated over
+                           (defaults to CHUNK_SIZE).
+        :type chunk_size: ``int``
+        """
+        self.hasher = hasher
+        self.bytes_read = 0
+
+        self._chunk_size = chunk_size or CHUNK_SIZE
+
+        # Current chunk of the iterator and the position of the data in it
+        # which hasn't been read yet. Reads return slices of the chunk so the
+        # remaining data is never copied
+        self._chunk = b("")
+        self._offset = 0
+
+        if hasattr(stream, "read"):
+            self._read = stream.read
+            self._iterator = None
+        elif hasattr(stream, "__next__") or hasattr(stream, "next"):
+            self._read = None
+            self._iterator = stream
+        else:
+            self._read = None
+            self._iterator = iter(stream)
+
+        # Expose remaining size of the stream (if known) so requests can send
+        # Content-Length header instead of using chunked transfer encoding
+        length = super_len(stream)
+
+        if length:
+            self.len = length
+
+    def read(self, size=-1):
+        if self._read is not None:
+            data = self._read() if size is None or size < 0 else self._read(size)
+            return self._update(data)
+
+        if size is None or size < 0:
+            size = None
+
+        pieces = []
+        remaining = size
+
+        while remaining is None or remaining > 0:
+            if self._offset >= len(self._chunk):
+                try:
+                    self._chunk = b(next(self._iterator))
+                except StopIteration:
+                    break
+
+                self._offset = 0
+                continue
+
+            end = len(self._chunk) if remaining is None else self._offset + remaining
+            piece = self._chunk[self._offset : end]
+            self._offset += len(piece)
+            pieces.append(piece)
+
+            if remaining is not None:
+                remaining -= len(piece)
+
+        if len(pieces) == 1:
+            return self._update(pieces[0])
+
+        return self._update(b("").join(pieces))
+
+    def exhaust(self):
+        """
+        Read and hash all the remaining data.
+        """
+        while self.read(self._chunk_size):
+            pass
+
+    def hexdigest(self):
+        return self.hasher.hexdigest()
+
+    def _update(self, data):
+        data = b(data)
+        self.hasher.update(data)
+        self.bytes_read += len(data)
+        return data
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        data = self.read(self._chunk_size)
+
+        if not data:
+            raise StopIteration
+
+        return data
+
+    next = __next__
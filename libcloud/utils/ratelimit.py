@@ -0,0 +1,466 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import json
+import time
+import threading
+from hashlib import sha256
+from email.utils import mktime_tz, parsedate_tz
+
+__all__ = ["TokenBucket", "FileTokenBucket", "RateLimiter", "parse_retry_after"]
+
+# Headers which carry the number of requests remaining in the current rate
+# limit window and the time when the window is reset
+RATE_LIMIT_REMAINING_HEADERS = ["x-ratelimit-remaining", "ratelimit-remaining"]
+RATE_LIMIT_RESET_HEADERS = ["x-ratelimit-reset", "ratelimit-reset"]
+
+# Reset header values larger than this are Unix timestamps, smaller values
+# are number of seconds until the reset
+RATE_LIMIT_RESET_TIMESTAMP_THRESHOLD = 1000000000
+
+
+def parse_retry_after(value):
+    """
+    Return the number of seconds to wait for the ``Retry-After`` header
+    value or None if the value is not valid.
+
+    Both the delta-seconds and the HTTP-date format are supported.
+
+    :param value: Value of the ``Retry-After`` header.
+    :type value: ``str``
+
+    :rtype: ``float`` or ``None``
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+
+    if not isinstance(value, str):
+        return None
+
+    http_date = parsedate_tz(value)
+
+    if http_date is None:
+        return None
+
+    return max(0.0, mktime_tz(http_date) - time.time())
+
+
+def _get_header_value(headers, names):
+    for name in names:
+        value = headers.get(name)
+
+        if value is None:
+            continue
+
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    return None
+
+
+class TokenBucket:
+    """
+    Token bucket which limits the rate at which requests are sent.
+
+    The bucket holds up to ``burst`` tokens and is refilled with ``rate``
+    tokens per second. Each request consumes a token and if none is
+    available, the caller is blocked until the bucket is refilled.
+
+    The refill rate can be temporarily lowered based on the quota reported
+    by the server (see :meth:`adjust`).
+
+    A single bucket can be shared by multiple connections and threads and
+    it can be used as :attr:`libcloud.common.base.Connection.rate_limiter`
+    in which case all the requests share the bucket.
+    """
+
+    def __init__(self, rate, burst=1):
+        """
+        :param rate: Number of tokens added to the bucket per second.
+        :type rate: ``float``
+
+        :param burst: Maximum number of tokens in the bucket (number of
+                      requests which can be sent at once).
+        :type burst: ``int``
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.rate = float(rate)
+        self.burst = max(burst, 1)
+
+        self._lock = threading.Lock()
+        self._state = None
+
+    def acquire(self, tokens=1, method=None, path=None):
+        """
+        Consume tokens from the bucket, blocking until they are available.
+
+        Callers reserve the tokens in the order in which they call this
+        method so waiting threads are served fairly.
+
+        :param tokens: Number of tokens to consume.
+        :type tokens: ``int``
+
+        :param method: HTTP method of the request (unused, accepted for
+                       compatibility with :class:`RateLimiter`).
+        :type method: ``str``
+
+        :param path: Path of the request (unused).
+        :type path: ``str``
+
+        :return: Number of seconds the caller was blocked for.
+        :rtype: ``float``
+        """
+
+        def reserve(state, now):
+            state["tokens"] -= tokens
+            return self._get_delay(state, now)
+
+        delay = self._update_state(reserve)
+
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
+
+    def update(self, method=None, path=None, headers=None, retry_after=None):
+        """
+        Adjust the bucket based on the response to a request.
+
+        :param method: HTTP method of the request (unused, accepted for
+                       compatibility with :class:`RateLimiter`).
+        :type method: ``str``
+
+        :param path: Path of the request (unused).
+        :type path: ``str``
+
+        :param headers: Response headers (with lower case names).
+        :type headers: ``dict``
+
+        :param retry_after: Number of seconds the server asked the client to
+                            wait before sending another request.
+        :type retry_after: ``float``
+        """
+        headers = headers or {}
+        remaining = _get_header_value(headers, RATE_LIMIT_REMAINING_HEADERS)
+        reset = _get_header_value(headers, RATE_LIMIT_RESET_HEADERS)
+
+        if retry_after is None:
+            retry_after = parse_retry_after(headers.get("retry-after"))
+
+        if reset is not None and reset > RATE_LIMIT_RESET_TIMESTAMP_THRESHOLD:
+            reset = reset - time.time()
+
+        if retry_after:
+            self.adjust(reset=retry_after)
+        elif remaining is not None:
+            self.adjust(remaining=int(remaining), reset=reset)
+
+    def adjust(self, remaining=None, reset=None):
+        """
+        Adjust the bucket to the rate limit quota reported by the server.
+
+        The bucket never holds more than ``remaining`` tokens and until the
+        quota is reset, it's only refilled with the tokens which are left in
+        the quota. Without ``remaining`` (e.g. for ``Retry-After`` header)
+        no requests are allowed until the reset.
+
+        :param remaining: Number of requests which can still be sent in the
+                          current rate limit window.
+        :type remaining: ``int``
+
+        :param reset: Number of seconds until the quota is reset.
+        :type reset: ``float``
+        """
+
+        def update(state, now):
+            quota = remaining if remaining is not None else 0
+            state["tokens"] = min(state["tokens"], quota)
+
+            if reset is not None and reset > 0:
+                state["rate"] = min(self.rate, max(quota - max(state["tokens"], 0), 0) / reset)
+                state["rate_until"] = now + reset
+
+        self._update_state(update)
+
+    def _update_state(self, func):
+        """
+        Refill the bucket, call ``func`` with the bucket state and the
+        current time and return its result.
+        """
+        with self._lock:
+            now = self._get_time()
+            state = self._load_state(now)
+            self._refill(state, now)
+            result = func(state, now)
+            self._save_state(state)
+
+        return result
+
+    def _get_time(self):
+        return time.monotonic()
+
+    def _load_state(self, now):
+        if self._state is None:
+            self._state = self._get_initial_state(now)
+
+        return self._state
+
+    def _save_state(self, state):
+        self._state = state
+
+    def _get_initial_state(self, now):
+        return {"tokens": float(self.burst), "updated": now, "rate": self.rate, "rate_until": None}
+
+    def _refill(self, state, now):
+        rate_until = state["rate_until"]
+
+        if rate_until is not None and now >= rate_until:
+            # Adjusted rate was only in effect until the quota reset
+            elapsed = max(rate_until - state["updated"], 0)
+            state["tokens"] = min(self.burst, state["tokens"] + elapsed * state["rate"])
+            state["updated"] = max(state["updated"], rate_until)
+            state["rate"] = self.rate
+            state["rate_until"] = None
+
+        elapsed = max(now - state["updated"], 0)
+        state["tokens"] = min(self.burst, state["tokens"] + elapsed * state["rate"])
+        state["updated"] = now
+
+    def _get_delay(self, state, now):
+        """
+        Return number of seconds until the bucket holds no token debt.
+        """
+        deficit = -state["tokens"]
+
+        if deficit <= 0:
+            return 0
+
+        rate_until = state["rate_until"]
+
+        if rate_until is None:
+            return deficit / state["rate"]
+
+        covered = (rate_until - now) * state["rate"]
+
+        if covered >= deficit:
+            return deficit / state["rate"]
+
+        return (rate_until - now) + (deficit - covered) / self.rate
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket whose state is stored in a file so it can be shared by
+    multiple processes on the same host.
+
+    This class requires the ``fasteners`` library.
+    """
+
+    def __init__(self, path, rate, burst=1):
+        """
+        :param path: Path to the file which stores the bucket state.
+        :type path: ``str``
+
+        :param rate: Number of tokens added to the bucket per second.
+        :type rate: ``float``
+
+        :param burst: Maximum number of tokens in the bucket.
+        :type burst: ``int``
+        """
+        try:
+            import fasteners
+        except ImportError:
+            raise ImportError(
+                "Missing fasteners dependency, you can install it "
+                "using pip: pip install fasteners"
+            )
+
+        super().__init__(rate=rate, burst=burst)
+
+        self.path = path
+        self._ipc_lock = fasteners.InterProcessLock(path + ".lock")
+
+    def _update_state(self, func):
+        # InterProcessLock is not safe to use from multiple threads so the
+        # thread lock is also held
+        with self._lock, self._ipc_lock:
+            now = self._get_time()
+            state = self._load_state(now)
+            self._refill(state, now)
+            result = func(state, now)
+            self._save_state(state)
+
+        return result
+
+    def _get_time(self):
+        # Monotonic clock can't be compared across processes
+        return time.time()
+
+    def _load_state(self, now):
+        try:
+            with open(self.path) as fp:
+                state = json.load(fp)
+        except (OSError, ValueError):
+            return self._get_initial_state(now)
+
+        if not isinstance(state, dict) or set(state) != {"tokens", "updated", "rate", "rate_until"}:
+            return self._get_initial_state(now)
+
+        return state
+
+    def _save_state(self, state):
+        with open(self.path, "w") as fp:
+            json.dump(state, fp)
+
+
+class RateLimiter:
+    """
+    Client side rate limiter used by :class:`libcloud.common.base.Connection`.
+
+    Requests are throttled using a token bucket per endpoint. Endpoints are
+    defined by regular expressions which are matched against the request
+    method and path (e.g. ``"POST /zones/\\w+/records"``) and requests which
+    don't match any of them share the default bucket.
+
+    The refill rate of a bucket is adjusted based on the ``Retry-After`` and
+    rate limit (``X-RateLimit-Remaining``, ``X-RateLimit-Reset``) response
+    headers.
+
+    A limiter can be shared by multiple driver instances. If ``path`` is
+    provided, the buckets are stored in files in that directory and are also
+    shared by all the processes which use the same directory.
+    """
+
+    def __init__(self, rate, burst=1, endpoints=None, costs=None, path=None):
+        """
+        :param rate: Number of requests per second for requests which don't
+                     match any of the ``endpoints``.
+        :type rate: ``float``
+
+        :param burst: Number of requests which can be sent at once.
+        :type burst: ``int``
+
+        :param endpoints: Mapping of endpoint patterns to a (rate, burst)
+                          tuple for the endpoint bucket.
+        :type endpoints: ``dict``
+
+        :param costs: Mapping of request patterns to a number of tokens the
+                      request consumes (by default each request consumes a
+                      single token).
+        :type costs: ``dict``
+
+        :param path: Directory for the files which store the buckets shared
+                     by multiple processes.
+        :type path: ``str``
+        """
+        self.rate = rate
+        self.burst = burst
+        self.endpoints = [
+            (re.compile(pattern), limits) for pattern, limits in (endpoints or {}).items()
+        ]
+        self.costs = [(re.compile(pattern), cost) for pattern, cost in (costs or {}).items()]
+        self.path = path
+
+        self._buckets = {}  # type: dict
+        self._lock = threading.Lock()
+
+        # Make sure invalid arguments are reported early
+        self._get_bucket(None)
+
+    def acquire(self, method, path):
+        """
+        Wait until a request can be sent.
+
+        :param method: HTTP method of the request.
+        :type method: ``str``
+
+        :param path: Path of the request.
+        :type path: ``str``
+
+        :return: Number of seconds the caller was blocked for.
+        :rtype: ``float``
+        """
+        request = self._get_request(method, path)
+        cost = 1
+
+        for pattern, request_cost in self.costs:
+            if pattern.match(request):
+                cost = request_cost
+                break
+
+        return self._get_endpoint_bucket(request).acquire(tokens=cost)
+
+    def update(self, method, path, headers=None, retry_after=None):
+        """
+        Adjust the endpoint bucket based on the response to a request.
+
+        :param method: HTTP method of the request.
+        :type method: ``str``
+
+        :param path: Path of the request.
+        :type path: ``str``
+
+        :param headers: Response headers (with lower case names).
+        :type headers: ``dict``
+
+        :param retry_after: Number of seconds the server asked the client to
+                            wait before sending another request.
+        :type retry_after: ``float``
+        """
+        bucket = self._get_endpoint_bucket(self._get_request(method, path))
+        bucket.update(headers=headers, retry_after=retry_after)
+
+    def _get_request(self, method, path):
+        return "{} {}".format(method.upper(), path.split("?", 1)[0])
+
+    def _get_endpoint_bucket(self, request):
+        for pattern, _ in self.endpoints:
+            if pattern.match(request):
+                return self._get_bucket(pattern.pattern)
+
+        return self._get_bucket(None)
+
+    def _get_bucket(self, endpoint):
+        with self._lock:
+            bucket = self._buckets.get(endpoint)
+
+            if bucket is None:
+                rate, burst = self.rate, self.burst
+
+                for pattern, limits in self.endpoints:
+                    if pattern.pattern == endpoint:
+                        rate, burst = limits
+
+                if self.path:
+                    name = sha256((endpoint or "").encode("utf-8")).hexdigest()
+                    file_path = os.path.join(self.path, "libcloud-ratelimit-%s.json" % (name))
+                    bucket = FileTokenBucket(path=file_path, rate=rate, burst=burst)
+                else:
+                    bucket = TokenBucket(rate=rate, burst=burst)
+
+                self._buckets[endpoint] = bucket
+
+        return bucket
@@ -16,6 +16,7 @@
 import ssl
 import time
 import socket
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from functools import wraps
@@ -26,6 +27,7 @@ from libcloud.common.exceptions import RateLimitReachedError
 __all__ = [
     "Retry",
     "RetryForeverOnRateLimitError",
+    "AsyncRetry",
 ]
 
 _logger = logging.getLogger(__name__)
@@ -225,3 +227,57 @@ class RetryForeverOnRateLimitError(Retry):
                         raise
 
         return retry_loop
+
+
+class AsyncRetry(Retry):
+    """
+    Version of :class:`Retry` which wraps coroutine functions.
+
+    The delays between the attempts don't block the event loop.
+
+    :Example:
+
+    retry_request = AsyncRetry(timeout=1, retry_delay=1, backoff=1)
+    await retry_request(self.async_connection.request)()
+    """
+
+    def __call__(self, func):
+        async def transform_ssl_error(function, *args, **kwargs):
+            try:
+                return await function(*args, **kwargs)
+            except ssl.SSLError as exc:
+                if TRANSIENT_SSL_ERROR in str(exc):
+                    raise TransientSSLError(*exc.args)
+
+                raise exc
+
+        @wraps(func)
+        async def retry_loop(*args, **kwargs):
+            current_delay = self.retry_delay
+            end = datetime.now() + timedelta(seconds=self.timeout)
+            last_exc = None
+
+            while datetime.now() < end:
+                try:
+                    return await transform_ssl_error(func, *args, **kwargs)
+                except Exception as exc:
+                    last_exc = exc
+
+                    if isinstance(exc, RateLimitReachedError):
+                        _logger.debug("You are being rate limited, backing " "off...")
+
+                        retry_after = exc.retry_after if exc.retry_after else 2
+                        await asyncio.sleep(retry_after)
+
+                        # Reset delay if we're told to wait due to rate
+                        # limiting
+                        current_delay = self.retry_delay
+                    elif self.should_retry(exc):
+                        await asyncio.sleep(current_delay)
+                        current_delay *= self.backoff
+                    else:
+                        raise
+
+            raise last_exc
+
+        return retry_loop
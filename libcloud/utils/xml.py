@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from libcloud.utils.py3 import ET
+
 __all__ = [
     "fixxpath",
     "findtext",
@@ -20,6 +22,7 @@ __all__ = [
     "findall",
     "findall_ignore_namespace",
     "findtext_ignore_namespace",
+    "IterParser",
 ]
 
 
@@ -82,3 +85,64 @@ def findall_ignore_namespace(element, xpath, namespace=None):
         result = findall(element=element, xpath=xpath, namespace=None)
 
     return result
+
+
+class IterParser:
+    """
+    Incrementally parse an XML document and iterate over the elements at
+    the provided path as soon as they are complete.
+
+    ``xpath`` is a path of element tags relative to the root element, e.g.
+    ``Contents`` or ``reservationSet/item``. Elements are removed from the
+    document once the iteration moves on so memory usage doesn't depend on
+    the number of matching elements.
+
+    After the iteration has finished, ``root`` holds the root element with
+    the rest of the document.
+    """
+
+    def __init__(self, chunks, xpath, namespace=None):
+        """
+        :param chunks: Iterator of document chunks.
+        :type chunks: ``iterator`` of ``bytes`` or ``str``
+
+        :param xpath: Path of the elements relative to the root element.
+        :type xpath: ``str``
+
+        :param namespace: Namespace of the element tags.
+        :type namespace: ``str``
+        """
+        self.chunks = chunks
+        self.tags = [fixxpath(xpath=tag, namespace=namespace) for tag in xpath.split("/")]
+        self.root = None
+
+    def __iter__(self):
+        parser = ET.XMLPullParser(events=("start", "end"))
+
+        # Elements which are currently open, starting with the root element
+        path = []
+
+        for chunk in self.chunks:
+            parser.feed(chunk)
+            yield from self._read_events(parser, path)
+
+        parser.close()
+        yield from self._read_events(parser, path)
+
+    def _read_events(self, parser, path):
+        for event, element in parser.read_events():
+            if event == "start":
+                if self.root is None:
+                    self.root = element
+
+                path.append(element)
+                continue
+
+            path.pop()
+
+            if len(path) != len(self.tags) or element.tag != self.tags[-1]:
+                continue
+
+            if all(parent.tag == tag for parent, tag in zip(path[1:], self.tags)):
+                yield element
+                path[-1].remove(element)